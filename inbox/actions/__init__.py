@@ -48,6 +48,8 @@ from inbox.models import Account, SpoolMessage
 from inbox.config import config
 from inbox.sendmail.base import generate_attachments
 from inbox.sendmail.message import create_email, Recipients
+from inbox.log import get_logger
+log = get_logger()
 
 
 def get_queue():
@@ -161,6 +163,49 @@ def delete_draft(account_id, inbox_uid):
                             db_session)
 
 
+# action -> (name of the backend function that applies it to many threads
+# at once, value to set). Backends without the function get one call of the
+# action per thread.
+_batch_functions = {
+    archive: ('set_remote_archived_batch', True),
+    unarchive: ('set_remote_archived_batch', False),
+    star: ('set_remote_starred_batch', True),
+    unstar: ('set_remote_starred_batch', False),
+    mark_unread: ('set_remote_unread_batch', True),
+    mark_read: ('set_remote_unread_batch', False),
+}
+
+
+def run_batch(action, account_id, thread_ids):
+    """ Run a thread action (e.g. `archive`) on each of the given threads of
+    an account, as a single job. Where the backend supports it, that's a
+    single connection, folder selection, search and store for all of them.
+
+    Otherwise the action is run thread by thread; a thread it fails on is
+    logged and doesn't stop the rest. The job still fails afterwards, so
+    the failure shows up like that of a single action.
+    """
+    if action in _batch_functions:
+        function_name, value = _batch_functions[action]
+        with session_scope() as db_session:
+            account = db_session.query(Account).get(account_id)
+            batch_function = getattr(module_registry[account.provider],
+                                     function_name, None)
+            if batch_function is not None:
+                return batch_function(account, thread_ids, value, db_session)
+    failed = []
+    for thread_id in thread_ids:
+        try:
+            action(account_id, thread_id)
+        except Exception:
+            log.exception('{0} failed on thread {1} of account {2}'.format(
+                action.__name__, thread_id, account_id))
+            failed.append(thread_id)
+    if failed:
+        raise Exception('{0} failed on threads {1} of account {2}'.format(
+            action.__name__, failed, account_id))
+
+
 # Later we're going to want to consider a pooling mechanism. We may want to
 # split actions queues by remote host, for example, and have workers for a
 # given host share a connection pool.
@@ -67,6 +67,12 @@ def _get_g_thrid(namespace_id, thread_id, db_session):
         id=thread_id).one()[0]
 
 
+def _get_g_thrids(namespace_id, thread_ids, db_session):
+    return [g_thrid for g_thrid, in db_session.query(ImapThread.g_thrid).
+            filter(ImapThread.namespace_id == namespace_id,
+                   ImapThread.id.in_(thread_ids))]
+
+
 def set_remote_archived(account, thread_id, archived, db_session):
     if not archived:
         # For now, implement unarchive as a move from all mail to inbox.
@@ -100,6 +106,39 @@ def set_remote_unread(account, thread_id, unread, db_session):
     return _syncback_action(fn, account, account.all_folder.name, db_session)
 
 
+def set_remote_archived_batch(account, thread_ids, archived, db_session):
+    """ Archive or unarchive many threads with one SEARCH and one STORE or
+        COPY.
+    """
+    def fn(account, db_session, crispin_client):
+        g_thrids = _get_g_thrids(account.namespace.id, thread_ids, db_session)
+        if archived:
+            crispin_client.archive_threads(g_thrids)
+        else:
+            # Unarchive is a copy from all mail to the inbox.
+            crispin_client.copy_threads(g_thrids, account.inbox_folder.name)
+
+    folder = account.inbox_folder if archived else account.all_folder
+    assert folder is not None
+    return _syncback_action(fn, account, folder.name, db_session)
+
+
+def set_remote_starred_batch(account, thread_ids, starred, db_session):
+    def fn(account, db_session, crispin_client):
+        g_thrids = _get_g_thrids(account.namespace.id, thread_ids, db_session)
+        crispin_client.set_threads_starred(g_thrids, starred)
+
+    return _syncback_action(fn, account, account.all_folder.name, db_session)
+
+
+def set_remote_unread_batch(account, thread_ids, unread, db_session):
+    def fn(account, db_session, crispin_client):
+        g_thrids = _get_g_thrids(account.namespace.id, thread_ids, db_session)
+        crispin_client.set_threads_unread(g_thrids, unread)
+
+    return _syncback_action(fn, account, account.all_folder.name, db_session)
+
+
 def remote_move(account, thread_id, from_folder, to_folder, db_session):
     """ NOTE: We are not planning to use this function yet since Inbox never
         modifies Gmail IMAP labels.
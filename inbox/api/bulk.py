@@ -0,0 +1,225 @@
+""" Fetching, and tag changes for, many threads at once.
+
+Bulk fetches (?ids=... or a POSTed list of ids) are read and serialized a
+chunk at a time, each chunk in a short-lived session of its own as for
+exports, and streamed out as they're ready; the first objects don't wait
+for the last ones to be loaded.
+
+Set-based tag changes:
+
+Applying tags through Thread.apply_tag()/remove_tag() costs several queries
+per thread (the thread, its tag items, their tags), one TagItem INSERT or
+DELETE per change and a transaction log entry built by diffing each thread.
+That's fine for one thread and hopeless for "archive these 5,000
+newsletters". Here the tag items of a chunk of threads are read with one
+query and written with one multi-row INSERT and one DELETE per tag. The
+transaction log entries the ORM would have produced are written the same
+way.
+
+The log entries look exactly like the ones Thread.apply_tag() leaves behind,
+so client sync, webhooks and syncback (which coalesces the resulting actions
+per account) see no difference.
+"""
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import joinedload
+
+from inbox.api.kellogs import encode, APIEncoder
+from inbox.models import Message, Tag, TagItem, Thread, Transaction
+from inbox.models.session import session_scope
+
+# Threads are processed this many at a time, to bound the size of each IN
+# list and of the multi-row statements.
+CHUNK_SIZE = 500
+# Bulk fetches are read and serialized this many objects at a time.
+FETCH_CHUNK_SIZE = 100
+
+# Tags changed as a side effect of adding or removing others; mirrors
+# Thread.apply_tag() and Thread.remove_tag().
+ON_ADD = {'inbox': ['archive'], 'archive': ['inbox'], 'sent': ['drafts']}
+ON_REMOVE_ADD = {'inbox': ['archive'], 'archive': ['inbox']}
+ON_REMOVE = {'unread': ['unseen']}
+
+
+def _expand(namespace, additions, removals):
+    """ Returns ({tag: action_pending} to add, {tag: action_pending} to
+    remove), including dependent changes. Explicit changes win over
+    dependent ones. """
+    tags = namespace.tags
+    to_add = {tag: True for tag in additions}
+    to_remove = {tag: True for tag in removals}
+    for tag in additions:
+        for public_id in ON_ADD.get(tag.public_id, []):
+            if public_id in tags and tags[public_id] not in to_add:
+                to_remove.setdefault(tags[public_id], False)
+    for tag in removals:
+        for public_id in ON_REMOVE_ADD.get(tag.public_id, []):
+            if public_id in tags and tags[public_id] not in to_remove:
+                to_add.setdefault(tags[public_id], False)
+        for public_id in ON_REMOVE.get(tag.public_id, []):
+            if public_id in tags and tags[public_id] not in to_add:
+                to_remove.setdefault(tags[public_id], False)
+    return to_add, to_remove
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _in_requested_order(objects, public_ids):
+    by_public_id = {obj.public_id: obj for obj in objects}
+    return [by_public_id[public_id] for public_id in public_ids
+            if public_id in by_public_id]
+
+
+def _threads(db_session, namespace_id, public_ids):
+    threads = db_session.query(Thread). \
+        filter(Thread.namespace_id == namespace_id,
+               Thread.public_id.in_(public_ids)). \
+        options(joinedload('summary')).all()
+    return _in_requested_order(threads, public_ids)
+
+
+def _messages(db_session, namespace_id, public_ids):
+    messages = db_session.query(Message). \
+        join(Message.thread). \
+        filter(Thread.namespace_id == namespace_id,
+               Message.public_id.in_(public_ids)). \
+        options(joinedload(Message.parts).load_only('public_id',
+                                                    'content_disposition'),
+                joinedload(Message.thread).load_only('public_id',
+                                                     'discriminator')).all()
+    return _in_requested_order(messages, public_ids)
+
+
+# kind -> function(db_session, namespace_id, public_ids) returning the
+# namespace's objects with those public ids, in the same order. Ids that
+# don't match an object are skipped.
+FETCHES = {
+    'threads': _threads,
+    'messages': _messages,
+}
+
+
+def fetch(kind, namespace_id, namespace_public_id, public_ids):
+    """ Yields the JSON array of the namespace's objects of `kind` with the
+    given public ids.
+
+    Doesn't touch the request's session or context, so it can be streamed
+    out after the request has been torn down.
+    """
+    encoder = APIEncoder(namespace_public_id)
+    yield '['
+    first = True
+    for chunk in _chunks(public_ids, FETCH_CHUNK_SIZE):
+        with session_scope(versioned=False) as db_session:
+            objects = FETCHES[kind](db_session, namespace_id, chunk)
+            encoded = [encoder.cereal(obj) for obj in objects]
+        for data in encoded:
+            yield data if first else ',' + data
+            first = False
+    yield ']'
+
+
+def update_tags(db_session, namespace, thread_ids, additions, removals):
+    """ Add and remove tags on many threads.
+
+    Parameters
+    ----------
+    db_session : InboxSession
+    namespace : Namespace
+    thread_ids : list of int
+        Ids of threads in `namespace`.
+    additions, removals : list of Tag
+        Tags to add and remove, disjoint. Changing them triggers syncback.
+
+    Returns
+    -------
+    int
+        The number of threads changed.
+    """
+    to_add, to_remove = _expand(namespace, additions, removals)
+    if not to_add and not to_remove:
+        return 0
+    tags_by_id = {tag.id: tag for tag in to_add.keys() + to_remove.keys()}
+    tagitem_table = TagItem.__table__
+
+    changed = 0
+    for chunk in _chunks(list(thread_ids), CHUNK_SIZE):
+        present = {tuple(row) for row in db_session.execute(
+            select([tagitem_table.c.thread_id, tagitem_table.c.tag_id]).
+            where(and_(tagitem_table.c.thread_id.in_(chunk),
+                       tagitem_table.c.tag_id.in_(tags_by_id.keys()),
+                       tagitem_table.c.deleted_at.is_(None))))}
+
+        # thread id -> {'added': [...], 'deleted': [...]}
+        deltas = defaultdict(lambda: {'added': [], 'deleted': []})
+        now = datetime.utcnow()
+        inserts = []
+        for thread_id in chunk:
+            for tag, action_pending in to_add.iteritems():
+                if (thread_id, tag.id) not in present:
+                    inserts.append({'thread_id': thread_id, 'tag_id': tag.id,
+                                    'created_at': now, 'updated_at': now})
+                    deltas[thread_id]['added'].append(
+                        {'tag_id': tag.id, 'action_pending': action_pending})
+        for tag, action_pending in to_remove.iteritems():
+            removed = [thread_id for thread_id in chunk
+                       if (thread_id, tag.id) in present]
+            if not removed:
+                continue
+            db_session.execute(tagitem_table.delete().where(
+                and_(tagitem_table.c.tag_id == tag.id,
+                     tagitem_table.c.thread_id.in_(removed))))
+            for thread_id in removed:
+                deltas[thread_id]['deleted'].append(
+                    {'tag_id': tag.id, 'action_pending': action_pending})
+        if inserts:
+            db_session.execute(tagitem_table.insert(), inserts)
+        if deltas:
+            _log_changes(db_session, namespace, deltas)
+            changed += len(deltas)
+    return changed
+
+
+def _log_changes(db_session, namespace, deltas):
+    """ Refresh the summaries of the threads in `deltas` and record their
+    tag changes in the transaction log. """
+    thread_ids = deltas.keys()
+    tags = defaultdict(list)
+    for thread_id, name, public_id in db_session.execute(
+            select([TagItem.thread_id, Tag.name, Tag.public_id]).
+            select_from(TagItem.__table__.join(Tag.__table__)).
+            where(and_(TagItem.thread_id.in_(thread_ids),
+                       TagItem.deleted_at.is_(None),
+                       Tag.deleted_at.is_(None)))):
+        tags[thread_id].append({'name': name, 'id': public_id})
+
+    threads = db_session.query(Thread). \
+        filter(Thread.id.in_(thread_ids)). \
+        options(joinedload('summary')).all()
+    for thread in threads:
+        if thread.summary is None:
+            # Computed from scratch, so it already sees the new tags.
+            thread.update_summary()
+            continue
+        thread.summary.tags = tags[thread.id]
+        thread.summary.unread = any(tag['id'] == 'unread'
+                                    for tag in tags[thread.id])
+    db_session.flush()
+
+    transactions = [{
+        'namespace_id': namespace.id,
+        'table_name': thread.__tablename__,
+        'record_id': thread.id,
+        'command': 'update',
+        'delta': {'tagitems': deltas[thread.id]},
+        'object_public_id': thread.public_id,
+        'public_snapshot': encode(thread, namespace.public_id),
+        # Tag changes always change the thread's representation.
+        'publishable': True,
+    } for thread in threads]
+    db_session.execute(Transaction.__table__.insert(), transactions)
@@ -0,0 +1,139 @@
+""" Streaming export of a namespace's threads, messages, contacts or files.
+
+Walking a whole mailbox through the paged listing endpoints costs a query
+and a buffered JSON document per page, and offset paging gets slower the
+deeper it goes. An export is instead a single response of newline-delimited
+JSON, one API object per line, produced in batches:
+
+ * Each batch is a keyset range scan (`id > last id`, in id order), so
+   batches cost the same however far into the export they are.
+ * Each batch is read and serialized in a short-lived session of its own and
+   then sent, so memory use is bounded by the batch size rather than the
+   size of the mailbox, and no transaction stays open for the duration of
+   the download.
+ * After each batch comes a checkpoint line,
+
+       {"object": "checkpoint", "checkpoint": "<token>"}
+
+   and the export ends with one that also has "done": true. An interrupted
+   export resumes from the last checkpoint received by passing it back as
+   ?checkpoint=<token>; a stream that ends without "done" was cut short.
+
+Messages are exported thread by thread, which is how they're indexed, so
+their checkpoints mark the last thread exported.
+"""
+import base64
+
+from sqlalchemy import asc
+from sqlalchemy.orm import joinedload
+
+from inbox.api.kellogs import APIEncoder
+from inbox.models import Thread, Message, Contact, Part
+from inbox.models.session import session_scope
+
+DEFAULT_BATCH_SIZE = 500
+# Messages are fetched for this many threads at a time.
+THREAD_BATCH_SIZE = 100
+
+
+def encode_checkpoint(kind, id_):
+    return base64.urlsafe_b64encode('{0}:{1}'.format(kind, id_)).rstrip('=')
+
+
+def decode_checkpoint(kind, token):
+    """ Returns the id encoded by `encode_checkpoint` for an export of
+    `kind`. """
+    try:
+        token = str(token)
+        key = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        token_kind, id_ = key.split(':')
+        if token_kind != kind:
+            raise ValueError
+        return int(id_)
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid checkpoint {}'.format(token))
+
+
+def _threads(db_session, scope, after, batch_size):
+    threads = db_session.query(Thread). \
+        filter(Thread.namespace_id == scope['namespace_id'],
+               Thread.id > after). \
+        order_by(asc(Thread.id)).limit(batch_size). \
+        options(joinedload('summary')).all()
+    return threads, [thread.id for thread in threads], batch_size
+
+
+def _messages(db_session, scope, after, batch_size):
+    thread_ids = [id_ for id_, in db_session.query(Thread.id).
+                  filter(Thread.namespace_id == scope['namespace_id'],
+                         Thread.id > after).
+                  order_by(asc(Thread.id)).limit(THREAD_BATCH_SIZE)]
+    if not thread_ids:
+        return [], [], THREAD_BATCH_SIZE
+    messages = db_session.query(Message). \
+        filter(Message.thread_id.in_(thread_ids),
+               Message.is_draft == False). \
+        order_by(asc(Message.thread_id), asc(Message.id)). \
+        options(joinedload(Message.parts).load_only('public_id',
+                                                    'content_disposition'),
+                joinedload(Message.thread).load_only('public_id',
+                                                     'discriminator')).all()
+    return messages, thread_ids, THREAD_BATCH_SIZE
+
+
+def _contacts(db_session, scope, after, batch_size):
+    contacts = db_session.query(Contact). \
+        filter(Contact.account_id == scope['account_id'],
+               Contact.source == 'local',
+               Contact.id > after). \
+        order_by(asc(Contact.id)).limit(batch_size).all()
+    return contacts, [contact.id for contact in contacts], batch_size
+
+
+def _files(db_session, scope, after, batch_size):
+    parts = db_session.query(Part). \
+        filter(Part.namespace_id == scope['namespace_id'],
+               Part.content_disposition.isnot(None),
+               Part.id > after). \
+        order_by(asc(Part.id)).limit(batch_size).all()
+    return parts, [part.id for part in parts], batch_size
+
+
+# kind -> function(db_session, scope, after, batch_size) returning
+# (objects, ids checkpointed by the batch, full batch size).
+EXPORTS = {
+    'threads': _threads,
+    'messages': _messages,
+    'contacts': _contacts,
+    'files': _files,
+}
+
+
+def export(kind, namespace_id, namespace_public_id, account_id, after=0,
+           batch_size=None):
+    """ Yields the NDJSON export of the namespace's objects of `kind` with
+    ids greater than `after`.
+
+    Doesn't touch the request's session or context, so it can be streamed
+    out after the request has been torn down.
+    """
+    batch_size = batch_size or DEFAULT_BATCH_SIZE
+    fetch = EXPORTS[kind]
+    scope = {'namespace_id': namespace_id, 'account_id': account_id}
+    encoder = APIEncoder(namespace_public_id)
+    done = False
+    while not done:
+        with session_scope(versioned=False) as db_session:
+            objects, ids, full_batch = fetch(db_session, scope, after,
+                                             batch_size)
+            lines = [encoder.cereal(obj) + '\n' for obj in objects]
+        done = len(ids) < full_batch
+        if ids:
+            after = ids[-1]
+        for line in lines:
+            yield line
+        checkpoint = {'object': 'checkpoint',
+                      'checkpoint': encode_checkpoint(kind, after)}
+        if done:
+            checkpoint['done'] = True
+        yield encoder.cereal(checkpoint) + '\n'
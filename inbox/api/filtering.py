@@ -1,11 +1,35 @@
-from datetime import datetime
+import base64
+import calendar
+from datetime import datetime, timedelta
 import bson
-from sqlalchemy import and_, or_, asc
-from sqlalchemy.orm import joinedload, subqueryload
+from sqlalchemy import and_, or_, asc, desc, select
+from sqlalchemy.orm import joinedload
 from inbox.models import (Contact, Message, MessageContactAssociation, Thread,
-                          Tag, TagItem, Part)
+                          Tag, TagItem, Part, Namespace)
+from inbox.api.planner import Restriction, apply_restrictions
 from inbox.util.encoding import base36decode
 
+EPOCH = datetime(1970, 1, 1)
+
+
+def encode_cursor(date, id_):
+    """ Opaque pagination token for the row with sort key (date, id). """
+    microseconds = (calendar.timegm(date.utctimetuple()) * 10**6 +
+                    date.microsecond)
+    return base64.urlsafe_b64encode(
+        '{0}:{1}'.format(microseconds, id_)).rstrip('=')
+
+
+def decode_cursor(cursor):
+    """ Returns the (date, id) sort key encoded by `encode_cursor`. """
+    try:
+        cursor = str(cursor)
+        key = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        microseconds, id_ = key.split(':')
+        return EPOCH + timedelta(microseconds=int(microseconds)), int(id_)
+    except (TypeError, ValueError, UnicodeError, OverflowError):
+        raise ValueError('Invalid cursor {}'.format(cursor))
+
 
 class Filter(object):
     """ A container for all the filtering query parameters an API client may
@@ -13,7 +37,8 @@ class Filter(object):
     def __init__(self, namespace_id, subject, from_addr, to_addr, cc_addr,
                  bcc_addr, any_email, thread_public_id, started_before,
                  started_after, last_message_before, last_message_after,
-                 filename, tag, limit, offset, order_by, db_session):
+                 filename, tag, limit, offset, order_by, db_session,
+                 cursor=None):
         self.namespace_id = namespace_id
         self.subject = subject
         self.from_addr = from_addr
@@ -32,6 +57,11 @@ class Filter(object):
         self.offset = offset
         self.order_by = order_by
         self.db_session = db_session
+        self.cursor = cursor
+        # Set by get_threads/get_messages when there may be another page.
+        self.next_cursor = None
+        # Description of how the last query was planned, for debugging.
+        self.plan = None
 
         # Validate input
 
@@ -63,15 +93,83 @@ class Filter(object):
                     raise ValueError('Invalid timestamp value {} for {}'.
                                      format(value, key))
 
-    def get_threads(self):
+        if cursor is not None:
+            if order_by == 'subject':
+                raise ValueError("cursor can't be used with order_by=subject")
+            if offset:
+                raise ValueError("cursor can't be combined with offset")
+            self.cursor = decode_cursor(cursor)
+
+    def _paginate(self, query, date_column, id_column, subject_column):
+        """ Order and limit `query`, returning the page of results.
+
+        Results are ordered by (date, id): newest first by default, oldest
+        first with order_by=date. Pages are fetched by keyset: the cursor
+        returned with the previous page becomes a range predicate on that
+        composite key, so each page is an index range scan no matter how
+        deep into the mailbox it is. Offset paging still works, but costs
+        O(offset).
+        """
+        if self.order_by == 'subject':
+            query = query.order_by(asc(subject_column), asc(id_column)). \
+                limit(self.limit)
+            if self.offset:
+                query = query.offset(self.offset)
+            return query.all()
+
+        ascending = self.order_by == 'date'
+        order = asc if ascending else desc
+        if self.cursor is not None:
+            date, id_ = self.cursor
+            # The redundant bound on the date alone keeps this an index
+            # range scan on MySQL.
+            if ascending:
+                query = query.filter(date_column >= date,
+                                     or_(date_column > date, id_column > id_))
+            else:
+                query = query.filter(date_column <= date,
+                                     or_(date_column < date, id_column < id_))
+        query = query.order_by(order(date_column), order(id_column)). \
+            limit(self.limit)
+        if self.offset:
+            query = query.offset(self.offset)
+
+        results = query.all()
+        if results and len(results) == self.limit:
+            last = results[-1]
+            self.next_cursor = encode_cursor(getattr(last, date_column.key),
+                                             last.id)
+        return results
+
+    def _account_id(self):
+        # Contacts belong to the account rather than the namespace.
+        return select([Namespace.account_id]). \
+            where(Namespace.id == self.namespace_id).as_scalar()
+
+    def _tag_restriction(self, column):
+        thread_ids = self.db_session.query(TagItem).join(Tag). \
+            filter(Tag.namespace_id == self.namespace_id,
+                   or_(Tag.public_id == self.tag, Tag.name == self.tag)). \
+            with_entities(TagItem.thread_id.label('id'))
+        return Restriction('tag', column, thread_ids)
+
+    def _contacts(self, *criteria):
+        """ Message-contact associations in this namespace's account matching
+        `criteria`. """
+        return self.db_session.query(MessageContactAssociation). \
+            join(Contact). \
+            filter(Contact.account_id == self._account_id(), *criteria)
+
+    def _filename_message_ids(self):
+        return self.db_session.query(Part). \
+            filter(Part.namespace_id == self.namespace_id,
+                   Part.filename == self.filename)
+
+    def _thread_query(self):
         query = self.db_session.query(Thread)
         thread_criteria = [Thread.namespace_id == self.namespace_id]
         if self.thread_public_id is not None:
-            query = query.filter(Thread.public_id ==
-                                 self.thread_public_id)
-            # TODO(emfree): at this point there should be at most one object,
-            # so we could just execute the query and check additional filters
-            # in Python-land.
+            thread_criteria.append(Thread.public_id == self.thread_public_id)
 
         if self.started_before is not None:
             thread_criteria.append(Thread.subjectdate < self.started_before)
@@ -89,70 +187,73 @@ class Filter(object):
         if self.subject is not None:
             thread_criteria.append(Thread.subject == self.subject)
 
-        thread_predicate = and_(*thread_criteria)
-        query = query.filter(thread_predicate)
+        query = query.filter(and_(*thread_criteria))
 
+        restrictions = []
         if self.tag is not None:
-            tag_query = self.db_session.query(TagItem).join(Tag). \
-                filter(or_(Tag.public_id == self.tag,
-                           Tag.name == self.tag)).subquery()
-
-            query = query.join(tag_query)
-
-        if any((self.from_addr, self.to_addr, self.cc_addr, self.bcc_addr)):
-            contact_criteria = []
-            for field in ('from_addr', 'to_addr', 'cc_addr', 'bcc_addr'):
-                if getattr(self, field, None) is not None:
-                    contact_criteria.append(and_(
-                        Contact.email_address == getattr(self, field),
-                        MessageContactAssociation.field == field))
-
-            contact_query = self.db_session.query(Message). \
-                join(MessageContactAssociation).join(Contact). \
-                filter(or_(*contact_criteria)).subquery()
-
-            query = query.join(contact_query)
+            restrictions.append(self._tag_restriction(Thread.id))
+
+        # A thread matches if any of its messages has any of the given
+        # addresses in the corresponding field.
+        address_criteria = [
+            and_(Contact.email_address == getattr(self, field),
+                 MessageContactAssociation.field == field)
+            for field in ('from_addr', 'to_addr', 'cc_addr', 'bcc_addr')
+            if getattr(self, field) is not None]
+        if address_criteria:
+            thread_ids = self._contacts(or_(*address_criteria)). \
+                join(MessageContactAssociation.message). \
+                with_entities(Message.thread_id.label('id'))
+            restrictions.append(Restriction('address', Thread.id, thread_ids))
 
         if self.any_email is not None:
-            any_contact_query = self.db_session.query(Message). \
-                join(MessageContactAssociation).join(Contact). \
-                filter(Contact.email_address == self.any_email).subquery()
-            query = query.join(any_contact_query)
+            thread_ids = self._contacts(
+                Contact.email_address == self.any_email). \
+                join(MessageContactAssociation.message). \
+                with_entities(Message.thread_id.label('id'))
+            restrictions.append(Restriction('any_email', Thread.id,
+                                            thread_ids))
 
         if self.filename is not None:
-            files_query = self.db_session.query(Message). \
-                join(Part).filter(Part.filename == self.filename).subquery()
-            query = query.join(files_query)
+            thread_ids = self._filename_message_ids(). \
+                join(Part.message). \
+                with_entities(Message.thread_id.label('id'))
+            restrictions.append(Restriction('filename', Thread.id,
+                                            thread_ids))
+
+        # Looking up a single thread is already as narrow as it gets.
+        query, self.plan = apply_restrictions(
+            query, restrictions, probe=self.thread_public_id is None)
+        return query
+
+    def get_thread_ids(self, after=0, limit=None):
+        """ Ids of matching threads greater than `after`, in order, up to
+        `limit` of them. The filter's own limit, offset and cursor are
+        ignored. """
+        query = self._thread_query().with_entities(Thread.id). \
+            filter(Thread.id > after).order_by(Thread.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return [id_ for id_, in query]
 
-        # Eager-load some objects in order to make constructing API
-        # representations faster.
-        query = query.options(
-            subqueryload(Thread.messages).
-            load_only('public_id', 'is_draft', 'discriminator', 'from_addr',
-                      'to_addr', 'cc_addr', 'bcc_addr'),
-            subqueryload('tagitems').joinedload('tag').
-            load_only('public_id', 'name'))
+    def get_threads(self):
+        query = self._thread_query()
 
-        query = query.limit(self.limit)
-        if self.offset:
-            query = query.offset(self.offset)
+        # The thread summary holds everything else the API representation
+        # needs, so each page is a single query.
+        query = query.options(joinedload('summary'))
 
-        if self.order_by == 'subject':
-            query = query.order_by(asc(Thread.subject))
-        elif self.order_by == 'date':
-            query = query.order_by(asc(Thread.recentdate))
-        return query.all()
+        return self._paginate(query, Thread.recentdate, Thread.id,
+                              Thread.subject)
 
     def get_messages(self):
         query = self.db_session.query(Message). \
-            filter(Message.is_draft == False)
+            filter(Message.namespace_id == self.namespace_id,
+                   Message.is_draft == False)
 
         thread_criteria = [Thread.namespace_id == self.namespace_id]
 
         if self.thread_public_id is not None:
-            # TODO(emfree) this is a common case that we should handle
-            # separately by just fetching the thread's messages and only
-            # filtering more if needed.
             thread_criteria.append(Thread.public_id == self.thread_public_id)
 
         if self.started_before is not None:
@@ -168,56 +269,41 @@ class Filter(object):
         if self.last_message_after is not None:
             thread_criteria.append(Thread.recentdate > self.last_message_after)
 
-        thread_predicate = and_(*thread_criteria)
-        thread_query = self.db_session.query(Thread).filter(thread_predicate)
-        if self.tag is not None:
-            thread_query = thread_query.join(TagItem).join(Tag). \
-                filter(or_(Tag.public_id == self.tag, Tag.name == self.tag))
-        thread_query = thread_query.subquery()
-
-        query = query.join(thread_query)
+        query = query.join(Message.thread).filter(and_(*thread_criteria))
 
         if self.subject is not None:
             query = query.filter(Message.subject == self.subject)
 
-        if self.to_addr is not None:
-            to_query = self.db_session.query(Message). \
-                join(MessageContactAssociation).join(Contact). \
-                filter(MessageContactAssociation.field == 'to_addr',
-                       Contact.email_address == self.to_addr).subquery()
-            query = query.join(to_query)
-
-        if self.from_addr is not None:
-            from_query = self.db_session.query(MessageContactAssociation). \
-                join(Contact).filter(
-                    MessageContactAssociation.field == 'from_addr',
-                    Contact.email_address == self.from_addr).subquery()
-            query = query.join(from_query)
-
-        if self.cc_addr is not None:
-            cc_query = self.db_session.query(MessageContactAssociation). \
-                join(Contact).filter(
-                    MessageContactAssociation.field == 'cc_addr',
-                    Contact.email_address == self.cc_addr).subquery()
-            query = query.join(cc_query)
-
-        if self.bcc_addr is not None:
-            bcc_query = self.db_session.query(MessageContactAssociation). \
-                join(Contact).filter(
-                    MessageContactAssociation.field == 'bcc_addr',
-                    Contact.email_address == self.bcc_addr).subquery()
-            query = query.join(bcc_query)
+        restrictions = []
+        if self.tag is not None:
+            restrictions.append(self._tag_restriction(Message.thread_id))
+
+        # Unlike for threads, every given address must match the message.
+        for field in ('from_addr', 'to_addr', 'cc_addr', 'bcc_addr'):
+            if getattr(self, field) is not None:
+                message_ids = self._contacts(
+                    Contact.email_address == getattr(self, field),
+                    MessageContactAssociation.field == field). \
+                    with_entities(
+                        MessageContactAssociation.message_id.label('id'))
+                restrictions.append(Restriction(field, Message.id,
+                                                message_ids))
 
         if self.any_email is not None:
-            any_email_query = self.db_session.query(
-                MessageContactAssociation).join(Contact). \
-                filter(Contact.email_address == self.any_email).subquery()
-            query = query.join(any_email_query)
+            message_ids = self._contacts(
+                Contact.email_address == self.any_email). \
+                with_entities(MessageContactAssociation.message_id.label('id'))
+            restrictions.append(Restriction('any_email', Message.id,
+                                            message_ids))
 
         if self.filename is not None:
-            file_query = self.db_session.query(Part). \
-                filter(Part.filename == self.filename).subquery()
-            query = query.join(file_query)
+            message_ids = self._filename_message_ids(). \
+                with_entities(Part.message_id.label('id'))
+            restrictions.append(Restriction('filename', Message.id,
+                                            message_ids))
+
+        query, self.plan = apply_restrictions(
+            query, restrictions, probe=self.thread_public_id is None)
 
         # Eager-load some objects in order to make constructing API
         # representations faster.
@@ -229,13 +315,5 @@ class Filter(object):
         # TODO(emfree) we should really eager-load the namespace too
         # (or just directly store it on the message object)
 
-        query = query.limit(self.limit)
-        if self.offset:
-            query = query.offset(self.offset)
-
-        if self.order_by == 'subject':
-            query = query.order_by(asc(Message.subject))
-        elif self.order_by == 'date':
-            query = query.order_by(asc(Message.received_date))
-
-        return query.all()
+        return self._paginate(query, Message.received_date, Message.id,
+                              Message.subject)
@@ -1,8 +1,14 @@
 import datetime
 import calendar
-from json import JSONEncoder, dumps
 
-from flask import Response
+try:
+    # simplejson's C speedups are quicker than the stdlib's; both fall back
+    # to pure Python when pretty-printing.
+    import simplejson as json
+except ImportError:
+    import json
+
+from flask import Response, request, has_request_context
 
 from inbox.models import (Message, Part, Contact, Thread, Namespace, Block,
                           Webhook, Lens, Tag, SpoolMessage)
@@ -14,6 +20,35 @@ def format_address_list(addresses):
     return [{'name': name, 'email': email} for name, email in addresses]
 
 
+# type -> function(obj, namespace_public_id) returning its representation.
+_encoders = {}
+# Resolved dispatch for every type seen so far, including subclasses of
+# registered types and types with no representation (None).
+_dispatch = {}
+
+
+def encodes(cls):
+    """Registers the decorated function as the encoder for instances of cls
+    and its subclasses."""
+    def register(fn):
+        _encoders[cls] = fn
+        _dispatch.clear()
+        return fn
+    return register
+
+
+def encoder_for(cls):
+    """Returns the encoder for instances of cls, or None if there isn't one.
+    The most specific registered class in cls's MRO wins."""
+    try:
+        return _dispatch[cls]
+    except KeyError:
+        fn = next((_encoders[base] for base in cls.__mro__
+                   if base in _encoders), None)
+        _dispatch[cls] = fn
+        return fn
+
+
 def encode(obj, namespace_public_id=None):
     """Returns a dictionary representation of an Inbox model object obj, or
     None if there is no such representation defined. If the optional
@@ -31,145 +66,184 @@ def encode(obj, namespace_public_id=None):
     -------
     dictionary or None
     """
-    def _get_namespace_public_id(obj):
-        return namespace_public_id or obj.namespace.public_id
-
-    # Flask's jsonify() doesn't handle datetimes or json arrays as primary
-    # objects.
-    if isinstance(obj, datetime.datetime):
-        return calendar.timegm(obj.utctimetuple())
-
-    elif isinstance(obj, Namespace):
-        return {
-            'id': obj.public_id,
-            'object': 'namepace',
-            'namespace': obj.public_id,
-
-            # Account specific
-            'account': obj.account.public_id,
-            'email_address': obj.account.email_address,
-            'provider': obj.account.provider,
-            # 'status':  'syncing',  # TODO what are values here
-            # 'last_sync':  1398790077,  # tuesday 4/29
-            # 'scope': ['mail', 'contacts']
-        }
-
-    elif isinstance(obj, Message):
-        resp = {
-            'id': obj.public_id,
-            'object': 'message',
-            'namespace': _get_namespace_public_id(obj),
-            'subject': obj.subject,
-            'from': format_address_list(obj.from_addr),
-            'to': format_address_list(obj.to_addr),
-            'cc': format_address_list(obj.cc_addr),
-            'bcc': format_address_list(obj.bcc_addr),
-            'date': obj.received_date,
-            'thread': obj.thread.public_id,
-            'files': [p.public_id for p in obj.parts if
-                      p.is_attachment],
-            'body': obj.sanitized_body,
-            'unread': not obj.is_read,
-        }
-
-        if isinstance(obj, SpoolMessage):
-            resp['state'] = obj.state
-            if obj.state != 'sent':
-                resp['object'] = 'draft'
-
-        return resp
-
-    elif isinstance(obj, Thread):
-        return {
-            'id': obj.public_id,
-            'object': 'thread',
-            'namespace': _get_namespace_public_id(obj),
-            'subject': obj.subject,
-            'participants': format_address_list(obj.participants),
-            'last_message_timestamp': obj.recentdate,
-            'subject_date': obj.subjectdate,
-            'snippet': obj.snippet,
-            'messages':  [m.public_id for m in obj.messages if not
-                          m.is_draft],
-            'drafts': [m.public_id for m in obj.latest_drafts],
-            'tags': [{'name': tag.name, 'id': tag.public_id}
-                     for tag in obj.tags]
-        }
-
-    elif isinstance(obj, Contact):
-        return {
-            'id': obj.public_id,
-            'object': 'contact',
-            'namespace': _get_namespace_public_id(obj),
-            'name': obj.name,
-            'email': obj.email_address
-        }
-
-    elif isinstance(obj, Part):  # ie: Attachments
-        return {
-            'id': obj.public_id,
-            'object': 'file',
-            'namespace': _get_namespace_public_id(obj),
-            'content_type': obj.content_type,
-            'size': obj.size,
-            'filename': obj.filename or obj.content_id,
-            'is_embedded': obj.content_disposition is not None
-            and obj.content_disposition.lower() == 'inline',
-            'message': obj.message.public_id
-        }
-
-    elif isinstance(obj, Block):  # ie: Files
-        # TODO consider adding more info?
-        return {
-            'id': obj.public_id,
-            'object': 'file',
-            'namespace': _get_namespace_public_id(obj),
-            'content_type': obj.content_type,
-            'size': obj.size,
-        }
-
-    elif isinstance(obj, Webhook):
-        resp = encode(obj.lens, namespace_public_id)
-        # resp is deliberately created in this order so that the 'id'
-        # and 'object' values of the webhook and not the lens are
-        # returned.
-        resp.update({
-            'id': obj.public_id,
-            'object': 'webhook',
-            'namespace': _get_namespace_public_id(obj),
-            'callback_url': obj.callback_url,
-            'failure_notify_url': obj.failure_notify_url,
-            'include_body': obj.include_body,
-            'active': obj.active,
-        })
-        return resp
-
-    elif isinstance(obj, Lens):
-        return {
-            'id': obj.public_id,
-            'object': 'lens',
-            'namespace': _get_namespace_public_id(obj),
-            'to': obj.to_addr,
-            'from': obj.from_addr,
-            'cc': obj.cc_addr,
-            'bcc': obj.bcc_addr,
-            'any_email': obj.any_email,
-            'subject': obj.subject,
-            'thread': obj.thread_public_id,
-            'filename': obj.filename,
-            'started_before': obj.started_before,
-            'started_after': obj.started_after,
-            'last_message_before': obj.last_message_before,
-            'last_message_after': obj.last_message_after,
-        }
-
-    elif isinstance(obj, Tag):
-        return {
-            'id': obj.public_id,
-            'object': 'tag',
-            'name': obj.name,
-            'namespace': _get_namespace_public_id(obj)
-        }
+    fn = encoder_for(type(obj))
+    if fn is not None:
+        return fn(obj, namespace_public_id)
+
+
+def _namespace_public_id(obj, namespace_public_id):
+    return namespace_public_id or obj.namespace.public_id
+
+
+# Flask's jsonify() doesn't handle datetimes or json arrays as primary
+# objects.
+@encodes(datetime.datetime)
+def _encode_datetime(obj, namespace_public_id):
+    return calendar.timegm(obj.utctimetuple())
+
+
+@encodes(Namespace)
+def _encode_namespace(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'namepace',
+        'namespace': obj.public_id,
+
+        # Account specific
+        'account': obj.account.public_id,
+        'email_address': obj.account.email_address,
+        'provider': obj.account.provider,
+        # 'status':  'syncing',  # TODO what are values here
+        # 'last_sync':  1398790077,  # tuesday 4/29
+        # 'scope': ['mail', 'contacts']
+    }
+
+
+@encodes(Message)
+def _encode_message(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'message',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'subject': obj.subject,
+        'from': format_address_list(obj.from_addr),
+        'to': format_address_list(obj.to_addr),
+        'cc': format_address_list(obj.cc_addr),
+        'bcc': format_address_list(obj.bcc_addr),
+        'date': obj.received_date,
+        'thread': obj.thread.public_id,
+        'files': [p.public_id for p in obj.parts if
+                  p.is_attachment],
+        'body': obj.sanitized_body,
+        'unread': not obj.is_read,
+    }
+
+
+@encodes(SpoolMessage)
+def _encode_spool_message(obj, namespace_public_id):
+    resp = _encode_message(obj, namespace_public_id)
+    resp['state'] = obj.state
+    if obj.state != 'sent':
+        resp['object'] = 'draft'
+    return resp
+
+
+@encodes(Thread)
+def _encode_thread(obj, namespace_public_id):
+    # Read the denormalized summary rather than every message and tag.
+    # Threads that predate it get one computed on the spot.
+    summary = obj.summary
+    if summary is None:
+        summary = obj.update_summary()
+    return {
+        'id': obj.public_id,
+        'object': 'thread',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'subject': obj.subject,
+        'participants': format_address_list(summary.participants),
+        'last_message_timestamp': obj.recentdate,
+        'subject_date': obj.subjectdate,
+        'snippet': obj.snippet,
+        'messages': summary.message_public_ids,
+        'drafts': summary.draft_public_ids,
+        'tags': summary.tags
+    }
+
+
+@encodes(Contact)
+def _encode_contact(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'contact',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'name': obj.name,
+        'email': obj.email_address
+    }
+
+
+@encodes(Part)  # ie: Attachments
+def _encode_part(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'file',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'content_type': obj.content_type,
+        'size': obj.size,
+        'filename': obj.filename or obj.content_id,
+        'is_embedded': obj.content_disposition is not None
+        and obj.content_disposition.lower() == 'inline',
+        'message': obj.message.public_id
+    }
+
+
+@encodes(Block)  # ie: Files
+def _encode_block(obj, namespace_public_id):
+    # TODO consider adding more info?
+    return {
+        'id': obj.public_id,
+        'object': 'file',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'content_type': obj.content_type,
+        'size': obj.size,
+    }
+
+
+@encodes(Lens)
+def _encode_lens(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'lens',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'to': obj.to_addr,
+        'from': obj.from_addr,
+        'cc': obj.cc_addr,
+        'bcc': obj.bcc_addr,
+        'any_email': obj.any_email,
+        'subject': obj.subject,
+        'thread': obj.thread_public_id,
+        'filename': obj.filename,
+        'started_before': obj.started_before,
+        'started_after': obj.started_after,
+        'last_message_before': obj.last_message_before,
+        'last_message_after': obj.last_message_after,
+    }
+
+
+@encodes(Webhook)
+def _encode_webhook(obj, namespace_public_id):
+    resp = _encode_lens(obj.lens, namespace_public_id)
+    # resp is deliberately created in this order so that the 'id'
+    # and 'object' values of the webhook and not the lens are
+    # returned.
+    resp.update({
+        'id': obj.public_id,
+        'object': 'webhook',
+        'namespace': _namespace_public_id(obj, namespace_public_id),
+        'callback_url': obj.callback_url,
+        'failure_notify_url': obj.failure_notify_url,
+        'include_body': obj.include_body,
+        'max_batch_size': obj.max_batch_size,
+        'active': obj.active,
+    })
+    return resp
+
+
+@encodes(Tag)
+def _encode_tag(obj, namespace_public_id):
+    return {
+        'id': obj.public_id,
+        'object': 'tag',
+        'name': obj.name,
+        'namespace': _namespace_public_id(obj, namespace_public_id)
+    }
+
+
+def wants_pretty():
+    """Whether the current request asked for pretty-printed output with
+    ?pretty=1."""
+    if not has_request_context():
+        return False
+    return request.args.get('pretty', '').lower() in ('1', 'true', 'yes')
 
 
 class APIEncoder(object):
@@ -190,18 +264,21 @@ class APIEncoder(object):
         self.encoder_class = self._encoder_factory(namespace_public_id)
 
     def _encoder_factory(self, namespace_public_id):
-        class InternalEncoder(JSONEncoder):
+        class InternalEncoder(json.JSONEncoder):
             def default(self, obj):
-                custom_representation = encode(obj, namespace_public_id)
-                if custom_representation is not None:
-                    return custom_representation
+                fn = encoder_for(type(obj))
+                if fn is not None:
+                    return fn(obj, namespace_public_id)
                 # Let the base class default method raise the TypeError
-                return JSONEncoder.default(self, obj)
+                return json.JSONEncoder.default(self, obj)
         return InternalEncoder
 
     def cereal(self, obj, pretty=False):
         """Returns the JSON string representation of obj.
 
+        Compact output goes through the JSON library's C encoder, which is
+        many times faster than the pure-Python one used for pretty-printing.
+
         Parameters
         ----------
         obj: serializable object
@@ -214,16 +291,17 @@ class APIEncoder(object):
             If obj is not serializable.
         """
         if pretty:
-            return dumps(obj,
-                         sort_keys=True,
-                         indent=4,
-                         separators=(',', ': '),
-                         cls=self.encoder_class)
-        return dumps(obj, cls=self.encoder_class)
+            return json.dumps(obj,
+                              sort_keys=True,
+                              indent=4,
+                              separators=(',', ': '),
+                              cls=self.encoder_class)
+        return json.dumps(obj, separators=(',', ':'), cls=self.encoder_class)
 
     def jsonify(self, obj):
         """Returns a Flask Response object encapsulating the JSON
-        representation of obj.
+        representation of obj. The output is compact unless the request
+        passed ?pretty=1.
 
         Parameters
         ----------
@@ -234,5 +312,5 @@ class APIEncoder(object):
         TypeError
             If obj is not serializable.
         """
-        return Response(self.cereal(obj, pretty=True),
+        return Response(self.cereal(obj, pretty=wants_pretty()),
                         mimetype='application/json')
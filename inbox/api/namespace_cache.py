@@ -0,0 +1,68 @@
+""" Process-wide cache of namespace lookups for the API.
+
+Every namespace API request used to start by loading its Namespace (and,
+through a joined load, its Account) and building a new encoder. For cheap
+endpoints that fixed overhead dominated. The handful of namespace
+properties requests actually key on never change, so they're cached here by
+public id, along with an encoder for the namespace. Entries expire after a
+TTL, which bounds how long a deleted namespace stays reachable.
+
+Requests that need the Namespace object itself load it on demand.
+"""
+import time
+
+from inbox.api.kellogs import APIEncoder
+from inbox.config import config
+from inbox.models import Namespace
+
+DEFAULT_TTL = 60
+
+
+class CachedNamespace(object):
+    """ The immutable properties of a namespace, plus its API encoder. """
+    def __init__(self, namespace):
+        self.id = namespace.id
+        self.public_id = namespace.public_id
+        self.account_id = namespace.account_id
+        self.provider = (namespace.account.provider
+                         if namespace.account is not None else None)
+        self.encoder = APIEncoder(namespace.public_id)
+
+
+class NamespaceCache(object):
+    """
+    Parameters
+    ----------
+    ttl : int
+        Seconds an entry is trusted for.
+    """
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        # public id -> (expiry time, CachedNamespace)
+        self._entries = {}
+
+    def get(self, public_id, db_session):
+        """ Returns the CachedNamespace for `public_id`, loading it with
+        `db_session` if need be, or None if there's no such namespace. """
+        now = time.time()
+        entry = self._entries.get(public_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        namespace = db_session.query(Namespace). \
+            filter(Namespace.public_id == public_id).first()
+        if namespace is None:
+            self._entries.pop(public_id, None)
+            return None
+        cached = CachedNamespace(namespace)
+        self._entries[public_id] = (now + self.ttl, cached)
+        return cached
+
+    def invalidate(self, public_id):
+        self._entries.pop(public_id, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+namespace_cache = NamespaceCache(
+    config.get('API_NAMESPACE_CACHE_TTL', DEFAULT_TTL))
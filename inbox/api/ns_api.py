@@ -1,25 +1,32 @@
 import os
+import time
 
 import zerorpc
-from flask import request, g, Blueprint, make_response, current_app, Response
+from flask import request, g, Blueprint, current_app, Response
 from flask import jsonify as flask_jsonify
-from sqlalchemy import asc
+from sqlalchemy import asc, func
 from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.exceptions import default_exceptions
 from werkzeug.exceptions import HTTPException
+from werkzeug.http import unquote_etag
 
 from inbox.models import (
     Message, Block, Part, Thread, Namespace, Webhook, Tag, SpoolMessage,
-    Contact)
-from inbox.api.kellogs import APIEncoder
+    Contact, Transaction)
+from inbox.api.kellogs import wants_pretty
+from inbox.api import bulk, export
 from inbox.api.filtering import Filter
+from inbox.api.namespace_cache import namespace_cache
+from inbox.api.response_cache import cached_response
 from inbox.api.validation import (InputError, get_tags, get_attachments,
-                                  get_thread)
+                                  get_thread, get_public_ids,
+                                  validate_public_id)
 from inbox.config import config
 from inbox import contacts, sendmail
 from inbox.models.base import MAX_INDEXABLE_LENGTH
 from inbox.models.session import InboxSession
 from inbox.transactions import client_sync
+from inbox.transactions.hub import get_hub
 
 from err import err
 
@@ -28,6 +35,8 @@ from inbox.ignition import engine
 
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 1000
+# Longest a /sync/events request may wait for new events, in seconds.
+MAX_LONG_POLL_TIMEOUT = 120
 
 
 app = Blueprint(
@@ -62,14 +71,14 @@ def start():
     g.db_session = InboxSession(engine)
 
     g.log = current_app.logger
-    try:
-        g.namespace = g.db_session.query(Namespace) \
-            .filter(Namespace.public_id == g.namespace_public_id).one()
-
-        g.encoder = APIEncoder(g.namespace.public_id)
-    except NoResultFound:
+    namespace = namespace_cache.get(g.namespace_public_id, g.db_session)
+    if namespace is None:
         return err(404, "Couldn't find namespace with id `{0}` ".format(
             g.namespace_public_id))
+    g.namespace_id = namespace.id
+    g.namespace_public_id = namespace.public_id
+    g.account_id = namespace.account_id
+    g.encoder = namespace.encoder
 
     try:
         g.limit = int(request.args.get('limit', 10))
@@ -82,28 +91,44 @@ def start():
     if g.limit > MAX_LIMIT:
         return err(400, 'cannot request more than {} resources at once.'.
                    format(MAX_LIMIT))
-    try:
-        g.api_filter = Filter(
-            namespace_id=g.namespace.id,
-            subject=request.args.get('subject'),
-            thread_public_id=request.args.get('thread'),
-            to_addr=request.args.get('to'),
-            from_addr=request.args.get('from'),
-            cc_addr=request.args.get('cc'),
-            bcc_addr=request.args.get('bcc'),
-            any_email=request.args.get('any_email'),
-            started_before=request.args.get('started_before'),
-            started_after=request.args.get('started_after'),
-            last_message_before=request.args.get('last_message_before'),
-            last_message_after=request.args.get('last_message_after'),
-            filename=request.args.get('filename'),
-            tag=request.args.get('tag'),
-            limit=g.limit,
-            offset=g.offset,
-            order_by=request.args.get('order_by'),
-            db_session=g.db_session)
-    except ValueError as e:
-        return err(400, e.message)
+
+
+def current_namespace():
+    """ The request's Namespace, loaded on first use. Most endpoints only
+    need its id, which is on `g` already. """
+    if getattr(g, 'namespace', None) is None:
+        g.namespace = g.db_session.query(Namespace).get(g.namespace_id)
+    return g.namespace
+
+
+def get_filter():
+    """ The request's Filter, built from its query arguments on first use.
+    """
+    if getattr(g, 'api_filter', None) is None:
+        try:
+            g.api_filter = Filter(
+                namespace_id=g.namespace_id,
+                subject=request.args.get('subject'),
+                thread_public_id=request.args.get('thread'),
+                to_addr=request.args.get('to'),
+                from_addr=request.args.get('from'),
+                cc_addr=request.args.get('cc'),
+                bcc_addr=request.args.get('bcc'),
+                any_email=request.args.get('any_email'),
+                started_before=request.args.get('started_before'),
+                started_after=request.args.get('started_after'),
+                last_message_before=request.args.get('last_message_before'),
+                last_message_after=request.args.get('last_message_after'),
+                filename=request.args.get('filename'),
+                tag=request.args.get('tag'),
+                limit=g.limit,
+                offset=g.offset,
+                order_by=request.args.get('order_by'),
+                db_session=g.db_session,
+                cursor=request.args.get('cursor'))
+        except ValueError as e:
+            raise InputError(e.message)
+    return g.api_filter
 
 
 @app.after_request
@@ -134,6 +159,11 @@ def record_auth(setup_state):
         app.error_handler_spec[None][code] = default_json_error
 
 
+@app.errorhandler(InputError)
+def handle_input_error(error):
+    return err(400, error.message)
+
+
 @app.errorhandler(NotImplementedError)
 def handle_not_implemented_error(error):
     response = flask_jsonify(message="API endpoint not yet implemented.",
@@ -147,15 +177,16 @@ def handle_not_implemented_error(error):
 #
 @app.route('/')
 def index():
-    return g.encoder.jsonify(g.namespace)
+    return g.encoder.jsonify(current_namespace())
 
 
 ##
 # Tags
 ##
 @app.route('/tags/')
+@cached_response
 def tag_query_api():
-    results = list(g.namespace.tags.values())
+    results = list(current_namespace().tags.values())
     return g.encoder.jsonify(results)
 
 
@@ -165,12 +196,12 @@ def tag_create_api():
     if data.keys() != ['name']:
         return err(400, 'Malformed tag request')
     tag_name = data['name']
-    if not Tag.name_available(tag_name, g.namespace.id, g.db_session):
+    if not Tag.name_available(tag_name, g.namespace_id, g.db_session):
         return err(409, 'Tag name not available')
     if len(tag_name) > MAX_INDEXABLE_LENGTH:
         return err(400, 'Tag name is too long.')
 
-    tag = Tag(name=tag_name, namespace=g.namespace, user_created=True)
+    tag = Tag(name=tag_name, namespace=current_namespace(), user_created=True)
     g.db_session.commit()
     return g.encoder.jsonify(tag)
 
@@ -178,9 +209,48 @@ def tag_create_api():
 #
 # Threads
 #
+def paged_response(results):
+    """ JSON response for a page of results, with the cursor for the next
+    page (if there may be one) in the X-Next-Cursor header. """
+    response = g.encoder.jsonify(results)
+    if get_filter().next_cursor is not None:
+        response.headers['X-Next-Cursor'] = get_filter().next_cursor
+    return response
+
+
+def bulk_response(kind):
+    """ JSON array of the namespace's threads or messages (`kind`) whose
+    public ids are listed in the `ids` query parameter, or for POSTs, in the
+    `ids` list of the JSON body, which isn't bound by the length of a URL.
+    The array is streamed as it's encoded; see inbox.api.bulk.fetch. """
+    if request.method == 'POST':
+        data = request.get_json(force=True)
+        ids = data.get('ids') if isinstance(data, dict) else None
+    else:
+        ids = request.args['ids']
+    try:
+        public_ids = get_public_ids(ids, MAX_LIMIT)
+    except InputError as e:
+        return err(400, e.message)
+    if wants_pretty():
+        return g.encoder.jsonify(bulk.FETCHES[kind](
+            g.db_session, g.namespace_id, public_ids))
+    return Response(bulk.fetch(kind, g.namespace_id, g.namespace_public_id,
+                               public_ids),
+                    mimetype='application/json')
+
+
 @app.route('/threads/')
+@cached_response
 def thread_query_api():
-    return g.encoder.jsonify(g.api_filter.get_threads())
+    if 'ids' in request.args:
+        return bulk_response('threads')
+    return paged_response(get_filter().get_threads())
+
+
+@app.route('/threads/', methods=['POST'])
+def thread_bulk_api():
+    return bulk_response('threads')
 
 
 @app.route('/threads/<public_id>')
@@ -189,7 +259,7 @@ def thread_api(public_id):
     try:
         thread = g.db_session.query(Thread).filter(
             Thread.public_id == public_id,
-            Thread.namespace_id == g.namespace.id).one()
+            Thread.namespace_id == g.namespace_id).one()
         return g.encoder.jsonify(thread)
 
     except NoResultFound:
@@ -205,7 +275,7 @@ def thread_api_update(public_id):
     try:
         thread = g.db_session.query(Thread).filter(
             Thread.public_id == public_id,
-            Thread.namespace_id == g.namespace.id).one()
+            Thread.namespace_id == g.namespace_id).one()
     except NoResultFound:
         return err(404, "Couldn't find thread with id `{0}` "
                    "on namespace {1}".format(public_id, g.namespace_public_id))
@@ -220,7 +290,7 @@ def thread_api_update(public_id):
 
     for tag_name in removals:
         tag = g.db_session.query(Tag).filter(
-            Tag.namespace_id == g.namespace.id,
+            Tag.namespace_id == g.namespace_id,
             Tag.name == tag_name).first()
         if tag is None:
             return err(404, 'No tag found with name {}'.  format(tag_name))
@@ -231,7 +301,7 @@ def thread_api_update(public_id):
     additions = data.get('add_tags', [])
     for tag_name in additions:
         tag = g.db_session.query(Tag).filter(
-            Tag.namespace_id == g.namespace.id,
+            Tag.namespace_id == g.namespace_id,
             Tag.name == tag_name).first()
         if tag is None:
             return err(404, 'No tag found with name {}'.format(tag_name))
@@ -243,6 +313,86 @@ def thread_api_update(public_id):
     return g.encoder.jsonify(thread)
 
 
+#
+# Update many threads
+#
+FILTER_ARGS = ('subject', 'thread', 'to', 'from', 'cc', 'bcc', 'any_email',
+               'started_before', 'started_after', 'last_message_before',
+               'last_message_after', 'filename', 'tag')
+
+
+@app.route('/threads/', methods=['PUT'])
+def thread_bulk_update_api():
+    """ Add and remove tags on the threads listed in `thread_ids`, or else on
+    all threads matching the request's filter arguments. """
+    data = request.get_json(force=True)
+    if not set(data).issubset({'add_tags', 'remove_tags', 'thread_ids'}):
+        return err(400, 'Can only add or remove tags from threads.')
+    additions = data.get('add_tags', [])
+    removals = data.get('remove_tags', [])
+    if not isinstance(additions, list) or not isinstance(removals, list):
+        return err(400, 'add_tags and remove_tags must be lists')
+    conflicts = set(additions) & set(removals)
+    if conflicts:
+        return err(400, 'Cannot both add and remove tag {}'.
+                   format(conflicts.pop()))
+
+    tags = {}
+    if additions or removals:
+        tags = {tag.name: tag for tag in g.db_session.query(Tag).filter(
+            Tag.namespace_id == g.namespace_id,
+            Tag.name.in_(additions + removals))}
+    for tag_name in removals:
+        if tag_name not in tags:
+            return err(404, 'No tag found with name {}'.format(tag_name))
+        if not tags[tag_name].user_removable:
+            return err(400, 'Cannot remove tag {}'.format(tag_name))
+    for tag_name in additions:
+        if tag_name not in tags:
+            return err(404, 'No tag found with name {}'.format(tag_name))
+        if not tags[tag_name].user_addable:
+            return err(400, 'Cannot add tag {}'.format(tag_name))
+
+    additions = [tags[name] for name in additions]
+    removals = [tags[name] for name in removals]
+    if 'thread_ids' in data:
+        public_ids = data['thread_ids']
+        if not isinstance(public_ids, list):
+            return err(400, 'thread_ids must be a list')
+        try:
+            for public_id in public_ids:
+                validate_public_id(public_id)
+        except InputError as e:
+            return err(400, e.message)
+        thread_ids = []
+        if public_ids:
+            thread_ids = [id_ for id_, in g.db_session.query(Thread.id).filter(
+                Thread.namespace_id == g.namespace_id,
+                Thread.public_id.in_(public_ids))]
+        updated = bulk.update_tags(g.db_session, current_namespace(),
+                                   thread_ids, additions, removals)
+        g.db_session.commit()
+        return g.encoder.jsonify({'matched': len(thread_ids),
+                                  'updated': updated})
+    elif not any(arg in request.args for arg in FILTER_ARGS):
+        return err(400, 'Specify thread_ids or filter arguments.')
+
+    # A filter can match any number of threads, so they're read and updated
+    # a chunk at a time, each chunk in a transaction of its own.
+    matched = updated = 0
+    after = 0
+    while True:
+        thread_ids = get_filter().get_thread_ids(after, bulk.CHUNK_SIZE)
+        if not thread_ids:
+            break
+        updated += bulk.update_tags(g.db_session, current_namespace(),
+                                    thread_ids, additions, removals)
+        g.db_session.commit()
+        matched += len(thread_ids)
+        after = thread_ids[-1]
+    return g.encoder.jsonify({'matched': matched, 'updated': updated})
+
+
 #
 #  Delete thread
 #
@@ -256,8 +406,16 @@ def thread_api_delete(public_id):
 # Messages
 ##
 @app.route('/messages/')
+@cached_response
 def message_query_api():
-    return g.encoder.jsonify(g.api_filter.get_messages())
+    if 'ids' in request.args:
+        return bulk_response('messages')
+    return paged_response(get_filter().get_messages())
+
+
+@app.route('/messages/', methods=['POST'])
+def message_bulk_api():
+    return bulk_response('messages')
 
 
 @app.route('/messages/<public_id>', methods=['GET', 'PUT'])
@@ -265,7 +423,7 @@ def message_api(public_id):
     try:
         message = g.db_session.query(Message).filter(
             Message.public_id == public_id).one()
-        assert int(message.namespace.id) == int(g.namespace.id)
+        assert int(message.namespace.id) == int(g.namespace_id)
 
     except NoResultFound:
         return err(404,
@@ -298,16 +456,17 @@ def message_api(public_id):
 # Contacts
 ##
 @app.route('/contacts/', methods=['GET'])
+@cached_response
 def contact_search_api():
     filter = request.args.get('filter', '')
     order = request.args.get('order_by')
     if order == 'rank':
         results = contacts.search_util.search(g.db_session,
-                                              g.namespace.account_id, filter,
+                                              g.account_id, filter,
                                               g.limit, g.offset)
     else:
         results = g.db_session.query(Contact). \
-            filter(Contact.account_id == g.namespace.account_id,
+            filter(Contact.account_id == g.account_id,
                    Contact.source == 'local'). \
             order_by(asc(Contact.id)).limit(g.limit).offset(g.offset).all()
 
@@ -322,7 +481,7 @@ def contact_create_api():
     email = data.get('email')
     if not any((name, email)):
         return err(400, 'Contact name and email cannot both be null.')
-    new_contact = contacts.crud.create(g.namespace, g.db_session,
+    new_contact = contacts.crud.create(current_namespace(), g.db_session,
                                        name, email)
     return g.encoder.jsonify(new_contact)
 
@@ -331,7 +490,7 @@ def contact_create_api():
 def contact_read_api(public_id):
     # TODO auth with account object
     # Get all data for an existing contact.
-    result = contacts.crud.read(g.namespace, g.db_session, public_id)
+    result = contacts.crud.read(current_namespace(), g.db_session, public_id)
     if result is None:
         return err(404, "Couldn't find contact with id {0}".
                    format(public_id))
@@ -356,7 +515,7 @@ def files_api():
     # TODO perhaps return just if content_disposition == 'attachment'
     # TODO(emfree) support query parameters per docs
     all_files = g.db_session.query(Part) \
-        .filter(Part.namespace_id == g.namespace.id) \
+        .filter(Part.namespace_id == g.namespace_id) \
         .filter(Part.content_disposition is not None) \
         .limit(DEFAULT_LIMIT).all()
     return g.encoder.jsonify(all_files)
@@ -368,7 +527,7 @@ def file_read_api(public_id):
         f = g.db_session.query(Block).filter(
             Block.public_id == public_id).one()
         if hasattr(f, 'message'):
-            assert int(f.message.namespace.id) == int(g.namespace.id)
+            assert int(f.message.namespace.id) == int(g.namespace_id)
             g.log.info("block's message namespace matches api context namespace")
         else:
             # Block was likely uploaded via file API and not yet sent in a message
@@ -381,6 +540,26 @@ def file_read_api(public_id):
                    "on namespace {1}".format(public_id, g.namespace_public_id))
 
 
+#
+# Export
+#
+@app.route('/export/<kind>')
+def export_api(kind):
+    """ Stream all of the namespace's objects of a kind as newline-delimited
+    JSON. See inbox.api.export. """
+    if kind not in export.EXPORTS:
+        return err(404, "Can't export {}".format(kind))
+    after = 0
+    if 'checkpoint' in request.args:
+        try:
+            after = export.decode_checkpoint(kind, request.args['checkpoint'])
+        except ValueError as e:
+            return err(400, e.message)
+    return Response(export.export(kind, g.namespace_id, g.namespace_public_id,
+                                  g.account_id, after),
+                    mimetype='application/x-ndjson')
+
+
 #
 # Upload file API. This actually supports multiple files at once
 # You can test with
@@ -391,7 +570,7 @@ def file_upload_api():
     for name, uploaded in request.files.iteritems():
         g.log.info("Processing upload '{0}'".format(name))
         f = Block()
-        f.namespace = g.namespace
+        f.namespace = current_namespace()
         f.content_type = uploaded.content_type
         f.filename = uploaded.filename
         f.data = uploaded.read()
@@ -411,7 +590,7 @@ def file_download_api(public_id):
     try:
         f = g.db_session.query(Block).filter(
             Block.public_id == public_id).one()
-        assert int(f.namespace_id) == int(g.namespace.id)
+        assert int(f.namespace_id) == int(g.namespace_id)
     except NoResultFound:
         return err(404, "Couldn't find file with id {0} "
                    "on namespace {1}".format(public_id, g.namespace_public_id))
@@ -440,9 +619,43 @@ def file_download_api(public_id):
             # HACK just append the major part of the content type
             name = 'attachment.{0}'.format(ct.split('/')[0])
 
-    # TODO the part.data object should really behave like a stream we can read
-    # & write to
-    response = make_response(f.data)
+    # Blobs are content-addressed, so the hash is a strong ETag.
+    etag = f.data_sha256
+    if etag is not None and etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    size = f.size or 0
+    start, stop = 0, size
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    # A Range is only honored if the client's copy (per If-Range) is current.
+    if request.range is not None and (
+            if_range is None or unquote_etag(if_range)[0] == etag):
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None and len(request.range.ranges) == 1:
+            response = Response(status=416)
+            response.headers['Content-Range'] = 'bytes */{0}'.format(size)
+            return response
+        # Multiple ranges aren't supported; send the whole file instead.
+        if byte_range is not None:
+            start, stop = byte_range
+
+    chunks = f.open_stream(start, stop)
+    if chunks is None:
+        return err(404, "Couldn't find data for file {0}".format(public_id))
+
+    # Stream the blob rather than reading it all into memory.
+    response = Response(chunks, status=206 if byte_range else 200,
+                        direct_passthrough=True)
+    response.headers['Content-Length'] = str(stop - start)
+    response.headers['Accept-Ranges'] = 'bytes'
+    if byte_range:
+        response.headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(
+            start, stop - 1, size)
+    if etag is not None:
+        response.set_etag(etag)
 
     response.headers['Content-Type'] = 'application/octet-stream'  # ct
     response.headers[
@@ -473,14 +686,14 @@ def get_webhook_client():
 @app.route('/webhooks/', methods=['GET'])
 def webhooks_read_all_api():
     return g.encoder.jsonify(g.db_session.query(Webhook).
-                   filter(Webhook.namespace_id == g.namespace.id).all())
+                   filter(Webhook.namespace_id == g.namespace_id).all())
 
 
 @app.route('/webhooks/', methods=['POST'])
 def webhooks_create_api():
     try:
         parameters = request.get_json(force=True)
-        result = get_webhook_client().register_hook(g.namespace.id, parameters)
+        result = get_webhook_client().register_hook(g.namespace_id, parameters)
         return Response(result, mimetype='application/json')
     except zerorpc.RemoteError:
         return err(400, 'Malformed webhook request')
@@ -492,7 +705,7 @@ def webhooks_read_update_api(public_id):
         try:
             hook = g.db_session.query(Webhook).filter(
                 Webhook.public_id == public_id,
-                Webhook.namespace_id == g.namespace.id).one()
+                Webhook.namespace_id == g.namespace_id).one()
             return g.encoder.jsonify(hook)
         except NoResultFound:
             return err(404, "Couldn't find webhook with id {}"
@@ -529,13 +742,14 @@ def webhooks_delete_api(public_id):
 
 @app.route('/drafts/', methods=['GET'])
 def draft_get_all_api():
-    drafts = sendmail.get_all_drafts(g.db_session, g.namespace.account)
+    drafts = sendmail.get_all_drafts(g.db_session, current_namespace().account)
     return g.encoder.jsonify(drafts)
 
 
 @app.route('/drafts/<public_id>', methods=['GET'])
 def draft_get_api(public_id):
-    draft = sendmail.get_draft(g.db_session, g.namespace.account, public_id)
+    draft = sendmail.get_draft(g.db_session, current_namespace().account,
+                               public_id)
     if draft is None:
         return err(404, 'No draft found with id {}'.format(public_id))
     return g.encoder.jsonify(draft)
@@ -552,16 +766,16 @@ def draft_create_api():
     body = data.get('body')
     files = data.get('files')
     try:
-        tags = get_tags(data.get('tags'), g.namespace.id, g.db_session)
-        files = get_attachments(data.get('files'), g.namespace.id,
+        tags = get_tags(data.get('tags'), g.namespace_id, g.db_session)
+        files = get_attachments(data.get('files'), g.namespace_id,
                                 g.db_session)
         replyto_thread = get_thread(data.get('reply_to_thread'),
-                                    g.namespace.id, g.db_session)
+                                    g.namespace_id, g.db_session)
     except InputError as e:
         return err(404, e.message)
 
-    draft = sendmail.create_draft(g.db_session, g.namespace.account, to,
-                                  subject, body, files, cc, bcc,
+    draft = sendmail.create_draft(g.db_session, current_namespace().account,
+                                  to, subject, body, files, cc, bcc,
                                   tags, replyto_thread)
 
     return g.encoder.jsonify(draft)
@@ -571,7 +785,7 @@ def draft_create_api():
 def draft_update_api(public_id):
     parent_draft = g.db_session.query(SpoolMessage). \
         filter(SpoolMessage.public_id == public_id).first()
-    if parent_draft is None or parent_draft.namespace.id != g.namespace.id:
+    if parent_draft is None or parent_draft.namespace.id != g.namespace_id:
         return err(404, 'No draft with public id {}'.format(public_id))
     if not parent_draft.is_latest:
         return err(409, 'Draft {} has already been updated to {}'.format(
@@ -588,13 +802,13 @@ def draft_update_api(public_id):
     subject = data.get('subject')
     body = data.get('body')
     try:
-        tags = get_tags(data.get('tags'), g.namespace.id, g.db_session)
-        files = get_attachments(data.get('files'), g.namespace.id,
+        tags = get_tags(data.get('tags'), g.namespace_id, g.db_session)
+        files = get_attachments(data.get('files'), g.namespace_id,
                                 g.db_session)
     except InputError as e:
         return err(404, e.message)
 
-    draft = sendmail.update_draft(g.db_session, g.namespace.account,
+    draft = sendmail.update_draft(g.db_session, current_namespace().account,
                                   parent_draft, to, subject, body,
                                   files, cc, bcc, tags)
     return g.encoder.jsonify(draft)
@@ -609,7 +823,7 @@ def draft_delete_api(public_id):
         return err(404, 'No draft found with public_id {}'.
                    format(public_id))
 
-    if draft.namespace != g.namespace:
+    if draft.namespace != current_namespace():
         return err(404, 'No draft found with public_id {}'.
                    format(public_id))
 
@@ -617,7 +831,7 @@ def draft_delete_api(public_id):
         return err(400, 'Message with public id {} is not a draft'.
                    format(public_id))
 
-    result = sendmail.delete_draft(g.db_session, g.namespace.account,
+    result = sendmail.delete_draft(g.db_session, current_namespace().account,
                                    public_id)
     return g.encoder.jsonify(result)
 
@@ -637,7 +851,7 @@ def draft_send_api():
             return err(404, 'No draft found with public_id {}'.
                        format(draft_public_id))
 
-        if draft.namespace != g.namespace:
+        if draft.namespace != current_namespace():
             return err(404, 'No draft found with public_id {}'.
                        format(draft_public_id))
 
@@ -659,8 +873,8 @@ def draft_send_api():
     body = data.get('body')
     block_public_ids = data.get('files')
 
-    draft = sendmail.create_draft(g.db_session, g.namespace.account, to,
-                                  subject, body, block_public_ids, cc, bcc)
+    draft = sendmail.create_draft(g.db_session, current_namespace().account,
+                                  to, subject, body, block_public_ids, cc, bcc)
     # Mark draft for sending
     draft.state = 'sending'
     return g.encoder.jsonify(draft)
@@ -672,20 +886,37 @@ def draft_send_api():
 
 @app.route('/sync/events')
 def sync_events():
+    """ Events since the given stamp. With ?timeout=<seconds>, long-polls:
+    if there are no events yet, waits up to that long for some. """
     start_stamp = request.args.get('stamp')
     try:
         limit = int(request.args.get('limit', 100))
+        timeout = float(request.args.get('timeout', 0))
     except ValueError:
-        return err(400, 'Invalid limit parameter')
+        return err(400, 'Invalid limit or timeout parameter')
     if limit <= 0:
         return err(400, 'Invalid limit parameter')
+    if not 0 <= timeout <= MAX_LONG_POLL_TIMEOUT:
+        return err(400, 'timeout must be between 0 and {}'.
+                   format(MAX_LONG_POLL_TIMEOUT))
     if start_stamp is None:
         return err(400, 'No stamp parameter in sync request.')
 
+    deadline = time.time() + timeout
     try:
-        results = client_sync.get_entries_from_public_id(
-            g.namespace.id, start_stamp, g.db_session, limit)
-        return g.encoder.jsonify(results)
+        while True:
+            # Anything newer than this wakes us up.
+            latest = g.db_session.query(func.max(Transaction.id)). \
+                filter(Transaction.namespace_id == g.namespace_id).scalar()
+            results = client_sync.get_entries_from_public_id(
+                g.namespace_id, start_stamp, g.db_session, limit)
+            remaining = deadline - time.time()
+            if results['events'] or remaining <= 0:
+                return g.encoder.jsonify(results)
+            # Don't hold a database connection while idle.
+            g.db_session.commit()
+            if not get_hub().wait(g.namespace_id, latest or 0, remaining):
+                return g.encoder.jsonify(results)
     except ValueError:
         return err(404, 'Invalid stamp parameter')
 
@@ -698,7 +929,7 @@ def generate_stamp():
                         '{"start": <Unix timestamp>}')
 
     timestamp = int(data['start'])
-    stamp = client_sync.get_public_id_from_ts(g.namespace.id,
+    stamp = client_sync.get_public_id_from_ts(g.namespace_id,
                                               timestamp,
                                               g.db_session)
     return g.encoder.jsonify({'stamp': stamp})
@@ -0,0 +1,88 @@
+""" Join planning for API filter queries.
+
+A filter like ?tag=foo&from=bar&filename=baz restricts threads (or messages)
+through other tables. Joining a subquery per restriction leaves MySQL to
+guess a join order, and it often guesses wrong: it materializes every
+matching message in the database, or scans the whole namespace to find a
+handful of threads. So instead:
+
+ * Each restriction is expressed as a query for the ids it allows,
+   written to be answerable from a single composite index.
+ * Its selectivity is estimated by counting matches up to a small cap,
+   which is a bounded index probe and never a scan.
+ * The most selective restriction, if any is selective at all, drives the
+   query as a join against its distinct ids. The others become semi-joins
+   (IN subqueries) checked against each candidate row.
+
+If nothing is selective, the query is driven by the namespace's recency
+index in pagination order, and stops as soon as a page is full.
+"""
+from sqlalchemy import func
+
+# Restrictions matching fewer rows than this drive the query.
+SELECTIVE_ROWS = 1000
+
+
+class Restriction(object):
+    """ A predicate that filters a column of the queried entity through
+    another table.
+
+    Parameters
+    ----------
+    name : str
+        Human-readable description, for plans.
+    column : Column
+        The restricted column of the queried entity.
+    ids : Query
+        Single-column query, labeled 'id', of values `column` may take.
+    """
+    def __init__(self, name, column, ids):
+        self.name = name
+        self.column = column
+        self.ids = ids
+
+    def estimate(self, limit=SELECTIVE_ROWS):
+        """ Number of rows matching the restriction, counted up to `limit`.
+        """
+        probe = self.ids.limit(limit).subquery()
+        # Query through the underlying session: the soft-delete filter needs
+        # a mapped entity to apply to, and the probe already has one.
+        return self.ids.session.query(func.count('*')). \
+            select_from(probe).scalar()
+
+
+def apply_restrictions(query, restrictions, probe=True):
+    """ Add `restrictions` to `query`, joining against the most selective
+    one.
+
+    Parameters
+    ----------
+    query : Query
+    restrictions : list of Restriction
+    probe : bool
+        Whether to estimate selectivity at all. Pass False when the query is
+        already known to be narrow (e.g. restricted to a single thread).
+
+    Returns
+    -------
+    (Query, list of str)
+        The restricted query and a description of the plan.
+    """
+    if not restrictions:
+        return query, []
+
+    remaining = list(restrictions)
+    plan = []
+    if probe:
+        estimates = [(r.estimate(), r) for r in restrictions]
+        rows, driver = min(estimates, key=lambda estimate: estimate[0])
+        if rows < SELECTIVE_ROWS:
+            ids = driver.ids.distinct().subquery()
+            query = query.join(ids, driver.column == ids.c.id)
+            remaining.remove(driver)
+            plan.append('drive by {0} (~{1} rows)'.format(driver.name, rows))
+
+    for restriction in remaining:
+        query = query.filter(restriction.column.in_(restriction.ids))
+        plan.append('semi-join {0}'.format(restriction.name))
+    return query, plan
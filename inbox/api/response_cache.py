@@ -0,0 +1,152 @@
+""" Cache of serialized API responses.
+
+Clients poll the same listings (the first page of /threads, /tags, ...) every
+few seconds, and almost every poll returns exactly what the previous one did.
+Every change the API can show is recorded in the transaction log, so a
+namespace's latest transaction identifies the state of all of its listings:
+a response is cached under (namespace, endpoint, query arguments) together
+with the transaction that was latest when it was generated, and stays valid
+until a newer transaction exists.
+
+The same version is the basis of the response's ETag. A poll whose
+If-None-Match matches gets a 304 straight away, without running the
+endpoint's query or serializing anything.
+
+The version is the latest transaction's public id as well as its id, since
+ids are reused when a database is restored or recreated. The latest id alone
+isn't enough: transactions are committed out of id order, and one with a
+lower id that becomes visible after the latest doesn't change it. So the
+version also counts the namespace's transactions created in the
+SETTLE_SECONDS up to the latest one (a range scan of the (namespace_id,
+created_at) index). A transaction committed late was created before it was
+committed, so unless its database transaction stayed open for longer than
+that, it's in the window and changes the version.
+"""
+from collections import OrderedDict
+from datetime import timedelta
+from functools import wraps
+from hashlib import sha1
+
+from flask import g, request, Response
+from sqlalchemy import select, desc, func
+
+from inbox.config import config
+from inbox.models import Transaction
+
+DEFAULT_MAX_ENTRIES = 10000
+SETTLE_SECONDS = config.get('API_RESPONSE_CACHE_SETTLE_SECONDS', 300)
+
+# Response headers which are part of the cached representation.
+CACHED_HEADERS = ('X-Next-Cursor',)
+
+
+class ResponseCache(object):
+    """ LRU cache of response bodies, each valid for a single version of its
+    namespace.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of responses to keep. 0 disables caching (ETags still work).
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (version, body, headers)
+        self._entries = OrderedDict()
+
+    def get(self, key, version):
+        """ Returns (body, headers) cached for `key` at `version`, or None.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        if entry[0] != version:
+            # Superseded; it can never be valid again.
+            return None
+        self._entries[key] = entry
+        return entry[1:]
+
+    def set(self, key, version, body, headers):
+        if not self.max_entries:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (version, body, headers)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def namespace_version(db_session, namespace_id):
+    """ (id, public id, number of recent transactions) of the namespace's
+    latest transaction, or None if it has none. """
+    query = select([Transaction.id, Transaction.public_id,
+                    Transaction.created_at]). \
+        where(Transaction.namespace_id == namespace_id). \
+        order_by(desc(Transaction.id)).limit(1)
+    row = db_session.execute(query).first()
+    if row is None:
+        return None
+    id_, public_id, created_at = row
+    recent = db_session.execute(
+        select([func.count(Transaction.id)]).where(
+            (Transaction.namespace_id == namespace_id) &
+            (Transaction.created_at >=
+             created_at - timedelta(seconds=SETTLE_SECONDS)))).scalar()
+    return (id_, public_id, recent)
+
+
+def request_key(namespace_id):
+    """ Cache key for the current request: the endpoint and its query
+    arguments, in a canonical order. """
+    args = tuple(sorted(request.args.items(multi=True)))
+    return (namespace_id, request.endpoint, args)
+
+
+def make_etag(key, version):
+    return sha1(repr((key, version))).hexdigest()
+
+
+response_cache = ResponseCache(
+    config.get('API_RESPONSE_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+
+
+def cached_response(view):
+    """ Serve a namespace API listing from the response cache.
+
+    The view must only depend on the namespace's data and the request's
+    query arguments, and return a JSON response. Streamed responses get an
+    ETag but aren't cached.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        version = namespace_version(g.db_session, g.namespace_id)
+        key = request_key(g.namespace_id)
+        etag = make_etag(key, version)
+
+        if etag in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        cached = response_cache.get(key, version)
+        if cached is not None:
+            body, headers = cached
+            response = Response(body, mimetype='application/json',
+                                headers=headers)
+        else:
+            response = view(*args, **kwargs)
+            if response.status_code != 200:
+                return response
+            # Buffering a streamed response to cache it would defeat the
+            # point of streaming it.
+            if response.is_streamed:
+                response.set_etag(etag)
+                return response
+            headers = [(name, response.headers[name])
+                       for name in CACHED_HEADERS if name in response.headers]
+            response_cache.set(key, version, response.get_data(), headers)
+        response.set_etag(etag)
+        return response
+    return wrapper
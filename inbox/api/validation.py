@@ -10,12 +10,37 @@ class InputError(Exception):
 
 def validate_public_id(public_id):
     try:
-        # raise ValueError on malformed public ids
+        # raise ValueError on malformed public ids, and TypeError on
+        # non-strings
         int(public_id, 36)
-    except ValueError:
+    except (ValueError, TypeError):
         raise InputError('Invalid id {}'.format(public_id))
 
 
+def get_public_ids(ids, limit):
+    """Parses a list, or a comma-separated string, of at most `limit` public
+    ids, dropping duplicates but keeping their order."""
+    if isinstance(ids, basestring):
+        ids = ids.split(',')
+    elif not isinstance(ids, list):
+        raise InputError('ids must be a list or a comma-separated string')
+    public_ids = []
+    seen = set()
+    for public_id in ids:
+        if not isinstance(public_id, basestring):
+            raise InputError('Invalid id {}'.format(public_id))
+        public_id = public_id.strip().lower()
+        if not public_id or public_id in seen:
+            continue
+        validate_public_id(public_id)
+        seen.add(public_id)
+        public_ids.append(public_id)
+        if len(public_ids) > limit:
+            raise InputError('Cannot request more than {} ids at once.'.
+                             format(limit))
+    return public_ids
+
+
 def get_tags(tag_public_ids, namespace_id, db_session):
     tags = set()
     if tag_public_ids is None:
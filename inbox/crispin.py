@@ -78,6 +78,9 @@ def writable_connection_pool(account_id, pool_size=4,
 
 CONN_DISCARD_EXC_CLASSES = (socket.error, imaplib.IMAP4.error)
 
+# Threads per X-GM-THRID SEARCH, to keep commands a reasonable length.
+THREAD_SEARCH_CHUNK_SIZE = 100
+
 
 class CrispinConnectionPool(geventconnpool.ConnectionPool):
     """
@@ -564,14 +567,32 @@ class GmailCrispinClient(CondStoreCrispinClient):
         return sorted([long(uid) for uid in
                        self.conn.search(['NOT DELETED', criteria])])
 
+    def find_thread_messages(self, g_thrids):
+        """ Get UIDs for the [sub]set of messages belonging to any of the
+            given threads that are in the current folder, with one SEARCH per
+            THREAD_SEARCH_CHUNK_SIZE threads.
+        """
+        uids = set()
+        g_thrids = list(g_thrids)
+        for i in range(0, len(g_thrids), THREAD_SEARCH_CHUNK_SIZE):
+            chunk = g_thrids[i:i + THREAD_SEARCH_CHUNK_SIZE]
+            criteria = ('OR ' * (len(chunk) - 1)) + ' '.join(
+                ['X-GM-THRID {}'.format(thrid) for thrid in chunk])
+            uids.update(long(uid) for uid in
+                        self.conn.search(['NOT DELETED', criteria]))
+        return sorted(uids)
+
     # -----------------------------------------
     # following methods WRITE to IMAP account!
     # -----------------------------------------
 
     def archive_thread(self, g_thrid):
+        self.archive_threads([g_thrid])
+
+    def archive_threads(self, g_thrids):
         assert self.selected_folder_name == self.folder_names()['inbox'], \
             "must select INBOX first ({0})".format(self.selected_folder_name)
-        uids = self.find_messages(g_thrid)
+        uids = self.find_thread_messages(g_thrids)
         # delete from inbox == archive for Gmail
         if uids:
             self.conn.delete_messages(uids)
@@ -580,7 +601,12 @@ class GmailCrispinClient(CondStoreCrispinClient):
         """ NOTE: Does nothing if the thread isn't in the currently selected
             folder.
         """
-        uids = self.find_messages(g_thrid)
+        self.copy_threads([g_thrid], to_folder)
+
+    def copy_threads(self, g_thrids, to_folder):
+        """ NOTE: Skips threads that aren't in the currently selected folder.
+        """
+        uids = self.find_thread_messages(g_thrids)
         if uids:
             self.conn.copy(uids, to_folder)
 
@@ -603,14 +629,24 @@ class GmailCrispinClient(CondStoreCrispinClient):
         self.conn.remove_gmail_labels(uids, [label_name])
 
     def set_unread(self, g_thrid, unread):
-        uids = self.find_messages(g_thrid)
+        self.set_threads_unread([g_thrid], unread)
+
+    def set_threads_unread(self, g_thrids, unread):
+        uids = self.find_thread_messages(g_thrids)
+        if not uids:
+            return
         if unread:
             self.conn.remove_flags(uids, ['\\Seen'])
         else:
             self.conn.add_flags(uids, ['\\Seen'])
 
     def set_starred(self, g_thrid, starred):
-        uids = self.find_messages(g_thrid)
+        self.set_threads_starred([g_thrid], starred)
+
+    def set_threads_starred(self, g_thrids, starred):
+        uids = self.find_thread_messages(g_thrids)
+        if not uids:
+            return
         if starred:
             self.conn.add_flags(uids, ['\\Starred'])
         else:
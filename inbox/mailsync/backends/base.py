@@ -1,11 +1,10 @@
-from gc import collect as garbage_collect
-
 import zerorpc
 from gevent import Greenlet, joinall, sleep
 from gevent.queue import Queue, Empty
 from sqlalchemy.exc import DataError
 
-from inbox.util.concurrency import retry_with_logging, retry_and_report_killed
+from inbox.util.concurrency import retry_and_report_killed
+from inbox.util.blobwriter import get_blob_writer, BlobWriteError
 from inbox.util.itert import partition
 from inbox.util.misc import load_modules
 from inbox.config import config
@@ -149,21 +148,25 @@ def create_db_objects(account_id, db_session, log, folder_name, raw_messages,
 def commit_uids(db_session, log, new_uids):
     new_messages = [item.message for item in new_uids]
 
-    # Save message part blobs before committing changes to db.
+    # Message part blobs are written behind by the blob writer; make sure
+    # the ones these rows reference are durable before committing.
+    blob_writer = get_blob_writer()
+    if blob_writer is not None:
+        try:
+            blob_writer.wait([part.data_sha256 for msg in new_messages
+                              for part in msg.parts if part.size])
+        except BlobWriteError as e:
+            # Fatally abort if part saves error out. Messages in this
+            # chunk will be retried when the sync is restarted.
+            log.error("Could not save message parts to blob store!")
+            log.error(e)
+            raise SyncException("Fatal error encountered")
+
+    # clear data to save memory
     for msg in new_messages:
-        threads = [Greenlet.spawn(retry_with_logging, lambda:
-                                  part.save(part._data), log)
-                   for part in msg.parts if hasattr(part, '_data')]
-        # Fatally abort if part saves error out. Messages in this
-        # chunk will be retried when the sync is restarted.
-        gevent_check_join(log, threads,
-                          "Could not save message parts to blob store!")
-        # clear data to save memory
         for part in msg.parts:
             part._data = None
 
-    garbage_collect()
-
     try:
         log.info("Committing {0} UIDs".format(len(new_uids)))
         db_session.add_all(new_uids)
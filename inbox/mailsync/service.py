@@ -7,6 +7,9 @@ from inbox.contacts.remote_sync import ContactSync
 from inbox.log import get_logger
 from inbox.models.session import session_scope
 from inbox.models import Account
+from inbox.models.roles import BLOB_STORE
+from inbox.util.blobwriter import start_blob_writer
+from inbox.util.packstore import start_pack_compactor
 
 from inbox.mailsync.backends import module_registry
 
@@ -18,6 +21,11 @@ class SyncService(object):
             if hasattr(mod, 'SYNC_MONITOR_CLS')}
 
         self.log = get_logger()
+        # Message parts are written behind on a bounded thread pool instead
+        # of blocking the sync greenlets.
+        start_blob_writer()
+        if BLOB_STORE == 'pack':
+            start_pack_compactor()
         # { account_id: MailSyncMonitor() }
         self.monitors = dict()
         self.contact_sync_monitors = dict()
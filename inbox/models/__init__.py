@@ -10,9 +10,9 @@ from inbox.models.message import Message, SpoolMessage
 from inbox.models.namespace import Namespace
 from inbox.models.search import SearchToken, SearchSignal
 from inbox.models.tag import Tag
-from inbox.models.thread import Thread, TagItem
-from inbox.models.transaction import Transaction
-from inbox.models.webhook import Webhook
+from inbox.models.thread import Thread, TagItem, ThreadSummary
+from inbox.models.transaction import Transaction, TransactionCursor
+from inbox.models.webhook import Webhook, WebhookRetry
 
 from inbox.models.backends import module_registry as backend_module_registry
 
@@ -20,5 +20,7 @@ __all__ = ['Account', 'MailSyncBase', 'Block', 'Part',
            'MessageContactAssociation', 'Contact', 'Folder',
            'FolderItem', 'Lens', 'Message', 'SpoolMessage',
            'Namespace', 'SearchToken', 'SearchSignal',
-           'Tag', 'TagItem', 'Thread', 'Transaction',
-           'Webhook', 'MAX_FOLDER_NAME_LENGTH', 'backend_module_registry']
+           'Tag', 'TagItem', 'Thread', 'ThreadSummary', 'Transaction',
+           'TransactionCursor', 'Webhook', 'WebhookRetry',
+           'MAX_FOLDER_NAME_LENGTH',
+           'backend_module_registry']
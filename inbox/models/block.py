@@ -1,5 +1,5 @@
 from sqlalchemy import (Column, Integer, String, Boolean,
-                        Enum, ForeignKey, event)
+                        Enum, ForeignKey, Index, event)
 from sqlalchemy.orm import reconstructor, relationship, backref
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql.expression import false
@@ -68,6 +68,9 @@ class Block(Blob, MailSyncBase, HasRevisions, HasPublicID):
         else:
             self.content_type = self._content_type_other
 
+# make filtering a namespace's files by filename fast
+Index('ix_block_namespace_id_filename', Block.namespace_id, Block.filename)
+
 
 @event.listens_for(Block, 'before_insert', propagate=True)
 def serialize_before_insert(mapper, connection, target):
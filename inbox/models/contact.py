@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship, backref, validates
 from sqlalchemy.orm.collections import attribute_mapped_collection
 from sqlalchemy.schema import UniqueConstraint
@@ -105,6 +105,10 @@ class Contact(MailSyncBase, HasRevisions, HasPublicID):
             self.token.append(new_token)
         return email_address
 
+# make looking up an account's contacts by email address (API filters) fast
+Index('ix_contact_account_id_email_address', Contact.account_id,
+      Contact.email_address)
+
 
 class MessageContactAssociation(MailSyncBase):
     """Association table between messages and contacts.
@@ -142,3 +146,7 @@ class MessageContactAssociation(MailSyncBase):
                         'MessageContactAssociation.message_id == Message.id, '
                         'MessageContactAssociation.deleted_at.is_(None))',
                         cascade='all, delete-orphan'))
+
+# make finding the messages a contact appears on in a given field fast
+Index('ix_messagecontactassociation_contact_id_field',
+      MessageContactAssociation.contact_id, MessageContactAssociation.field)
@@ -4,7 +4,7 @@ from hashlib import sha256
 from flanker import mime
 
 from sqlalchemy import (Column, Integer, BigInteger, String, DateTime,
-                        Boolean, Enum, ForeignKey, Text)
+                        Boolean, Enum, ForeignKey, Text, Index, event)
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql.expression import false
 
@@ -19,7 +19,7 @@ from inbox.util.misc import parse_ml_headers, parse_references
 
 from inbox.models.mixins import HasPublicID
 from inbox.models.transaction import HasRevisions
-from inbox.models.base import MailSyncBase
+from inbox.models.base import MailSyncBase, MAX_INDEXABLE_LENGTH
 
 
 from inbox.log import get_logger
@@ -64,6 +64,11 @@ class Message(MailSyncBase, HasRevisions, HasPublicID):
                         'Message.deleted_at.is_(None))',
                         order_by='Message.received_date',
                         info={'versioned_properties': ['id']}))
+    # The thread's, copied on insert so that a namespace's messages can be
+    # listed by date from a single index.
+    namespace_id = Column(Integer,
+                          ForeignKey('namespace.id', ondelete='CASCADE'),
+                          nullable=True)
 
     from_addr = Column(JSON, nullable=True)
     sender_addr = Column(JSON, nullable=True)
@@ -407,6 +412,21 @@ class Message(MailSyncBase, HasRevisions, HasPublicID):
     __mapper_args__ = {'polymorphic_on': discriminator,
                        'polymorphic_identity': 'message'}
 
+# make keyset-paginating a namespace's messages by date fast
+Index('ix_message_namespace_id_received_date', Message.namespace_id,
+      Message.received_date, Message.id)
+Index('ix_message_thread_id_received_date', Message.thread_id,
+      Message.received_date)
+# subject is TEXT, so only a prefix can be indexed
+Index('ix_message_subject', Message.subject,
+      mysql_length={'subject': MAX_INDEXABLE_LENGTH})
+
+
+@event.listens_for(Message, 'before_insert', propagate=True)
+def copy_namespace_id(mapper, connection, target):
+    if target.namespace_id is None and target.thread is not None:
+        target.namespace_id = target.thread.namespace_id
+
 
 class SpoolMessage(Message):
     """
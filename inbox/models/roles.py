@@ -1,4 +1,8 @@
+import mmap
 import os
+import threading
+import zlib
+from collections import OrderedDict
 from hashlib import sha256
 
 from sqlalchemy import Column, Integer, String
@@ -14,12 +18,280 @@ STORE_MSG_ON_S3 = config.get('STORE_MESSAGES_ON_S3', None)
 # "AWS_SECRET_ACCESS_KEY": "<YOUR_AWS_ACCESS_KEY>",
 # "MESSAGE_STORE_BUCKET_NAME": "<YOUR_AWS_ACCESS_KEY>",
 
+# Which blob backend to use: 'disk' (one file per blob under
+# MSG_PARTS_DIRECTORY), 'pack' (append-only segment files, see
+# inbox.util.packstore) or 's3'. Blobs the disk store wrote before a switch
+# to 'pack' are still read and deleted from MSG_PARTS_DIRECTORY, so the switch
+# needs no migration.
+# "BLOB_STORE": "disk",
+BLOB_STORE = config.get('BLOB_STORE', 's3' if STORE_MSG_ON_S3 else 'disk')
+assert BLOB_STORE in ('disk', 'pack', 's3'), \
+    "Unknown BLOB_STORE {0}".format(BLOB_STORE)
 
-if STORE_MSG_ON_S3:
+
+if BLOB_STORE == 's3':
     from boto.s3.connection import S3Connection
     from boto.s3.key import Key
 
+# Compress text-like blobs on write. Blobs are always readable regardless of
+# this setting, since stored data is self-describing.
+# "COMPRESS_BLOBS": true,
+COMPRESS_BLOBS = config.get('COMPRESS_BLOBS', True)
+
+try:
+    from lz4.block import compress as lz4_compress
+    from lz4.block import decompress as lz4_decompress
+except ImportError:
+    lz4_compress = lz4_decompress = None
+
 from inbox.util.file import mkdirp, remove_file
+from inbox.util.blobwriter import get_blob_writer, fsync_path
+from inbox.util.blobindex import get_blob_index
+from inbox.util.packstore import get_pack_store
+
+
+# Boto connections aren't thread-safe, and blob writes may run on the blob
+# writer's thread pool, so keep one connection (and bucket handle) per thread.
+_s3_local = threading.local()
+
+
+def _s3_bucket():
+    bucket = getattr(_s3_local, 'bucket', None)
+    if bucket is None:
+        conn = S3Connection(config.get('AWS_ACCESS_KEY_ID'),
+                            config.get('AWS_SECRET_ACCESS_KEY'))
+        bucket = _s3_local.bucket = conn.get_bucket(
+            config.get('MESSAGE_STORE_BUCKET_NAME'))
+    return bucket
+
+
+# Compressed blobs are stored as MAGIC + format byte + compressed bytes.
+# Uncompressed blobs (including everything written before compression
+# existed) are stored raw.
+BLOB_MAGIC = '\x89IBC'
+ZLIB_FORMAT = 'z'
+LZ4_FORMAT = '4'
+
+# Not worth the CPU below this size.
+MIN_COMPRESS_SIZE = 512
+
+# Blobs are streamed (e.g. to API clients) this many bytes at a time.
+BLOB_CHUNK_SIZE = 64 * 1024
+
+COMPRESSIBLE_CONTENT_TYPES = frozenset([
+    'application/json',
+    'application/xml',
+    'application/xhtml+xml',
+    'application/javascript',
+    'application/rtf',
+    'application/msword',
+    'application/pkcs7-signature',
+    'application/pgp-signature',
+    'message/rfc822',
+    'message/delivery-status',
+    'image/svg+xml',
+])
+
+
+def _storage_format(content_type):
+    """ Which compression (if any) to store a blob of `content_type` with.
+
+    Blobs with no content type are our own serialized data, e.g. the JSON
+    headers part (walk_index 0). Media, PDFs and archives are already
+    compressed and are stored as-is.
+    """
+    if not COMPRESS_BLOBS:
+        return None
+    if content_type is not None:
+        content_type = content_type.lower()
+        if not (content_type.startswith('text/') or
+                content_type in COMPRESSIBLE_CONTENT_TYPES):
+            return None
+    return LZ4_FORMAT if lz4_compress is not None else ZLIB_FORMAT
+
+
+def _encode_blob(data, storage_format):
+    if storage_format is None or len(data) < MIN_COMPRESS_SIZE:
+        return data
+    if storage_format == LZ4_FORMAT:
+        compressed = lz4_compress(data)
+    else:
+        compressed = zlib.compress(data, 6)
+    if len(compressed) + len(BLOB_MAGIC) + 1 >= len(data):
+        return data
+    return BLOB_MAGIC + storage_format + compressed
+
+
+def _decode_blob(stored, data_sha256):
+    """ Inverse of _encode_blob. `data_sha256` (of the uncompressed bytes)
+    disambiguates raw blobs that happen to begin with BLOB_MAGIC. """
+    if not stored.startswith(BLOB_MAGIC):
+        return stored
+    storage_format = stored[len(BLOB_MAGIC)]
+    payload = stored[len(BLOB_MAGIC) + 1:]
+    try:
+        if storage_format == ZLIB_FORMAT:
+            value = zlib.decompress(payload)
+        elif storage_format == LZ4_FORMAT:
+            assert lz4_decompress is not None, \
+                "Blob {0} is lz4-compressed but lz4 isn't installed".format(
+                    data_sha256)
+            value = lz4_decompress(payload)
+        else:
+            return stored
+    except (zlib.error, ValueError):
+        return stored
+    if sha256(value).hexdigest() != data_sha256:
+        return stored
+    return value
+
+
+def _data_file_directory(data_sha256):
+    # Nest it 6 items deep so we don't have folders with too many files.
+    h = data_sha256
+    root = config.get_required('MSG_PARTS_DIRECTORY')
+    return os.path.join(root,
+                        h[0], h[1], h[2], h[3], h[4], h[5])
+
+
+def _save_to_s3(data_sha256, data):
+    assert len(data) > 0, "Need data to save!"
+    # TODO: store AWS credentials in a better way.
+    assert 'AWS_ACCESS_KEY_ID' in config, "Need AWS key!"
+    assert 'AWS_SECRET_ACCESS_KEY' in config, "Need AWS secret!"
+    assert 'MESSAGE_STORE_BUCKET_NAME' in config, \
+        "Need bucket name to store message data!"
+    bucket = _s3_bucket()
+
+    # See if it alreays exists and has the same hash
+    data_obj = bucket.get_key(data_sha256)
+    if data_obj:
+        assert data_obj.get_metadata('data_sha256') == data_sha256, \
+            "Block hash doesn't match what we previously stored on s3!"
+        # log.info("Block already exists on S3.")
+        return
+
+    data_obj = Key(bucket)
+    # if metadata:
+    #     assert type(metadata) is dict
+    #     for k, v in metadata.iteritems():
+    #         data_obj.set_metadata(k, v)
+    data_obj.set_metadata('data_sha256', data_sha256)
+    # data_obj.content_type = self.content_type  # Experimental
+    data_obj.key = data_sha256
+    # log.info("Writing data to S3 with hash {0}".format(data_sha256))
+    # def progress(done, total):
+    #     log.info("%.2f%% done" % (done/total * 100) )
+    # data_obj.set_contents_from_string(data, cb=progress)
+    data_obj.set_contents_from_string(data)
+
+
+def _save_to_disk(data_sha256, data):
+    """ Write the blob atomically (temp file + rename) and fsync the file,
+    unless an identical blob is already on disk.
+
+    Returns the directory written into, or None if nothing was written; the
+    caller is responsible for fsyncing it so the rename itself is durable.
+    """
+    directory = _data_file_directory(data_sha256)
+    path = os.path.join(directory, data_sha256)
+    if not get_blob_index().incref(data_sha256,
+                                   lambda: os.path.exists(path)):
+        return
+    mkdirp(directory)
+    tmp_path = '{0}.{1}.tmp'.format(path, threading.current_thread().ident)
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.rename(tmp_path, path)
+    return directory
+
+
+def _save_blob(data_sha256, data, storage_format=None):
+    # Hashes are always of the uncompressed bytes, so compression is
+    # invisible to dedup and to hash verification on read.
+    data = _encode_blob(data, storage_format)
+    if BLOB_STORE == 's3':
+        return _save_to_s3(data_sha256, data)
+    elif BLOB_STORE == 'pack':
+        return get_pack_store().put(data_sha256, data)
+    return _save_to_disk(data_sha256, data)
+
+
+def _disk_chunks(path, start, end, chunk_size):
+    with open(path, 'rb') as f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        for offset in xrange(start, min(end, len(m)), chunk_size):
+            yield m[offset:min(offset + chunk_size, end)]
+    finally:
+        m.close()
+
+
+def _s3_chunks(data_sha256, start, end, chunk_size):
+    data_obj = _s3_bucket().get_key(data_sha256)
+    if not data_obj:
+        raise IOError('No S3 key for hash {0}'.format(data_sha256))
+    data_obj.open_read(
+        headers={'Range': 'bytes={0}-{1}'.format(start, end - 1)})
+    try:
+        while True:
+            chunk = data_obj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        data_obj.close()
+
+
+class BlobIntegrityError(Exception):
+    """ Raised when a blob's stored bytes don't match its hash. """
+    pass
+
+
+# Hashes of blobs whose stored bytes have been checked in full. Blobs are
+# content-addressed and never rewritten in place, so a blob that checked out
+# once doesn't need checking before every range read.
+MAX_VERIFIED_BLOBS = 10000
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _mark_verified(data_sha256):
+    with _verified_lock:
+        _verified.pop(data_sha256, None)
+        _verified[data_sha256] = True
+        if len(_verified) > MAX_VERIFIED_BLOBS:
+            _verified.popitem(last=False)
+
+
+def _is_verified(data_sha256):
+    with _verified_lock:
+        return data_sha256 in _verified
+
+
+def _verify_chunks(chunks, data_sha256):
+    """ Pass `chunks` through, hashing as we go. The last chunk is withheld
+    until the hash checks out, so corrupt data is never delivered in full:
+    the stream ends with a BlobIntegrityError instead, which a client reading
+    a response of known length sees as a truncated download.
+    """
+    digest = sha256()
+    previous = None
+    for chunk in chunks:
+        digest.update(chunk)
+        if previous is not None:
+            yield previous
+        previous = chunk
+    if digest.hexdigest() != data_sha256:
+        log.error('Stored data for blob {0} does not match its hash; '
+                  'aborting the stream'.format(data_sha256))
+        raise BlobIntegrityError(
+            "Stored data doesn't match hash {0}".format(data_sha256))
+    _mark_verified(data_sha256)
+    if previous is not None:
+        yield previous
 
 
 class Blob(object):
@@ -36,17 +308,22 @@ class Blob(object):
             # NOTE: This is a placeholder for "empty bytes". If this doesn't
             # work as intended, it will trigger the hash assertion later.
             value = ""
-        elif hasattr(self, '_data'):
+        elif getattr(self, '_data', None) is not None:
             # on initial download we temporarily store data in memory
             value = self._data
-        elif STORE_MSG_ON_S3:
+        elif BLOB_STORE == 's3':
             value = self._get_from_s3()
+        elif BLOB_STORE == 'pack':
+            value = get_pack_store().get(self.data_sha256)
+            if value is None:
+                value = self._get_from_disk()
         else:
             value = self._get_from_disk()
 
         if value is None:
             log.error("Couldn't find data on disk!")
             return value
+        value = _decode_blob(value, self.data_sha256)
 
         assert self.data_sha256 == sha256(value).hexdigest(), \
             "Returned data doesn't match stored hash!"
@@ -60,10 +337,19 @@ class Blob(object):
         self.size = len(value)
         self.data_sha256 = sha256(value).hexdigest()
         if self.size > 0:
-            if STORE_MSG_ON_S3:
-                self._save_to_s3(value)
+            storage_format = _storage_format(
+                getattr(self, 'content_type', None))
+            blob_writer = get_blob_writer()
+            if blob_writer is None:
+                self._save(value, storage_format)
             else:
-                self._save_to_disk(value)
+                # Write-behind: keep the bytes around for reads until the
+                # writer pool has made them durable. Callers must wait on the
+                # writer before committing rows that reference this blob.
+                self._data = value
+                data_sha256 = self.data_sha256
+                blob_writer.submit(data_sha256, lambda: _save_blob(
+                    data_sha256, value, storage_format))
         else:
             log.warning("Not saving 0-length {1} {0}".format(
                 self.id, self.__class__.__name__))
@@ -73,54 +359,83 @@ class Blob(object):
         if self.size == 0:
             # nothing to do here
             return
-        if STORE_MSG_ON_S3:
+        if BLOB_STORE == 's3':
             self._delete_from_s3()
+        elif BLOB_STORE == 'pack':
+            if not get_pack_store().delete(self.data_sha256):
+                self._delete_from_disk()
         else:
             self._delete_from_disk()
         self.size = None
         self.data_sha256 = None
 
-    def _save_to_s3(self, data):
-        assert len(data) > 0, "Need data to save!"
-        # TODO: store AWS credentials in a better way.
-        assert 'AWS_ACCESS_KEY_ID' in config, "Need AWS key!"
-        assert 'AWS_SECRET_ACCESS_KEY' in config, "Need AWS secret!"
-        assert 'MESSAGE_STORE_BUCKET_NAME' in config, \
-            "Need bucket name to store message data!"
-        # Boto pools connections at the class level
-        conn = S3Connection(config.get('AWS_ACCESS_KEY_ID'),
-                            config.get('AWS_SECRET_ACCESS_KEY'))
-        bucket = conn.get_bucket(config.get('MESSAGE_STORE_BUCKET_NAME'))
-
-        # See if it alreays exists and has the same hash
-        data_obj = bucket.get_key(self.data_sha256)
-        if data_obj:
-            assert data_obj.get_metadata('data_sha256') == self.data_sha256, \
-                "Block hash doesn't match what we previously stored on s3!"
-            # log.info("Block already exists on S3.")
-            return
+    def _save(self, data, storage_format=None):
+        path = _save_blob(self.data_sha256, data, storage_format)
+        if path is not None:
+            fsync_path(path)
+
+    def open_stream(self, start=0, end=None, chunk_size=BLOB_CHUNK_SIZE):
+        """ Read bytes [start, end) of the blob without loading all of it.
 
-        data_obj = Key(bucket)
-        # if metadata:
-        #     assert type(metadata) is dict
-        #     for k, v in metadata.iteritems():
-        #         data_obj.set_metadata(k, v)
-        data_obj.set_metadata('data_sha256', self.data_sha256)
-        # data_obj.content_type = self.content_type  # Experimental
-        data_obj.key = self.data_sha256
-        # log.info("Writing data to S3 with hash {0}".format(self.data_sha256))
-        # def progress(done, total):
-        #     log.info("%.2f%% done" % (done/total * 100) )
-        # data_obj.set_contents_from_string(data, cb=progress)
-        data_obj.set_contents_from_string(data)
+        Returns an iterator of chunks of at most `chunk_size` bytes, or None
+        if the data can't be found or is corrupt. Streams of the whole blob
+        are hash-verified incrementally (see _verify_chunks). A range can't
+        be checked on its own, so before the first range read of a blob the
+        whole of it is read and checked. Compressed blobs can't be read by
+        range, so they are decoded in memory (compression is only used for
+        text-like parts).
+
+        The iterator doesn't touch this object, so it can outlive the
+        session it was loaded in.
+        """
+        if end is None or end > self.size:
+            end = self.size
+        if not self.size or start >= end:
+            return iter([])
+        if getattr(self, '_data', None) is not None:
+            return iter([self._data[start:end]])
+
+        try:
+            header = ''.join(self._stored_chunks(0, len(BLOB_MAGIC) + 1,
+                                                 chunk_size))
+        except (IOError, OSError):
+            header = ''
+        if not header:
+            log.error('No data for hash {0}'.format(self.data_sha256))
+            return None
+        if header.startswith(BLOB_MAGIC):
+            value = self.data
+            if value is None:
+                return None
+            return iter([value[start:end]])
+
+        if start == 0 and end == self.size:
+            return _verify_chunks(
+                self._stored_chunks(start, end, chunk_size), self.data_sha256)
+        if not _is_verified(self.data_sha256):
+            try:
+                for _ in _verify_chunks(
+                        self._stored_chunks(0, self.size, chunk_size),
+                        self.data_sha256):
+                    pass
+            except BlobIntegrityError:
+                return None
+        return self._stored_chunks(start, end, chunk_size)
+
+    def _stored_chunks(self, start, end, chunk_size):
+        """ Stored (possibly compressed) bytes [start, end), in chunks. """
+        assert self.data_sha256, "Can't get data with no hash!"
+        if BLOB_STORE == 's3':
+            return _s3_chunks(self.data_sha256, start, end, chunk_size)
+        elif BLOB_STORE == 'pack':
+            store = get_pack_store()
+            if store.contains(self.data_sha256):
+                return store.read(self.data_sha256, start, end, chunk_size)
+        return _disk_chunks(self._data_file_path, start, end, chunk_size)
 
     def _get_from_s3(self):
         assert self.data_sha256, "Can't get data with no hash!"
-        # Boto pools connections at the class level
-        conn = S3Connection(config.get('AWS_ACCESS_KEY_ID'),
-                            config.get('AWS_SECRET_ACCESS_KEY'))
-        bucket = conn.get_bucket(config.get('MESSAGE_STORE_BUCKET_NAME'))
-        data_obj = bucket.get_key(self.data_sha256)
+        data_obj = _s3_bucket().get_key(self.data_sha256)
         assert data_obj, "No data returned!"
         return data_obj.get_contents_as_string()
 
@@ -132,21 +447,12 @@ class Blob(object):
     @property
     def _data_file_directory(self):
         assert self.data_sha256
-        # Nest it 6 items deep so we don't have folders with too many files.
-        h = self.data_sha256
-        root = config.get_required('MSG_PARTS_DIRECTORY')
-        return os.path.join(root,
-                            h[0], h[1], h[2], h[3], h[4], h[5])
+        return _data_file_directory(self.data_sha256)
 
     @property
     def _data_file_path(self):
         return os.path.join(self._data_file_directory, self.data_sha256)
 
-    def _save_to_disk(self, data):
-        mkdirp(self._data_file_directory)
-        with open(self._data_file_path, 'wb') as f:
-            f.write(data)
-
     def _get_from_disk(self):
         try:
             with open(self._data_file_path, 'rb') as f:
@@ -157,4 +463,11 @@ class Blob(object):
             return None
 
     def _delete_from_disk(self):
-        remove_file(self._data_file_path)
+        # Other blocks may share this blob; only the last reference
+        # removes the file.
+        path = self._data_file_path
+        remaining = get_blob_index().decref(self.data_sha256,
+                                            lambda: remove_file(path))
+        if remaining is None:
+            log.warning('Blob {0} is not in the blob index; leaving it on '
+                        'disk'.format(self.data_sha256))
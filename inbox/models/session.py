@@ -91,9 +91,15 @@ class InboxSession(object):
         if ignore_soft_deletes:
             args['query_cls'] = InboxQuery
         sqlalchemy_session = Session(**args)
+        # Registered before the transaction log hook so that thread
+        # snapshots see up-to-date summaries.
+        from inbox.models.thread import maintain_thread_summaries
+        maintain_thread_summaries(sqlalchemy_session)
         if versioned:
             from inbox.models import Transaction
             from inbox.models.transaction import HasRevisions
+            from inbox.transactions.hub import notify_on_commit
+            notify_on_commit(sqlalchemy_session)
             self._session = versioned_session(
                 sqlalchemy_session, Transaction, HasRevisions)
         else:
@@ -139,6 +145,10 @@ class InboxSession(object):
     def flush(self):
         self._session.flush()
 
+    def execute(self, *args, **kwargs):
+        """ Execute a Core statement in the session's transaction. """
+        return self._session.execute(*args, **kwargs)
+
     def close(self):
         self._session.close()
 
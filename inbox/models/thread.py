@@ -1,6 +1,7 @@
 import itertools
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import (Column, Integer, String, DateTime, ForeignKey, Text,
+                        Boolean, Index, event, inspect)
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship, backref, validates, object_session
 from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
@@ -8,10 +9,10 @@ from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 from inbox.log import get_logger
 log = get_logger()
 
-from inbox.sqlalchemy_ext.util import JSON, Base36UID
+from inbox.sqlalchemy_ext.util import JSON, BigJSON, Base36UID
 
 from inbox.models.mixins import HasPublicID
-from inbox.models.base import MailSyncBase
+from inbox.models.base import MailSyncBase, MAX_INDEXABLE_LENGTH
 from inbox.models.transaction import HasRevisions
 from inbox.models.namespace import Namespace
 
@@ -20,6 +21,12 @@ from inbox.models.tag import Tag
 from inbox.models.message import Message, SpoolMessage
 
 
+def _message_participants(message):
+    return (tuple(entry) for entry in
+            itertools.chain(message.from_addr, message.to_addr,
+                            message.cc_addr, message.bcc_addr))
+
+
 class Thread(MailSyncBase, HasPublicID, HasRevisions):
     """ Threads are a first-class object in Inbox. This thread aggregates
         the relevant thread metadata from elsewhere so that clients can only
@@ -123,9 +130,7 @@ class Thread(MailSyncBase, HasPublicID, HasRevisions):
                 if isinstance(m, SpoolMessage) and not m.is_latest:
                     # Don't use old draft revisions to compute participants.
                     continue
-            p.update(tuple(entry) for entry in
-                     itertools.chain(m.from_addr, m.to_addr, m.cc_addr,
-                                     m.bcc_addr))
+            p.update(_message_participants(m))
         return list(p)
 
     @property
@@ -213,9 +218,31 @@ class Thread(MailSyncBase, HasPublicID, HasRevisions):
         return [message for message in self.messages if message.is_draft and
                 message.is_latest]
 
+    def update_summary(self):
+        """Recompute this thread's ThreadSummary from its messages and tags,
+        creating it if need be. Returns the summary."""
+        if self.summary is None:
+            self.summary = ThreadSummary()
+        summary = self.summary
+        summary.participants = self.participants
+        summary.message_public_ids = [m.public_id for m in self.messages
+                                      if not m.is_draft]
+        summary.draft_public_ids = [m.public_id for m in self.latest_drafts]
+        summary.tags = [{'name': tag.name, 'id': tag.public_id}
+                        for tag in self.tags]
+        summary.unread = any(tag.public_id == 'unread' for tag in self.tags)
+        return summary
+
     discriminator = Column('type', String(16))
     __mapper_args__ = {'polymorphic_on': discriminator}
 
+# make keyset-paginating a namespace's threads by recency fast
+Index('ix_thread_namespace_id_recentdate', Thread.namespace_id,
+      Thread.recentdate, Thread.id)
+# subject is TEXT, so only a prefix can be indexed
+Index('ix_thread_namespace_id_subject', Thread.namespace_id, Thread.subject,
+      mysql_length={'subject': MAX_INDEXABLE_LENGTH})
+
 
 class TagItem(MailSyncBase):
     """Mapping between user tags and threads."""
@@ -257,3 +284,162 @@ class TagItem(MailSyncBase):
     @property
     def namespace(self):
         return self.thread.namespace
+
+# make finding the threads with a given tag fast
+Index('ix_tagitem_tag_id_thread_id', TagItem.tag_id, TagItem.thread_id)
+
+
+class ThreadSummary(MailSyncBase):
+    """Denormalized per-thread data for listing threads: everything the API
+    would otherwise compute by loading all of a thread's messages and tags.
+
+    Kept up to date by `maintain_thread_summaries`, which recomputes the
+    summary of every thread touched by a flush.
+    """
+    thread_id = Column(Integer, ForeignKey(Thread.id, ondelete='CASCADE'),
+                       nullable=False, unique=True)
+    thread = relationship(
+        'Thread',
+        backref=backref('summary',
+                        uselist=False,
+                        cascade='all, delete-orphan',
+                        primaryjoin='and_(ThreadSummary.thread_id==Thread.id, '
+                                    'ThreadSummary.deleted_at.is_(None))'),
+        primaryjoin='and_(ThreadSummary.thread_id==Thread.id, '
+        'Thread.deleted_at.is_(None))')
+
+    participants = Column(BigJSON, nullable=True)
+    message_public_ids = Column(BigJSON, nullable=True)
+    draft_public_ids = Column(JSON, nullable=True)
+    tags = Column(JSON, nullable=True)
+    unread = Column(Boolean, nullable=False, default=False)
+
+    # The JSON columns don't track in-place changes, so these assign new
+    # values rather than mutating.
+    def add_message(self, message):
+        """Account for a new, non-draft message of the thread."""
+        if message.public_id not in self.message_public_ids:
+            self.message_public_ids = self.message_public_ids + \
+                [message.public_id]
+        participants = set(tuple(p) for p in self.participants)
+        participants.update(_message_participants(message))
+        self.participants = list(participants)
+
+    def add_tag(self, tag):
+        if tag.public_id not in [t['id'] for t in self.tags]:
+            self.tags = self.tags + [{'name': tag.name, 'id': tag.public_id}]
+        if tag.public_id == 'unread':
+            self.unread = True
+
+    def remove_tag(self, tag):
+        self.tags = [t for t in self.tags if t['id'] != tag.public_id]
+        if tag.public_id == 'unread':
+            self.unread = False
+
+
+# Message columns that a thread's summary is computed from. Changes to any
+# other column (flags, sync state, ...) leave the summary as it is.
+SUMMARY_MESSAGE_ATTRS = ('is_draft', 'from_addr', 'to_addr', 'cc_addr',
+                         'bcc_addr', 'thread_id', 'deleted_at')
+
+
+def _changed(obj, attrs):
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _thread_of(obj):
+    """The thread a message or tag item belonged to before the flush. A tag
+    item removed from its thread no longer has a `thread`, but its
+    attribute history still has it until the flush is over."""
+    if obj.thread is not None:
+        return obj.thread
+    previous = inspect(obj).attrs.thread.history.deleted
+    return previous[0] if previous else None
+
+
+def _summary_changes(session):
+    """The threads whose summaries must be recomputed, and the incremental
+    changes to make to the others' (as (thread, method name, argument)),
+    for everything in the flush."""
+    rebuild = set()
+    changes = []
+    for obj in session.new:
+        if isinstance(obj, Thread):
+            rebuild.add(obj)
+        elif isinstance(obj, Message) and obj.thread is not None:
+            thread = obj.thread
+            # New draft revisions supersede older ones, and messages older
+            # than the thread's latest (e.g. from a backfill) belong in the
+            # middle of its message list.
+            if obj.is_draft or obj.received_date < thread.recentdate:
+                rebuild.add(thread)
+            else:
+                changes.append((thread, 'add_message', obj))
+        elif isinstance(obj, TagItem) and obj.thread is not None:
+            changes.append((obj.thread, 'add_tag', obj.tag))
+
+    for obj in session.dirty:
+        if isinstance(obj, Thread):
+            # Threads that predate summaries get one when next written.
+            if obj.summary is None:
+                rebuild.add(obj)
+        elif isinstance(obj, Message):
+            if _changed(obj, SUMMARY_MESSAGE_ATTRS) and \
+                    obj.thread is not None:
+                rebuild.add(obj.thread)
+        elif isinstance(obj, TagItem):
+            thread = _thread_of(obj)
+            if thread is None:
+                continue
+            if _changed(obj, ('tag_id', 'thread_id')):
+                rebuild.add(thread)
+            elif _changed(obj, ('deleted_at',)):
+                changes.append((thread, 'remove_tag', obj.tag))
+
+    for obj in session.deleted:
+        if isinstance(obj, (Message, TagItem)):
+            thread = _thread_of(obj)
+            if thread is None:
+                continue
+            if isinstance(obj, Message):
+                # A participant may also be in the thread's other messages.
+                rebuild.add(thread)
+            else:
+                changes.append((thread, 'remove_tag', obj.tag))
+
+    return rebuild, changes
+
+
+def maintain_thread_summaries(session):
+    """Keep ThreadSummary rows current for everything written through
+    `session`.
+
+    Summaries are updated from the messages and tag items in the flush: a
+    new message's id and participants are added to its thread's summary,
+    and a tag item's tag is added or removed. Only changes that can't be
+    applied that way (new draft revisions, deleted messages, messages
+    older than the thread's latest, threads without a summary yet) load
+    the thread's messages and tags to recompute its summary.
+
+    This runs after the flush rather than before it so that new messages and
+    tags already have their public ids. The summaries themselves are then
+    written by the next flush (Session.commit() flushes until the session is
+    clean).
+    """
+    @event.listens_for(session, 'after_flush')
+    def after_flush(session, flush_context):
+        rebuild, changes = _summary_changes(session)
+        for thread, method, arg in changes:
+            if thread in rebuild or thread in session.deleted or \
+                    thread.is_deleted:
+                continue
+            if thread.summary is None:
+                rebuild.add(thread)
+            else:
+                getattr(thread.summary, method)(arg)
+        for thread in rebuild.difference(session.deleted):
+            if not thread.is_deleted:
+                thread.update_summary()
+
+    return session
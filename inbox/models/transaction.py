@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import (Column, Integer, String, Boolean, ForeignKey, Index,
+                        UniqueConstraint)
+from sqlalchemy.orm import relationship, object_session
 
+from inbox.config import config
 from inbox.log import get_logger
 log = get_logger()
 
@@ -32,6 +34,9 @@ class Transaction(MailSyncBase, Revision, HasPublicID):
     # Dictionary of any additional properties we wish to snapshot when the
     # transaction is generated.
     private_snapshot = Column(BigJSON)
+    # Whether the client sync API publishes this transaction, decided when
+    # it's written. NULL for transactions that predate the column.
+    publishable = Column(Boolean, nullable=True)
 
     def set_extra_attrs(self, obj):
         try:
@@ -50,10 +55,32 @@ class Transaction(MailSyncBase, Revision, HasPublicID):
         """Record the API's representation of `obj` at the time this
         transaction is generated, as well as any other properties we want to
         have available in the transaction log. Used for client syncing and
-        webhooks."""
+        webhooks.
+
+        With DEFER_TRANSACTION_SNAPSHOTS set, only deletes are snapshotted
+        here; the rest are left pending for inbox.transactions.snapshots to
+        record outside of the flush."""
+        if (self.command != 'delete' and
+                config.get('DEFER_TRANSACTION_SNAPSHOTS', False)):
+            return
+        self.record_snapshot(obj)
+
+    @property
+    def snapshot_pending(self):
+        return (self.public_snapshot is None and self.publishable is None and
+                self.command != 'delete')
+
+    def record_snapshot(self, obj):
         from inbox.api.kellogs import encode
         self.public_snapshot = encode(obj)
 
+        from inbox.transactions.client_sync import (publishable,
+                                                    previous_snapshot)
+        previous = None
+        if self.command == 'update':
+            previous = previous_snapshot(self, object_session(obj))
+        self.publishable = publishable(self, previous)
+
         from inbox.models.message import Message
         if isinstance(obj, Message):  # hack
             self.private_snapshot = {
@@ -62,4 +89,27 @@ class Transaction(MailSyncBase, Revision, HasPublicID):
                 'filenames': [part.filename for part in obj.parts if
                               part.is_attachment]}
 
+# make scanning a namespace's log (client sync, long polling) fast
+Index('ix_transaction_namespace_id_id', Transaction.namespace_id,
+      Transaction.id)
+# make finding the stamp for a point in time fast
+Index('ix_transaction_namespace_id_created_at', Transaction.namespace_id,
+      Transaction.created_at)
+# make the syncback and webhook services' scans by object type fast
+Index('ix_transaction_table_name_id', Transaction.table_name, Transaction.id)
+# make finding a record's previous transaction fast
+Index('ix_transaction_table_name_record_id_id', Transaction.table_name,
+      Transaction.record_id, Transaction.id)
+
 HasRevisions = gen_rev_role(Transaction)
+
+
+class TransactionCursor(MailSyncBase):
+    """ How far a consumer of the transaction log has got. Consumers record
+    their position here so that the log can be compacted and purged behind
+    them. """
+    name = Column(String(64), nullable=False)
+    # Everything up to and including this transaction has been consumed.
+    transaction_id = Column(Integer, nullable=False, server_default='0')
+
+    __table_args__ = (UniqueConstraint('name'),)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import (Column, Integer, Boolean, ForeignKey, Text, DateTime,
+                        UniqueConstraint)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.expression import true
 
@@ -30,6 +31,22 @@ class Webhook(MailSyncBase, HasPublicID):
     include_body = Column(Boolean, nullable=False)
     max_retries = Column(Integer, nullable=False, server_default='3')
     retry_interval = Column(Integer, nullable=False, server_default='60')
+    # Events per callback request; above 1, events are posted as a list.
+    max_batch_size = Column(Integer, nullable=False, server_default='1')
     active = Column(Boolean, nullable=False, server_default=true())
 
     min_processed_id = Column(Integer, nullable=False, server_default='0')
+
+
+class WebhookRetry(MailSyncBase):
+    """ An event a webhook failed to deliver, and when to try it again.
+    Stored so that retries survive restarts (see
+    inbox.transactions.retries). """
+    webhook_id = Column(ForeignKey(Webhook.id, ondelete='CASCADE'),
+                        nullable=False)
+    transaction_id = Column(Integer, nullable=False)
+    # Deliveries attempted so far.
+    attempts = Column(Integer, nullable=False, server_default='1')
+    retry_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (UniqueConstraint('webhook_id', 'transaction_id'),)
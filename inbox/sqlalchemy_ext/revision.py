@@ -59,7 +59,9 @@ The versioned properties of unchanged and deleted children appear similarly.
 See the tests for more examples. (TODO(emfree): actually write some tests.)
 """
 
-from sqlalchemy import Column, Integer, String, Enum, Index
+from collections import OrderedDict
+
+from sqlalchemy import Column, Integer, String, Enum
 from sqlalchemy import event, inspect
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.exc import UnmappedColumnError
@@ -71,9 +73,10 @@ from .util import BigJSON
 
 class Revision(object):
     """ All revision records in a single table (role). """
-    # Which object are we recording changes to?
-    table_name = Column(String(20), nullable=False, index=True)
-    record_id = Column(Integer, nullable=False, index=True)
+    # Which object are we recording changes to? Indexes are left to the
+    # concrete revision class, which knows how its table is scanned.
+    table_name = Column(String(20), nullable=False)
+    record_id = Column(Integer, nullable=False)
 
     command = Column(Enum('insert', 'update', 'delete'), nullable=False)
     delta = Column(BigJSON, nullable=True)
@@ -85,9 +88,6 @@ class Revision(object):
         pass
 
 
-Index('table_name_record_id', Revision.table_name, Revision.record_id)
-
-
 def gen_rev_role(rev_cls):
     """ Generate generic HasRevisions mixin.
 
@@ -136,58 +136,99 @@ def _get_properties(properties, items):
             for item in items]
 
 
-def delta(obj):
+class _DeltaPlan(object):
+    """ What delta() looks at for a mapper, worked out once per mapper
+    rather than on every flush. """
+    def __init__(self, mapper):
+        # property key -> keys of the columns it maps, in the order the
+        # columns appear from the mapper's table up to the root's.
+        self.columns = OrderedDict()
+        for m in mapper.iterate_to_root():
+            for col in m.local_table.c:
+                # get the MapperProperty related to the mapped column. this
+                # allows usage of MapperProperties that have a different
+                # keyname than that of the mapped column.
+                try:
+                    prop = mapper.get_property_by_column(col)
+                except UnmappedColumnError:
+                    # in the case of single table inheritance, there may be
+                    # columns on the mapped table intended for the subclass
+                    # only. the "unmapped" status of the subclass column on
+                    # the base class is a feature of the declarative module
+                    # as of sqla 0.5.2.
+                    continue
+                self.columns.setdefault(prop.key, []).append(col.key)
+        # Relationships which have versioned properties defined.
+        self.relationships = [
+            rel for rel in mapper.iterate_properties
+            if isinstance(rel, RelationshipProperty) and
+            'versioned_properties' in rel.info]
+
+
+_plans = {}
+
+
+def _plan(mapper):
+    plan = _plans.get(mapper)
+    if plan is None:
+        plan = _plans[mapper] = _DeltaPlan(mapper)
+    return plan
+
+
+def delta(obj, modified_only=True):
+    """ The changes to `obj` since it was loaded (or, for a new object, its
+    values), or None if there are none.
+
+    Only attributes which have been modified can have changes, and SQLAlchemy
+    notes those in the object's committed_state. By default only they are
+    looked at. With `modified_only` False, every mapped attribute is looked
+    at, loading any which are expired or deferred; the result is the same.
+    """
     obj_state = inspect(obj)
+    plan = _plan(obj_state.mapper)
+
+    if modified_only:
+        keys = [key for key in obj_state.committed_state
+                if key in plan.columns]
+    else:
+        keys = plan.columns.keys()
+        for key in keys:
+            # expired object attributes and also deferred cols might not be
+            # in the dict. force it to load no matter what by using getattr().
+            if key not in obj_state.dict:
+                getattr(obj, key)
 
     obj_changed = False
     d = {}
 
-    for m in obj_state.mapper.iterate_to_root():
-        for col in m.local_table.c:
-            # get the value of the attribute based on the MapperProperty
-            # related to the mapped column. this will allow usage of
-            # MapperProperties that have a different keyname than that of the
-            # mapped column.
-            try:
-                prop = obj_state.mapper.get_property_by_column(col)
-            except UnmappedColumnError:
-                # in the case of single table inheritance, there may be columns
-                # on the mapped table intended for the subclass only. the
-                # "unmapped" status of the subclass column on the base class is
-                # a feature of the declarative module as of sqla 0.5.2.
-                continue
-
-            # expired object attributes and also deferred cols might not be in
-            # the dict. force it to load no matter what by using getattr().
-            if prop.key not in obj_state.dict:
-                getattr(obj, prop.key)
-
-            added, unchanged, deleted = getattr(
-                obj_state.attrs, prop.key).history
-            if added:
-                # if the attribute had no value.
-                d[col.key] = added[0]
-                obj_changed = True
-            elif deleted:
-                d[col.key] = deleted[0]
-                obj_changed = True
+    for key in keys:
+        added, unchanged, deleted = getattr(obj_state.attrs, key).history
+        if added:
+            # if the attribute had no value.
+            value = added[0]
+        elif deleted:
+            value = deleted[0]
+        else:
             # do nothing for unchanged
-
-    # Check relationships which have versioned properties defined.
-    for prop in obj_state.mapper.iterate_properties:
-        if (isinstance(prop, RelationshipProperty) and 'versioned_properties'
-                in prop.info):
-            history = getattr(obj_state.attrs, prop.key).history
-            if not history.has_changes():
-                continue
-            changes = {}
-            versioned_properties = prop.info['versioned_properties']
-            changes['added'] = _get_properties(versioned_properties,
-                                               history.added)
-            changes['deleted'] = _get_properties(versioned_properties,
-                                                 history.deleted)
-            d[prop.key] = changes
-            obj_changed = True
+            continue
+        for col_key in plan.columns[key]:
+            d[col_key] = value
+        obj_changed = True
+
+    for prop in plan.relationships:
+        if modified_only and prop.key not in obj_state.committed_state:
+            continue
+        history = getattr(obj_state.attrs, prop.key).history
+        if not history.has_changes():
+            continue
+        changes = {}
+        versioned_properties = prop.info['versioned_properties']
+        changes['added'] = _get_properties(versioned_properties,
+                                           history.added)
+        changes['deleted'] = _get_properties(versioned_properties,
+                                             history.deleted)
+        d[prop.key] = changes
+        obj_changed = True
 
     if not obj_changed:
         return
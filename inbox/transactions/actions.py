@@ -8,19 +8,19 @@ TODO(emfree):
    still pending).
  * Add better logging.
 """
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import gevent
-from sqlalchemy import asc, or_, func
 
 from inbox.util.concurrency import retry_with_logging
 from inbox.log import get_logger
-from inbox.models.session import session_scope
-from inbox.models import (SpoolMessage, Tag, Thread,
-                                             Transaction)
+from inbox.models import SpoolMessage, Tag, Thread
 from inbox.actions import (get_queue, mark_read, mark_unread,
                                        archive, unarchive, star, unstar,
-                                       save_draft, delete_draft, rqworker)
+                                       save_draft, delete_draft, rqworker,
+                                       run_batch)
 from inbox.sendmail.base import send_draft
+from inbox.transactions.compaction import SYNCBACK_CURSOR_NAME
+from inbox.transactions.feed import ChangeFeed, Subscriber, get_feed
 
 
 class ActionRegistry(object):
@@ -29,6 +29,7 @@ class ActionRegistry(object):
     def __init__(self):
         self._actions_on_apply = defaultdict(set)
         self._actions_on_remove = defaultdict(set)
+        self.inverses = {}
 
     def __contains__(self, tag_public_id):
         return (tag_public_id in self._actions_on_apply or tag_public_id in
@@ -50,6 +51,9 @@ class ActionRegistry(object):
             self._actions_on_apply[tag_public_id].add(apply_action)
         if remove_action is not None:
             self._actions_on_remove[tag_public_id].add(remove_action)
+        if apply_action is not None and remove_action is not None:
+            self.inverses[apply_action] = remove_action
+            self.inverses[remove_action] = apply_action
 
     def on_apply(self, tag_public_id):
         """Returns the set of actions to execute when the tag with given public
@@ -62,11 +66,61 @@ class ActionRegistry(object):
         return self._actions_on_remove[tag_public_id]
 
 
-class SyncbackService(gevent.Greenlet):
-    """Asynchronously consumes the transaction log and executes syncback
-    actions."""
-
-    def __init__(self, poll_interval=1, chunk_size=22, run_immediately=True):
+class ActionBatcher(object):
+    """Coalesces the thread actions found in a pass over the log into one job
+    per (action, account), so that e.g. archiving thousands of threads is a
+    single job rather than thousands.
+
+    Only a thread's net change is kept: an action and its inverse (archive
+    then unarchive) cancel out, and repeats of an action run once. Actions
+    that aren't each other's inverses set independent state, so their
+    relative order doesn't matter.
+
+    Parameters
+    ----------
+    queue: rq.Queue
+    inverses: dict
+        Maps each action to its inverse, for those that have one.
+    """
+    def __init__(self, queue, inverses=None):
+        self.queue = queue
+        self.inverses = inverses or {}
+        # (account_id, thread_id, action or its inverse, whichever came
+        # first) -> [first action, last action]
+        self._changes = OrderedDict()
+
+    def add(self, action, account_id, thread_id):
+        inverse = self.inverses.get(action)
+        key = (account_id, thread_id, action)
+        if key not in self._changes and inverse is not None:
+            key = (account_id, thread_id, inverse)
+        change = self._changes.get(key)
+        if change is None:
+            self._changes[(account_id, thread_id, action)] = [action, action]
+        else:
+            change[1] = action
+
+    def flush(self):
+        pending = OrderedDict()
+        for (account_id, thread_id, _), (first, last) in \
+                self._changes.iteritems():
+            if self.inverses.get(first) is last:
+                # Back where it started.
+                continue
+            pending.setdefault((last, account_id), []).append(thread_id)
+        for (action, account_id), thread_ids in pending.iteritems():
+            self.queue.enqueue(run_batch, action, account_id, thread_ids)
+        self._changes.clear()
+
+
+class SyncbackService(gevent.Greenlet, Subscriber):
+    """Asynchronously consumes the transaction log, through the change feed,
+    and executes syncback actions. Its position in the log is durable, so
+    actions logged while it isn't running are executed when it restarts."""
+    table_names = {'thread', 'imapthread', 'easthread', 'spoolmessage'}
+    cursor_name = SYNCBACK_CURSOR_NAME
+
+    def __init__(self, poll_interval=None, run_immediately=True, feed=None):
 
         self.log = get_logger(purpose='actions')
         self.actions = ActionRegistry()
@@ -77,75 +131,72 @@ class SyncbackService(gevent.Greenlet):
         # refactor to bring those definitions into this file.
         self.queue = get_queue()
 
-        self.poll_interval = poll_interval
-        self.chunk_size = chunk_size
-        with session_scope() as db_session:
-            # Just start working from the head of the log.
-            # TODO(emfree): once we can do retry, persist a pointer into the
-            # transaction log and advance it only on syncback success.
-            self.minimum_id = db_session.query(
-                func.max(Transaction.id)).one()[0] or -1
+        if feed is None:
+            # Asking for a poll interval gets a feed of one's own.
+            feed = (get_feed() if poll_interval is None else
+                    ChangeFeed(poll_interval=poll_interval))
+        self.feed = feed
         gevent.Greenlet.__init__(self)
         if run_immediately:
             self.start()
 
-    def _process_log(self):
+    def process(self, transactions, db_session):
+        batcher = ActionBatcher(self.queue, self.actions.inverses)
+        for transaction in transactions:
+            try:
+                self._process_transaction(transaction, db_session, batcher)
+            except Exception:
+                # Don't let one bad entry hold up the rest of the log.
+                self.log.error('Error processing transaction {0}'.
+                               format(transaction.id), exc_info=True)
+        batcher.flush()
+
+    def _process_transaction(self, transaction, db_session, batcher):
         # TODO(emfree) handle the case that message/thread objects may have
         # been deleted in the interim
-        with session_scope() as db_session:
-            query = db_session.query(Transaction). \
-                filter(or_(Transaction.table_name == 'thread',
-                           Transaction.table_name == 'imapthread',
-                           Transaction.table_name == 'easthread',
-                           Transaction.table_name == 'spoolmessage'),
-                       Transaction.id > self.minimum_id). \
-                order_by(asc(Transaction.id)).yield_per(self.chunk_size)
-
-            # TODO(emfree) clean up this processing logic.
-            for transaction in query:
-                self.minimum_id = transaction.id
-                if transaction.table_name == 'spoolmessage':
-                    # TODO(emfree) handle deleted messages here
-                    # Note: For deletes, only syncback for SpoolMessages that
-                    # do not have a child_draft --kavya
-                    message = db_session.query(SpoolMessage). \
-                        get(transaction.record_id)
-                    account_id = message.namespace.account_id
-                    if transaction.command == 'insert':
-                        if transaction.delta.get('draft_copied_from') is None:
-                            self.queue.enqueue(save_draft, account_id,
-                                               message.id)
-                    elif (transaction.command == 'update' and
-                          transaction.delta.get('state') == 'sending'):
-                        self.queue.enqueue(send_draft, account_id, message.id)
-                    elif (transaction.command == 'update' and
-                          transaction.delta.get('state') == 'sent'):
-                        self.queue.enqueue(delete_draft, account_id,
-                                           message.inbox_uid)
-                    continue
-                thread = db_session.query(Thread).get(transaction.record_id)
-                account_id = thread.namespace.account_id
-
-                tagitems = transaction.delta.get('tagitems')
-                if tagitems is None:
-                    continue
-                added_tag_ids = [entry['tag_id'] for entry in tagitems['added']
-                                 if entry['action_pending']]
-
-                removed_tag_ids = [entry['tag_id'] for entry in
-                                   tagitems['deleted'] if
-                                   entry['action_pending']]
-                for tag_id in added_tag_ids:
-                    tag = db_session.query(Tag).get(tag_id)
-                    for action in self.actions.on_apply(tag.public_id):
-                        self.queue.enqueue(action, account_id, thread.id)
-
-                for tag_id in removed_tag_ids:
-                    tag = db_session.query(Tag).get(tag_id)
-                    for action in self.actions.on_remove(tag.public_id):
-                        # TODO(emfree): should have some notion of retrying
-                        # failed syncback actions here.
-                        self.queue.enqueue(action, account_id, thread.id)
+        # TODO(emfree) clean up this processing logic.
+        if transaction.table_name == 'spoolmessage':
+            # TODO(emfree) handle deleted messages here
+            # Note: For deletes, only syncback for SpoolMessages that
+            # do not have a child_draft --kavya
+            message = db_session.query(SpoolMessage). \
+                get(transaction.record_id)
+            account_id = message.namespace.account_id
+            if transaction.command == 'insert':
+                if transaction.delta.get('draft_copied_from') is None:
+                    self.queue.enqueue(save_draft, account_id,
+                                       message.id)
+            elif (transaction.command == 'update' and
+                  transaction.delta.get('state') == 'sending'):
+                self.queue.enqueue(send_draft, account_id, message.id)
+            elif (transaction.command == 'update' and
+                  transaction.delta.get('state') == 'sent'):
+                self.queue.enqueue(delete_draft, account_id,
+                                   message.inbox_uid)
+            return
+        thread = db_session.query(Thread).get(transaction.record_id)
+        account_id = thread.namespace.account_id
+
+        tagitems = transaction.delta.get('tagitems')
+        if tagitems is None:
+            return
+        added_tag_ids = [entry['tag_id'] for entry in tagitems['added']
+                         if entry['action_pending']]
+
+        removed_tag_ids = [entry['tag_id'] for entry in
+                           tagitems['deleted'] if
+                           entry['action_pending']]
+        for tag_id in added_tag_ids:
+            tag = db_session.query(Tag).get(tag_id)
+            for action in self.actions.on_apply(tag.public_id):
+                batcher.add(action, account_id, thread.id)
+
+        for tag_id in removed_tag_ids:
+            tag = db_session.query(Tag).get(tag_id)
+            for action in self.actions.on_remove(tag.public_id):
+                # TODO(emfree): should have some notion of retrying
+                # failed syncback actions here.
+                batcher.add(action, account_id, thread.id)
 
     def register_default_actions(self):
         self.actions.register_action('unread', mark_unread, mark_read)
@@ -158,9 +209,7 @@ class SyncbackService(gevent.Greenlet):
         self.register_default_actions()
         # Start the workers
         gevent.spawn(retry_with_logging, rqworker)
-        while True:
-            self._process_log()
-            gevent.sleep(self.poll_interval)
+        self.feed.subscribe(self)
 
     def _run(self):
         retry_with_logging(self._run_impl, self.log)
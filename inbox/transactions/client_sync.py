@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, or_
 from sqlalchemy.orm.exc import NoResultFound
 
 from inbox.models import Transaction
+from inbox.transactions.snapshots import ensure_snapshots
 
 
 def dict_delta(current_dict, previous_dict):
@@ -13,29 +14,29 @@ def dict_delta(current_dict, previous_dict):
             or previous_dict[k] != v}
 
 
-def should_publish_transaction(transaction, db_session):
+def publishable(transaction, previous_snapshot):
     """Returns True if the given transaction should actually be published by
-    the client sync API."""
+    the client sync API.
+
+    Parameters
+    ----------
+    transaction: Transaction
+    previous_snapshot: dict or None
+        The public snapshot of the previous transaction on the same record,
+        if any.
+    """
     if transaction.object_public_id is None:
         return False
-    if 'object' not in transaction.public_snapshot:
+    if (transaction.public_snapshot is None or
+            'object' not in transaction.public_snapshot):
         return False
-    if transaction.command == 'update':
+    if transaction.command == 'update' and previous_snapshot is not None:
         # Don't publish transactions if they don't result in publicly-visible
         # changes.
-        prev_revision = db_session.query(Transaction). \
-            filter(Transaction.table_name == transaction.table_name,
-                   Transaction.record_id == transaction.record_id,
-                   Transaction.namespace_id == transaction.namespace_id,
-                   Transaction.id < transaction.id). \
-            order_by(desc(Transaction.id)).first()
-
-        if (prev_revision is not None and prev_revision.public_snapshot is not
-                None):
-            public_delta = dict_delta(transaction.public_snapshot,
-                                      prev_revision.public_snapshot)
-            if not public_delta:
-                return False
+        public_delta = dict_delta(transaction.public_snapshot,
+                                  previous_snapshot)
+        if not public_delta:
+            return False
     if (transaction.public_snapshot.get('object') == 'file' and
             transaction.public_snapshot.get('filename') is None):
         # Don't publish transactions on Parts/Blocks if they're really just raw
@@ -44,6 +45,31 @@ def should_publish_transaction(transaction, db_session):
     return True
 
 
+def previous_snapshot(transaction, db_session):
+    """Returns the public snapshot of the transaction preceding the given one
+    on the same record, or None. Works for transactions that haven't been
+    written yet too."""
+    query = db_session.query(Transaction.public_snapshot). \
+        filter(Transaction.table_name == transaction.table_name,
+               Transaction.record_id == transaction.record_id)
+    if transaction.id is not None:
+        query = query.filter(Transaction.id < transaction.id)
+    previous = query.order_by(desc(Transaction.id)).first()
+    return previous[0] if previous is not None else None
+
+
+def should_publish_transaction(transaction, db_session):
+    """Returns True if the given transaction should actually be published by
+    the client sync API. The decision is made when the transaction is written
+    (see Transaction.take_snapshot); older transactions are checked here."""
+    if transaction.publishable is not None:
+        return transaction.publishable
+    previous = None
+    if transaction.command == 'update':
+        previous = previous_snapshot(transaction, db_session)
+    return publishable(transaction, previous)
+
+
 def create_event(transaction):
     """Returns a dictionary representing the JSON object that should be
     returned to the client for this transaction, or returns None if there are
@@ -89,8 +115,10 @@ def get_public_id_from_ts(namespace_id, timestamp, db_session):
     """
 
     dt = datetime.utcfromtimestamp(timestamp)
+    # Ordering by created_at first lets this be a single probe of the
+    # (namespace_id, created_at) index.
     transaction = db_session.query(Transaction). \
-        order_by(desc(Transaction.id)). \
+        order_by(desc(Transaction.created_at), desc(Transaction.id)). \
         filter(Transaction.created_at < dt,
                Transaction.namespace_id == namespace_id).first()
     if transaction is None:
@@ -146,20 +174,30 @@ def get_entries_from_public_id(namespace_id, events_start, db_session,
     except (ValueError, NoResultFound):
         raise ValueError('Invalid first_public_id parameter: {}'.
                          format(events_start))
+    # Transactions known not to be publishable are skipped by the query.
     query = db_session.query(Transaction). \
         order_by(asc(Transaction.id)). \
         filter(Transaction.namespace_id == namespace_id,
-               Transaction.id > internal_start_id)
+               Transaction.id > internal_start_id,
+               or_(Transaction.publishable == True,
+                   Transaction.publishable.is_(None)))
     events = []
     events_end = events_start
-    for transaction in query.yield_per(result_limit):
-
-        if should_publish_transaction(transaction, db_session):
-            event = create_event(transaction)
-            events.append(event)
-            events_end = transaction.public_id
-            if len(events) == result_limit:
-                break
+    last_id = internal_start_id
+    while len(events) < result_limit:
+        transactions = query.filter(Transaction.id > last_id). \
+            limit(result_limit).all()
+        if not transactions:
+            break
+        last_id = transactions[-1].id
+        ensure_snapshots(transactions)
+        for transaction in transactions:
+            if should_publish_transaction(transaction, db_session):
+                event = create_event(transaction)
+                events.append(event)
+                events_end = transaction.public_id
+                if len(events) == result_limit:
+                    break
 
     result = {
         'events_start': events_start,
@@ -0,0 +1,266 @@
+""" Compaction and retention of the transaction log.
+
+Every change to a versioned object adds a row to the log, with a full API
+snapshot of the object (a message's includes its body). Nothing ever removed
+them, so the log grew without bound. The CompactionService periodically
+shrinks the part of the log that no consumer still needs:
+
+ * Transactions older than the retention window are deleted.
+ * Transactions older than the compaction window are compacted: an update
+   superseded by a later transaction on the same record is deleted, and
+   message bodies are dropped from the snapshots that remain.
+
+Neither ever goes past the oldest live consumer. Active webhooks record
+their position as Webhook.min_processed_id (and hold on to the events they
+have yet to retry as WebhookRetry rows), and the syncback service records
+its position as a TransactionCursor. A cursor which hasn't moved for a week
+belongs to a consumer that's gone, and is ignored. API
+clients hold stamps (transaction public ids) that can't be enumerated, so
+the windows are what protect them: a client stamp older than the compaction
+window may no longer exist, in which case the client has to get a new stamp
+for a point in time (/sync/generate_stamp).
+
+The compaction service records its own progress as a TransactionCursor, so
+each transaction is only compacted once.
+
+Space reclaimed is the size of the deleted and stripped JSON columns; InnoDB
+reuses the freed pages but doesn't return them to the filesystem. For a
+partitioned log (see inbox.transactions.partition), dropping old partitions
+is cheaper than purging them row by row.
+"""
+from datetime import datetime, timedelta
+
+import gevent
+from sqlalchemy import func, tuple_
+
+from inbox.config import config
+from inbox.log import get_logger
+from inbox.models import (Message, SpoolMessage, Transaction,
+                          TransactionCursor, Webhook, WebhookRetry)
+from inbox.models.session import session_scope
+from inbox.util.concurrency import retry_with_logging
+
+DEFAULT_COMPACT_AFTER_DAYS = 7
+DEFAULT_RETENTION_DAYS = 90
+# Seconds between passes.
+DEFAULT_INTERVAL = 3600
+# Transactions handled per database transaction.
+BATCH_SIZE = 1000
+# Cursors that haven't moved for this long are ignored.
+STALE_CURSOR_AGE = timedelta(days=7)
+
+CURSOR_NAME = 'compaction'
+SYNCBACK_CURSOR_NAME = 'syncback'
+
+MESSAGE_TABLES = (Message.__tablename__, SpoolMessage.__tablename__)
+
+
+def record_position(name, transaction_id):
+    """ Record that the consumer called `name` has consumed the log up to
+    and including `transaction_id`. """
+    with session_scope(versioned=False) as db_session:
+        cursor = db_session.query(TransactionCursor). \
+            filter(TransactionCursor.name == name).first()
+        if cursor is None:
+            cursor = TransactionCursor(name=name)
+            db_session.add(cursor)
+        cursor.transaction_id = transaction_id
+        db_session.commit()
+
+
+def _session():
+    # Transactions are deleted in bulk, which InboxQuery doesn't support.
+    return session_scope(versioned=False, ignore_soft_deletes=False)
+
+
+def _last_id_before(db_session, cutoff):
+    return db_session.query(func.max(Transaction.id)). \
+        filter(Transaction.created_at < cutoff).scalar() or 0
+
+
+def consumer_horizon(db_session, stale_before):
+    """ The id of the last transaction every live consumer has consumed, or
+    None if there are no live consumers. """
+    positions = [position for position, in db_session.query(
+        Webhook.min_processed_id).filter(Webhook.active == True)]
+    positions.extend(position for position, in db_session.query(
+        TransactionCursor.transaction_id).filter(
+            TransactionCursor.name != CURSOR_NAME,
+            TransactionCursor.updated_at >= stale_before))
+    # Stored webhook retries still need their transactions.
+    retry_from = db_session.query(func.min(WebhookRetry.transaction_id)). \
+        join(Webhook, Webhook.id == WebhookRetry.webhook_id). \
+        filter(Webhook.active == True).scalar()
+    if retry_from is not None:
+        positions.append(retry_from - 1)
+    return min(positions) if positions else None
+
+
+def _json_size(column):
+    return func.coalesce(func.sum(
+        func.coalesce(func.length(column), 0)), 0)
+
+
+def _deleted_size(query):
+    """ Size of the JSON columns of the transactions matched by `query`. """
+    return int(query.with_entities(
+        _json_size(Transaction.delta) +
+        _json_size(Transaction.public_snapshot) +
+        _json_size(Transaction.private_snapshot)).scalar())
+
+
+class CompactionService(gevent.Greenlet):
+    """
+    Parameters
+    ----------
+    compact_after, retain_for : timedelta
+        Age at which transactions are compacted and deleted.
+    interval : int
+        Seconds between passes.
+    """
+    def __init__(self, compact_after=None, retain_for=None,
+                 interval=DEFAULT_INTERVAL, batch_size=BATCH_SIZE):
+        self.compact_after = compact_after or timedelta(
+            days=config.get('TRANSACTION_COMPACT_AFTER_DAYS',
+                            DEFAULT_COMPACT_AFTER_DAYS))
+        self.retain_for = retain_for or timedelta(
+            days=config.get('TRANSACTION_RETENTION_DAYS',
+                            DEFAULT_RETENTION_DAYS))
+        self.interval = interval
+        self.batch_size = batch_size
+        self.log = get_logger()
+        gevent.Greenlet.__init__(self)
+
+    def _run(self):
+        return retry_with_logging(self._run_impl, self.log)
+
+    def _run_impl(self):
+        while True:
+            self.compact()
+            gevent.sleep(self.interval)
+
+    def compact(self, now=None):
+        """ Run one pass over the log.
+
+        Returns
+        -------
+        dict
+            The number of transactions purged and collapsed, the number of
+            snapshots stripped of their body and the bytes reclaimed.
+        """
+        now = now or datetime.utcnow()
+        stats = {'purged': 0, 'collapsed': 0, 'stripped': 0, 'bytes': 0}
+        with _session() as db_session:
+            horizon = consumer_horizon(db_session, now - STALE_CURSOR_AGE)
+            purge_upto = _last_id_before(db_session, now - self.retain_for)
+            compact_upto = _last_id_before(db_session,
+                                           now - self.compact_after)
+            start = db_session.query(TransactionCursor.transaction_id). \
+                filter(TransactionCursor.name == CURSOR_NAME).scalar() or 0
+        if horizon is not None:
+            purge_upto = min(purge_upto, horizon)
+            compact_upto = min(compact_upto, horizon)
+
+        self._purge(purge_upto, stats)
+        position = max(start, purge_upto)
+        while position < compact_upto:
+            position = self._compact_batch(position, compact_upto, stats)
+            record_position(CURSOR_NAME, position)
+
+        self.log.info('Compacted transaction log: purged {purged}, collapsed '
+                      '{collapsed}, stripped {stripped} transactions, '
+                      'reclaimed {bytes} bytes'.format(**stats))
+        return stats
+
+    def _purge(self, upto, stats):
+        """ Delete the transactions with ids up to `upto`. """
+        while True:
+            with _session() as db_session:
+                ids = [id_ for id_, in db_session.query(Transaction.id).
+                       filter(Transaction.id <= upto).
+                       order_by(Transaction.id).limit(self.batch_size)]
+                if not ids:
+                    return
+                query = db_session.query(Transaction). \
+                    filter(Transaction.id >= ids[0],
+                           Transaction.id <= ids[-1])
+                stats['bytes'] += _deleted_size(query)
+                stats['purged'] += query.delete(synchronize_session=False)
+                db_session.commit()
+
+    def _compact_batch(self, after, upto, stats):
+        """ Compact the next batch of transactions with ids in (after, upto].
+        Returns the id of the last transaction in the batch. """
+        with _session() as db_session:
+            rows = db_session.query(Transaction.id, Transaction.table_name,
+                                    Transaction.record_id,
+                                    Transaction.command). \
+                filter(Transaction.id > after, Transaction.id <= upto). \
+                order_by(Transaction.id).limit(self.batch_size).all()
+            if not rows:
+                return upto
+
+            # The latest transaction on each record the batch touches.
+            records = {(table_name, record_id)
+                       for _, table_name, record_id, _ in rows}
+            latest = {(table_name, record_id): id_
+                      for table_name, record_id, id_ in db_session.query(
+                          Transaction.table_name, Transaction.record_id,
+                          func.max(Transaction.id)).
+                      filter(tuple_(Transaction.table_name,
+                                    Transaction.record_id).in_(records),
+                             Transaction.id <= upto).
+                      group_by(Transaction.table_name,
+                               Transaction.record_id)}
+            superseded = [id_ for id_, table_name, record_id, command in rows
+                          if command == 'update' and
+                          id_ < latest[(table_name, record_id)]]
+            if superseded:
+                query = db_session.query(Transaction). \
+                    filter(Transaction.id.in_(superseded))
+                stats['bytes'] += _deleted_size(query)
+                stats['collapsed'] += query.delete(synchronize_session=False)
+                self._reset_publishable(db_session, rows, latest, superseded)
+
+            superseded = set(superseded)
+            message_ids = [id_ for id_, table_name, _, _ in rows
+                           if table_name in MESSAGE_TABLES and
+                           id_ not in superseded]
+            if message_ids:
+                self._strip_bodies(db_session, message_ids, stats)
+            db_session.commit()
+            return rows[-1][0]
+
+    def _reset_publishable(self, db_session, rows, latest, superseded):
+        """ An update is stored as unpublishable when it shows nothing its
+        predecessor didn't. Once that predecessor is collapsed, clients
+        syncing from before it would never see the change, so the decision
+        is left to be made again (against the new predecessor) when the
+        update is read. """
+        superseded = set(superseded)
+        survivors = {latest[(table_name, record_id)]
+                     for id_, table_name, record_id, _ in rows
+                     if id_ in superseded}
+        db_session.query(Transaction). \
+            filter(Transaction.id.in_(survivors),
+                   Transaction.command == 'update',
+                   Transaction.publishable == False,
+                   Transaction.public_snapshot.isnot(None)). \
+            update({'publishable': None}, synchronize_session=False)
+
+    def _strip_bodies(self, db_session, transaction_ids, stats):
+        for transaction in db_session.query(Transaction).filter(
+                Transaction.id.in_(transaction_ids)):
+            snapshot = transaction.public_snapshot
+            if snapshot is None:
+                # Deferred and not recorded yet, or its object was deleted
+                # before it could be.
+                continue
+            body = snapshot.get('body')
+            if body is None:
+                continue
+            stats['bytes'] += len(body.encode('utf-8'))
+            snapshot = dict(snapshot)
+            snapshot['body'] = None
+            transaction.public_snapshot = snapshot
+            stats['stripped'] += 1
@@ -0,0 +1,91 @@
+""" HTTP delivery of webhook events.
+
+Every webhook request used to go out through a bare `requests.post`, opening
+a new TLS connection per event, one event at a time per hook, and recording
+the hook's progress in the database after each one. Now
+
+ * all requests go through one session per process, which keeps a pool of
+   keep-alive connections to each callback host (WEBHOOK_POOL_SIZE per host);
+ * each hook has up to WEBHOOK_CONCURRENCY requests in flight, each bounded
+   by WEBHOOK_TIMEOUT seconds, so a slow endpoint holds up only its own hook;
+ * hooks with a max_batch_size above 1 get up to that many queued events per
+   request, posted as a list;
+ * each hook's progress is tracked in memory by a Checkpoint and written to
+   its min_processed_id every WEBHOOK_CHECKPOINT_INTERVAL seconds.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+from inbox.config import config
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_HOSTS = 100
+DEFAULT_TIMEOUT = 10
+
+_session = None
+
+
+def get_session():
+    """ The process's session for webhook requests. """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.get('WEBHOOK_POOL_HOSTS',
+                                        DEFAULT_POOL_HOSTS),
+            pool_maxsize=config.get('WEBHOOK_POOL_SIZE', DEFAULT_POOL_SIZE))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _session = session
+    return _session
+
+
+def post(url, data):
+    """ POST the JSON `data` to `url` over a pooled connection. """
+    # OMG WTF TODO (emfree): Do NOT set verify=False in prod!
+    return get_session().post(
+        url, data=data, headers={'content-type': 'application/json'},
+        verify=False, timeout=config.get('WEBHOOK_TIMEOUT', DEFAULT_TIMEOUT))
+
+
+class EventData(object):
+    """Keeps track of the data from a single transaction log entry, together
+    with some bookkeeping for retrying."""
+    def __init__(self, transaction):
+        self.id = transaction.id
+        # Set once the event is stored with the RetryScheduler.
+        self.retry_ts = 0
+        self.retry_count = 0
+        self.snapshot = transaction.public_snapshot
+
+
+class Checkpoint(object):
+    """ The progress of a hook through the transaction log, when its events
+    are delivered concurrently and so finish out of order.
+
+    Events are added when they're queued and marked done once they've been
+    delivered, stored for a retry or given up on. `position` is the id up to
+    which every event is done, which is what can be stored as the hook's
+    min_processed_id.
+    """
+    def __init__(self, position):
+        self._done_through = position
+        self._latest = position
+        self._pending = set()
+
+    def add(self, id_):
+        self._pending.add(id_)
+        self._latest = max(self._latest, id_)
+
+    def done(self, id_):
+        self._pending.discard(id_)
+
+    @property
+    def position(self):
+        if self._pending:
+            position = min(self._pending) - 1
+        else:
+            position = self._latest
+        # Never back: events up to here were already done.
+        self._done_through = max(self._done_through, position)
+        return self._done_through
@@ -0,0 +1,195 @@
+""" A single reader of the transaction log for all of a process's consumers.
+
+The syncback service, the webhook service and the long-polling client sync
+API used to poll the log independently, each with its own chunking and
+cursor. Now each is a subscriber to the process's ChangeFeed, which reads
+the log a batch at a time and hands every subscriber the part of the batch
+it cares about:
+
+ * Each batch starts with one scan of the ids, namespaces and tables of the
+   next `batch_size` transactions after a position. Subscribers at the same
+   position share the scan; one that's behind, or that keeps failing, is
+   read for separately, so it never holds back the others.
+ * Subscribers that want whole transactions name the tables they want, and
+   the matching transactions are loaded (and their snapshots decoded, or
+   recorded if they were deferred) once per read, for all of them.
+ * Subscribers that only need to know something changed, like the long-poll
+   hub, get the scanned (id, namespace id, table name) rows.
+
+A subscriber has a `position`: the id of the last transaction it has
+processed. The feed advances it after each batch the subscriber handles
+without raising, and records it as a TransactionCursor if the subscriber
+has a `cursor_name`, so that it resumes from there after a restart. A
+subscriber that fails is handed the same transactions again on the next
+pass.
+
+Batch size and poll interval are configured once for the process, by
+CHANGE_FEED_BATCH_SIZE and CHANGE_FEED_POLL_INTERVAL.
+"""
+from collections import defaultdict
+
+import gevent
+from sqlalchemy import func
+
+from inbox.config import config
+from inbox.log import get_logger
+from inbox.models import Transaction, TransactionCursor
+from inbox.models.session import session_scope
+from inbox.transactions.compaction import record_position
+from inbox.transactions.snapshots import ensure_snapshots
+
+DEFAULT_POLL_INTERVAL = 1
+DEFAULT_BATCH_SIZE = 500
+
+
+class Subscriber(object):
+    """ Base class for consumers of the change feed.
+
+    Attributes
+    ----------
+    table_names : set of str or None
+        Tables whose transactions the subscriber wants whole; None for all.
+    full : bool
+        Whether the subscriber wants whole transactions, or just the
+        (id, namespace id, table name) rows of every transaction.
+    cursor_name : str or None
+        Name to record the subscriber's position under, if it should persist.
+    position : int or None
+        Id of the last transaction processed. If None when the subscriber
+        subscribes, it starts from its recorded position or, failing that,
+        the end of the log.
+    """
+    table_names = None
+    full = True
+    cursor_name = None
+    position = None
+
+    def process(self, entries, db_session):
+        """ Handle the next entries of the log, in id order. Called with an
+        empty list when a batch has nothing for the subscriber. """
+        raise NotImplementedError
+
+
+class ChangeFeed(object):
+    """
+    Parameters
+    ----------
+    poll_interval : float
+        Seconds between checks of the log once the subscribers are caught up.
+    batch_size : int
+        Number of transactions read at a time.
+    """
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.log = get_logger()
+        self._subscribers = []
+        self._reader = None
+
+    def subscribe(self, subscriber):
+        if subscriber.position is None:
+            subscriber.position = self._initial_position(subscriber)
+        if subscriber not in self._subscribers:
+            self._subscribers.append(subscriber)
+        if self._reader is None or self._reader.dead:
+            self._reader = gevent.spawn(self._run)
+
+    def unsubscribe(self, subscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def _initial_position(self, subscriber):
+        with session_scope() as db_session:
+            if subscriber.cursor_name is not None:
+                position = db_session.query(
+                    TransactionCursor.transaction_id).filter(
+                        TransactionCursor.name ==
+                        subscriber.cursor_name).scalar()
+                if position is not None:
+                    return position
+            return db_session.query(func.max(Transaction.id)).scalar() or 0
+
+    def _run(self):
+        while self._subscribers:
+            try:
+                more = self.process_batch()
+            except Exception:
+                self.log.error('Error reading the transaction log',
+                               exc_info=True)
+                more = False
+            if not more:
+                gevent.sleep(self.poll_interval)
+
+    def process_batch(self):
+        """ Read the next batch of the log for each subscriber and hand it
+        over. Returns whether there's more to read right away. """
+        # Subscribers at the same position (normally all of them, once
+        # they've caught up) share a read. One that's behind, or keeps
+        # failing, gets reads of its own and holds back nobody else.
+        groups = defaultdict(list)
+        for subscriber in self._subscribers:
+            groups[subscriber.position].append(subscriber)
+        more = False
+        for start in sorted(groups):
+            more = self._process_group(start, groups[start]) or more
+        return more
+
+    def _process_group(self, start, subscribers):
+        """ Hand the batch after `start` to the given subscribers. Returns
+        whether the batch was full and some subscriber took it. """
+        with session_scope() as db_session:
+            rows = db_session.query(Transaction.id, Transaction.namespace_id,
+                                    Transaction.table_name). \
+                filter(Transaction.id > start). \
+                order_by(Transaction.id).limit(self.batch_size).all()
+            if not rows:
+                return False
+            end = rows[-1][0]
+
+            wanted = {}
+            for subscriber in subscribers:
+                if subscriber.full:
+                    wanted[subscriber] = [
+                        id_ for id_, _, table_name in rows
+                        if subscriber.table_names is None or
+                        table_name in subscriber.table_names]
+            ids = set().union(*wanted.values())
+            transactions = {}
+            if ids:
+                transactions = {transaction.id: transaction for transaction
+                                in db_session.query(Transaction).filter(
+                                    Transaction.id.in_(ids))}
+                ensure_snapshots(transactions.values())
+
+            advanced = False
+            for subscriber in subscribers:
+                if subscriber.full:
+                    entries = [transactions[id_] for id_ in wanted[subscriber]
+                               if id_ in transactions]
+                else:
+                    entries = rows
+                try:
+                    subscriber.process(entries, db_session)
+                except Exception:
+                    self.log.error('Error in change feed subscriber {0}'.
+                                   format(subscriber), exc_info=True)
+                    continue
+                advanced = True
+                if subscriber.position < end:
+                    subscriber.position = end
+                    if subscriber.cursor_name is not None:
+                        record_position(subscriber.cursor_name, end)
+        return advanced and len(rows) == self.batch_size
+
+
+_feed = None
+
+
+def get_feed():
+    global _feed
+    if _feed is None:
+        _feed = ChangeFeed(
+            config.get('CHANGE_FEED_POLL_INTERVAL', DEFAULT_POLL_INTERVAL),
+            config.get('CHANGE_FEED_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    return _feed
@@ -0,0 +1,139 @@
+""" In-process notification of new transaction log entries.
+
+Long-polling API clients wait here for their namespace to change instead of
+re-querying the log on a timer. While anyone is waiting, the hub subscribes
+to the process's change feed (see inbox.transactions.feed), which tells it
+about each batch of new transactions from the head of the log on, and wakes
+the waiters for the namespaces in the batch. A new waiter checks its own
+namespace once, with an indexed query, for anything from before that. Idle
+waiters therefore cost a greenlet and an Event each, not a query each.
+
+Commits made through an InboxSession in this process notify the hub
+directly, so changes made by this process (e.g. through the API) wake
+waiters without waiting for the next poll.
+"""
+from collections import defaultdict
+
+from gevent.event import Event
+from sqlalchemy import event, func
+
+from inbox.models import Transaction
+from inbox.models.session import session_scope
+from inbox.transactions.feed import Subscriber, get_feed
+
+
+class ChangeHub(Subscriber):
+    """
+    Parameters
+    ----------
+    feed : ChangeFeed
+        The feed to follow the log through; the process's by default.
+    """
+    # Only needs to know which namespaces changed.
+    full = False
+
+    def __init__(self, feed=None):
+        self._feed = feed
+        # namespace id -> set of Events
+        self._waiters = defaultdict(set)
+        # namespace id -> highest transaction id known to exist
+        self._latest = {}
+        self._subscribed = False
+
+    @property
+    def feed(self):
+        if self._feed is None:
+            self._feed = get_feed()
+        return self._feed
+
+    def wait(self, namespace_id, after_id, timeout):
+        """ Block until the namespace has a transaction with id greater than
+        `after_id`, or `timeout` seconds pass.
+
+        Returns
+        -------
+        bool
+            Whether there are new transactions.
+        """
+        if self._latest.get(namespace_id, 0) > after_id:
+            return True
+        waiter = Event()
+        self._waiters[namespace_id].add(waiter)
+        try:
+            if not self._subscribed:
+                # From the head of the log; never further back, which would
+                # rescan everyone's transactions (and, sharing the feed,
+                # hold up the other subscribers).
+                self.position = None
+                self.feed.subscribe(self)
+                self._subscribed = True
+            # The feed reports everything after its position. Anything in
+            # this namespace from before that is found by looking once.
+            with session_scope() as db_session:
+                latest = db_session.query(func.max(Transaction.id)). \
+                    filter(Transaction.namespace_id == namespace_id).scalar()
+            if latest is not None:
+                self.notify(namespace_id, latest)
+            if self._latest.get(namespace_id, 0) > after_id:
+                return True
+            return waiter.wait(timeout)
+        finally:
+            waiters = self._waiters[namespace_id]
+            waiters.discard(waiter)
+            if not waiters:
+                del self._waiters[namespace_id]
+            if not self._waiters and self._subscribed:
+                self.feed.unsubscribe(self)
+                self._subscribed = False
+
+    def notify(self, namespace_id, transaction_id):
+        """ Record that the namespace has a transaction with the given id,
+        waking anyone waiting on it. """
+        if transaction_id <= self._latest.get(namespace_id, 0):
+            return
+        self._latest[namespace_id] = transaction_id
+        for waiter in self._waiters.get(namespace_id, ()):
+            waiter.set()
+
+    def process(self, rows, db_session):
+        latest = {}
+        for id_, namespace_id, _ in rows:
+            latest[namespace_id] = max(id_, latest.get(namespace_id, 0))
+        for namespace_id, transaction_id in latest.iteritems():
+            self.notify(namespace_id, transaction_id)
+
+
+_hub = None
+
+
+def get_hub():
+    global _hub
+    if _hub is None:
+        _hub = ChangeHub()
+    return _hub
+
+
+def notify_on_commit(session):
+    """ Tell this process's hub about the transactions `session` commits.
+    """
+    @event.listens_for(session, 'after_flush')
+    def after_flush(session, flush_context):
+        from inbox.models import Transaction
+        pending = session.info.setdefault('new_transactions', {})
+        for obj in session.new:
+            if isinstance(obj, Transaction):
+                pending[obj.namespace_id] = max(
+                    obj.id, pending.get(obj.namespace_id, 0))
+
+    @event.listens_for(session, 'after_commit')
+    def after_commit(session):
+        pending = session.info.pop('new_transactions', {})
+        if pending and _hub is not None:
+            for namespace_id, transaction_id in pending.iteritems():
+                _hub.notify(namespace_id, transaction_id)
+
+    @event.listens_for(session, 'after_rollback')
+    def after_rollback(session):
+        session.info.pop('new_transactions', None)
+
+    return session
@@ -0,0 +1,119 @@
+""" Finding the webhooks whose lenses may match a transaction.
+
+Checking every hook in a namespace against every new message runs each
+hook's chain of lens filters over the message's snapshot, so the work grows
+with hooks times messages. Most lenses have at least one criterion that
+must match exactly (a thread, an address, a filename, a subject or a tag),
+and a message can only match the lens if it has that exact value. Hooks are
+indexed by their lens's most selective such criterion; a message's values
+for those criteria are gathered in one pass over its snapshot, and only the
+hooks indexed under one of them (plus the few hooks with no exact criteria,
+e.g. only regular expressions or dates) are checked in full.
+"""
+from collections import defaultdict
+import itertools
+
+# (lens attribute, indexed field), most selective first.
+INDEXED_ATTRS = [('thread_public_id', 'thread'),
+                 ('from_addr', 'from'),
+                 ('to_addr', 'to'),
+                 ('cc_addr', 'cc'),
+                 ('bcc_addr', 'bcc'),
+                 ('any_email', 'email'),
+                 ('filename', 'filename'),
+                 ('subject', 'subject'),
+                 ('tag', 'tag')]
+
+ADDRESS_FIELDS = ('to', 'from', 'cc', 'bcc')
+
+
+def _is_regex(value):
+    return value.startswith('/') and value.endswith('/')
+
+
+def index_key(lens):
+    """ The (field, value) to index `lens` under, or None if it has no
+    criterion that must match exactly. """
+    for attr, field in INDEXED_ATTRS:
+        value = getattr(lens, attr)
+        if value is None:
+            continue
+        # Thread ids are always compared exactly.
+        if field == 'thread' or not _is_regex(value):
+            return (field, value)
+    return None
+
+
+def transaction_keys(transaction):
+    """ The (field, value) pairs of the message in `transaction` that a lens
+    could be indexed under. """
+    snapshot = transaction.public_snapshot or {}
+    private_snapshot = transaction.private_snapshot or {}
+    keys = set()
+    if snapshot.get('thread') is not None:
+        keys.add(('thread', snapshot['thread']))
+    for field in ADDRESS_FIELDS:
+        # Lenses match either the name or the address of a participant.
+        for value in itertools.chain.from_iterable(
+                participant.itervalues()
+                for participant in snapshot.get(field) or ()):
+            keys.add((field, value))
+            keys.add(('email', value))
+    for filename in private_snapshot.get('filenames') or ():
+        keys.add(('filename', filename))
+    if snapshot.get('subject') is not None:
+        keys.add(('subject', snapshot['subject']))
+    for tag in snapshot.get('tags') or ():
+        keys.add(('tag', tag['name']))
+    return keys
+
+
+class LensIndex(object):
+    """ Items (e.g. webhook workers), each with a lens, indexed so that the
+    ones whose lens may match a transaction can be found quickly. """
+    def __init__(self):
+        # namespace id -> {(field, value): set of items}
+        self._indexed = defaultdict(lambda: defaultdict(set))
+        # namespace id -> set of items whose lens has no exact criteria
+        self._unindexed = defaultdict(set)
+        # item -> (namespace id, key or None)
+        self._entries = {}
+
+    def add(self, namespace_id, item, lens):
+        self.remove(item)
+        key = index_key(lens)
+        if key is None:
+            self._unindexed[namespace_id].add(item)
+        else:
+            self._indexed[namespace_id][key].add(item)
+        self._entries[item] = (namespace_id, key)
+
+    def remove(self, item):
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+        namespace_id, key = entry
+        if key is None:
+            self._unindexed[namespace_id].discard(item)
+            if not self._unindexed[namespace_id]:
+                del self._unindexed[namespace_id]
+            return
+        indexed = self._indexed[namespace_id]
+        indexed[key].discard(item)
+        if not indexed[key]:
+            del indexed[key]
+        if not indexed:
+            del self._indexed[namespace_id]
+
+    def candidates(self, transaction):
+        """ The items whose lens may match `transaction`; the rest can't.
+        """
+        namespace_id = transaction.namespace_id
+        candidates = set(self._unindexed.get(namespace_id, ()))
+        indexed = self._indexed.get(namespace_id)
+        if indexed:
+            for key in transaction_keys(transaction):
+                items = indexed.get(key)
+                if items:
+                    candidates.update(items)
+        return candidates
@@ -0,0 +1,129 @@
+""" Optional range partitioning of the transaction log by time.
+
+The log only ever grows, and everything that reads it wants recent entries.
+Partitioning it into one MySQL partition per period keeps each partition's
+indexes small, lets `id > ...` scans skip old partitions entirely, and makes
+discarding old history a matter of dropping a partition instead of deleting
+rows one by one.
+
+Partitions are ranges of transaction ids, so the primary key stays as it is
+and keyset scans by id prune naturally. Each is named after the date it ends
+on: `p20140801` holds the transactions created before 2014-08-01 (and after
+the previous partition ended), and `pmax` everything since the last rotation.
+Rotating splits `pmax` at the current end of the log, so it should be run at
+the start of every period (e.g. monthly, from cron).
+
+MySQL doesn't allow foreign keys on partitioned tables, so partitioning drops
+the transaction table's namespace foreign key. Transactions then outlive
+their namespace until their partition is dropped.
+
+Nothing here runs unless asked to; see bin/partition-transaction-log.
+"""
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.engine import reflection
+
+from inbox.models import Transaction
+from inbox.log import get_logger
+log = get_logger()
+
+TABLE = Transaction.__tablename__
+MAX_PARTITION = 'pmax'
+NAME_FORMAT = 'p%Y%m%d'
+
+
+def partition_name(end):
+    return end.strftime(NAME_FORMAT)
+
+
+def partition_end(name):
+    """ The date the partition called `name` ends on, or None for `pmax`. """
+    if name == MAX_PARTITION:
+        return None
+    return datetime.strptime(name, NAME_FORMAT)
+
+
+def partitions(engine):
+    """ Returns [(name, upper id bound)] for the log's partitions in order,
+    or [] if it isn't partitioned. The bound of `pmax` is None. """
+    rows = engine.execute(
+        'SELECT PARTITION_NAME, PARTITION_DESCRIPTION '
+        'FROM information_schema.PARTITIONS '
+        'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s '
+        'AND PARTITION_NAME IS NOT NULL '
+        'ORDER BY PARTITION_ORDINAL_POSITION', (TABLE,))
+    return [(name, None if bound == 'MAXVALUE' else int(bound))
+            for name, bound in rows]
+
+
+def _first_id_since(db_session, start):
+    return db_session.query(func.min(Transaction.id)). \
+        filter(Transaction.created_at >= start).scalar()
+
+
+def _definition(name, bound):
+    return 'PARTITION {0} VALUES LESS THAN ({1})'.format(
+        name, 'MAXVALUE' if bound is None else bound)
+
+
+def partition_log(engine, db_session, period_ends):
+    """ Partition an unpartitioned log, with one partition for each period
+    ending on one of the dates in `period_ends` and `pmax` for the rest.
+
+    Rewrites the whole table, so expect it to take a while on a big log.
+    """
+    if partitions(engine):
+        raise ValueError('The transaction log is already partitioned')
+    definitions = []
+    last_bound = None
+    for end in sorted(period_ends):
+        bound = _first_id_since(db_session, end)
+        if bound is None:
+            # No transactions since; later periods are created by rotation.
+            break
+        if bound == last_bound:
+            # An empty period.
+            continue
+        definitions.append(_definition(partition_name(end), bound))
+        last_bound = bound
+    definitions.append(_definition(MAX_PARTITION, None))
+
+    inspector = reflection.Inspector.from_engine(engine)
+    for fk in inspector.get_foreign_keys(TABLE):
+        log.info('Dropping foreign key {0} on {1}'.format(fk['name'], TABLE))
+        engine.execute('ALTER TABLE `{0}` DROP FOREIGN KEY `{1}`'.format(
+            TABLE, fk['name']))
+    engine.execute('ALTER TABLE `{0}` PARTITION BY RANGE (id) ({1})'.format(
+        TABLE, ', '.join(definitions)))
+
+
+def rotate(engine, db_session, end=None):
+    """ End the current period at `end` (by default, now): the transactions
+    in `pmax` move to a partition of their own, named after `end`. """
+    end = end or datetime.utcnow()
+    bound = (db_session.query(func.max(Transaction.id)).scalar() or 0) + 1
+    existing = partitions(engine)
+    if not existing:
+        raise ValueError('The transaction log is not partitioned')
+    if partition_name(end) in dict(existing):
+        # Already rotated for this period.
+        return
+    if len(existing) > 1 and existing[-2][1] >= bound:
+        # Nothing has been written since the last rotation.
+        return
+    engine.execute(
+        'ALTER TABLE `{0}` REORGANIZE PARTITION {1} INTO ({2}, {3})'.format(
+            TABLE, MAX_PARTITION, _definition(partition_name(end), bound),
+            _definition(MAX_PARTITION, None)))
+
+
+def drop_partitions_before(engine, cutoff):
+    """ Drop the partitions which only hold transactions created before
+    `cutoff`. Returns the names of the partitions dropped. """
+    names = [name for name, _ in partitions(engine)
+             if name != MAX_PARTITION and partition_end(name) <= cutoff]
+    if names:
+        engine.execute('ALTER TABLE `{0}` DROP PARTITION {1}'.format(
+            TABLE, ', '.join(names)))
+    return names
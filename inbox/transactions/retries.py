@@ -0,0 +1,187 @@
+""" Scheduling of webhook retries.
+
+Each webhook worker used to keep its failed events in a small FIFO queue,
+polled every retry_interval seconds, so retries weren't taken in order of
+when they were due, and once the queue filled the hook stopped taking new
+events altogether. Retries were also lost on restart.
+
+Now one RetryScheduler per process holds the retries of all hooks in a heap
+ordered by due time, and a single greenlet sleeps until the earliest is due
+and hands it back to its hook's worker. Each failed attempt waits twice as
+long as the one before, starting at the hook's retry_interval and capped at
+WEBHOOK_MAX_BACKOFF seconds, until the hook's max_retries attempts have been
+made. Events a hook has no room to queue are deferred the same way, without
+counting as an attempt. Every scheduled retry is also stored as a
+WebhookRetry row, and loaded again when the service (or the hook) starts, so
+a hook's progress through the log no longer has to wait on the events it's
+retrying.
+"""
+from datetime import datetime
+import calendar
+import heapq
+import itertools
+import time
+
+import gevent
+import gevent.event
+
+from inbox.config import config
+from inbox.log import get_logger
+from inbox.models import Transaction, Webhook, WebhookRetry
+from inbox.models.session import session_scope
+from inbox.transactions.delivery import EventData
+from inbox.transactions.snapshots import ensure_snapshots
+from inbox.util.concurrency import retry_with_logging
+
+DEFAULT_MAX_BACKOFF = 6 * 60 * 60
+
+
+def backoff(retry_interval, attempts, max_backoff=DEFAULT_MAX_BACKOFF):
+    """ Seconds to wait after the `attempts`th failed attempt. """
+    return min(retry_interval * 2 ** (attempts - 1), max_backoff)
+
+
+class RetryScheduler(gevent.Greenlet):
+    """
+    Parameters
+    ----------
+    get_worker : function
+        Returns the running worker for a hook id, or None if the hook isn't
+        running. The retries of hooks that aren't running stay stored until
+        the hook is started again.
+    """
+    def __init__(self, get_worker, max_backoff=None):
+        self.get_worker = get_worker
+        self.max_backoff = max_backoff or config.get('WEBHOOK_MAX_BACKOFF',
+                                                     DEFAULT_MAX_BACKOFF)
+        # (retry timestamp, sequence number, hook id, EventData)
+        self._heap = []
+        self._counter = itertools.count()
+        self._wakeup = gevent.event.Event()
+        self.log = get_logger(purpose='webhooks')
+        gevent.Greenlet.__init__(self)
+
+    def _run(self):
+        return retry_with_logging(self._run_impl, self.log)
+
+    def _run_impl(self):
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                self._wakeup.wait()
+                continue
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                # Until it's due, or something due sooner is scheduled.
+                self._wakeup.wait(delay)
+                continue
+            _, _, hook_id, event = heapq.heappop(self._heap)
+            worker = self.get_worker(hook_id)
+            if worker is not None:
+                worker.retry(event)
+
+    def _push(self, hook_id, event):
+        heapq.heappush(self._heap,
+                       (event.retry_ts, next(self._counter), hook_id, event))
+        if self._heap[0][3] is event:
+            self._wakeup.set()
+
+    def schedule(self, worker, events):
+        """ Schedule the retries of events `worker` just failed to deliver.
+        Events that have had all their attempts are given up on. """
+        now = time.time()
+        scheduled = []
+        for event in events:
+            event.retry_count += 1
+            if event.retry_count < worker.max_retries:
+                event.retry_ts = now + backoff(worker.retry_interval,
+                                               event.retry_count,
+                                               self.max_backoff)
+                scheduled.append(event)
+            else:
+                self.log.info('Giving up on transaction {0} for hook {1}'.
+                              format(event.id, worker.id))
+
+        self._store(worker, events, scheduled)
+
+    def defer(self, worker, events):
+        """ Hold events `worker` has no room to queue until its
+        retry_interval has passed. Deferring doesn't count as an attempt.
+        """
+        retry_ts = time.time() + worker.retry_interval
+        for event in events:
+            event.retry_ts = retry_ts
+        self._store(worker, events, events)
+
+    def _store(self, worker, events, scheduled):
+        """ Store the retries of `scheduled` and forget those of the rest of
+        `events`, then schedule them. """
+        scheduled_ids = {event.id for event in scheduled}
+        with session_scope() as db_session:
+            stored = {retry.transaction_id: retry for retry in
+                      db_session.query(WebhookRetry).filter(
+                          WebhookRetry.webhook_id == worker.id,
+                          WebhookRetry.transaction_id.in_(
+                              [event.id for event in events]))}
+            for event in events:
+                retry = stored.get(event.id)
+                if event.id not in scheduled_ids:
+                    if retry is not None:
+                        db_session.delete(retry)
+                    continue
+                if retry is None:
+                    retry = WebhookRetry(webhook_id=worker.id,
+                                         transaction_id=event.id)
+                    db_session.add(retry)
+                retry.attempts = event.retry_count
+                retry.retry_at = datetime.utcfromtimestamp(event.retry_ts)
+            db_session.commit()
+
+        for event in scheduled:
+            self._push(worker.id, event)
+
+    def delivered(self, worker, events):
+        """ Forget the stored retries of events `worker` has now delivered.
+        """
+        retried = [event.id for event in events if event.retry_ts]
+        if not retried:
+            return
+        with session_scope(ignore_soft_deletes=False) as db_session:
+            db_session.query(WebhookRetry).filter(
+                WebhookRetry.webhook_id == worker.id,
+                WebhookRetry.transaction_id.in_(retried)). \
+                delete(synchronize_session=False)
+            db_session.commit()
+
+    def load(self, hook_id=None):
+        """ Schedule the stored retries of the given hook, or of every active
+        hook. """
+        if hook_id is not None:
+            self._heap = [entry for entry in self._heap
+                          if entry[2] != hook_id]
+            heapq.heapify(self._heap)
+
+        with session_scope() as db_session:
+            query = db_session.query(WebhookRetry, Transaction). \
+                outerjoin(Transaction,
+                          Transaction.id == WebhookRetry.transaction_id)
+            if hook_id is not None:
+                query = query.filter(WebhookRetry.webhook_id == hook_id)
+            else:
+                query = query.join(
+                    Webhook, Webhook.id == WebhookRetry.webhook_id). \
+                    filter(Webhook.active == True)
+            rows = query.all()
+            ensure_snapshots([transaction for _, transaction in rows
+                              if transaction is not None])
+            for retry, transaction in rows:
+                if transaction is None:
+                    # Purged from the log since.
+                    db_session.delete(retry)
+                    continue
+                event = EventData(transaction)
+                event.retry_count = retry.attempts
+                event.retry_ts = calendar.timegm(
+                    retry.retry_at.utctimetuple())
+                self._push(retry.webhook_id, event)
+            db_session.commit()
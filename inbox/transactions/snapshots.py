@@ -0,0 +1,155 @@
+""" Deferred transaction snapshots.
+
+Each transaction carries the API representation of its object, which used to
+be encoded inside the flush that created the transaction. Encoding a message
+loads its body, thread and parts; encoding a thread loads its summary; and
+all of it happened on the sync hot path, in every flush.
+
+With DEFER_TRANSACTION_SNAPSHOTS set, flushes only record ids and deltas
+(see Transaction.take_snapshot). The snapshots are recorded afterwards, in
+batches, by whichever comes first of
+
+ * the SnapshotService, which follows the log a batch at a time, and
+ * a reader of the log (client sync, webhooks) that comes across pending
+   transactions, which records theirs before using them.
+
+A deferred snapshot is of the object as it is when it's recorded, so several
+pending updates to the same object get the same snapshot, and only the first
+is published. Deletes are always snapshotted immediately, since the object
+won't be around later.
+"""
+from collections import defaultdict
+
+import gevent
+from sqlalchemy import func
+from sqlalchemy.orm.attributes import set_committed_value
+
+from inbox.log import get_logger
+from inbox.models import Transaction, TransactionCursor
+from inbox.models.base import MailSyncBase
+from inbox.models.session import session_scope
+from inbox.transactions.compaction import record_position
+from inbox.util.concurrency import retry_with_logging
+
+CURSOR_NAME = 'snapshots'
+BATCH_SIZE = 500
+
+SNAPSHOT_ATTRS = ('public_snapshot', 'private_snapshot', 'publishable')
+
+_classes = None
+
+
+def _class_for_table(table_name):
+    """ The model class whose instances log transactions as `table_name`. """
+    global _classes
+    if _classes is None:
+        _classes = {cls.__tablename__: cls for cls in
+                    MailSyncBase._decl_class_registry.values()
+                    if isinstance(cls, type) and hasattr(cls, '__table__')}
+    return _classes.get(table_name)
+
+
+def _record(db_session, transaction_ids):
+    """ Record the snapshots of those of the given transactions which are
+    pending. Returns {transaction id: {attribute: value}}. """
+    transactions = db_session.query(Transaction). \
+        filter(Transaction.id.in_(transaction_ids)). \
+        order_by(Transaction.id).all()
+    record_ids = defaultdict(set)
+    for transaction in transactions:
+        record_ids[transaction.table_name].add(transaction.record_id)
+    objects = {}
+    for table_name, ids in record_ids.iteritems():
+        cls = _class_for_table(table_name)
+        if cls is None:
+            continue
+        for obj in db_session.query(cls).filter(cls.id.in_(ids)):
+            objects[(table_name, obj.id)] = obj
+
+    recorded = {}
+    # In id order, so that each update is compared with the snapshot of the
+    # one before it.
+    for transaction in transactions:
+        # Unless another reader got there first.
+        if transaction.snapshot_pending:
+            obj = objects.get((transaction.table_name,
+                               transaction.record_id))
+            if obj is None:
+                # Deleted since; there's nothing left to show.
+                transaction.publishable = False
+            else:
+                transaction.record_snapshot(obj)
+        recorded[transaction.id] = {attr: getattr(transaction, attr)
+                                    for attr in SNAPSHOT_ATTRS}
+    db_session.commit()
+    return recorded
+
+
+def record_snapshots(transaction_ids):
+    """ Record the snapshots of the given pending transactions, in a session
+    of their own. Returns {transaction id: {attribute: value}}. """
+    if not transaction_ids:
+        return {}
+    # Soft-deleted objects still have a representation to record.
+    with session_scope(versioned=False, ignore_soft_deletes=False) \
+            as db_session:
+        return _record(db_session, transaction_ids)
+
+
+def ensure_snapshots(transactions):
+    """ Make sure the given Transaction objects, from any session, have their
+    snapshots, recording any that are pending. """
+    pending = [transaction for transaction in transactions
+               if transaction.snapshot_pending]
+    if not pending:
+        return
+    recorded = record_snapshots([transaction.id for transaction in pending])
+    for transaction in pending:
+        for attr, value in recorded.get(transaction.id, {}).iteritems():
+            # Already written; the caller's session needn't write it again.
+            set_committed_value(transaction, attr, value)
+
+
+class SnapshotService(gevent.Greenlet):
+    """ Records pending snapshots as they appear in the log. Its position is
+    kept as a TransactionCursor, which also stops the log being compacted
+    ahead of it. """
+    def __init__(self, poll_interval=1, batch_size=BATCH_SIZE):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.log = get_logger()
+        with session_scope() as db_session:
+            self.minimum_id = db_session.query(
+                TransactionCursor.transaction_id).filter(
+                    TransactionCursor.name == CURSOR_NAME).scalar() or 0
+        gevent.Greenlet.__init__(self)
+
+    def _run(self):
+        return retry_with_logging(self._run_impl, self.log)
+
+    def _run_impl(self):
+        while True:
+            if not self._process_log():
+                gevent.sleep(self.poll_interval)
+
+    def _process_log(self):
+        """ Record the next batch of pending snapshots. Returns whether there
+        may be more to do right away. """
+        with session_scope() as db_session:
+            head = db_session.query(func.max(Transaction.id)).scalar() or 0
+            pending = [id_ for id_, in db_session.query(Transaction.id).
+                       filter(Transaction.id > self.minimum_id,
+                              Transaction.id <= head,
+                              Transaction.public_snapshot.is_(None),
+                              Transaction.publishable.is_(None),
+                              Transaction.command != 'delete').
+                       order_by(Transaction.id).limit(self.batch_size)]
+        if len(pending) == self.batch_size:
+            position = pending[-1]
+        else:
+            position = head
+        record_snapshots(pending)
+        if position != self.minimum_id:
+            self.minimum_id = position
+            record_position(CURSOR_NAME, position)
+        return len(pending) == self.batch_size
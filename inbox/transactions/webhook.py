@@ -13,14 +13,18 @@ its own greenlet.
 The WebhookService asynchronously consumes the transaction log, and pushes any
 events that match the filter parameters for W to the corresponding
 WebhookWorker's queue. The WebhookWorker continuously monitors its queue; when
-it receives a transaction, it attempts to post to the stored callback_url. If
-this succeeds, we increment the min_processed_id column of the associated
-Webhook row, indicating that the webhook has successfully processed
-all transaction log entries with id less than or equal to min_processed_id.
-
-If the post request fails, the worker places the transaction in a bounded-size
-retry queue. If the retry queue fills up, we suspend the worker to avoid
-consuming arbitrarily large amounts of memory.
+it receives transactions, it posts them to the stored callback_url, one at a
+time or in batches of up to the hook's max_batch_size, with several requests
+in flight at once (see inbox.transactions.delivery). Every few seconds, we
+advance the min_processed_id column of the associated Webhook row to the id
+up to which every event has been delivered, indicating that the webhook has
+successfully processed all transaction log entries with id less than or equal
+to min_processed_id.
+
+If the post request fails, the worker hands the transaction to the service's
+RetryScheduler, which stores it and hands it back to the worker once its
+exponential backoff has passed (see inbox.transactions.retries), until the
+hook's max_retries attempts have been made.
 
 If the webhook service dies and is restarted, it resumes consuming the
 transaction log at the minimum id across all stored min_processed_id values.
@@ -37,32 +41,24 @@ import time
 import urlparse
 
 import gevent
+import gevent.pool
 import gevent.queue
 import requests
-from sqlalchemy import asc, func
 
+from inbox.config import config
 from inbox.util.concurrency import retry_with_logging
 from inbox.log import get_logger
 from inbox.models.session import session_scope
 from inbox.api.kellogs import APIEncoder
-from inbox.models import Transaction, Webhook, Lens
-
-
-class EventData(object):
-    """Keeps track of the data from a single transaction log entry, together
-    with some bookkeeping for retrying."""
-    def __init__(self, transaction):
-        self.id = transaction.id
-        self.retry_ts = 0
-        self.retry_count = 0
-        self.snapshot = transaction.public_snapshot
+from inbox.models import Webhook, Lens
+from inbox.transactions.delivery import Checkpoint, EventData, post
+from inbox.transactions.feed import Subscriber, get_feed
+from inbox.transactions.matching import LensIndex
+from inbox.transactions.retries import RetryScheduler
 
-    def __cmp__(self, other):
-        return cmp(self.retry_ts, other.retry_ts)
-
-    def note_failure(self, retry_interval):
-        self.retry_count += 1
-        self.retry_ts = int(time.time() + retry_interval)
+DEFAULT_CONCURRENCY = 4
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_CHECKPOINT_INTERVAL = 5
 
 
 def format_output(public_snapshot, include_body):
@@ -74,6 +70,13 @@ def format_output(public_snapshot, include_body):
                            if k != 'body' or include_body})
 
 
+def format_batch_output(public_snapshots, include_body):
+    encoder = APIEncoder()
+    return encoder.cereal([{k: v for k, v in public_snapshot.iteritems()
+                            if k != 'body' or include_body}
+                           for public_snapshot in public_snapshots])
+
+
 def format_failure_output(hook_id, timestamp, status_code):
     response = {
         'webhook_id': hook_id,
@@ -83,16 +86,19 @@ def format_failure_output(hook_id, timestamp, status_code):
     return json.dumps(response)
 
 
-class WebhookService():
-    """Asynchronously consumes the transaction log and executes registered
-    webhooks."""
-    def __init__(self, poll_interval=1, chunk_size=22):
+class WebhookService(Subscriber):
+    """Asynchronously consumes the transaction log, through the change feed,
+    and executes registered webhooks. Its position in the log is kept by the
+    hooks themselves, as their min_processed_id."""
+    table_names = {'message'}
+
+    def __init__(self, feed=None):
         self.workers = defaultdict(set)
+        self.index = LensIndex()
+        self.scheduler = RetryScheduler(self.get_worker)
         self.log = get_logger(purpose='webhooks')
-        self.poll_interval = poll_interval
-        self.chunk_size = chunk_size
-        self.minimum_id = -1
-        self.poller = None
+        self.feed = feed or get_feed()
+        self.position = -1
         self.polling = False
         self.encoder = APIEncoder()
         self._on_startup()
@@ -104,6 +110,11 @@ class WebhookService():
             return set()
         return set.union(*worker_sets)
 
+    def get_worker(self, hook_id):
+        for worker in self.all_active_workers:
+            if worker.id == hook_id:
+                return worker
+
     def register_hook(self, namespace_id, parameters):
         """Register a new webhook.
 
@@ -121,6 +132,10 @@ class WebhookService():
         if urlparse.urlparse(parameters.get('callback_url')).scheme != 'https':
             raise ValueError('callback_url MUST be https!')
 
+        max_batch_size = parameters.get('max_batch_size', 1)
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError('max_batch_size must be a positive integer')
+
         with session_scope() as db_session:
             lens = Lens(
                 namespace_id=namespace_id,
@@ -143,8 +158,9 @@ class WebhookService():
                 callback_url=parameters.get('callback_url'),
                 failure_notify_url=parameters.get('failure_notify_url'),
                 include_body=parameters.get('include_body', False),
+                max_batch_size=max_batch_size,
                 active=parameters.get('active', True),
-                min_processed_id=self.minimum_id)
+                min_processed_id=self.position)
 
             db_session.add(hook)
             db_session.add(lens)
@@ -165,13 +181,15 @@ class WebhookService():
         if any(worker.id == hook.id for worker in self.all_active_workers):
             # Hook already has a worker
             return 'OK hook already running'
-        hook.min_processed_id = self.minimum_id
+        hook.min_processed_id = self.position
         hook.active = True
         namespace_id = hook.namespace_id
-        worker = WebhookWorker(hook)
+        worker = WebhookWorker(hook, self.scheduler)
         self.workers[namespace_id].add(worker)
+        self.index.add(namespace_id, worker, worker.lens)
         if not worker.started:
             worker.start()
+        self.scheduler.load(hook.id)
         db_session.commit()
         if not self.polling:
             self._start_polling()
@@ -187,6 +205,7 @@ class WebhookService():
             for worker in self.workers[hook.namespace_id]:
                 if worker.public_id == hook_public_id:
                     self.workers[hook.namespace_id].remove(worker)
+                    self.index.remove(worker)
                     worker.kill()
                     break
 
@@ -200,6 +219,8 @@ class WebhookService():
         for worker in itertools.chain(*self.workers.values()):
             if not worker.started:
                 worker.start()
+        self.scheduler.load()
+        self.scheduler.start()
         # Needed for workers to actually start up.
         gevent.sleep(0)
         if self.all_active_workers:
@@ -207,56 +228,26 @@ class WebhookService():
 
     def _start_polling(self):
         self.log.info('Start polling')
-        self.minimum_id = min(hook.min_processed_id for hook in
-                              self.all_active_workers)
-        self.poller = gevent.spawn(self._poll)
+        self.position = min(hook.min_processed_id for hook in
+                            self.all_active_workers)
+        self.feed.subscribe(self)
         self.polling = True
 
     def _stop_polling(self):
         self.log.info('Stop polling')
-        self.poller.kill()
+        self.feed.unsubscribe(self)
         self.polling = False
 
-    def _poll(self):
-        """Poll the transaction log forever and publish events. Only runs when
-        there are actually active webhooks."""
-        while True:
-            self._process_log()
-            gevent.sleep(self.poll_interval)
-
-    def _process_log(self):
-        """Scan the transaction log `self.chunk_size` entries at a time,
-        publishing matching events to registered hooks."""
-        with session_scope() as db_session:
-            self.log.info('Scanning tx log from id: {}'.
-                          format(self.minimum_id))
-            unprocessed_txn_count = db_session.query(
-                func.count(Transaction.id)).filter(
-                Transaction.table_name == 'message',
-                Transaction.id > self.minimum_id).scalar()
-            if unprocessed_txn_count:
-                self.log.debug('Total of {0} transactions to process'.
-                               format(unprocessed_txn_count))
-
-            max_tx_id, = db_session.query(func.max(Transaction.id)).one()
-            if max_tx_id is None:
-                max_tx_id = 0
-            for pointer in range(self.minimum_id, max_tx_id, self.chunk_size):
-                # TODO(emfree) add the right index to make this query more
-                # performant.
-                for transaction in db_session.query(Transaction). \
-                        filter(Transaction.table_name == 'message',
-                               Transaction.command == 'insert',
-                               Transaction.id > pointer,
-                               Transaction.id <= pointer + self.chunk_size). \
-                        order_by(asc(Transaction.id)):
-                    namespace_id = transaction.namespace_id
-                    for worker in self.workers[namespace_id]:
-                        if worker.match(transaction):
-                            worker.enqueue(EventData(transaction))
-                    self.minimum_id = transaction.id
-            self.log.debug('Processed tx. setting min id to {0}'.
-                           format(self.minimum_id))
+    def process(self, transactions, db_session):
+        """Publish new messages to the hooks that match them. Only called
+        while there are active webhooks."""
+        for transaction in transactions:
+            if transaction.command != 'insert':
+                continue
+            # Only the hooks whose lenses could match are checked in full.
+            for worker in self.index.candidates(transaction):
+                if worker.match(transaction):
+                    worker.enqueue(EventData(transaction))
 
     def _load_hooks(self):
         """Load stored hook parameters from the database. Run once on
@@ -265,11 +256,13 @@ class WebhookService():
             all_hooks = db_session.query(Webhook).filter_by(active=True).all()
             for hook in all_hooks:
                 namespace_id = hook.namespace_id
-                self.workers[namespace_id].add(WebhookWorker(hook))
+                worker = WebhookWorker(hook, self.scheduler)
+                self.workers[namespace_id].add(worker)
+                self.index.add(namespace_id, worker, worker.lens)
 
 
 class WebhookWorker(gevent.Greenlet):
-    def __init__(self, hook, max_queue_size=22):
+    def __init__(self, hook, scheduler, max_queue_size=None):
         self.id = hook.id
         self.public_id = hook.public_id
         self.lens = hook.lens
@@ -279,99 +272,140 @@ class WebhookWorker(gevent.Greenlet):
         self.failure_notify_url = hook.failure_notify_url
         self.max_retries = hook.max_retries
         self.retry_interval = hook.retry_interval
+        self.max_batch_size = hook.max_batch_size
         self.hook_updated_at = hook.updated_at
-
-        # 'frozen' means that the worker has accumulated too large of a failure
-        # backlog, and that we aren't enqueueing new events.
-        # This is not to be confused with the 'Webhook.active' attribute: an
-        # inactive webhook is one that has been manually suspended, and has no
-        # associated worker.
-        self.frozen = False
-
-        self.retry_queue = gevent.queue.Queue(max_queue_size)
-        self.queue = gevent.queue.Queue(max_queue_size)
+        self.scheduler = scheduler
+
+        self.checkpoint = Checkpoint(self.min_processed_id)
+        self.checkpoint_interval = config.get(
+            'WEBHOOK_CHECKPOINT_INTERVAL', DEFAULT_CHECKPOINT_INTERVAL)
+        # Retries that are due, from the scheduler.
+        self.retry_queue = gevent.queue.Queue()
+        self.queue = gevent.queue.Queue(
+            max_queue_size or config.get('WEBHOOK_QUEUE_SIZE',
+                                         DEFAULT_QUEUE_SIZE))
+        # Requests in flight for this hook.
+        self.pool = gevent.pool.Pool(
+            config.get('WEBHOOK_CONCURRENCY', DEFAULT_CONCURRENCY))
         self.log = get_logger()
         gevent.Greenlet.__init__(self)
 
     def _run(self):
-        gevent.spawn(retry_with_logging, self.retry_failed, self.log)
-        retry_with_logging(self._run_impl, self.log)
+        children = [
+            gevent.spawn(retry_with_logging, self.retry_failed, self.log),
+            gevent.spawn(retry_with_logging, self.checkpoint_periodically,
+                         self.log)]
+        try:
+            retry_with_logging(self._run_impl, self.log)
+        finally:
+            gevent.killall(children)
+            self.pool.kill()
 
     def _run_impl(self):
         self.log.info("Starting worker for hook id {}".format(self.id))
         while True:
             gevent.sleep(0)
-            event = self.queue.get()
-            self.execute(event)
+            events = [self.queue.get()]
+            while len(events) < self.max_batch_size and not self.queue.empty():
+                events.append(self.queue.get_nowait())
+            # Waits while the hook has as many requests in flight as it may.
+            self.pool.spawn(self.execute, events)
 
     def retry_failed(self):
-        """Periodically poll the retry queue, attempting to reexecute failed
-        hooks. Runs in its own child greenlet."""
+        """Reexecute events as the scheduler finds their retries are due.
+        Runs in its own child greenlet."""
+        while True:
+            event = self.retry_queue.get()
+            # Waits while the hook has as many requests in flight as it may.
+            self.pool.spawn(self.execute, [event])
+
+    def retry(self, event):
+        self.retry_queue.put(event)
+
+    def checkpoint_periodically(self):
+        """Record how far through the log the hook has got every so often,
+        rather than after every event. Runs in its own child greenlet."""
         while True:
-            gevent.sleep(self.retry_interval)
-            retry_ts = self.retry_queue.peek().retry_ts
-            if retry_ts < time.time():
-                event = self.retry_queue.get()
-                result = self.execute(event)
-                if result:
-                    self.frozen = False
+            gevent.sleep(self.checkpoint_interval)
+            self.set_min_processed_id(self.checkpoint.position)
 
     def enqueue(self, data):
-        if not self.frozen:
-            self.queue.put(data)
+        """Queue an event for delivery. Called from the change feed, so it
+        mustn't block: if the queue is full the event is stored with the
+        RetryScheduler instead, and handed back once there's been time to
+        catch up."""
+        self.checkpoint.add(data.id)
+        try:
+            self.queue.put_nowait(data)
+        except gevent.queue.Full:
+            self.log.info('Queue full for hook {0}, deferring transaction '
+                          '{1}'.format(self.id, data.id))
+            try:
+                self.scheduler.defer(self, [data])
+            finally:
+                self.checkpoint.done(data.id)
 
-    def execute(self, event):
-        """Attempts to post event data to callback_url. Returns True on
-        success, false otherwise. On failure, puts the event on the retry
-        queue.
+    def execute(self, events):
+        """Attempts to post event data to callback_url, as a single event or,
+        if the hook takes batches, a list. Returns True on success, false
+        otherwise. On failure, schedules the events' retries.
+
+        The events are done with as far as the hook's checkpoint is
+        concerned however this returns, so that an unexpected error can't
+        hold the hook back for good.
 
         Parameters
         ----------
-        event: EventData
+        events: list of EventData
         """
-        if event.id < self.min_processed_id:
-            # We've already successfully processed this event. This can happen
-            # if the service is restarted -- it will consume the log starting
-            # at the minimum across all min_processed_id values.
+        try:
+            return self._execute(events)
+        finally:
+            for event in events:
+                self.checkpoint.done(event.id)
+
+    def _execute(self, events):
+        # We may have already successfully processed some of these events.
+        # This can happen if the service is restarted -- it will consume the
+        # log starting at the minimum across all min_processed_id values.
+        # (Events from the scheduler are behind it by design.)
+        events = [event for event in events if event.retry_ts or
+                  event.id > self.min_processed_id]
+        if not events:
             return True
+        if self.max_batch_size > 1:
+            data = format_batch_output([event.snapshot for event in events],
+                                       self.include_body)
+        else:
+            data = format_output(events[0].snapshot, self.include_body)
+        status_code = None
         try:
-            self.log.info('Posting event {0} to webhook {1}'.
-                          format(event.id, self.id))
-            # OMG WTF TODO (emfree): Do NOT set verify=False in prod!
-            r = requests.post(
-                self.callback_url,
-                data=format_output(event.snapshot, self.include_body),
-                headers={'content-type': 'application/json'},
-                verify=False)
+            self.log.info('Posting events {0} to webhook {1}'.
+                          format([event.id for event in events], self.id))
+            r = post(self.callback_url, data)
             if r.status_code == requests.status_codes.codes.ok:
-                if self.retry_queue.empty():
-                    self.set_min_processed_id(event.id)
+                self.scheduler.delivered(self, events)
                 return True
-        except requests.ConnectionError:
+            status_code = r.status_code
+        except requests.RequestException:
             # Handle this failure in the code below, in the same way we do for
             # response codes other than 200.
             pass
-        self.log.info('Hook {0} failed at transaction {1}'.
-                      format(self.id, event.id))
+        self.log.info('Hook {0} failed at transactions {1}'.
+                      format(self.id, [event.id for event in events]))
         if self.failure_notify_url is not None:
             timestamp = int(time.time())
             failure_output = format_failure_output(
                 hook_id=self.public_id,
                 timestamp=timestamp,
-                status_code=r.status_code)
+                status_code=status_code)
             try:
-                requests.post(self.failure_notify_url,
-                              data=failure_output,
-                              headers={'content-type': 'application/json'})
-            except requests.ConnectionError:
+                post(self.failure_notify_url, failure_output)
+            except requests.RequestException:
                 # Don't do anything special if this request fails.
                 pass
-        event.note_failure(self.retry_interval)
-        if event.retry_count < self.max_retries:
-            try:
-                self.retry_queue.put_nowait(event)
-            except gevent.queue.Full:
-                self.frozen = True
+        # Stored with their retries, the events needn't hold the hook back.
+        self.scheduler.schedule(self, events)
         return False
 
     def match(self, transaction):
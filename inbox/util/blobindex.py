@@ -0,0 +1,185 @@
+""" Local existence and reference-count index for on-disk message part blobs.
+
+Blobs are content-addressed by sha256, and the same bytes (mailing-list
+footers, signature images, logos) show up in thousands of messages. The index
+lets us skip rewriting a blob that's already on disk, and makes deletes safe:
+a blob file is only removed once no Block references it anymore.
+
+The index is a small SQLite database next to the parts directory. It's
+shared by every process on the host, and SQLite's locking serializes the
+read-modify-write of a refcount across threads and processes.
+
+Files written before the index existed have no row. The first time such a
+blob is referenced again it gets a row marked `pinned`: we don't know how
+many Blocks already point at it, so it's never removed until
+`rebuild_blob_index` has recomputed the counts from the database.
+"""
+import os
+import sqlite3
+import threading
+
+from inbox.config import config
+from inbox.util.file import mkdirp
+from inbox.log import get_logger
+log = get_logger()
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blob_refcount (
+    sha256 TEXT PRIMARY KEY,
+    refcount INTEGER NOT NULL,
+    pinned INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class BlobIndex(object):
+    """ Refcounts for content-addressed blobs, keyed by sha256.
+
+    Parameters
+    ----------
+    path : str
+        Filename of the SQLite database.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        mkdirp(os.path.dirname(path))
+        with self._transaction() as cursor:
+            cursor.execute(SCHEMA)
+
+    @property
+    def _conn(self):
+        # SQLite connections can't be shared across threads, and blob writes
+        # run on the blob writer's thread pool.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _transaction(self):
+        return ImmediateTransaction(self._conn)
+
+    def incref(self, sha256, exists):
+        """ Record a new reference to the blob.
+
+        Parameters
+        ----------
+        sha256 : str
+        exists : function
+            Returns whether the blob file is currently present on disk. It's
+            called with the write lock held, so a concurrent `decref` can't
+            remove the file between the check and the new reference.
+
+        Returns
+        -------
+        bool
+            True if the caller needs to write the blob data.
+        """
+        with self._transaction() as cursor:
+            exists = exists()
+            row = cursor.execute(
+                'SELECT refcount FROM blob_refcount WHERE sha256 = ?',
+                (sha256,)).fetchone()
+            if row is None:
+                # An unindexed file on disk predates the index.
+                cursor.execute(
+                    'INSERT INTO blob_refcount (sha256, refcount, pinned) '
+                    'VALUES (?, 1, ?)', (sha256, int(exists)))
+            else:
+                cursor.execute(
+                    'UPDATE blob_refcount SET refcount = refcount + 1 '
+                    'WHERE sha256 = ?', (sha256,))
+        return not exists
+
+    def decref(self, sha256, remove_fn):
+        """ Drop a reference to the blob, calling `remove_fn()` to delete the
+        data once nothing references it anymore.
+
+        Returns
+        -------
+        int or None
+            The remaining number of references, or None if the blob isn't
+            tracked (in which case nothing is removed).
+        """
+        with self._transaction() as cursor:
+            row = cursor.execute(
+                'SELECT refcount, pinned FROM blob_refcount WHERE sha256 = ?',
+                (sha256,)).fetchone()
+            if row is None:
+                return None
+            refcount, pinned = row
+            refcount = max(refcount - 1, 0)
+            if refcount == 0 and not pinned:
+                # Removing while holding the lock means a concurrent incref,
+                # which checks for the file under the same lock, either sees
+                # the file and its row or neither, and rewrites it.
+                remove_fn()
+                cursor.execute('DELETE FROM blob_refcount WHERE sha256 = ?',
+                               (sha256,))
+            else:
+                cursor.execute(
+                    'UPDATE blob_refcount SET refcount = ? WHERE sha256 = ?',
+                    (refcount, sha256))
+            return refcount
+
+    def refcount(self, sha256):
+        row = self._conn.execute(
+            'SELECT refcount FROM blob_refcount WHERE sha256 = ?',
+            (sha256,)).fetchone()
+        return row[0] if row is not None else None
+
+    def rebuild(self, counts):
+        """ Replace the whole index with authoritative counts.
+
+        Parameters
+        ----------
+        counts : iterable of (sha256, refcount) tuples
+        """
+        with self._transaction() as cursor:
+            cursor.execute('DELETE FROM blob_refcount')
+            cursor.executemany(
+                'INSERT INTO blob_refcount (sha256, refcount, pinned) '
+                'VALUES (?, ?, 0)', counts)
+
+
+class ImmediateTransaction(object):
+    """ BEGIN IMMEDIATE ... COMMIT, so a read-modify-write holds the database
+    write lock throughout. """
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn.cursor()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute('ROLLBACK')
+
+
+_blob_index = None
+
+
+def get_blob_index():
+    global _blob_index
+    if _blob_index is None:
+        default_path = os.path.join(
+            config.get_required('MSG_PARTS_DIRECTORY'), 'refcount.sqlite3')
+        _blob_index = BlobIndex(config.get('MSG_PARTS_INDEX', default_path))
+    return _blob_index
+
+
+def rebuild_blob_index(db_session):
+    """ Recompute every refcount from the block table. """
+    from sqlalchemy import func
+    from inbox.models import Block
+
+    counts = db_session.query(Block.data_sha256, func.count(Block.id)). \
+        filter(Block.size > 0, Block.data_sha256.isnot(None)). \
+        group_by(Block.data_sha256)
+    get_blob_index().rebuild(counts)
@@ -0,0 +1,213 @@
+""" Write-behind service for message part blobs.
+
+Mail sync parses a whole chunk of messages before committing them, and every
+parsed part used to be written to the blob store synchronously from inside the
+parsing greenlet. Those writes are plain blocking file (or boto) I/O that
+gevent can't yield on, so a single slow disk stalled every sync greenlet in
+the process.
+
+The BlobWriter moves those writes onto a small, bounded pool of OS threads:
+
+ * Callers `submit()` a write keyed by the blob's sha256 and carry on. Every
+   submission runs, even for a key that is already pending: the disk store
+   keeps a refcount per blob, and a duplicate write only bumps it.
+ * A single dispatcher greenlet drains the submission queue in batches and
+   hands each batch to the thread pool. The pool size bounds how many writes
+   are in flight; the bounded submission queue pushes back on producers when
+   the disk can't keep up.
+ * Each write function returns the path that still needs an fsync for the
+   write to be durable (the directory it renamed a file into, or the pack
+   segment it appended to), or None for remote stores. These fsyncs are
+   coalesced so each path touched by a batch is fsynced once.
+ * Before committing rows that reference blobs, callers `wait()` on exactly
+   the keys they reference. Nothing else has to be durable yet.
+
+The writer is only started by processes that create lots of blobs (the mail
+sync engine); everywhere else `get_blob_writer()` returns None and blobs are
+written synchronously as before.
+"""
+import os
+from collections import defaultdict
+
+import gevent
+from gevent.event import AsyncResult
+from gevent.queue import Queue, Empty
+from gevent.threadpool import ThreadPool
+
+from inbox.config import config
+from inbox.log import get_logger
+log = get_logger()
+
+
+DEFAULT_NUM_THREADS = 4
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_QUEUE_SIZE = 512
+
+
+class BlobWriteError(Exception):
+    pass
+
+
+def fsync_path(path):
+    """ Make a file, or a directory's entries (e.g. a freshly renamed file),
+    durable. """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_batch(batch):
+    """ Runs in a pool thread: perform every write in `batch` and fsync each
+    touched path once. Returns a list of (key, error) pairs, where error
+    is None on success.
+
+    Must not touch greenlet-local state or ORM objects; the write functions
+    close over everything they need.
+    """
+    results = []
+    paths = set()
+    for key, write_fn in batch:
+        try:
+            path = write_fn()
+            if path is not None:
+                paths.add(path)
+            results.append((key, None))
+        except Exception as e:
+            results.append((key, e))
+
+    for path in paths:
+        try:
+            fsync_path(path)
+        except OSError as e:
+            # Can't vouch for anything written in this batch.
+            results = [(key, error or e) for key, error in results]
+            break
+    return results
+
+
+class BlobWriter(object):
+    """ Bounded, batching write-behind pool for blob data.
+
+    Parameters
+    ----------
+    num_threads : int
+        Maximum number of concurrent blob writes (OS threads).
+    batch_size : int
+        Maximum number of writes handed to a thread at once.
+    queue_size : int
+        Maximum number of queued writes before `submit()` blocks.
+    """
+    def __init__(self, num_threads=DEFAULT_NUM_THREADS,
+                 batch_size=DEFAULT_BATCH_SIZE, queue_size=DEFAULT_QUEUE_SIZE):
+        self.pool = ThreadPool(num_threads)
+        self.batch_size = batch_size
+        self.queue = Queue(queue_size)
+        # key -> AsyncResults for writes that aren't durable yet
+        self.pending = defaultdict(list)
+        # key -> errors of failed writes that no `wait()` has collected yet
+        self.failed = defaultdict(list)
+        self.dispatcher = None
+
+    def start(self):
+        if self.dispatcher is None:
+            self.dispatcher = gevent.spawn(self._dispatch)
+        return self
+
+    def stop(self):
+        if self.dispatcher is not None:
+            self.dispatcher.kill()
+            self.dispatcher = None
+        self.pool.join()
+
+    def submit(self, key, write_fn):
+        """ Schedule `write_fn()` to run on the writer pool.
+
+        Returns an AsyncResult that is set once the write is durable.
+        """
+        result = AsyncResult()
+        self.pending[key].append(result)
+        self.queue.put((key, write_fn, result))
+        return result
+
+    def wait(self, keys, timeout=None):
+        """ Block until the writes for all of `keys` are durable.
+
+        Keys that were never submitted (or have already been written) are
+        ignored. Failed writes are reported by the first `wait()` on their
+        key, however long ago they failed.
+
+        Raises
+        ------
+        BlobWriteError
+            If any of the writes failed.
+        """
+        keys = set(keys)
+        results = [result for key in keys
+                   for result in self.pending.get(key, ())]
+        failures = []
+        for result in results:
+            try:
+                result.get(timeout=timeout)
+            except gevent.Timeout as e:
+                failures.append(e)
+            except Exception:
+                # Recorded in self.failed by _complete().
+                pass
+        for key in keys:
+            failures.extend(self.failed.pop(key, ()))
+        if failures:
+            raise BlobWriteError('{0} blob writes failed: {1}'.format(
+                len(failures), failures))
+
+    def _dispatch(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+            # ThreadPool.spawn blocks while all threads are busy, which is
+            # what keeps the number of in-flight writes bounded.
+            batch_result = self.pool.spawn(
+                _write_batch, [(key, write_fn) for key, write_fn, _ in batch])
+            gevent.spawn(self._complete, batch, batch_result)
+
+    def _complete(self, batch, batch_result):
+        try:
+            errors = [error for _, error in batch_result.get()]
+        except Exception as e:
+            errors = [e] * len(batch)
+        for (key, _, result), error in zip(batch, errors):
+            self.pending[key].remove(result)
+            if not self.pending[key]:
+                del self.pending[key]
+            if error is None:
+                result.set(key)
+            else:
+                log.error('Failed to write blob {0}: {1}'.format(key, error))
+                self.failed[key].append(error)
+                result.set_exception(error)
+
+
+_blob_writer = None
+
+
+def start_blob_writer():
+    """ Start the process-wide blob writer. Idempotent. """
+    global _blob_writer
+    if _blob_writer is None:
+        _blob_writer = BlobWriter(
+            num_threads=config.get('BLOB_WRITER_THREADS',
+                                   DEFAULT_NUM_THREADS),
+            batch_size=config.get('BLOB_WRITER_BATCH_SIZE',
+                                  DEFAULT_BATCH_SIZE)).start()
+    return _blob_writer
+
+
+def get_blob_writer():
+    """ Returns the process-wide blob writer, or None if blobs should be
+    written synchronously. """
+    return _blob_writer
@@ -0,0 +1,381 @@
+""" Pack-file blob store.
+
+The default disk store writes one file per message part, six directory
+levels deep. At hundreds of millions of parts that exhausts inodes, makes
+backups crawl and costs several metadata lookups per read. The pack store
+instead appends blobs to large segment files:
+
+    <pack dir>/segment-000001.pack
+    <pack dir>/segment-000002.pack
+    ...
+    <pack dir>/index.sqlite3
+
+Each record in a segment is a fixed header (magic, sha256, length) followed
+by the blob bytes, so a segment can be scanned to rebuild the index if need
+be. The SQLite index maps sha256 -> (segment, offset, length, refcount).
+Blobs are content-addressed, so a blob that's already packed is never
+appended again; its refcount is bumped instead.
+
+Reads mmap the segment and slice out the record. Deletes drop the refcount
+and, when it reaches zero, account the record's bytes as dead in its
+segment. The compactor copies the live records of a mostly-dead, sealed
+segment into a new segment file and unlinks the old one. Copying and
+fsyncing happen outside the index lock; the lock is only taken to point the
+index at the copies, so writers aren't held up for the length of a rewrite.
+
+Appends happen inside the index's write transaction, so SQLite's lock also
+serializes appenders across threads and processes on the host.
+
+Enable with "BLOB_STORE": "pack" in the config. "MSG_PACK_DIRECTORY"
+defaults to <MSG_PARTS_DIRECTORY>/packs.
+"""
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+
+import gevent
+
+from inbox.config import config
+from inbox.util.blobindex import ImmediateTransaction
+from inbox.util.blobwriter import fsync_path
+from inbox.util.file import mkdirp, remove_file
+from inbox.log import get_logger
+log = get_logger()
+
+
+RECORD_MAGIC = 'IBPK'
+RECORD_HEADER = struct.Struct('>4s64sQ')
+
+# Start a new segment once the active one reaches this size.
+DEFAULT_SEGMENT_SIZE = 1024 * 1024 * 1024
+# Compact sealed segments once at least this fraction of them is dead.
+DEFAULT_COMPACT_THRESHOLD = 0.5
+
+SCHEMA = ["""
+CREATE TABLE IF NOT EXISTS pack_index (
+    sha256 TEXT PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    refcount INTEGER NOT NULL
+)
+""", """
+CREATE INDEX IF NOT EXISTS pack_index_segment ON pack_index (segment)
+""", """
+CREATE TABLE IF NOT EXISTS pack_segment (
+    segment INTEGER PRIMARY KEY,
+    size INTEGER NOT NULL,
+    dead_bytes INTEGER NOT NULL DEFAULT 0
+)
+"""]
+
+
+class PackStore(object):
+    """ Append-only segment files plus a sha256 index.
+
+    Parameters
+    ----------
+    directory : str
+        Where segments and the index live.
+    segment_size : int
+        Size at which the active segment is sealed and a new one started.
+    """
+    def __init__(self, directory, segment_size=DEFAULT_SEGMENT_SIZE):
+        self.directory = directory
+        self.segment_size = segment_size
+        self._local = threading.local()
+        # segment number -> mmap
+        self._maps = {}
+        self._maps_lock = threading.Lock()
+        mkdirp(directory)
+        with self._transaction() as cursor:
+            for statement in SCHEMA:
+                cursor.execute(statement)
+
+    def segment_path(self, segment):
+        return os.path.join(self.directory,
+                            'segment-{0:06d}.pack'.format(segment))
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(
+                os.path.join(self.directory, 'index.sqlite3'), timeout=60,
+                isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _transaction(self):
+        return ImmediateTransaction(self._conn)
+
+    def _active_segment(self, cursor, record_size):
+        row = cursor.execute(
+            'SELECT segment, size FROM pack_segment '
+            'ORDER BY segment DESC LIMIT 1').fetchone()
+        if row is None or row[1] + record_size > self.segment_size:
+            segment = row[0] + 1 if row is not None else 1
+            cursor.execute('INSERT INTO pack_segment (segment, size) '
+                           'VALUES (?, 0)', (segment,))
+            return segment, 0
+        return row
+
+    def _append(self, cursor, data_sha256, data):
+        """ Append a record to the active segment. Must be called inside an
+        index transaction. Returns (segment, offset of the data). """
+        # Hashes read back from the index are unicode; struct wants bytes.
+        record = RECORD_HEADER.pack(RECORD_MAGIC, str(data_sha256),
+                                    len(data)) + data
+        segment, size = self._active_segment(cursor, len(record))
+        with open(self.segment_path(segment), 'ab') as f:
+            # Don't trust the index's idea of the size: a crash between the
+            # write and the index commit leaves an orphaned tail.
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            f.write(record)
+        cursor.execute('UPDATE pack_segment SET size = ? WHERE segment = ?',
+                       (offset + len(record), segment))
+        return segment, offset + RECORD_HEADER.size
+
+    def put(self, data_sha256, data):
+        """ Store `data` unless a blob with this hash is already packed.
+
+        Returns the segment file written to (which the caller must fsync for
+        the write to be durable), or None if nothing was written.
+        """
+        with self._transaction() as cursor:
+            row = cursor.execute(
+                'SELECT refcount FROM pack_index WHERE sha256 = ?',
+                (data_sha256,)).fetchone()
+            if row is not None:
+                cursor.execute(
+                    'UPDATE pack_index SET refcount = refcount + 1 '
+                    'WHERE sha256 = ?', (data_sha256,))
+                return
+            segment, offset = self._append(cursor, data_sha256, data)
+            cursor.execute(
+                'INSERT INTO pack_index '
+                '(sha256, segment, offset, length, refcount) '
+                'VALUES (?, ?, ?, ?, 1)',
+                (data_sha256, segment, offset, len(data)))
+        return self.segment_path(segment)
+
+    def _lookup(self, data_sha256):
+        return self._conn.execute(
+            'SELECT segment, offset, length FROM pack_index '
+            'WHERE sha256 = ?', (data_sha256,)).fetchone()
+
+    def _map(self, segment, end):
+        """ Returns an mmap of `segment` covering at least `end` bytes. The
+        active segment grows, so a cached map may need to be replaced. """
+        with self._maps_lock:
+            m = self._maps.get(segment)
+            if m is None or len(m) < end:
+                with open(self.segment_path(segment), 'rb') as f:
+                    m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                old = self._maps.get(segment)
+                self._maps[segment] = m
+                if old is not None:
+                    old.close()
+            return m
+
+    def _forget_map(self, segment):
+        with self._maps_lock:
+            m = self._maps.pop(segment, None)
+            if m is not None:
+                m.close()
+
+    def get(self, data_sha256):
+        """ Returns the stored bytes, or None if there's no such blob. """
+        for _ in range(2):
+            row = self._lookup(data_sha256)
+            if row is None:
+                return None
+            segment, offset, length = row
+            try:
+                return self._map(segment, offset + length)[
+                    offset:offset + length]
+            except (IOError, OSError, ValueError):
+                # The segment may have been compacted away between the
+                # lookup and the read; the second lookup sees the new home.
+                self._forget_map(segment)
+        log.error('Pack segment for blob {0} is unreadable'.format(
+            data_sha256))
+        return None
+
+    def read(self, data_sha256, start=0, end=None, chunk_size=64 * 1024):
+        """ Yields the stored bytes [start, end) in chunks of at most
+        `chunk_size`, following the blob if compaction moves it mid-read.
+        Yields nothing if there's no such blob. """
+        position = start
+        retried = False
+        while True:
+            row = self._lookup(data_sha256)
+            if row is None:
+                return
+            segment, offset, length = row
+            stop = length if end is None else min(end, length)
+            try:
+                while position < stop:
+                    chunk_end = min(position + chunk_size, stop)
+                    chunk = self._map(segment, offset + chunk_end)[
+                        offset + position:offset + chunk_end]
+                    position = chunk_end
+                    yield chunk
+                return
+            except (IOError, OSError, ValueError):
+                self._forget_map(segment)
+                if retried:
+                    raise
+                retried = True
+
+    def contains(self, data_sha256):
+        return self._lookup(data_sha256) is not None
+
+    def delete(self, data_sha256):
+        """ Drop a reference to the blob. The record's bytes are reclaimed by
+        compaction once nothing references it.
+
+        Returns False if there's no such blob. """
+        with self._transaction() as cursor:
+            row = cursor.execute(
+                'SELECT segment, length, refcount FROM pack_index '
+                'WHERE sha256 = ?', (data_sha256,)).fetchone()
+            if row is None:
+                return False
+            segment, length, refcount = row
+            if refcount > 1:
+                cursor.execute(
+                    'UPDATE pack_index SET refcount = refcount - 1 '
+                    'WHERE sha256 = ?', (data_sha256,))
+                return True
+            cursor.execute('DELETE FROM pack_index WHERE sha256 = ?',
+                           (data_sha256,))
+            cursor.execute(
+                'UPDATE pack_segment SET dead_bytes = dead_bytes + ? '
+                'WHERE segment = ?', (RECORD_HEADER.size + length, segment))
+        return True
+
+    def _copy_live(self, segment):
+        """ Copy the live records of the sealed `segment` to a new, fsynced
+        file. Doesn't take the index lock: the segment is never appended to
+        again, and records deleted meanwhile are caught when the copies are
+        swapped in.
+
+        Returns (path, [(sha256, old offset, new offset, length)], size).
+        """
+        live = self._conn.execute(
+            'SELECT sha256, offset, length FROM pack_index '
+            'WHERE segment = ?', (segment,)).fetchall()
+        path = os.path.join(self.directory,
+                            'compact-{0:06d}.tmp'.format(segment))
+        moved = []
+        with open(path, 'wb') as f:
+            for data_sha256, offset, length in live:
+                data = self._map(segment, offset + length)[
+                    offset:offset + length]
+                f.write(RECORD_HEADER.pack(RECORD_MAGIC, str(data_sha256),
+                                           length))
+                moved.append((data_sha256, offset, f.tell(), length))
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        return path, moved, size
+
+    def _swap_in(self, cursor, segment, path, moved, size):
+        """ Make the copy at `path` a segment and point the index entries
+        still in `segment` at their copies. Must be called inside an index
+        transaction. """
+        # The copy becomes the newest segment, and so the one appended to
+        # next.
+        new_segment = cursor.execute(
+            'SELECT MAX(segment) FROM pack_segment').fetchone()[0] + 1
+        os.rename(path, self.segment_path(new_segment))
+        fsync_path(self.directory)
+        dead_bytes = 0
+        for data_sha256, offset, new_offset, length in moved:
+            cursor.execute(
+                'UPDATE pack_index SET segment = ?, offset = ? '
+                'WHERE sha256 = ? AND segment = ? AND offset = ?',
+                (new_segment, new_offset, data_sha256, segment, offset))
+            if not cursor.rowcount:
+                # Deleted since it was copied.
+                dead_bytes += RECORD_HEADER.size + length
+        cursor.execute(
+            'INSERT INTO pack_segment (segment, size, dead_bytes) '
+            'VALUES (?, ?, ?)', (new_segment, size, dead_bytes))
+
+    def compact(self, threshold=DEFAULT_COMPACT_THRESHOLD):
+        """ Rewrite sealed segments whose dead fraction exceeds `threshold`.
+
+        Returns the number of bytes reclaimed.
+        """
+        reclaimed = 0
+        candidates = self._conn.execute(
+            'SELECT segment, size FROM pack_segment '
+            'WHERE segment < (SELECT MAX(segment) FROM pack_segment) '
+            'AND size > 0 AND dead_bytes >= size * ?',
+            (threshold,)).fetchall()
+        for segment, size in candidates:
+            tmp_path, moved, new_size = self._copy_live(segment)
+            with self._transaction() as cursor:
+                if moved:
+                    self._swap_in(cursor, segment, tmp_path, moved, new_size)
+                else:
+                    remove_file(tmp_path)
+                cursor.execute('DELETE FROM pack_segment WHERE segment = ?',
+                               (segment,))
+            self._forget_map(segment)
+            remove_file(self.segment_path(segment))
+            reclaimed += size - new_size
+            log.info('Compacted pack segment {0}: moved {1} live blobs'.
+                     format(segment, len(moved)))
+        return reclaimed
+
+
+class PackCompactor(gevent.Greenlet):
+    """ Periodically compacts the pack store on the hub's thread pool. """
+    def __init__(self, store, interval=3600,
+                 threshold=DEFAULT_COMPACT_THRESHOLD):
+        self.store = store
+        self.interval = interval
+        self.threshold = threshold
+        gevent.Greenlet.__init__(self)
+
+    def _run(self):
+        from inbox.util.concurrency import retry_with_logging
+        retry_with_logging(self._run_impl, log)
+
+    def _run_impl(self):
+        while True:
+            gevent.sleep(self.interval)
+            reclaimed = gevent.get_hub().threadpool.apply(
+                self.store.compact, (self.threshold,))
+            if reclaimed:
+                log.info('Pack compaction reclaimed {0} bytes'.format(
+                    reclaimed))
+
+
+_pack_store = None
+
+
+def get_pack_store():
+    global _pack_store
+    if _pack_store is None:
+        default_directory = os.path.join(
+            config.get_required('MSG_PARTS_DIRECTORY'), 'packs')
+        _pack_store = PackStore(
+            config.get('MSG_PACK_DIRECTORY', default_directory),
+            segment_size=config.get('MSG_PACK_SEGMENT_SIZE',
+                                    DEFAULT_SEGMENT_SIZE))
+    return _pack_store
+
+
+def start_pack_compactor():
+    interval = config.get('MSG_PACK_COMPACT_INTERVAL', 3600)
+    compactor = PackCompactor(get_pack_store(), interval=interval)
+    compactor.start()
+    return compactor
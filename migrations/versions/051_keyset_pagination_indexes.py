@@ -0,0 +1,41 @@
+"""Indexes for keyset pagination of threads and messages.
+
+Revision ID: 3c11391b7bd4
+Revises: 29217fad3f46
+Create Date: 2014-07-08 14:12:05.107213
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3c11391b7bd4'
+down_revision = '29217fad3f46'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_index('ix_thread_namespace_id_recentdate', 'thread',
+                    ['namespace_id', 'recentdate', 'id'], unique=False)
+
+    # Messages are listed per namespace, which they otherwise only have
+    # through their thread.
+    op.add_column('message', sa.Column('namespace_id', sa.Integer(),
+                                       nullable=True))
+    op.execute('UPDATE message JOIN thread ON message.thread_id = thread.id '
+               'SET message.namespace_id = thread.namespace_id')
+    op.create_index('ix_message_namespace_id_received_date', 'message',
+                    ['namespace_id', 'received_date', 'id'], unique=False)
+    op.create_foreign_key('message_ibfk_2', 'message', 'namespace',
+                          ['namespace_id'], ['id'], ondelete='CASCADE')
+    op.create_index('ix_message_thread_id_received_date', 'message',
+                    ['thread_id', 'received_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_message_thread_id_received_date', table_name='message')
+    op.drop_constraint('message_ibfk_2', 'message', type_='foreignkey')
+    op.drop_index('ix_message_namespace_id_received_date',
+                  table_name='message')
+    op.drop_column('message', 'namespace_id')
+    op.drop_index('ix_thread_namespace_id_recentdate', table_name='thread')
@@ -0,0 +1,62 @@
+"""Denormalized thread summaries
+
+Revision ID: 5a68ac0e3e9
+Revises: 3c11391b7bd4
+Create Date: 2014-07-09 11:23:40.551874
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '5a68ac0e3e9'
+down_revision = '3c11391b7bd4'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    from inbox.sqlalchemy_ext.util import JSON, BigJSON
+    op.create_table(
+        'threadsummary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('thread_id', sa.Integer(), nullable=False),
+        sa.Column('participants', BigJSON, nullable=True),
+        sa.Column('message_public_ids', BigJSON, nullable=True),
+        sa.Column('draft_public_ids', JSON, nullable=True),
+        sa.Column('tags', JSON, nullable=True),
+        sa.Column('unread', sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(['thread_id'], ['thread.id'],
+                                ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('thread_id'))
+    op.create_index('ix_threadsummary_created_at', 'threadsummary',
+                    ['created_at'], unique=False)
+    op.create_index('ix_threadsummary_deleted_at', 'threadsummary',
+                    ['deleted_at'], unique=False)
+    op.create_index('ix_threadsummary_updated_at', 'threadsummary',
+                    ['updated_at'], unique=False)
+
+    from inbox.models.session import session_scope
+    from inbox.models import Thread
+
+    with session_scope(versioned=False, ignore_soft_deletes=False) \
+            as db_session:
+        num_threads, = db_session.query(sa.func.max(Thread.id)).one()
+        if num_threads is None:
+            # There aren't actually any threads to summarize.
+            return
+        for pointer in range(0, num_threads + 1, 1000):
+            print pointer
+            for thread in db_session.query(Thread).filter(
+                    Thread.id >= pointer,
+                    Thread.id < pointer + 1000,
+                    Thread.deleted_at.is_(None)):
+                thread.update_summary()
+            db_session.commit()
+
+
+def downgrade():
+    op.drop_table('threadsummary')
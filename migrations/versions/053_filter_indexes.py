@@ -0,0 +1,40 @@
+"""Indexes backing the API filter query planner.
+
+Revision ID: 4f3a1f6eaee3
+Revises: 5a68ac0e3e9
+Create Date: 2014-07-10 16:40:12.318093
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '4f3a1f6eaee3'
+down_revision = '5a68ac0e3e9'
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index('ix_thread_namespace_id_subject', 'thread',
+                    ['namespace_id', 'subject'], unique=False,
+                    mysql_length={'subject': 191})
+    op.create_index('ix_message_subject', 'message', ['subject'],
+                    unique=False, mysql_length={'subject': 191})
+    op.create_index('ix_contact_account_id_email_address', 'contact',
+                    ['account_id', 'email_address'], unique=False)
+    op.create_index('ix_messagecontactassociation_contact_id_field',
+                    'messagecontactassociation', ['contact_id', 'field'],
+                    unique=False)
+    op.create_index('ix_block_namespace_id_filename', 'block',
+                    ['namespace_id', 'filename'], unique=False)
+    op.create_index('ix_tagitem_tag_id_thread_id', 'tagitem',
+                    ['tag_id', 'thread_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tagitem_tag_id_thread_id', table_name='tagitem')
+    op.drop_index('ix_block_namespace_id_filename', table_name='block')
+    op.drop_index('ix_messagecontactassociation_contact_id_field',
+                  table_name='messagecontactassociation')
+    op.drop_index('ix_contact_account_id_email_address', table_name='contact')
+    op.drop_index('ix_message_subject', table_name='message')
+    op.drop_index('ix_thread_namespace_id_subject', table_name='thread')
@@ -0,0 +1,24 @@
+"""Record whether each transaction is published by the client sync API.
+
+Revision ID: 3c02d8204335
+Revises: 4f3a1f6eaee3
+Create Date: 2014-07-14 11:02:47.561820
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3c02d8204335'
+down_revision = '4f3a1f6eaee3'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    # Existing transactions are left NULL and checked when they're read.
+    op.add_column('transaction', sa.Column('publishable', sa.Boolean(),
+                                           nullable=True))
+
+
+def downgrade():
+    op.drop_column('transaction', 'publishable')
@@ -0,0 +1,55 @@
+"""Composite indexes for the transaction log's access patterns.
+
+Revision ID: 1b6ceae51b43
+Revises: 3c02d8204335
+Create Date: 2014-07-15 14:21:09.772301
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '1b6ceae51b43'
+down_revision = '3c02d8204335'
+
+from alembic import op
+from sqlalchemy.engine import reflection
+
+
+def _index_names(table_name):
+    from inbox.ignition import engine
+    inspector = reflection.Inspector.from_engine(engine)
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade():
+    op.create_index('ix_transaction_namespace_id_id', 'transaction',
+                    ['namespace_id', 'id'], unique=False)
+    op.create_index('ix_transaction_namespace_id_created_at', 'transaction',
+                    ['namespace_id', 'created_at'], unique=False)
+    op.create_index('ix_transaction_table_name_id', 'transaction',
+                    ['table_name', 'id'], unique=False)
+    op.create_index('ix_transaction_table_name_record_id_id', 'transaction',
+                    ['table_name', 'record_id', 'id'], unique=False)
+
+    # Prefixes of the new indexes. The namespace foreign key uses
+    # ix_transaction_namespace_id_id instead of the index MySQL created for
+    # it.
+    existing = _index_names('transaction')
+    for name in ('namespace_id', 'ix_transaction_table_name',
+                 'ix_transaction_record_id'):
+        if name in existing:
+            op.drop_index(name, table_name='transaction')
+
+
+def downgrade():
+    op.create_index('ix_transaction_table_name', 'transaction',
+                    ['table_name'], unique=False)
+    op.create_index('ix_transaction_record_id', 'transaction',
+                    ['record_id'], unique=False)
+    op.create_index('namespace_id', 'transaction', ['namespace_id'],
+                    unique=False)
+    op.drop_index('ix_transaction_table_name_record_id_id',
+                  table_name='transaction')
+    op.drop_index('ix_transaction_table_name_id', table_name='transaction')
+    op.drop_index('ix_transaction_namespace_id_created_at',
+                  table_name='transaction')
+    op.drop_index('ix_transaction_namespace_id_id', table_name='transaction')
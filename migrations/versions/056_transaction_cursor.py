@@ -0,0 +1,38 @@
+"""Durable positions of transaction log consumers.
+
+Revision ID: 2d05e116bdb7
+Revises: 1b6ceae51b43
+Create Date: 2014-07-16 10:47:31.118840
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '2d05e116bdb7'
+down_revision = '1b6ceae51b43'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_table(
+        'transactioncursor',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('transaction_id', sa.Integer(), server_default='0',
+                  nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'))
+    op.create_index('ix_transactioncursor_created_at', 'transactioncursor',
+                    ['created_at'], unique=False)
+    op.create_index('ix_transactioncursor_deleted_at', 'transactioncursor',
+                    ['deleted_at'], unique=False)
+    op.create_index('ix_transactioncursor_updated_at', 'transactioncursor',
+                    ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_table('transactioncursor')
@@ -0,0 +1,23 @@
+"""Let webhooks receive several events per request.
+
+Revision ID: 4b07b67498e1
+Revises: 2d05e116bdb7
+Create Date: 2014-07-17 14:21:09.402318
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '4b07b67498e1'
+down_revision = '2d05e116bdb7'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('webhook', sa.Column('max_batch_size', sa.Integer(),
+                                       nullable=False, server_default='1'))
+
+
+def downgrade():
+    op.drop_column('webhook', 'max_batch_size')
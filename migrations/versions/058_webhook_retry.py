@@ -0,0 +1,42 @@
+"""Store webhook retries.
+
+Revision ID: 1e9a4f3ec7b5
+Revises: 4b07b67498e1
+Create Date: 2014-07-18 16:05:42.871203
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '1e9a4f3ec7b5'
+down_revision = '4b07b67498e1'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_table(
+        'webhookretry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('webhook_id', sa.Integer(), nullable=False),
+        sa.Column('transaction_id', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='1',
+                  nullable=False),
+        sa.Column('retry_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['webhook_id'], ['webhook.id'],
+                                ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('webhook_id', 'transaction_id'))
+    op.create_index('ix_webhookretry_created_at', 'webhookretry',
+                    ['created_at'], unique=False)
+    op.create_index('ix_webhookretry_deleted_at', 'webhookretry',
+                    ['deleted_at'], unique=False)
+    op.create_index('ix_webhookretry_updated_at', 'webhookretry',
+                    ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_table('webhookretry')
@@ -0,0 +1,92 @@
+"""Exercise the bulk API endpoints."""
+import json
+
+from tests.util.base import api_client, mock_syncback_service
+
+
+def test_bulk_fetch(api_client):
+    threads = api_client.get_data('/threads?limit=3')
+    ids = [thread['id'] for thread in reversed(threads)]
+    fetched = api_client.get_data('/threads?ids={}'.format(
+        ','.join(ids + [ids[0], 'nonexistent'])))
+    assert [thread['id'] for thread in fetched] == ids
+
+    messages = api_client.get_data('/messages?limit=3')
+    ids = [message['id'] for message in messages]
+    fetched = api_client.get_data('/messages?ids={}'.format(','.join(ids)))
+    assert fetched == messages
+
+
+def test_bulk_fetch_by_post(api_client):
+    threads = api_client.get_data('/threads?limit=3')
+    ids = [thread['id'] for thread in threads]
+    r = api_client.post_data('/threads/', {'ids': ids + ids})
+    assert r.status_code == 200
+    assert [thread['id'] for thread in json.loads(r.data)] == ids
+
+    messages = api_client.get_data('/messages?limit=3')
+    r = api_client.post_data('/messages/',
+                             {'ids': [m['id'] for m in messages]})
+    assert json.loads(r.data) == messages
+
+    r = api_client.post_data('/threads/', {'ids': [1, 2]})
+    assert r.status_code == 400
+
+
+def test_bulk_fetch_validation(api_client):
+    path = api_client.full_path('/threads?ids=not-an-id', 1)
+    assert api_client.client.get(path).status_code == 400
+
+    path = api_client.full_path('/threads?ids={}'.format(
+        ','.join(str(i) for i in range(1001))), 1)
+    assert api_client.client.get(path).status_code == 400
+
+
+def test_bulk_tag_update(api_client, mock_syncback_service):
+    import gevent
+    from inbox.actions import run_batch, archive
+    gevent.sleep()
+    del mock_syncback_service.queue[:]
+
+    threads = api_client.get_data('/threads?limit=5')
+    ids = [thread['id'] for thread in threads]
+    api_client.put_data('/threads/', {'thread_ids': ids,
+                                      'remove_tags': ['archive']})
+    r = json.loads(api_client.put_data(
+        '/threads/', {'thread_ids': ids,
+                      'add_tags': ['archive', 'starred']}).data)
+    assert r['matched'] == r['updated'] == len(ids)
+    for thread_id in ids:
+        tags = [tag['name'] for tag in
+                api_client.get_data('/threads/{}'.format(thread_id))['tags']]
+        assert 'archive' in tags and 'starred' in tags
+        assert 'inbox' not in tags
+
+    # Applying the same tags again changes nothing.
+    r = json.loads(api_client.put_data(
+        '/threads/', {'thread_ids': ids, 'add_tags': ['archive']}).data)
+    assert r['updated'] == 0
+
+    # One syncback job per action and account, not per thread.
+    gevent.sleep()
+    archive_jobs = [job for job in mock_syncback_service.queue
+                    if job[:2] == (run_batch, archive)]
+    assert len(archive_jobs) == 1
+    assert len(archive_jobs[0][3]) == len(ids)
+
+
+def test_bulk_tag_update_by_filter(api_client):
+    api_client.put_data('/threads?tag=inbox', {'add_tags': ['starred']})
+    starred = api_client.get_data('/threads?tag=starred&limit=1000')
+    inbox = api_client.get_data('/threads?tag=inbox&limit=1000')
+    assert {t['id'] for t in inbox}.issubset({t['id'] for t in starred})
+
+    path = api_client.full_path('/threads/', 1)
+    r = api_client.client.put(path, data='{"add_tags": ["starred"]}')
+    assert r.status_code == 400
+    r = api_client.client.put(
+        path, data='{"add_tags": ["starred"], "remove_tags": ["starred"]}')
+    assert r.status_code == 400
+    r = api_client.put_data('/threads/', {'thread_ids': [1],
+                                          'add_tags': ['starred']})
+    assert r.status_code == 400
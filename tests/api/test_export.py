@@ -0,0 +1,45 @@
+"""Exercise the streaming export API."""
+import json
+
+from tests.util.base import api_client
+
+
+def read_export(api_client, kind, checkpoint=None):
+    path = '/export/{}'.format(kind)
+    if checkpoint is not None:
+        path += '?checkpoint={}'.format(checkpoint)
+    r = api_client.client.get(api_client.full_path(path, 1))
+    assert r.status_code == 200
+    return [json.loads(line) for line in r.data.splitlines()]
+
+
+def test_export_messages(api_client):
+    lines = read_export(api_client, 'messages')
+    assert lines[-1]['object'] == 'checkpoint' and lines[-1]['done']
+    exported = [line['id'] for line in lines if line['object'] != 'checkpoint']
+
+    listed = api_client.get_data('/messages?limit=1000')
+    assert sorted(exported) == sorted(message['id'] for message in listed)
+
+
+def test_export_resumes(api_client, monkeypatch):
+    import inbox.api.export
+    monkeypatch.setattr(inbox.api.export, 'DEFAULT_BATCH_SIZE', 2)
+    lines = read_export(api_client, 'threads')
+    ids = [line['id'] for line in lines if line['object'] == 'thread']
+    checkpoints = [i for i, line in enumerate(lines)
+                   if line['object'] == 'checkpoint']
+    assert len(checkpoints) > 1
+
+    # Resuming from the first checkpoint yields everything after it.
+    resumed = read_export(api_client, 'threads',
+                          lines[checkpoints[0]]['checkpoint'])
+    assert [line['id'] for line in resumed if line['object'] == 'thread'] == \
+        ids[2:]
+
+
+def test_export_errors(api_client):
+    path = api_client.full_path('/export/tags', 1)
+    assert api_client.client.get(path).status_code == 404
+    path = api_client.full_path('/export/threads?checkpoint=bogus', 1)
+    assert api_client.client.get(path).status_code == 400
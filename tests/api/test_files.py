@@ -0,0 +1,56 @@
+"""Exercise the file download API."""
+import json
+from hashlib import sha256
+from StringIO import StringIO
+
+from tests.util.base import api_client
+
+# Large enough to span several stream chunks.
+DATA = ''.join(chr(i % 251) for i in range(200 * 1024))
+
+
+def upload(api_client, data):
+    path = api_client.full_path('/files/', 1)
+    r = api_client.client.post(
+        path, data={'upload': (StringIO(data), 'data.bin')})
+    return json.loads(r.data)[0]['id']
+
+
+def test_download_streams_whole_file(api_client):
+    file_id = upload(api_client, DATA)
+    path = api_client.full_path('/files/{}/download'.format(file_id), 1)
+    r = api_client.client.get(path)
+    assert r.status_code == 200
+    assert r.data == DATA
+    assert r.headers['Accept-Ranges'] == 'bytes'
+    assert r.headers['ETag'] == '"{}"'.format(sha256(DATA).hexdigest())
+
+    r = api_client.client.get(path,
+                              headers={'If-None-Match': r.headers['ETag']})
+    assert r.status_code == 304
+    assert not r.data
+
+
+def test_download_range(api_client):
+    file_id = upload(api_client, DATA)
+    path = api_client.full_path('/files/{}/download'.format(file_id), 1)
+
+    r = api_client.client.get(path, headers={'Range': 'bytes=100-70000'})
+    assert r.status_code == 206
+    assert r.data == DATA[100:70001]
+    assert r.headers['Content-Range'] == 'bytes 100-70000/{}'.format(
+        len(DATA))
+
+    r = api_client.client.get(path, headers={'Range': 'bytes=-10'})
+    assert r.status_code == 206
+    assert r.data == DATA[-10:]
+
+    r = api_client.client.get(
+        path, headers={'Range': 'bytes={}-'.format(len(DATA) + 10)})
+    assert r.status_code == 416
+
+    # A stale If-Range gets the whole file.
+    r = api_client.client.get(path, headers={'Range': 'bytes=0-9',
+                                             'If-Range': '"stale"'})
+    assert r.status_code == 200
+    assert r.data == DATA
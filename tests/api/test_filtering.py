@@ -1,5 +1,6 @@
 import datetime
 import calendar
+import json
 from inbox.models import Message
 from tests.util.base import api_client
 
@@ -91,3 +92,47 @@ def test_filtering(db, api_client):
                                   format('inboxapptest@gmail.com', 3))
     assert len(results) == 3
     assert len(results) == 3
+
+
+def test_cursor_pagination(api_client):
+    for resource in ('/threads', '/messages'):
+        everything = [obj['id'] for obj in
+                      api_client.get_data('{}?limit=1000'.format(resource))]
+        assert len(everything) > 4
+
+        paged = []
+        path = api_client.full_path('{}?limit=3'.format(resource), 1)
+        while True:
+            r = api_client.client.get(path)
+            assert r.status_code == 200
+            paged.extend(obj['id'] for obj in json.loads(r.data))
+            cursor = r.headers.get('X-Next-Cursor')
+            if cursor is None:
+                break
+            path = api_client.full_path(
+                '{}?limit=3&cursor={}'.format(resource, cursor), 1)
+        assert paged == everything
+
+    r = api_client.client.get(api_client.full_path('/threads?cursor=bogus', 1))
+    assert r.status_code == 400
+
+
+def test_selective_restriction_drives_query(db):
+    from inbox.api.filtering import Filter
+    params = dict.fromkeys((
+        'subject', 'from_addr', 'to_addr', 'cc_addr', 'bcc_addr', 'any_email',
+        'thread_public_id', 'started_before', 'started_after',
+        'last_message_before', 'last_message_after', 'filename'))
+    api_filter = Filter(namespace_id=NAMESPACE_ID, tag='inbox',
+                        any_email='inboxapptest@gmail.com', limit=100,
+                        offset=0, order_by=None, db_session=db.session,
+                        **params)
+    threads = api_filter.get_threads()
+    assert threads
+    assert all('inbox' in [tag.public_id for tag in thread.tags]
+               for thread in threads)
+    # Every restriction is small in the test data, so one of them drives
+    # the query and the other is checked as a semi-join.
+    assert len(api_filter.plan) == 2
+    assert api_filter.plan[0].startswith('drive by')
+    assert api_filter.plan[1].startswith('semi-join')
@@ -0,0 +1,29 @@
+"""Exercise namespace resolution in the API."""
+from tests.util.base import api_client
+
+
+def test_namespace_cache(db):
+    from inbox.api.namespace_cache import NamespaceCache
+    from inbox.models import Namespace
+    namespace = db.session.query(Namespace).first()
+
+    cache = NamespaceCache(ttl=60)
+    cached = cache.get(namespace.public_id, db.session)
+    assert cached.id == namespace.id
+    assert cached.account_id == namespace.account_id
+    assert cache.get(namespace.public_id, db.session) is cached
+
+    cache.ttl = -1
+    assert cache.get(namespace.public_id, db.session) is not cached
+    assert cache.get('0' * 25, db.session) is None
+
+
+def test_bad_requests(api_client):
+    r = api_client.client.get('/n/{}/threads'.format('0' * 25))
+    assert r.status_code == 404
+
+    # Filter arguments are only checked by endpoints that use them.
+    path = api_client.full_path('/threads?started_before=yesterday', 1)
+    assert api_client.client.get(path).status_code == 400
+    path = api_client.full_path('/tags/?started_before=yesterday', 1)
+    assert api_client.client.get(path).status_code == 200
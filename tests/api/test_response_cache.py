@@ -0,0 +1,68 @@
+"""Exercise caching of API listings."""
+import json
+
+from sqlalchemy import func
+
+from tests.util.base import api_client, db
+
+
+def test_unchanged_listing_not_modified(api_client):
+    path = api_client.full_path('/threads?limit=5', 1)
+    r = api_client.client.get(path)
+    assert r.status_code == 200
+    etag = r.headers['ETag']
+
+    r = api_client.client.get(path, headers={'If-None-Match': etag})
+    assert r.status_code == 304
+    assert not r.data
+
+    # Different arguments are cached separately.
+    other = api_client.client.get(path + '&offset=1')
+    assert other.headers['ETag'] != etag
+
+
+def test_new_transaction_invalidates(api_client):
+    path = api_client.full_path('/tags/', 1)
+    first = api_client.client.get(path)
+    assert api_client.client.get(path).data == first.data
+
+    api_client.post_data('/tags/', {'name': 'cached'})
+    r = api_client.client.get(path,
+                              headers={'If-None-Match': first.headers['ETag']})
+    assert r.status_code == 200
+    assert r.headers['ETag'] != first.headers['ETag']
+    assert 'cached' in [tag['name'] for tag in json.loads(r.data)]
+
+
+def test_cache_eviction():
+    from inbox.api.response_cache import ResponseCache
+    cache = ResponseCache(max_entries=2)
+    cache.set('a', 1, 'A', [])
+    cache.set('b', 1, 'B', [])
+    assert cache.get('a', 1) == ('A', [])
+    cache.set('c', 1, 'C', [])
+    # 'b' was least recently used.
+    assert cache.get('b', 1) is None
+    assert cache.get('a', 1) == ('A', [])
+    # A stale version is a miss, and is dropped.
+    assert cache.get('a', 2) is None
+    assert cache.get('a', 1) is None
+
+
+def test_version_changes_on_late_commit(db):
+    """ A transaction with a lower id that's committed after the latest one
+    still changes the version. """
+    from inbox.api.response_cache import namespace_version
+    from inbox.models import Transaction
+    max_id = db.session.query(func.max(Transaction.id)).scalar()
+
+    def add(id_):
+        db.session.add(Transaction(id=id_, namespace_id=1,
+                                   table_name='thread', record_id=1,
+                                   object_public_id='abc', command='update'))
+        db.session.commit()
+
+    add(max_id + 2)
+    version = namespace_version(db.session, 1)
+    add(max_id + 1)
+    assert namespace_version(db.session, 1) != version
@@ -0,0 +1,25 @@
+"""Exercise API JSON serialization."""
+import json
+
+from tests.util.base import api_client
+
+
+def test_compact_unless_pretty(api_client):
+    path = api_client.full_path('/threads?limit=2', 1)
+    compact = api_client.client.get(path).data
+    assert '\n' not in compact
+
+    pretty = api_client.client.get(path + '&pretty=1').data
+    assert pretty.startswith('[\n    {')
+    assert json.loads(pretty) == json.loads(compact)
+
+
+def test_encoder_dispatch_follows_subclasses(db):
+    from inbox.api.kellogs import encode, encoder_for
+    from inbox.models import Block, Part, Message, SpoolMessage, Thread
+
+    assert encoder_for(Part) is not encoder_for(Block)
+    assert encoder_for(SpoolMessage) is not encoder_for(Message)
+    thread = db.session.query(Thread).first()
+    assert encode(thread)['object'] == 'thread'
+    assert encode(object()) is None
@@ -137,19 +137,18 @@ def test_actions_syncback(api_client, mock_syncback_service):
     api_client.put_data(thread_path, {'remove_tags': ['archive']})
     api_client.put_data(thread_path, {'remove_tags': ['starred']})
 
-    # Add and remove tags that should trigger actions
-
-    api_client.put_data(thread_path, {'add_tags': ['unread']})
-    api_client.put_data(thread_path, {'remove_tags': ['unread']})
-
-    api_client.put_data(thread_path, {'add_tags': ['archive']})
-    api_client.put_data(thread_path, {'remove_tags': ['archive']})
-
-    api_client.put_data(thread_path, {'add_tags': ['starred']})
-    api_client.put_data(thread_path, {'remove_tags': ['starred']})
+    # Add and remove tags that should trigger actions. Let the service run
+    # after each change, since a change undone within the same pass over
+    # the log is never synced back.
+    for tag in ['unread', 'archive', 'starred']:
+        gevent.sleep()
+        api_client.put_data(thread_path, {'add_tags': [tag]})
+        gevent.sleep()
+        api_client.put_data(thread_path, {'remove_tags': [tag]})
 
     gevent.sleep()
 
-    queued_actions = [item[0] for item in mock_syncback_service.queue]
+    # Jobs are (run_batch, action, account_id, thread_ids).
+    queued_actions = [item[1] for item in mock_syncback_service.queue]
     for action in [mark_read, mark_unread, archive, unarchive, star, unstar]:
         assert action in queued_actions
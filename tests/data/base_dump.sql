@@ -132,7 +132,7 @@ CREATE TABLE `alembic_version` (
 
 LOCK TABLES `alembic_version` WRITE;
 /*!40000 ALTER TABLE `alembic_version` DISABLE KEYS */;
-INSERT INTO `alembic_version` VALUES ('29217fad3f46');
+INSERT INTO `alembic_version` VALUES ('1e9a4f3ec7b5');
 /*!40000 ALTER TABLE `alembic_version` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -161,6 +161,7 @@ CREATE TABLE `block` (
   KEY `ix_block_created_at` (`created_at`),
   KEY `ix_block_deleted_at` (`deleted_at`),
   KEY `ix_block_updated_at` (`updated_at`),
+  KEY `ix_block_namespace_id_filename` (`namespace_id`,`filename`),
   CONSTRAINT `block_ibfk_1` FOREIGN KEY (`namespace_id`) REFERENCES `namespace` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=51 DEFAULT CHARSET=utf8mb4;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -204,6 +205,7 @@ CREATE TABLE `contact` (
   KEY `ix_contact_created_at` (`created_at`),
   KEY `ix_contact_deleted_at` (`deleted_at`),
   KEY `ix_contact_updated_at` (`updated_at`),
+  KEY `ix_contact_account_id_email_address` (`account_id`,`email_address`),
   CONSTRAINT `contact_ibfk_1` FOREIGN KEY (`account_id`) REFERENCES `account` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=9 DEFAULT CHARSET=utf8mb4;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -738,6 +740,7 @@ CREATE TABLE `message` (
   `updated_at` datetime NOT NULL,
   `deleted_at` datetime DEFAULT NULL,
   `is_read` tinyint(1) NOT NULL DEFAULT '0',
+  `namespace_id` int(11) DEFAULT NULL,
   PRIMARY KEY (`id`),
   KEY `thread_id` (`thread_id`),
   KEY `ix_message_g_msgid` (`g_msgid`),
@@ -746,7 +749,11 @@ CREATE TABLE `message` (
   KEY `ix_message_created_at` (`created_at`),
   KEY `ix_message_deleted_at` (`deleted_at`),
   KEY `ix_message_updated_at` (`updated_at`),
-  CONSTRAINT `message_ibfk_1` FOREIGN KEY (`thread_id`) REFERENCES `thread` (`id`) ON DELETE CASCADE
+  KEY `ix_message_namespace_id_received_date` (`namespace_id`,`received_date`,`id`),
+  KEY `ix_message_thread_id_received_date` (`thread_id`,`received_date`),
+  KEY `ix_message_subject` (`subject`(191)),
+  CONSTRAINT `message_ibfk_1` FOREIGN KEY (`thread_id`) REFERENCES `thread` (`id`) ON DELETE CASCADE,
+  CONSTRAINT `message_ibfk_2` FOREIGN KEY (`namespace_id`) REFERENCES `namespace` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=17 DEFAULT CHARSET=utf8mb4;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -756,7 +763,7 @@ CREATE TABLE `message` (
 
 LOCK TABLES `message` WRITE;
 /*!40000 ALTER TABLE `message` DISABLE KEYS */;
-INSERT INTO `message` VALUES (1,'�b\"_MF��',1,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuP6D+RUW5T_ZbER9T-O--qYDj_JbgD72RGGfrSkJteQ4Q@mail.gmail.com>','asiuhdakhsdf','2014-04-03 02:19:42',2127,'f92545e762b44776e0cb3fdad773f47a563fd5cb72a7fc31c26a2c43cc764343','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">iuhasdklfhasdf</div></body></html>','iuhasdklfhasdf',0,1464327557735981576,1464327557735981576,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(2,'zR��Dc@7�',2,'[[\"\'Rui Ueyama\' via golang-nuts\", \"golang-nuts@googlegroups.com\"]]','[[\"\", \"golang-nuts@googlegroups.com\"]]','[[\"Rui Ueyama\", \"ruiu@google.com\"]]','[[\"Paul Tiseo\", \"paulxtiseo@gmail.com\"]]','[[\"golang-nuts\", \"golang-nuts@googlegroups.com\"]]','[]','\"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\"','<CAJENXgt5t4yYJdDuV7m2DKwcDEbsY8TohVWmgmMqhnqC3pGwMw@mail.gmail.com>','[go-nuts] Runtime Panic On Method Call','2014-05-03 00:26:05',10447,'e317a191277854cb8b88481268940441a065bad48d02d5a477f0564d4cbe5297','{\"List-Id\": \"<golang-nuts.googlegroups.com>\", \"List-Post\": \"<http://groups.google.com/group/golang-nuts/post>, <mailto:golang-nuts@googlegroups.com>\", \"List-Owner\": null, \"List-Subscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:golang-nuts+subscribe@googlegroups.com>\", \"List-Unsubscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:googlegroups-manage+332403668183+unsubscribe@googlegroups.com>\", \"List-Archive\": \"<http://groups.google.com/group/golang-nuts>\", \"List-Help\": \"<http://groups.google.com/support/>, <mailto:golang-nuts+help@googlegroups.com>\"}',0,'<html><body><div dir=\"ltr\">I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground.<div class=\"gmail_extra\"></div></div>\n<p></p>\n\n-- <br/>\nYou received this message because you are subscribed to the Google Groups \"golang-nuts\" group.<br/>\nTo unsubscribe from this group and stop receiving emails from it, send an email to <a href=\"mailto:golang-nuts+unsubscribe@googlegroups.com\">golang-nuts+unsubscribe@googlegroups.com</a>.<br/>\nFor more options, visit <a href=\"https://groups.google.com/d/optout\">https://groups.google.com/d/optout</a>.<br/></body></html>','I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground. \n \n\n--  \nYou received this message because you are subscribed to the Google Grou',0,1467038319150540079,1467038319150540079,NULL,'\"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1),(3,'��%�lB',3,'[[\"Gmail Team\", \"mail-noreply@google.com\"]]','[]','[]','[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CAOPuB_MAEq7GsOVvWgE+qHR_6vWYXifHhF+hQ1sFyzk_eKPYpQ@mail.gmail.com>','Tips for using Gmail','2013-08-20 18:02:28',15711,'8f62d93f04735652b9f4edc89bc764e5b48fff1bcd0acec67718047c81d76051','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html xmlns=\"http://www.w3.org/1999/xhtml\"><head><meta content=\"text/html;charset=utf-8\" http-equiv=\"content-type\"/><title>Tips for using Gmail</title></head><body link=\"#1155CC\" marginheight=\"0\" marginwidth=\"0\" text=\"#444444\">\n<table bgcolor=\"#f5f5f5\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"100%\">\n<tr>\n<td> </td>\n<td height=\"51\" width=\"64\"><img alt=\"\" height=\"51\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td background=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-middle.png\" bgcolor=\"#f5f5f5\" height=\"51\" valign=\"bottom\" width=\"673\">\n</td>\n<td height=\"51\" width=\"64\"><img alt=\"\" height=\"51\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-right.png\" style=\"display:block\" width=\"68\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"225\" width=\"64\"><img alt=\"\" height=\"225\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td bgcolor=\"#ffffff\" valign=\"top\" width=\"668\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"100%\">\n<tr>\n<td colspan=\"3\"> </td>\n</tr>\n<tr>\n<td align=\"center\" colspan=\"3\" height=\"50\" valign=\"bottom\"><img alt=\"\" src=\"https://ssl.gstatic.com/drive/announcements/images/logo.gif\" style=\"display:block\"/></td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"40\"> </td>\n</tr>\n<tr>\n<td> </td>\n<td width=\"450\">\n<b>\n<font color=\"#444444\" face=\"Arial, sans-serif\" size=\"-1\" style=\"line-height: 1.4em\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_small.png\" style=\"display:block;float:left;margin-top:4px;margin-right:3px;\"/>Hi Inbox\n                    </font>\n</b>\n</td>\n<td> </td>\n</tr>\n<tr>\n<td height=\"40\" valign=\"top\">\n</td></tr>\n<tr>\n<td width=\"111\"> </td>\n<td align=\"left\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"540\">\n<tr>\n<td valign=\"top\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"+2\"><span style=\"font-family:Open Sans, Arial, sans-serif; font-size: 25px\">Tips for using Gmail</span></font></td>\n</tr>\n</table>\n</td>\n<td width=\"111\"> </td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"10\"> </td>\n</tr>\n</table>\n</td>\n<td height=\"225\" width=\"64\"><img alt=\"\" height=\"225\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-right.png\" style=\"display:block\" width=\"64\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"950\" width=\"64\"><img alt=\"\" height=\"950\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td align=\"center\" bgcolor=\"#ffffff\" valign=\"top\" width=\"668\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"540\">\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_hangouts.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Chat right from your inbox</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">Chat with contacts and start video chats with up to 10 people in <a href=\"http://www.google.com/+/learnmore/hangouts/?hl=en\" style=\"text-decoration:none;\">Google+ Hangouts</a>.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_contacts.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Bring your email into Gmail</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">You can import your email from other webmail to make the transition to Gmail a bit easier. <a href=\"https://support.google.com/mail/answer/164640?hl=en\" style=\"text-decoration:none;\">Learn how.</a></font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_drive.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Use Google Drive to send large files</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\"><a href=\"https://support.google.com/mail/answer/2480713?hl=en\" style=\"text-decoration:none;\">Send huge files in Gmail </a>  (up to 10GB) using <a href=\"https://drive.google.com/?hl=en\" style=\"text-decoration:none;\">Google Drive</a>. Plus files stored in Drive stay up-to-date automatically so everyone has the most recent version and can access them from anywhere.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_storage.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Save everything</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">With 10GB of space, you’ll never need to delete an email. Just keep everything and easily find it later.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_search.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Find emails fast</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">With the power of Google Search right in your inbox, you can quickly find the important emails you need with suggestions based on emails, past searches and contacts.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n</table>\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"500\">\n<tr>\n<td colspan=\"2\" height=\"40\"> </td>\n</tr>\n<tr>\n<td rowspan=\"2\" width=\"68\"><img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_large.png\" style=\"display:block\"/></td>\n<td align=\"left\" height=\"20\" valign=\"bottom\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"-1\">Happy emailing,</font></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"+2\"><span style=\"font-family:Open Sans, Arial, sans-serif;\">The Gmail Team</span></font></td>\n</tr>\n<tr>\n<td colspan=\"2\" height=\"60\"> </td>\n</tr>\n</table>\n</td>\n<td height=\"950\" width=\"64\"><img alt=\"\" height=\"950\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-right.png\" style=\"display:block\" width=\"64\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"102\" width=\"64\"><img alt=\"\" height=\"102\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td background=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-middle.png\" height=\"102\" valign=\"top\" width=\"673\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"100%\">\n<tr>\n<td height=\"12\"></td>\n</tr>\n<tr>\n<td valign=\"bottom\">\n<font color=\"#AAAAAA\" face=\"Arial, sans-serif\" size=\"-2\">\n                  © 2013 Google Inc. 1600 Amphitheatre Parkway, Mountain View, CA 94043\n                </font>\n</td>\n</tr>\n</table>\n</td>\n<td height=\"102\" width=\"64\"><img alt=\"\" height=\"102\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-right.png\" style=\"display:block\" width=\"68\"/></td>\n<td> </td>\n</tr>\n</table>\n</body></html>','\n \n \n   \n \n \n \n \n   \n \n \n   \n \n \n \n \n   \n \n \n \n \n \n   \n \n \n   \n \n \n \n Hi Inbox\n                     \n \n \n   \n \n \n \n \n \n   \n \n \n \n Tips for using Gmail \n \n \n \n   \n \n \n   \n \n \n \n \n   \n \n \n   \n ',0,1443911956831022215,1443911956831022215,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1),(4,'FqR��O�',4,'[[\"Christine Spang\", \"christine@spang.cc\"]]','[[\"\", \"christine.spang@gmail.com\"]]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CAFMxqJyA0xft8f67uEcDiTAs8pgfXO26VaipnGHngFB45Vwiog@mail.gmail.com>','trigger poll','2014-03-21 04:53:00',2178,'6b0736bd5f6e9cb4200e1b280ac649229ee78eae1447028a7489b68739506c3a','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">hi</div></body></html>','hi',0,1463159441433026019,1463159441433026019,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(5,'@��hlvKa�-',5,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuM+fcDS9QGXnvOEvm-N8VjF8XxgVLtYLZ0=ENx_0A8u2A@mail.gmail.com>','idle trigger','2014-04-03 02:28:34',3003,'4461bfa07c3638fa6082535ecb1affb98e3a5a855d32543ac6e7f1d66c95c08e','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">idle trigger</div></body></html>','idle trigger',0,1464328115838585338,1464328115838585338,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(6,'���3��',6,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuN+beJ_br_j0uifnXUE+EFAf_bDDBJ0tB-Zkd_2USTc+w@mail.gmail.com>','idle test 123','2014-04-03 03:10:48',2126,'be9b8517433ab5524b7719653d2a057d1f0e4145b4f111e9e4c83dbab6bd6242','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">idle test 123</div></body></html>','idle test 123',0,1464330773292835572,1464330773292835572,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1),(7,':lZTO��',7,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuNcTC0_37JuNRQugskTCyYM9-HrszhPKfrf+JqOJE8ntA@mail.gmail.com>','another idle test','2014-04-03 02:34:43',2124,'8adff77788264670035888b1cb2afc6edd4a20b50c43f5b11874f2bc84d1c835','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">hello</div></body></html>','hello',0,1464328502421499234,1464328502421499234,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(8,'e�݀]G��',8,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuOoG=Haky985B_Lx3J0kBo1o8J+2rH87qdpnyHg1+JVJA@mail.gmail.com>','ohaiulskjndf','2014-04-03 02:55:54',2994,'6e4a76ba1ca34b0b4edd2d164229ad9d4b8a5d53ea53dc214799c93b802f2340','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">aoiulhksjndf</div></body></html>','aoiulhksjndf',0,1464329835043990839,1464329835043990839,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1),(9,'\nkg�Q�G�',9,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuM6jXXOtc7KGU-M4bQKkP3wXxjnrBWFhbznsJDsiauHmA@mail.gmail.com>','guaysdhbjkf','2014-04-03 02:46:00',2165,'e5cc414d931127db23a633eb27b12b1fa7621562ee639487b20c18818cb78437','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">a8ogysuidfaysogudhkbjfasdf<div><br/></div></div></body></html>','a8ogysuidfaysogudhkbjfasdf',0,1464329212533881603,1464329212533881603,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(10,'O���O�',10,'[[\"\", \"no-reply@accounts.google.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<MC4rhxPMVYU1ydNeoLDDDA@notifications.google.com>','Google Account recovery phone number changed','2013-10-21 02:55:43',19501,'7836dd4eef7852ea9e9fafae09cc40d18887478d8279d0c2e215c2a7daad3deb','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html lang=\"en\"><body style=\"margin:0; padding: 0;\">\n<table align=\"center\" bgcolor=\"#f1f1f1\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" height=\"100%\" style=\"border-collapse: collapse\" width=\"100%\">\n<tr align=\"center\">\n<td valign=\"top\">\n<table bgcolor=\"#f1f1f1\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" height=\"60\" style=\"border-collapse: collapse\">\n<tr height=\"40\" valign=\"middle\">\n<td width=\"9\"></td>\n<td valign=\"middle\" width=\"217\">\n<img alt=\"Google Accounts\" border=\"0\" height=\"40\" src=\"cid:google\" style=\"display: block;\"/>\n</td>\n<td style=\"font-size: 13px; font-family: arial, sans-serif; color: #777777; text-align: right\" width=\"327\">\n            \n              Inbox App\n            \n          </td>\n<td width=\"10\"></td>\n<td><img src=\"cid:profilephoto\"/></td>\n<td width=\"10\"></td>\n</tr>\n</table>\n<table bgcolor=\"#ffffff\" border=\"1\" bordercolor=\"#e5e5e5\" cellpadding=\"0\" cellspacing=\"0\" style=\"text-align: left\">\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n<tr>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\">\n</td>\n<td style=\"font-size: 83%; border-top: none; border-bottom: none; border-left: none; border-right: none; font-size: 13px; font-family: arial, sans-serif; color: #222222; line-height: 18px\" valign=\"top\" width=\"568\">\n            \n              Hi Inbox,\n              <br/>\n<br/>\n            \n\n\nThe recovery phone number for your Google Account - inboxapptest@gmail.com - was recently changed. If you made this change, you don\'t need to do anything more.\n\n<br/>\n<br/>\n\nIf you didn\'t change your recovery phone, someone may have broken into your account. Visit this link for more information: <a href=\"https://support.google.com/accounts/bin/answer.py?answer=2450236\" style=\"text-decoration: none; color: #4D90FE\">https://support.google.com/accounts/bin/answer.py?answer=2450236</a>.\n\n<br/>\n<br/>\n\nIf you are having problems accessing your account, reset your password by clicking the button below:\n\n<br/>\n<br/>\n<a href=\"https://accounts.google.com/RecoverAccount?fpOnly=1&amp;source=ancrppe&amp;Email=inboxapptest@gmail.com\" style=\"text-align: center; font-size: 11px; font-family: arial, sans-serif; color: white; font-weight: bold; border-color: #3079ed; background-color: #4d90fe; background-image: linear-gradient(top,#4d90fe,#4787ed); text-decoration: none; display:inline-block; height: 27px; padding-left: 8px; padding-right: 8px; line-height: 27px; border-radius: 2px; border-width: 1px;\" target=\"_blank\">\n<span style=\"color: white;\">\n    \n      Reset password\n    \n  </span>\n</a>\n<br/>\n<br/>\n                \n                  Sincerely,<br/>\n                  The Google Accounts team\n                \n                </td>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\">\n</td>\n</tr>\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n<tr>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\"></td>\n<td style=\"font-size: 11px; font-family: arial, sans-serif; color: #777777; border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"568\">\n                \n                  This email can\'t receive replies. For more information, visit the <a href=\"https://support.google.com/accounts/bin/answer.py?answer=2450236\" style=\"text-decoration: none; color: #4D90FE\"><span style=\"color: #4D90FE;\">Google Accounts Help Center</span></a>.\n                \n                </td>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\"></td>\n</tr>\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n</table>\n<table bgcolor=\"#f1f1f1\" height=\"80\" style=\"text-align: left\">\n<tr valign=\"middle\">\n<td style=\"font-size: 11px; font-family: arial, sans-serif; color: #777777;\">\n                  \n                    You received this mandatory email service announcement to update you about important changes to your Google product or account.\n                  \n                  <br/>\n<br/>\n<div style=\"direction: ltr;\">\n                  \n                    © 2013 Google Inc., 1600 Amphitheatre Parkway, Mountain View, CA 94043, USA\n                  \n                  </div>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n</table>\n</body></html>','\n \n \n \n \n \n \n \n \n \n \n            \n              Inbox App\n            \n           \n \n \n \n \n \n \n \n \n \n \n \n \n \n \n            \n              Hi Inbox,\n               \n \n            \n\n\nThe recove',0,1449471921372979402,1449471921372979402,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(11,'䥪+%�F��',11,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<5361906e.c3ef320a.62fb.064c@mx.google.com>','Wakeup78fcb997159345c9b160573e1887264a','2014-05-01 00:08:14',1238,'aa2f127af89b74364ae781becd35704c48f690a3df0abd90e543eafc2ef4d590','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466856002099058157,1466856002099058157,'c64be65384804950972d7cb34cd33c69','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(12,'\0B�sҝM ��',12,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53618e85.e14f320a.1f54.21a6@mx.google.com>','Wakeup1dd3dabe7d9444da8aec3be27a82d030','2014-05-01 00:00:05',1199,'4a07bb7d5d933c811c267c0262525de7c468d735e9b6edb0ee2060b6f24ab330','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466855488650356657,1466855488650356657,'e4f72ba9f22842bab7d41e6c4b877b83','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(13,'�����',13,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53618c4e.a983320a.45a5.21a5@mx.google.com>','Wakeupe2ea85dc880d421089b7e1fb8cc12c35','2014-04-30 23:50:38',1200,'91b33ba2f89ca4006d4b5c26d760d4e253bb3f4ed5c87efe964545c2c4ca0db4','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466854894292093968,1466854894292093968,'d1dea076298a4bd09178758433f7542c','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(14,'�o�)aAڤT',14,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<536030e2.640e430a.04ce.ffff8de9@mx.google.com>','Wakeup735d8864f6124797a10e94ec5de6be13','2014-04-29 23:08:18',1205,'73b93d369f20843a12a81daf72788b1b7fbe703c4abd289f69d1e41f212833a0','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466761634398434761,1466761634398434761,'5bf16c2bc9684717a9b77b73cbe9ba45','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(15,'����G^',15,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53602f7d.a6a3420a.73de.6c0b@mx.google.com>','Wakeup2eba715ecd044a55ae4e12f604a8dc96','2014-04-29 23:02:21',1242,'b13ddac39e20275606cf2f651e269f22f850ac18dce43cf18de982ed3ac20e4f','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466761259745473801,1466761259745473801,'7e7d36a5b6f54af1af551a55b48d1735','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0),(16,'���>ߤG�',16,'[[\"kavya joshi\", \"kavya719@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]','\"<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\"','<CAMpoCYqq6BmoRW+MouXOwDxiA=DO20b=sG4e2agmr04Bt8Wg_g@mail.gmail.com>','Golden Gate Park next Sat','2014-04-24 08:58:04',13142,'a5993aef718c4ce3ffd93f0a3cf3a4e54f93278bcb5873a533de3882c383e706','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\"><br/><br/><br/></div></body></html>','',0,1466255156975764289,1466255156975764289,NULL,'\"<CA+ADUwxeXG8+=Mya+T1Qb_RYS23w6=_EZgssm3GgW6SkhXPxGQ@mail.gmail.com>\\t<F7C679E5-09F7-4F17-B1CA-A67A6B207650@gmail.com>\\t<CAPGJ9TSw5oHjhDNGNa3zs4GQ1WC=bCJ8UTdF12NFqgSdYib9FA@mail.gmail.com>\\t<CAPGJ9TRPNG7pS0JTEZog1A+usobFsH3S5nE0EbPbqtwBW3dKKw@mail.gmail.com>\\t<CA+ADUwytg_oZ6B2HfW=v=Vy39G1t1vT17UpjUTaYJuqr8FYR6w@mail.gmail.com>\\t<CALEp7UFOAXWGgMUW9_GVmJfd1xQSfmXHoGs3rajEd6wZwra1Qw@mail.gmail.com>\\t<CA+ADUwwh7gmTDfzVObOkcm0d=5j9mMZt-NxswDqXv9VnpYg_Lg@mail.gmail.com>\\t<CAMpoCYqjMdo=dVvQMZZE5BhZMb2sZkznQnc=7K6kZ_M6NCg+EQ@mail.gmail.com>\\t<CAPGJ9TQi7Rqxr+HmjASJJ0o2OMgFBG5z-mguUQuy8su1fakLiQ@mail.gmail.com>\\t<CA+ADUwzEgH6GC=ji5FT0m+i1XSxu0uamwrqAwGMAZhg-qWvL2g@mail.gmail.com>\\t<CAPGJ9TQkb923ZKeVxqfqB=JeLnhE9-MOAigRrHo-PZCtueZ-Tg@mail.gmail.com>\\t<3A2441BA-C669-4533-A67A-5CE841A82B54@gmail.com>\\t<CALEp7UFN3t=rzzZ_in=3LvAypVN=S9hi_RQkpKwc1kc13ymYTw@mail.gmail.com>\\t<CALRhdLLxFd1L5D+7RoUKVqq0G62cLJezYmMZaST2eiB7kQDCPw@mail.gmail.com>\\t<CAPGJ9TQe4TyhwmS3vbu1hkZgDkNzsb4O2F1OYvvhMxO3v61Ehg@mail.gmail.com>\\t<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1);
+INSERT INTO `message` VALUES (1,'�b\"_MF��',1,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuP6D+RUW5T_ZbER9T-O--qYDj_JbgD72RGGfrSkJteQ4Q@mail.gmail.com>','asiuhdakhsdf','2014-04-03 02:19:42',2127,'f92545e762b44776e0cb3fdad773f47a563fd5cb72a7fc31c26a2c43cc764343','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">iuhasdklfhasdf</div></body></html>','iuhasdklfhasdf',0,1464327557735981576,1464327557735981576,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(2,'zR��Dc@7�',2,'[[\"\'Rui Ueyama\' via golang-nuts\", \"golang-nuts@googlegroups.com\"]]','[[\"\", \"golang-nuts@googlegroups.com\"]]','[[\"Rui Ueyama\", \"ruiu@google.com\"]]','[[\"Paul Tiseo\", \"paulxtiseo@gmail.com\"]]','[[\"golang-nuts\", \"golang-nuts@googlegroups.com\"]]','[]','\"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\"','<CAJENXgt5t4yYJdDuV7m2DKwcDEbsY8TohVWmgmMqhnqC3pGwMw@mail.gmail.com>','[go-nuts] Runtime Panic On Method Call','2014-05-03 00:26:05',10447,'e317a191277854cb8b88481268940441a065bad48d02d5a477f0564d4cbe5297','{\"List-Id\": \"<golang-nuts.googlegroups.com>\", \"List-Post\": \"<http://groups.google.com/group/golang-nuts/post>, <mailto:golang-nuts@googlegroups.com>\", \"List-Owner\": null, \"List-Subscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:golang-nuts+subscribe@googlegroups.com>\", \"List-Unsubscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:googlegroups-manage+332403668183+unsubscribe@googlegroups.com>\", \"List-Archive\": \"<http://groups.google.com/group/golang-nuts>\", \"List-Help\": \"<http://groups.google.com/support/>, <mailto:golang-nuts+help@googlegroups.com>\"}',0,'<html><body><div dir=\"ltr\">I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground.<div class=\"gmail_extra\"></div></div>\n<p></p>\n\n-- <br/>\nYou received this message because you are subscribed to the Google Groups \"golang-nuts\" group.<br/>\nTo unsubscribe from this group and stop receiving emails from it, send an email to <a href=\"mailto:golang-nuts+unsubscribe@googlegroups.com\">golang-nuts+unsubscribe@googlegroups.com</a>.<br/>\nFor more options, visit <a href=\"https://groups.google.com/d/optout\">https://groups.google.com/d/optout</a>.<br/></body></html>','I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground. \n \n\n--  \nYou received this message because you are subscribed to the Google Grou',0,1467038319150540079,1467038319150540079,NULL,'\"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1,1),(3,'��%�lB',3,'[[\"Gmail Team\", \"mail-noreply@google.com\"]]','[]','[]','[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CAOPuB_MAEq7GsOVvWgE+qHR_6vWYXifHhF+hQ1sFyzk_eKPYpQ@mail.gmail.com>','Tips for using Gmail','2013-08-20 18:02:28',15711,'8f62d93f04735652b9f4edc89bc764e5b48fff1bcd0acec67718047c81d76051','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html xmlns=\"http://www.w3.org/1999/xhtml\"><head><meta content=\"text/html;charset=utf-8\" http-equiv=\"content-type\"/><title>Tips for using Gmail</title></head><body link=\"#1155CC\" marginheight=\"0\" marginwidth=\"0\" text=\"#444444\">\n<table bgcolor=\"#f5f5f5\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"100%\">\n<tr>\n<td> </td>\n<td height=\"51\" width=\"64\"><img alt=\"\" height=\"51\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td background=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-middle.png\" bgcolor=\"#f5f5f5\" height=\"51\" valign=\"bottom\" width=\"673\">\n</td>\n<td height=\"51\" width=\"64\"><img alt=\"\" height=\"51\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-top-right.png\" style=\"display:block\" width=\"68\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"225\" width=\"64\"><img alt=\"\" height=\"225\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td bgcolor=\"#ffffff\" valign=\"top\" width=\"668\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"100%\">\n<tr>\n<td colspan=\"3\"> </td>\n</tr>\n<tr>\n<td align=\"center\" colspan=\"3\" height=\"50\" valign=\"bottom\"><img alt=\"\" src=\"https://ssl.gstatic.com/drive/announcements/images/logo.gif\" style=\"display:block\"/></td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"40\"> </td>\n</tr>\n<tr>\n<td> </td>\n<td width=\"450\">\n<b>\n<font color=\"#444444\" face=\"Arial, sans-serif\" size=\"-1\" style=\"line-height: 1.4em\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_small.png\" style=\"display:block;float:left;margin-top:4px;margin-right:3px;\"/>Hi Inbox\n                    </font>\n</b>\n</td>\n<td> </td>\n</tr>\n<tr>\n<td height=\"40\" valign=\"top\">\n</td></tr>\n<tr>\n<td width=\"111\"> </td>\n<td align=\"left\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"540\">\n<tr>\n<td valign=\"top\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"+2\"><span style=\"font-family:Open Sans, Arial, sans-serif; font-size: 25px\">Tips for using Gmail</span></font></td>\n</tr>\n</table>\n</td>\n<td width=\"111\"> </td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"10\"> </td>\n</tr>\n</table>\n</td>\n<td height=\"225\" width=\"64\"><img alt=\"\" height=\"225\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-right.png\" style=\"display:block\" width=\"64\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"950\" width=\"64\"><img alt=\"\" height=\"950\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td align=\"center\" bgcolor=\"#ffffff\" valign=\"top\" width=\"668\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse;\" width=\"540\">\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_hangouts.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Chat right from your inbox</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">Chat with contacts and start video chats with up to 10 people in <a href=\"http://www.google.com/+/learnmore/hangouts/?hl=en\" style=\"text-decoration:none;\">Google+ Hangouts</a>.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_contacts.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Bring your email into Gmail</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">You can import your email from other webmail to make the transition to Gmail a bit easier. <a href=\"https://support.google.com/mail/answer/164640?hl=en\" style=\"text-decoration:none;\">Learn how.</a></font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_drive.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Use Google Drive to send large files</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\"><a href=\"https://support.google.com/mail/answer/2480713?hl=en\" style=\"text-decoration:none;\">Send huge files in Gmail </a>  (up to 10GB) using <a href=\"https://drive.google.com/?hl=en\" style=\"text-decoration:none;\">Google Drive</a>. Plus files stored in Drive stay up-to-date automatically so everyone has the most recent version and can access them from anywhere.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_storage.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Save everything</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">With 10GB of space, you’ll never need to delete an email. Just keep everything and easily find it later.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n<tr>\n<td align=\"left\">\n<img alt=\"\" src=\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_search.png\" style=\"display:block\"/>\n</td>\n<td width=\"15\"></td>\n<td align=\"left\" valign=\"middle\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse:collapse;\" width=\"400\">\n<tr>\n<td align=\"left\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"+1\"><span style=\"font-family:Arial, sans-serif; font-size: 20px;\">Find emails fast</span></font>\n</td>\n</tr>\n<tr>\n<td height=\"10\"></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\">\n<font color=\"#444444\" face=\"Arial,sans-serif\" size=\"-1\" style=\"line-height:1.4em\">With the power of Google Search right in your inbox, you can quickly find the important emails you need with suggestions based on emails, past searches and contacts.</font>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n<tr>\n<td colspan=\"3\" height=\"30\"> </td>\n</tr>\n</table>\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"500\">\n<tr>\n<td colspan=\"2\" height=\"40\"> </td>\n</tr>\n<tr>\n<td rowspan=\"2\" width=\"68\"><img alt=\"\" src=\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_large.png\" style=\"display:block\"/></td>\n<td align=\"left\" height=\"20\" valign=\"bottom\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"-1\">Happy emailing,</font></td>\n</tr>\n<tr>\n<td align=\"left\" valign=\"top\"><font color=\"#444444\" face=\"Arial, sans-serif\" size=\"+2\"><span style=\"font-family:Open Sans, Arial, sans-serif;\">The Gmail Team</span></font></td>\n</tr>\n<tr>\n<td colspan=\"2\" height=\"60\"> </td>\n</tr>\n</table>\n</td>\n<td height=\"950\" width=\"64\"><img alt=\"\" height=\"950\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-right.png\" style=\"display:block\" width=\"64\"/></td>\n<td> </td>\n</tr>\n<tr>\n<td> </td>\n<td height=\"102\" width=\"64\"><img alt=\"\" height=\"102\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-left.png\" style=\"display:block\" width=\"64\"/></td>\n<td background=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-middle.png\" height=\"102\" valign=\"top\" width=\"673\">\n<table border=\"0\" cellpadding=\"0\" cellspacing=\"0\" style=\"border-collapse: collapse; \" width=\"100%\">\n<tr>\n<td height=\"12\"></td>\n</tr>\n<tr>\n<td valign=\"bottom\">\n<font color=\"#AAAAAA\" face=\"Arial, sans-serif\" size=\"-2\">\n                  © 2013 Google Inc. 1600 Amphitheatre Parkway, Mountain View, CA 94043\n                </font>\n</td>\n</tr>\n</table>\n</td>\n<td height=\"102\" width=\"64\"><img alt=\"\" height=\"102\" src=\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-right.png\" style=\"display:block\" width=\"68\"/></td>\n<td> </td>\n</tr>\n</table>\n</body></html>','\n \n \n   \n \n \n \n \n   \n \n \n   \n \n \n \n \n   \n \n \n \n \n \n   \n \n \n   \n \n \n \n Hi Inbox\n                     \n \n \n   \n \n \n \n \n \n   \n \n \n \n Tips for using Gmail \n \n \n \n   \n \n \n   \n \n \n \n \n   \n \n \n   \n ',0,1443911956831022215,1443911956831022215,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1,1),(4,'FqR��O�',4,'[[\"Christine Spang\", \"christine@spang.cc\"]]','[[\"\", \"christine.spang@gmail.com\"]]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CAFMxqJyA0xft8f67uEcDiTAs8pgfXO26VaipnGHngFB45Vwiog@mail.gmail.com>','trigger poll','2014-03-21 04:53:00',2178,'6b0736bd5f6e9cb4200e1b280ac649229ee78eae1447028a7489b68739506c3a','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">hi</div></body></html>','hi',0,1463159441433026019,1463159441433026019,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(5,'@��hlvKa�-',5,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuM+fcDS9QGXnvOEvm-N8VjF8XxgVLtYLZ0=ENx_0A8u2A@mail.gmail.com>','idle trigger','2014-04-03 02:28:34',3003,'4461bfa07c3638fa6082535ecb1affb98e3a5a855d32543ac6e7f1d66c95c08e','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">idle trigger</div></body></html>','idle trigger',0,1464328115838585338,1464328115838585338,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(6,'���3��',6,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuN+beJ_br_j0uifnXUE+EFAf_bDDBJ0tB-Zkd_2USTc+w@mail.gmail.com>','idle test 123','2014-04-03 03:10:48',2126,'be9b8517433ab5524b7719653d2a057d1f0e4145b4f111e9e4c83dbab6bd6242','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">idle test 123</div></body></html>','idle test 123',0,1464330773292835572,1464330773292835572,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1,1),(7,':lZTO��',7,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuNcTC0_37JuNRQugskTCyYM9-HrszhPKfrf+JqOJE8ntA@mail.gmail.com>','another idle test','2014-04-03 02:34:43',2124,'8adff77788264670035888b1cb2afc6edd4a20b50c43f5b11874f2bc84d1c835','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">hello</div></body></html>','hello',0,1464328502421499234,1464328502421499234,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(8,'e�݀]G��',8,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuOoG=Haky985B_Lx3J0kBo1o8J+2rH87qdpnyHg1+JVJA@mail.gmail.com>','ohaiulskjndf','2014-04-03 02:55:54',2994,'6e4a76ba1ca34b0b4edd2d164229ad9d4b8a5d53ea53dc214799c93b802f2340','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">aoiulhksjndf</div></body></html>','aoiulhksjndf',0,1464329835043990839,1464329835043990839,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1,1),(9,'\nkg�Q�G�',9,'[[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<CABO4WuM6jXXOtc7KGU-M4bQKkP3wXxjnrBWFhbznsJDsiauHmA@mail.gmail.com>','guaysdhbjkf','2014-04-03 02:46:00',2165,'e5cc414d931127db23a633eb27b12b1fa7621562ee639487b20c18818cb78437','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\">a8ogysuidfaysogudhkbjfasdf<div><br/></div></div></body></html>','a8ogysuidfaysogudhkbjfasdf',0,1464329212533881603,1464329212533881603,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(10,'O���O�',10,'[[\"\", \"no-reply@accounts.google.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]',NULL,'<MC4rhxPMVYU1ydNeoLDDDA@notifications.google.com>','Google Account recovery phone number changed','2013-10-21 02:55:43',19501,'7836dd4eef7852ea9e9fafae09cc40d18887478d8279d0c2e215c2a7daad3deb','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html lang=\"en\"><body style=\"margin:0; padding: 0;\">\n<table align=\"center\" bgcolor=\"#f1f1f1\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" height=\"100%\" style=\"border-collapse: collapse\" width=\"100%\">\n<tr align=\"center\">\n<td valign=\"top\">\n<table bgcolor=\"#f1f1f1\" border=\"0\" cellpadding=\"0\" cellspacing=\"0\" height=\"60\" style=\"border-collapse: collapse\">\n<tr height=\"40\" valign=\"middle\">\n<td width=\"9\"></td>\n<td valign=\"middle\" width=\"217\">\n<img alt=\"Google Accounts\" border=\"0\" height=\"40\" src=\"cid:google\" style=\"display: block;\"/>\n</td>\n<td style=\"font-size: 13px; font-family: arial, sans-serif; color: #777777; text-align: right\" width=\"327\">\n            \n              Inbox App\n            \n          </td>\n<td width=\"10\"></td>\n<td><img src=\"cid:profilephoto\"/></td>\n<td width=\"10\"></td>\n</tr>\n</table>\n<table bgcolor=\"#ffffff\" border=\"1\" bordercolor=\"#e5e5e5\" cellpadding=\"0\" cellspacing=\"0\" style=\"text-align: left\">\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n<tr>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\">\n</td>\n<td style=\"font-size: 83%; border-top: none; border-bottom: none; border-left: none; border-right: none; font-size: 13px; font-family: arial, sans-serif; color: #222222; line-height: 18px\" valign=\"top\" width=\"568\">\n            \n              Hi Inbox,\n              <br/>\n<br/>\n            \n\n\nThe recovery phone number for your Google Account - inboxapptest@gmail.com - was recently changed. If you made this change, you don\'t need to do anything more.\n\n<br/>\n<br/>\n\nIf you didn\'t change your recovery phone, someone may have broken into your account. Visit this link for more information: <a href=\"https://support.google.com/accounts/bin/answer.py?answer=2450236\" style=\"text-decoration: none; color: #4D90FE\">https://support.google.com/accounts/bin/answer.py?answer=2450236</a>.\n\n<br/>\n<br/>\n\nIf you are having problems accessing your account, reset your password by clicking the button below:\n\n<br/>\n<br/>\n<a href=\"https://accounts.google.com/RecoverAccount?fpOnly=1&amp;source=ancrppe&amp;Email=inboxapptest@gmail.com\" style=\"text-align: center; font-size: 11px; font-family: arial, sans-serif; color: white; font-weight: bold; border-color: #3079ed; background-color: #4d90fe; background-image: linear-gradient(top,#4d90fe,#4787ed); text-decoration: none; display:inline-block; height: 27px; padding-left: 8px; padding-right: 8px; line-height: 27px; border-radius: 2px; border-width: 1px;\" target=\"_blank\">\n<span style=\"color: white;\">\n    \n      Reset password\n    \n  </span>\n</a>\n<br/>\n<br/>\n                \n                  Sincerely,<br/>\n                  The Google Accounts team\n                \n                </td>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\">\n</td>\n</tr>\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n<tr>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\"></td>\n<td style=\"font-size: 11px; font-family: arial, sans-serif; color: #777777; border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"568\">\n                \n                  This email can\'t receive replies. For more information, visit the <a href=\"https://support.google.com/accounts/bin/answer.py?answer=2450236\" style=\"text-decoration: none; color: #4D90FE\"><span style=\"color: #4D90FE;\">Google Accounts Help Center</span></a>.\n                \n                </td>\n<td style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\" width=\"15\"></td>\n</tr>\n<tr>\n<td height=\"15\" style=\"border-top: none; border-bottom: none; border-left: none; border-right: none;\">\n</td>\n</tr>\n</table>\n<table bgcolor=\"#f1f1f1\" height=\"80\" style=\"text-align: left\">\n<tr valign=\"middle\">\n<td style=\"font-size: 11px; font-family: arial, sans-serif; color: #777777;\">\n                  \n                    You received this mandatory email service announcement to update you about important changes to your Google product or account.\n                  \n                  <br/>\n<br/>\n<div style=\"direction: ltr;\">\n                  \n                    © 2013 Google Inc., 1600 Amphitheatre Parkway, Mountain View, CA 94043, USA\n                  \n                  </div>\n</td>\n</tr>\n</table>\n</td>\n</tr>\n</table>\n</body></html>','\n \n \n \n \n \n \n \n \n \n \n            \n              Inbox App\n            \n           \n \n \n \n \n \n \n \n \n \n \n \n \n \n \n            \n              Hi Inbox,\n               \n \n            \n\n\nThe recove',0,1449471921372979402,1449471921372979402,NULL,'\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(11,'䥪+%�F��',11,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<5361906e.c3ef320a.62fb.064c@mx.google.com>','Wakeup78fcb997159345c9b160573e1887264a','2014-05-01 00:08:14',1238,'aa2f127af89b74364ae781becd35704c48f690a3df0abd90e543eafc2ef4d590','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466856002099058157,1466856002099058157,'c64be65384804950972d7cb34cd33c69','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(12,'\0B�sҝM ��',12,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53618e85.e14f320a.1f54.21a6@mx.google.com>','Wakeup1dd3dabe7d9444da8aec3be27a82d030','2014-05-01 00:00:05',1199,'4a07bb7d5d933c811c267c0262525de7c468d735e9b6edb0ee2060b6f24ab330','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466855488650356657,1466855488650356657,'e4f72ba9f22842bab7d41e6c4b877b83','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(13,'�����',13,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53618c4e.a983320a.45a5.21a5@mx.google.com>','Wakeupe2ea85dc880d421089b7e1fb8cc12c35','2014-04-30 23:50:38',1200,'91b33ba2f89ca4006d4b5c26d760d4e253bb3f4ed5c87efe964545c2c4ca0db4','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466854894292093968,1466854894292093968,'d1dea076298a4bd09178758433f7542c','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(14,'�o�)aAڤT',14,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<536030e2.640e430a.04ce.ffff8de9@mx.google.com>','Wakeup735d8864f6124797a10e94ec5de6be13','2014-04-29 23:08:18',1205,'73b93d369f20843a12a81daf72788b1b7fbe703c4abd289f69d1e41f212833a0','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466761634398434761,1466761634398434761,'5bf16c2bc9684717a9b77b73cbe9ba45','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(15,'����G^',15,'[[\"Inbox App\", \"inboxapptest@gmail.com\"]]','[]','[]','[[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]]','[[\"\", \"ben.bitdiddle1861@gmail.com\"]]','[]',NULL,'<53602f7d.a6a3420a.73de.6c0b@mx.google.com>','Wakeup2eba715ecd044a55ae4e12f604a8dc96','2014-04-29 23:02:21',1242,'b13ddac39e20275606cf2f651e269f22f850ac18dce43cf18de982ed3ac20e4f','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>','Sea, birds, yoga and sand.',0,1466761259745473801,1466761259745473801,'7e7d36a5b6f54af1af551a55b48d1735','\"\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,0,1),(16,'���>ߤG�',16,'[[\"kavya joshi\", \"kavya719@gmail.com\"]]','[]','[]','[[\"\", \"inboxapptest@gmail.com\"]]','[]','[]','\"<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\"','<CAMpoCYqq6BmoRW+MouXOwDxiA=DO20b=sG4e2agmr04Bt8Wg_g@mail.gmail.com>','Golden Gate Park next Sat','2014-04-24 08:58:04',13142,'a5993aef718c4ce3ffd93f0a3cf3a4e54f93278bcb5873a533de3882c383e706','{\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}',0,'<html><body><div dir=\"ltr\"><br/><br/><br/></div></body></html>','',0,1466255156975764289,1466255156975764289,NULL,'\"<CA+ADUwxeXG8+=Mya+T1Qb_RYS23w6=_EZgssm3GgW6SkhXPxGQ@mail.gmail.com>\\t<F7C679E5-09F7-4F17-B1CA-A67A6B207650@gmail.com>\\t<CAPGJ9TSw5oHjhDNGNa3zs4GQ1WC=bCJ8UTdF12NFqgSdYib9FA@mail.gmail.com>\\t<CAPGJ9TRPNG7pS0JTEZog1A+usobFsH3S5nE0EbPbqtwBW3dKKw@mail.gmail.com>\\t<CA+ADUwytg_oZ6B2HfW=v=Vy39G1t1vT17UpjUTaYJuqr8FYR6w@mail.gmail.com>\\t<CALEp7UFOAXWGgMUW9_GVmJfd1xQSfmXHoGs3rajEd6wZwra1Qw@mail.gmail.com>\\t<CA+ADUwwh7gmTDfzVObOkcm0d=5j9mMZt-NxswDqXv9VnpYg_Lg@mail.gmail.com>\\t<CAMpoCYqjMdo=dVvQMZZE5BhZMb2sZkznQnc=7K6kZ_M6NCg+EQ@mail.gmail.com>\\t<CAPGJ9TQi7Rqxr+HmjASJJ0o2OMgFBG5z-mguUQuy8su1fakLiQ@mail.gmail.com>\\t<CA+ADUwzEgH6GC=ji5FT0m+i1XSxu0uamwrqAwGMAZhg-qWvL2g@mail.gmail.com>\\t<CAPGJ9TQkb923ZKeVxqfqB=JeLnhE9-MOAigRrHo-PZCtueZ-Tg@mail.gmail.com>\\t<3A2441BA-C669-4533-A67A-5CE841A82B54@gmail.com>\\t<CALEp7UFN3t=rzzZ_in=3LvAypVN=S9hi_RQkpKwc1kc13ymYTw@mail.gmail.com>\\t<CALRhdLLxFd1L5D+7RoUKVqq0G62cLJezYmMZaST2eiB7kQDCPw@mail.gmail.com>\\t<CAPGJ9TQe4TyhwmS3vbu1hkZgDkNzsb4O2F1OYvvhMxO3v61Ehg@mail.gmail.com>\\t<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\"','message','2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,1,1);
 /*!40000 ALTER TABLE `message` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -781,6 +788,7 @@ CREATE TABLE `messagecontactassociation` (
   KEY `ix_messagecontactassociation_created_at` (`created_at`),
   KEY `ix_messagecontactassociation_deleted_at` (`deleted_at`),
   KEY `ix_messagecontactassociation_updated_at` (`updated_at`),
+  KEY `ix_messagecontactassociation_contact_id_field` (`contact_id`,`field`),
   CONSTRAINT `messagecontactassociation_ibfk_1` FOREIGN KEY (`contact_id`) REFERENCES `contact` (`id`),
   CONSTRAINT `messagecontactassociation_ibfk_2` FOREIGN KEY (`message_id`) REFERENCES `message` (`id`)
 ) ENGINE=InnoDB AUTO_INCREMENT=39 DEFAULT CHARSET=utf8mb4;
@@ -1020,6 +1028,7 @@ CREATE TABLE `tagitem` (
   KEY `ix_tagitem_created_at` (`created_at`),
   KEY `ix_tagitem_deleted_at` (`deleted_at`),
   KEY `ix_tagitem_updated_at` (`updated_at`),
+  KEY `ix_tagitem_tag_id_thread_id` (`tag_id`,`thread_id`),
   CONSTRAINT `tagitem_ibfk_1` FOREIGN KEY (`tag_id`) REFERENCES `tag` (`id`),
   CONSTRAINT `tagitem_ibfk_2` FOREIGN KEY (`thread_id`) REFERENCES `thread` (`id`)
 ) ENGINE=InnoDB AUTO_INCREMENT=37 DEFAULT CHARSET=utf8mb4;
@@ -1063,6 +1072,8 @@ CREATE TABLE `thread` (
   KEY `ix_thread_created_at` (`created_at`),
   KEY `ix_thread_deleted_at` (`deleted_at`),
   KEY `ix_thread_updated_at` (`updated_at`),
+  KEY `ix_thread_namespace_id_recentdate` (`namespace_id`,`recentdate`,`id`),
+  KEY `ix_thread_namespace_id_subject` (`namespace_id`,`subject`(191)),
   CONSTRAINT `thread_ibfk_1` FOREIGN KEY (`namespace_id`) REFERENCES `namespace` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=17 DEFAULT CHARSET=utf8mb4;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -1077,6 +1088,42 @@ INSERT INTO `thread` VALUES (1,'�ׁ�&�B�','asiuhdakhsdf','2014-04-03 02:
 /*!40000 ALTER TABLE `thread` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `threadsummary`
+--
+
+DROP TABLE IF EXISTS `threadsummary`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `threadsummary` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `created_at` datetime NOT NULL,
+  `updated_at` datetime NOT NULL,
+  `deleted_at` datetime DEFAULT NULL,
+  `thread_id` int(11) NOT NULL,
+  `participants` longtext,
+  `message_public_ids` longtext,
+  `draft_public_ids` text,
+  `tags` text,
+  `unread` tinyint(1) NOT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `thread_id` (`thread_id`),
+  KEY `ix_threadsummary_created_at` (`created_at`),
+  KEY `ix_threadsummary_deleted_at` (`deleted_at`),
+  KEY `ix_threadsummary_updated_at` (`updated_at`),
+  CONSTRAINT `threadsummary_ibfk_1` FOREIGN KEY (`thread_id`) REFERENCES `thread` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `threadsummary`
+--
+
+LOCK TABLES `threadsummary` WRITE;
+/*!40000 ALTER TABLE `threadsummary` DISABLE KEYS */;
+/*!40000 ALTER TABLE `threadsummary` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `transaction`
 --
@@ -1098,12 +1145,16 @@ CREATE TABLE `transaction` (
   `object_public_id` varchar(191) DEFAULT NULL,
   `public_snapshot` longtext,
   `private_snapshot` longtext,
+  `publishable` tinyint(1) DEFAULT NULL,
   PRIMARY KEY (`id`),
-  KEY `namespace_id` (`namespace_id`),
   KEY `ix_transaction_created_at` (`created_at`),
   KEY `ix_transaction_deleted_at` (`deleted_at`),
   KEY `ix_transaction_updated_at` (`updated_at`),
   KEY `ix_transaction_public_id` (`public_id`),
+  KEY `ix_transaction_namespace_id_id` (`namespace_id`,`id`),
+  KEY `ix_transaction_namespace_id_created_at` (`namespace_id`,`created_at`),
+  KEY `ix_transaction_table_name_id` (`table_name`,`id`),
+  KEY `ix_transaction_table_name_record_id_id` (`table_name`,`record_id`,`id`),
   CONSTRAINT `transaction_ibfk_1` FOREIGN KEY (`namespace_id`) REFERENCES `namespace` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=126 DEFAULT CHARSET=utf8mb4;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -1114,10 +1165,41 @@ CREATE TABLE `transaction` (
 
 LOCK TABLES `transaction` WRITE;
 /*!40000 ALTER TABLE `transaction` DISABLE KEYS */;
-INSERT INTO `transaction` VALUES ('part',3,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"a5dswfe6mzl9ad0g8mrk399eq\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"6103eda40adfd98a9e4b4e16ff958e693893f4c37359c76fd9b4e77531a22828\", \"id\": 3, \"filename\": null, \"message_id\": 1, \"size\": 36}',1,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'}3KhS',NULL,NULL,NULL),('part',2,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5nrzawkxf1apntb0evw541akg\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"d58d3859935609dd2afe7233c68939cd9cd20ef54e3a61d0442f41fc157fc10d\", \"id\": 2, \"filename\": null, \"message_id\": 1, \"size\": 15}',2,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'.3[J=j{F\Z',NULL,NULL,NULL),('folderitem',1,'insert','{\"thread_id\": 1, \"id\": 1, \"folder_name\": \"important\"}',3,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'4XiN*',NULL,NULL,NULL),('message',1,'insert','{\"public_id\": \"1c393pgoea1sqnv4mv1rpux1c\", \"sender_addr\": [], \"thread_id\": 1, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">iuhasdklfhasdf</div></body></html>\", \"id\": 1, \"subject\": \"asiuhdakhsdf\", \"g_msgid\": 1464327557735981576, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464327557735981576, \"inbox_uid\": null, \"snippet\": \"iuhasdklfhasdf\", \"message_id_header\": \"<CABO4WuP6D+RUW5T_ZbER9T-O--qYDj_JbgD72RGGfrSkJteQ4Q@mail.gmail.com>\", \"received_date\": {\"$date\": 1396491582000}, \"size\": 2127, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"f92545e762b44776e0cb3fdad773f47a563fd5cb72a7fc31c26a2c43cc764343\", \"reply_to\": []}',4,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']EN|Bs',NULL,NULL,NULL),('folderitem',3,'insert','{\"thread_id\": 1, \"id\": 3, \"folder_name\": \"archive\"}',5,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'$twA%1-',NULL,NULL,NULL),('folderitem',2,'insert','{\"thread_id\": 1, \"id\": 2, \"folder_name\": \"inbox\"}',6,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B%J(t~(',NULL,NULL,NULL),('part',1,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"ccylhpm5fvy284raoo34lgut2\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"1c61dd2b4dd1193911f3aaa63ac0d7d55058d567664cddaab094e59a46cdc59d\", \"id\": 1, \"message_id\": 1, \"size\": 1950}',7,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'u.J5O{\\Ϸ',NULL,NULL,NULL),('contact',1,'insert','{\"public_id\": \"9fmqsnooedtybo5c3z0clflnc\", \"uid\": {\"$uuid\": \"ac99aa06560442349cccdfb5f41973d1\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 10, \"provider_name\": \"inbox\", \"email_address\": \"inboxapptest@gmail.com\", \"id\": 1, \"name\": \"\"}',8,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'VLqI*',NULL,NULL,NULL),('contact',2,'insert','{\"public_id\": \"92jcqqvvaje9akg7kveteaaln\", \"uid\": {\"$uuid\": \"523f7769c26e4728921dffd43e5bb1b4\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"benbitdiddle1861@gmail.com\", \"id\": 2, \"name\": \"Ben Bitdiddle\"}',9,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>L\\p=5l',NULL,NULL,NULL),('part',6,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"mup7o0q2aqinnisod06d7kto\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"UTF-8\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"2014eb3bb6de2ecb23151b266a3057be6cf3e9c19659d215b531fcee286a87f5\", \"id\": 6, \"filename\": null, \"message_id\": 2, \"size\": 2120}',10,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ZEtr|',NULL,NULL,NULL),('message',2,'insert','{\"public_id\": \"78pdocq8sa8qw4ky77gzxhdl9\", \"sender_addr\": [[\"\", \"golang-nuts@googlegroups.com\"]], \"thread_id\": 2, \"bcc_addr\": [], \"cc_addr\": [[\"golang-nuts\", \"golang-nuts@googlegroups.com\"]], \"references\": \"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground.<div class=\\\"gmail_extra\\\"></div></div>\\n<p></p>\\n\\n-- <br/>\\nYou received this message because you are subscribed to the Google Groups \\\"golang-nuts\\\" group.<br/>\\nTo unsubscribe from this group and stop receiving emails from it, send an email to <a href=\\\"mailto:golang-nuts+unsubscribe@googlegroups.com\\\">golang-nuts+unsubscribe@googlegroups.com</a>.<br/>\\nFor more options, visit <a href=\\\"https://groups.google.com/d/optout\\\">https://groups.google.com/d/optout</a>.<br/></body></html>\", \"id\": 2, \"subject\": \"[go-nuts] Runtime Panic On Method Call\", \"g_msgid\": 1467038319150540079, \"from_addr\": [[\"\'Rui Ueyama\' via golang-nuts\", \"golang-nuts@googlegroups.com\"]], \"g_thrid\": 1467038319150540079, \"inbox_uid\": null, \"snippet\": \"I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground. \\n \\n\\n--  \\nYou received this message because you are subscribed to the Google Grou\", \"message_id_header\": \"<CAJENXgt5t4yYJdDuV7m2DKwcDEbsY8TohVWmgmMqhnqC3pGwMw@mail.gmail.com>\", \"received_date\": {\"$date\": 1399076765000}, \"size\": 10447, \"type\": \"message\", \"to_addr\": [[\"Paul Tiseo\", \"paulxtiseo@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": \"<golang-nuts.googlegroups.com>\", \"List-Post\": \"<http://groups.google.com/group/golang-nuts/post>, <mailto:golang-nuts@googlegroups.com>\", \"List-Owner\": null, \"List-Subscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:golang-nuts+subscribe@googlegroups.com>\", \"List-Unsubscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:googlegroups-manage+332403668183+unsubscribe@googlegroups.com>\", \"List-Archive\": \"<http://groups.google.com/group/golang-nuts>\", \"List-Help\": \"<http://groups.google.com/support/>, <mailto:golang-nuts+help@googlegroups.com>\"}, \"in_reply_to\": \"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\", \"is_draft\": false, \"data_sha256\": \"e317a191277854cb8b88481268940441a065bad48d02d5a477f0564d4cbe5297\", \"reply_to\": [[\"Rui Ueyama\", \"ruiu@google.com\"]]}',11,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'q\ngBJC̲ܛ',NULL,NULL,NULL),('folderitem',6,'insert','{\"thread_id\": 2, \"id\": 6, \"folder_name\": \"archive\"}',12,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Jե@KٛfCX',NULL,NULL,NULL),('folderitem',4,'insert','{\"thread_id\": 2, \"id\": 4, \"folder_name\": \"important\"}',13,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'HD_Kn\r4',NULL,NULL,NULL),('part',4,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"6zkps691gu9y2b3dk5zwh7upk\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"179cd7e3034869737ae02cee0b918fb85f9254ea2fd0c0b3f7b84a32420edebc\", \"id\": 4, \"message_id\": 2, \"size\": 6738}',14,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\nKV\'I4! u',NULL,NULL,NULL),('part',5,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"eeu7pyr0rpvvnue1nj1rde1dv\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"UTF-8\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"7fdc6a5d14d7832747b01287f8b7da14bf612e2e100df9df1b4561bcaec8d268\", \"id\": 5, \"filename\": null, \"message_id\": 2, \"size\": 1361}',15,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/ABobEOUA',NULL,NULL,NULL),('folderitem',5,'insert','{\"thread_id\": 2, \"id\": 5, \"folder_name\": \"inbox\"}',16,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\'dH<Kt',NULL,NULL,NULL),('contact',3,'insert','{\"public_id\": \"de3rvdrlp4cuksjn9jt33uhg4\", \"uid\": {\"$uuid\": \"0ff751115a7246a4a0d0d1d189422117\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 10, \"provider_name\": \"inbox\", \"email_address\": \"paulxtiseo@gmail.com\", \"id\": 3, \"name\": \"Paul Tiseo\"}',17,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'LOE^',NULL,NULL,NULL),('contact',4,'insert','{\"public_id\": \"a46s0bayqfw9kihg3i6sss2dm\", \"uid\": {\"$uuid\": \"6840fd7634e34b1ab0a36b797bbf92d7\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"golang-nuts@googlegroups.com\", \"id\": 4, \"name\": \"golang-nuts\"}',18,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/QDgũ6g',NULL,NULL,NULL),('folderitem',7,'insert','{\"thread_id\": 3, \"id\": 7, \"folder_name\": \"important\"}',19,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'*6K?T	F/',NULL,NULL,NULL),('part',8,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"16ecxuyoazxnhz6msuqcac4bm\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"windows-1252\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"b1558fdb97bc5918be82a7d342358fdd8abaa32cace1c96056319c594af6ddfe\", \"id\": 8, \"filename\": null, \"message_id\": 3, \"size\": 1251}',20,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'3fJ&',NULL,NULL,NULL),('part',9,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7ll34zrterre48tmhvjs18tpr\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"windows-1252\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"5ef8b7411036839cf82f81125fda1227b56378c14e4d2f2e251aaaa5496062ad\", \"id\": 9, \"filename\": null, \"message_id\": 3, \"size\": 12626}',21,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'I˸',NULL,NULL,NULL),('folderitem',8,'insert','{\"thread_id\": 3, \"id\": 8, \"folder_name\": \"inbox\"}',22,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\n#KRM9',NULL,NULL,NULL),('message',3,'insert','{\"public_id\": \"aowxtw42xdybrxfpkalf7qvki\", \"sender_addr\": [], \"thread_id\": 3, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html xmlns=\\\"http://www.w3.org/1999/xhtml\\\"><head><meta content=\\\"text/html;charset=utf-8\\\" http-equiv=\\\"content-type\\\"/><title>Tips for using Gmail</title></head><body link=\\\"#1155CC\\\" marginheight=\\\"0\\\" marginwidth=\\\"0\\\" text=\\\"#444444\\\">\\n<table bgcolor=\\\"#f5f5f5\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"100%\\\">\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"51\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"51\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td background=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-middle.png\\\" bgcolor=\\\"#f5f5f5\\\" height=\\\"51\\\" valign=\\\"bottom\\\" width=\\\"673\\\">\\n</td>\\n<td height=\\\"51\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"51\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-right.png\\\" style=\\\"display:block\\\" width=\\\"68\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"225\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"225\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td bgcolor=\\\"#ffffff\\\" valign=\\\"top\\\" width=\\\"668\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"100%\\\">\\n<tr>\\n<td colspan=\\\"3\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"center\\\" colspan=\\\"3\\\" height=\\\"50\\\" valign=\\\"bottom\\\"><img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/logo.gif\\\" style=\\\"display:block\\\"/></td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"40\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td width=\\\"450\\\">\\n<b>\\n<font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height: 1.4em\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_small.png\\\" style=\\\"display:block;float:left;margin-top:4px;margin-right:3px;\\\"/>Hi Inbox\\n                    </font>\\n</b>\\n</td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td height=\\\"40\\\" valign=\\\"top\\\">\\n</td></tr>\\n<tr>\\n<td width=\\\"111\\\">\\u00a0</td>\\n<td align=\\\"left\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"540\\\">\\n<tr>\\n<td valign=\\\"top\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"+2\\\"><span style=\\\"font-family:Open Sans, Arial, sans-serif; font-size: 25px\\\">Tips for using Gmail</span></font></td>\\n</tr>\\n</table>\\n</td>\\n<td width=\\\"111\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"10\\\">\\u00a0</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"225\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"225\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-right.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"950\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"950\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td align=\\\"center\\\" bgcolor=\\\"#ffffff\\\" valign=\\\"top\\\" width=\\\"668\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"540\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_hangouts.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Chat right from your inbox</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">Chat with contacts and start video chats with up to 10 people in <a href=\\\"http://www.google.com/+/learnmore/hangouts/?hl=en\\\" style=\\\"text-decoration:none;\\\">Google+ Hangouts</a>.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_contacts.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Bring your email into Gmail</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">You can import your email from other webmail to make the transition to Gmail a bit easier. <a href=\\\"https://support.google.com/mail/answer/164640?hl=en\\\" style=\\\"text-decoration:none;\\\">Learn how.</a></font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_drive.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Use Google Drive to send large files</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\"><a href=\\\"https://support.google.com/mail/answer/2480713?hl=en\\\" style=\\\"text-decoration:none;\\\">Send huge files in Gmail </a>  (up to 10GB) using <a href=\\\"https://drive.google.com/?hl=en\\\" style=\\\"text-decoration:none;\\\">Google Drive</a>. Plus files stored in Drive stay up-to-date automatically so everyone has the most recent version and can access them from anywhere.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_storage.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Save everything</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">With 10GB of space, you\\u2019ll never need to delete an email. Just keep everything and easily find it later.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_search.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Find emails fast</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">With the power of Google Search right in your inbox, you can quickly find the important emails you need with suggestions based on emails, past searches and contacts.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n</table>\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"500\\\">\\n<tr>\\n<td colspan=\\\"2\\\" height=\\\"40\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td rowspan=\\\"2\\\" width=\\\"68\\\"><img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_large.png\\\" style=\\\"display:block\\\"/></td>\\n<td align=\\\"left\\\" height=\\\"20\\\" valign=\\\"bottom\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-1\\\">Happy emailing,</font></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"+2\\\"><span style=\\\"font-family:Open Sans, Arial, sans-serif;\\\">The Gmail Team</span></font></td>\\n</tr>\\n<tr>\\n<td colspan=\\\"2\\\" height=\\\"60\\\">\\u00a0</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"950\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"950\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-right.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"102\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"102\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td background=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-middle.png\\\" height=\\\"102\\\" valign=\\\"top\\\" width=\\\"673\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"100%\\\">\\n<tr>\\n<td height=\\\"12\\\"></td>\\n</tr>\\n<tr>\\n<td valign=\\\"bottom\\\">\\n<font color=\\\"#AAAAAA\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-2\\\">\\n                  \\u00a9 2013 Google Inc. 1600 Amphitheatre Parkway, Mountain View, CA 94043\\n                </font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"102\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"102\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-right.png\\\" style=\\\"display:block\\\" width=\\\"68\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n</table>\\n</body></html>\", \"id\": 3, \"subject\": \"Tips for using Gmail\", \"g_msgid\": 1443911956831022215, \"from_addr\": [[\"Gmail Team\", \"mail-noreply@google.com\"]], \"g_thrid\": 1443911956831022215, \"inbox_uid\": null, \"snippet\": \"\\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n Hi Inbox\\n                     \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\n Tips for using Gmail \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \", \"message_id_header\": \"<CAOPuB_MAEq7GsOVvWgE+qHR_6vWYXifHhF+hQ1sFyzk_eKPYpQ@mail.gmail.com>\", \"received_date\": {\"$date\": 1377021748000}, \"size\": 15711, \"type\": \"message\", \"to_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"8f62d93f04735652b9f4edc89bc764e5b48fff1bcd0acec67718047c81d76051\", \"reply_to\": []}',23,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'6\nEUx(C',NULL,NULL,NULL),('folderitem',9,'insert','{\"thread_id\": 3, \"id\": 9, \"folder_name\": \"archive\"}',24,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'.JGs\0',NULL,NULL,NULL),('part',7,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"73dkm7j8xewm7c4m93wnu4w9a\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"98ae516cd24a27e52537143ff996e1c462ae2be9ea96ef0df3e4db41f8cb1060\", \"id\": 7, \"message_id\": 3, \"size\": 453}',25,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\n&BU $H|',NULL,NULL,NULL),('contact',1,'update','{\"score\": 11}',26,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Q\" J	@+',NULL,NULL,NULL),('contact',5,'insert','{\"public_id\": \"di10igsxl9uy7c71bcwz05h1j\", \"uid\": {\"$uuid\": \"31d28d8167df479bae796f19589a88dd\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"mail-noreply@google.com\", \"id\": 5, \"name\": \"Gmail Team\"}',27,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'f1BK?vgbE',NULL,NULL,NULL),('message',4,'insert','{\"public_id\": \"464qbsuwnumipzmfny7kr7rxf\", \"sender_addr\": [[\"\", \"christine.spang@gmail.com\"]], \"thread_id\": 4, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">hi</div></body></html>\", \"id\": 4, \"subject\": \"trigger poll\", \"g_msgid\": 1463159441433026019, \"from_addr\": [[\"Christine Spang\", \"christine@spang.cc\"]], \"g_thrid\": 1463159441433026019, \"inbox_uid\": null, \"snippet\": \"hi\", \"message_id_header\": \"<CAFMxqJyA0xft8f67uEcDiTAs8pgfXO26VaipnGHngFB45Vwiog@mail.gmail.com>\", \"received_date\": {\"$date\": 1395377580000}, \"size\": 2178, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"6b0736bd5f6e9cb4200e1b280ac649229ee78eae1447028a7489b68739506c3a\", \"reply_to\": []}',28,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'gʧm@F',NULL,NULL,NULL),('folderitem',10,'insert','{\"thread_id\": 4, \"id\": 10, \"folder_name\": \"important\"}',29,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'9֢VIUš',NULL,NULL,NULL),('folderitem',12,'insert','{\"thread_id\": 4, \"id\": 12, \"folder_name\": \"archive\"}',30,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/\rcD8F599',NULL,NULL,NULL),('part',12,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"3s8wuv52par00vberkuk85kgj\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"408ba4f10aada5751a08119a3c82a667239b3094bf14fe2e67a258dc03afbacf\", \"id\": 12, \"filename\": null, \"message_id\": 4, \"size\": 24}',31,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ÜN2BxL\"',NULL,NULL,NULL),('part',10,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"bwzdk7r5we57dpel296wcf6ln\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"af620f6b1b2178f7ae978e21534b334c1b313e09c1c9657db686726368312434\", \"id\": 10, \"message_id\": 4, \"size\": 2037}',32,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'=e@,YC>!f',NULL,NULL,NULL),('part',11,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5gg7622l7gsovibw5jd5opogl\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"98ea6e4f216f2fb4b69fff9b3a44842c38686ca685f3f55dc48c5d3fb1107be4\", \"id\": 11, \"filename\": null, \"message_id\": 4, \"size\": 3}',33,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'j}Mva',NULL,NULL,NULL),('folderitem',11,'insert','{\"thread_id\": 4, \"id\": 11, \"folder_name\": \"inbox\"}',34,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'쉋Lcя-',NULL,NULL,NULL),('contact',1,'update','{\"score\": 12}',35,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Q	J_G^',NULL,NULL,NULL),('contact',6,'insert','{\"public_id\": \"5gb3egbwvvh087gnytdb4ud04\", \"uid\": {\"$uuid\": \"c0849c30e29d4404b931ddf9c3d06201\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"christine@spang.cc\", \"id\": 6, \"name\": \"Christine Spang\"}',36,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>ԾC{? ',NULL,NULL,NULL),('part',13,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"d9u8mcwr689m3y24ygjlohw4l\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"889b24bb1bf892e1634717a015b0ccd9f93b39afa46a2986be3fe90879d6d19e\", \"id\": 13, \"message_id\": 5, \"size\": 2846}',37,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'qWZNݏ\ZQ)',NULL,NULL,NULL),('message',5,'insert','{\"public_id\": \"3tyqksg3qclys5cpr40mssun1\", \"sender_addr\": [], \"thread_id\": 5, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">idle trigger</div></body></html>\", \"id\": 5, \"subject\": \"idle trigger\", \"g_msgid\": 1464328115838585338, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464328115838585338, \"inbox_uid\": null, \"snippet\": \"idle trigger\", \"message_id_header\": \"<CABO4WuM+fcDS9QGXnvOEvm-N8VjF8XxgVLtYLZ0=ENx_0A8u2A@mail.gmail.com>\", \"received_date\": {\"$date\": 1396492114000}, \"size\": 3003, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"4461bfa07c3638fa6082535ecb1affb98e3a5a855d32543ac6e7f1d66c95c08e\", \"reply_to\": []}',38,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\r6L;1;`wb',NULL,NULL,NULL),('folderitem',15,'insert','{\"thread_id\": 5, \"id\": 15, \"folder_name\": \"archive\"}',39,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"t])Fjʍ϶yd',NULL,NULL,NULL),('folderitem',13,'insert','{\"thread_id\": 5, \"id\": 13, \"folder_name\": \"important\"}',40,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'|:kE]',NULL,NULL,NULL),('part',15,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7v9apij58ue792rntg53t2ekj\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"a0d9bb0476a09e0b8cda7c8799e2ff00959e645292dcd64790d9138623393995\", \"id\": 15, \"filename\": null, \"message_id\": 5, \"size\": 34}',41,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'$hNLʥON+=',NULL,NULL,NULL),('part',14,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"82n7afyko0sdt4xgk0ea8bv5b\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"004815e57fe5989f9536f2d50d29bcc0474462dfd0543868e43c5351285c4f60\", \"id\": 14, \"filename\": null, \"message_id\": 5, \"size\": 13}',42,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'a\r2CRKZj4v',NULL,NULL,NULL),('folderitem',14,'insert','{\"thread_id\": 5, \"id\": 14, \"folder_name\": \"inbox\"}',43,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'W~dIL\'',NULL,NULL,NULL),('contact',1,'update','{\"score\": 13}',44,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'׺[xE݌C&',NULL,NULL,NULL),('part',16,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"7lk6ltkocb1tjfamz1pqttdek\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"f582e89b834cd098b5d023d09014c99554e519649523427da7eb6ed1bbb2dbb9\", \"id\": 16, \"message_id\": 6, \"size\": 1951}',45,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\ZA>@):դ',NULL,NULL,NULL),('part',18,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"8kxtx92ooontidy3ufzfsun3d\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"3f93e1bec4711d5bca6c71e1ae3bd7a81437a6ade1e1afab07fd8c26e8f60961\", \"id\": 18, \"filename\": null, \"message_id\": 6, \"size\": 35}',46,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ևWyBڌ\'',NULL,NULL,NULL),('message',6,'insert','{\"public_id\": \"ejx6a26qz7hci1ksc4gwscw39\", \"sender_addr\": [], \"thread_id\": 6, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">idle test 123</div></body></html>\", \"id\": 6, \"subject\": \"idle test 123\", \"g_msgid\": 1464330773292835572, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464330773292835572, \"inbox_uid\": null, \"snippet\": \"idle test 123\", \"message_id_header\": \"<CABO4WuN+beJ_br_j0uifnXUE+EFAf_bDDBJ0tB-Zkd_2USTc+w@mail.gmail.com>\", \"received_date\": {\"$date\": 1396494648000}, \"size\": 2126, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"be9b8517433ab5524b7719653d2a057d1f0e4145b4f111e9e4c83dbab6bd6242\", \"reply_to\": []}',47,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'RFM5i3',NULL,NULL,NULL),('folderitem',17,'insert','{\"thread_id\": 6, \"id\": 17, \"folder_name\": \"inbox\"}',48,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Yc@Cr\Z?8Ex',NULL,NULL,NULL),('folderitem',18,'insert','{\"thread_id\": 6, \"id\": 18, \"folder_name\": \"archive\"}',49,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'BQ[:DF%',NULL,NULL,NULL),('part',17,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"9ita4einrwv0zrzxswzz7ejc0\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"b0bbbdfc73c7ebd75b9d5e66896312cc3c3a59fe5c86e0de44de3a132b34ebad\", \"id\": 17, \"filename\": null, \"message_id\": 6, \"size\": 14}',50,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'=i8%ER.',NULL,NULL,NULL),('folderitem',16,'insert','{\"thread_id\": 6, \"id\": 16, \"folder_name\": \"important\"}',51,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'l\"wKȑ\'Dyt',NULL,NULL,NULL),('contact',1,'update','{\"score\": 14}',52,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'XfDkvR',NULL,NULL,NULL),('message',7,'insert','{\"public_id\": \"3fqr02v6yjz37rfr902w63tgk\", \"sender_addr\": [], \"thread_id\": 7, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">hello</div></body></html>\", \"id\": 7, \"subject\": \"another idle test\", \"g_msgid\": 1464328502421499234, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464328502421499234, \"inbox_uid\": null, \"snippet\": \"hello\", \"message_id_header\": \"<CABO4WuNcTC0_37JuNRQugskTCyYM9-HrszhPKfrf+JqOJE8ntA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396492483000}, \"size\": 2124, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"8adff77788264670035888b1cb2afc6edd4a20b50c43f5b11874f2bc84d1c835\", \"reply_to\": []}',53,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,',f#Cf\r{',NULL,NULL,NULL),('folderitem',21,'insert','{\"thread_id\": 7, \"id\": 21, \"folder_name\": \"archive\"}',54,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ߍ}NS	',NULL,NULL,NULL),('folderitem',20,'insert','{\"thread_id\": 7, \"id\": 20, \"folder_name\": \"inbox\"}',55,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'a߁uM@ʿ\ZWƤ?',NULL,NULL,NULL),('part',19,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"17qyhh8lgpw0ytyodxhpkgnep\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"223681a017f96b40fa854b8810c039a20db392c8df9773575177976aba3e0834\", \"id\": 19, \"message_id\": 7, \"size\": 1965}',56,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'å\nL~>|6o',NULL,NULL,NULL),('part',20,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"2qktlwsya5ibd1gwt6cdbry75\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"5891b5b522d5df086d0ff0b110fbd9d21bb4fc7163af34d08286a2e846f6be03\", \"id\": 20, \"filename\": null, \"message_id\": 7, \"size\": 6}',57,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'JW',NULL,NULL,NULL),('part',21,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"ew61n9u0ongow41dmayeyo7i8\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"eccf61f9770be39afd1efe2c8ec5bdbf2ddc3d3cf30a688bf6a18bf4dac45048\", \"id\": 21, \"filename\": null, \"message_id\": 7, \"size\": 27}',58,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B@]3~6',NULL,NULL,NULL),('folderitem',19,'insert','{\"thread_id\": 7, \"id\": 19, \"folder_name\": \"important\"}',59,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'sp;@ƺI_',NULL,NULL,NULL),('contact',1,'update','{\"score\": 15}',60,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']BHkmKلsY',NULL,NULL,NULL),('part',23,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"aljqi080vg3g2e99fhjx8nlo6\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"31b75c53af215582d8b94e90730e58dd711f17b2c6c9128836ba98e8620892c8\", \"id\": 23, \"filename\": null, \"message_id\": 8, \"size\": 13}',61,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'֑\"H(0',NULL,NULL,NULL),('folderitem',24,'insert','{\"thread_id\": 8, \"id\": 24, \"folder_name\": \"archive\"}',62,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'߃GI)3<іϫ',NULL,NULL,NULL),('message',8,'insert','{\"public_id\": \"1ois6b5z3fuczqszu0qxji89p\", \"sender_addr\": [], \"thread_id\": 8, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">aoiulhksjndf</div></body></html>\", \"id\": 8, \"subject\": \"ohaiulskjndf\", \"g_msgid\": 1464329835043990839, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464329835043990839, \"inbox_uid\": null, \"snippet\": \"aoiulhksjndf\", \"message_id_header\": \"<CABO4WuOoG=Haky985B_Lx3J0kBo1o8J+2rH87qdpnyHg1+JVJA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396493754000}, \"size\": 2994, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"6e4a76ba1ca34b0b4edd2d164229ad9d4b8a5d53ea53dc214799c93b802f2340\", \"reply_to\": []}',63,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B7eNDgrA',NULL,NULL,NULL),('part',22,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"dzddta75o6reb07yhuhxse0hu\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"6a10813ed0f5a12fb60a530aed347f74b32c0de65da5f8b4f14cd459469bfb30\", \"id\": 22, \"message_id\": 8, \"size\": 2837}',64,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'{O',NULL,NULL,NULL),('folderitem',23,'insert','{\"thread_id\": 8, \"id\": 23, \"folder_name\": \"inbox\"}',65,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']aDueU',NULL,NULL,NULL),('folderitem',22,'insert','{\"thread_id\": 8, \"id\": 22, \"folder_name\": \"important\"}',66,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'q\ZBw9S',NULL,NULL,NULL),('part',24,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"cvksynwp4v7uu0irsqkbagol6\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"889eddcafac71f421c65339c0c38bec66940ffdd76adedce2472a4edf704398d\", \"id\": 24, \"filename\": null, \"message_id\": 8, \"size\": 34}',67,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'|NƓt8',NULL,NULL,NULL),('contact',1,'update','{\"score\": 16}',68,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'-K<A',NULL,NULL,NULL),('part',27,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"bkeoyvyzdrq9wz3l4vneejr8a\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"d560107b9f59d09cabcbc2633bbf986545e2bd41f3517655d7b8bf3c7dea7786\", \"id\": 27, \"filename\": null, \"message_id\": 9, \"size\": 63}',69,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'p\"x+BVu',NULL,NULL,NULL),('message',9,'insert','{\"public_id\": \"m7gc8epgseemesuizweahmfq\", \"sender_addr\": [], \"thread_id\": 9, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">a8ogysuidfaysogudhkbjfasdf<div><br/></div></div></body></html>\", \"id\": 9, \"subject\": \"guaysdhbjkf\", \"g_msgid\": 1464329212533881603, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464329212533881603, \"inbox_uid\": null, \"snippet\": \"a8ogysuidfaysogudhkbjfasdf\", \"message_id_header\": \"<CABO4WuM6jXXOtc7KGU-M4bQKkP3wXxjnrBWFhbznsJDsiauHmA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396493160000}, \"size\": 2165, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"e5cc414d931127db23a633eb27b12b1fa7621562ee639487b20c18818cb78437\", \"reply_to\": []}',70,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"\0%DEY',NULL,NULL,NULL),('folderitem',27,'insert','{\"thread_id\": 9, \"id\": 27, \"folder_name\": \"archive\"}',71,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'^ZMJ',NULL,NULL,NULL),('part',26,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"bzn56f396mgwi69xsitc7q06r\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"a87dd39d644c9330f2f60ea9458b35c503352a3d6a9be0339f5b3b44d8239d88\", \"id\": 26, \"filename\": null, \"message_id\": 9, \"size\": 27}',72,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'[3N[>1k',NULL,NULL,NULL),('folderitem',25,'insert','{\"thread_id\": 9, \"id\": 25, \"folder_name\": \"important\"}',73,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'+pCIMZWD',NULL,NULL,NULL),('folderitem',26,'insert','{\"thread_id\": 9, \"id\": 26, \"folder_name\": \"inbox\"}',74,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ZVJO$d2z',NULL,NULL,NULL),('part',25,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"7ohzr8mnpeipdy49220gppi1g\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"46866e65955fdb44934bda5241facc2e5351d85bc58d5fe4363bacd99dfbed9b\", \"id\": 25, \"message_id\": 9, \"size\": 1949}',75,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'E3GW\\',NULL,NULL,NULL),('contact',1,'update','{\"score\": 17}',76,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'`Eҩrܨd',NULL,NULL,NULL),('part',30,'insert','{\"walk_index\": 3, \"namespace_id\": 1, \"public_id\": \"au4mckfefae6a41wglfyct7d9\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"e956c365e2a7b8481070dde8bdd3d741d799f32f2c208a44a8b6aac9c377419a\", \"id\": 30, \"filename\": null, \"message_id\": 10, \"size\": 5575}',77,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'mh\rAۯ\n=p˚',NULL,NULL,NULL),('folderitem',28,'insert','{\"thread_id\": 10, \"id\": 28, \"folder_name\": \"inbox\"}',78,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'3_L9dH\0zYx',NULL,NULL,NULL),('part',28,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"cl2vbhbrfbmchgutyg3kcqbuf\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"f9f27dc47aa42dcd7dc0140be6723e58942ae5f4b5a4947ff43d8c427991917c\", \"id\": 28, \"message_id\": 10, \"size\": 2224}',79,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'uN+iU',NULL,NULL,NULL),('part',32,'insert','{\"walk_index\": 5, \"namespace_id\": 1, \"public_id\": \"ej0vssrsaddtidsfrelsavift\", \"misc_keyval\": [[\"Content-Type\", [\"image/png\", {\"name\": \"profilephoto.png\"}]], [\"Content-Disposition\", [\"attachment\", {\"filename\": \"profilephoto.png\"}]], [\"Content-Transfer-Encoding\", [\"base64\", {}]], [\"Content-Id\", \"<profilephoto>\"]], \"_content_type_other\": null, \"_content_type_common\": \"image/png\", \"content_id\": \"<profilephoto>\", \"data_sha256\": \"ff3f6b9d30f972e18d28a27d9c19aee77c5f704de8cf490a502c1389c2caf93a\", \"id\": 32, \"filename\": \"profilephoto.png\", \"content_disposition\": \"attachment\", \"message_id\": 10, \"size\": 565}',80,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'N(OM*H?)F̕',NULL,NULL,NULL),('part',29,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"c6fl5i9mbrbcrwwn9inpwfbwm\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"format\": \"flowed\", \"charset\": \"ISO-8859-1\", \"delsp\": \"yes\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"3d747459c9884417e66ceb56b4f1811b15cfb3fc8efcf1bfb4ac88e3859fa4f0\", \"id\": 29, \"filename\": null, \"message_id\": 10, \"size\": 993}',81,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'TZE[/M\n',NULL,NULL,NULL),('part',31,'insert','{\"walk_index\": 4, \"namespace_id\": 1, \"public_id\": \"2kumywaetaego8caxg47xe9f3\", \"misc_keyval\": [[\"Content-Type\", [\"image/png\", {\"name\": \"google.png\"}]], [\"Content-Disposition\", [\"attachment\", {\"filename\": \"google.png\"}]], [\"Content-Transfer-Encoding\", [\"base64\", {}]], [\"Content-Id\", \"<google>\"]], \"_content_type_other\": null, \"_content_type_common\": \"image/png\", \"content_id\": \"<google>\", \"data_sha256\": \"2991102bf5c783ea6f018731a8939ee97a4d7562a76e8188775447e3c6e0876f\", \"id\": 31, \"filename\": \"google.png\", \"content_disposition\": \"attachment\", \"message_id\": 10, \"size\": 6321}',82,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'VcR\"EߡIП',NULL,NULL,NULL),('message',10,'insert','{\"public_id\": \"4pg72e80db49823fwyibgvezq\", \"sender_addr\": [], \"thread_id\": 10, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html lang=\\\"en\\\"><body style=\\\"margin:0; padding: 0;\\\">\\n<table align=\\\"center\\\" bgcolor=\\\"#f1f1f1\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" height=\\\"100%\\\" style=\\\"border-collapse: collapse\\\" width=\\\"100%\\\">\\n<tr align=\\\"center\\\">\\n<td valign=\\\"top\\\">\\n<table bgcolor=\\\"#f1f1f1\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" height=\\\"60\\\" style=\\\"border-collapse: collapse\\\">\\n<tr height=\\\"40\\\" valign=\\\"middle\\\">\\n<td width=\\\"9\\\"></td>\\n<td valign=\\\"middle\\\" width=\\\"217\\\">\\n<img alt=\\\"Google Accounts\\\" border=\\\"0\\\" height=\\\"40\\\" src=\\\"cid:google\\\" style=\\\"display: block;\\\"/>\\n</td>\\n<td style=\\\"font-size: 13px; font-family: arial, sans-serif; color: #777777; text-align: right\\\" width=\\\"327\\\">\\n            \\n              Inbox App\\n            \\n          </td>\\n<td width=\\\"10\\\"></td>\\n<td><img src=\\\"cid:profilephoto\\\"/></td>\\n<td width=\\\"10\\\"></td>\\n</tr>\\n</table>\\n<table bgcolor=\\\"#ffffff\\\" border=\\\"1\\\" bordercolor=\\\"#e5e5e5\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"text-align: left\\\">\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n<tr>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\">\\n</td>\\n<td style=\\\"font-size: 83%; border-top: none; border-bottom: none; border-left: none; border-right: none; font-size: 13px; font-family: arial, sans-serif; color: #222222; line-height: 18px\\\" valign=\\\"top\\\" width=\\\"568\\\">\\n            \\n              Hi Inbox,\\n              <br/>\\n<br/>\\n            \\n\\n\\nThe recovery phone number for your Google Account - inboxapptest@gmail.com - was recently changed. If you made this change, you don\'t need to do anything more.\\n\\n<br/>\\n<br/>\\n\\nIf you didn\'t change your recovery phone, someone may have broken into your account. Visit this link for more information: <a href=\\\"https://support.google.com/accounts/bin/answer.py?answer=2450236\\\" style=\\\"text-decoration: none; color: #4D90FE\\\">https://support.google.com/accounts/bin/answer.py?answer=2450236</a>.\\n\\n<br/>\\n<br/>\\n\\nIf you are having problems accessing your account, reset your password by clicking the button below:\\n\\n<br/>\\n<br/>\\n<a href=\\\"https://accounts.google.com/RecoverAccount?fpOnly=1&amp;source=ancrppe&amp;Email=inboxapptest@gmail.com\\\" style=\\\"text-align: center; font-size: 11px; font-family: arial, sans-serif; color: white; font-weight: bold; border-color: #3079ed; background-color: #4d90fe; background-image: linear-gradient(top,#4d90fe,#4787ed); text-decoration: none; display:inline-block; height: 27px; padding-left: 8px; padding-right: 8px; line-height: 27px; border-radius: 2px; border-width: 1px;\\\" target=\\\"_blank\\\">\\n<span style=\\\"color: white;\\\">\\n    \\n      Reset password\\n    \\n  </span>\\n</a>\\n<br/>\\n<br/>\\n                \\n                  Sincerely,<br/>\\n                  The Google Accounts team\\n                \\n                </td>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\">\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n<tr>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\"></td>\\n<td style=\\\"font-size: 11px; font-family: arial, sans-serif; color: #777777; border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"568\\\">\\n                \\n                  This email can\'t receive replies. For more information, visit the <a href=\\\"https://support.google.com/accounts/bin/answer.py?answer=2450236\\\" style=\\\"text-decoration: none; color: #4D90FE\\\"><span style=\\\"color: #4D90FE;\\\">Google Accounts Help Center</span></a>.\\n                \\n                </td>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\"></td>\\n</tr>\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n</table>\\n<table bgcolor=\\\"#f1f1f1\\\" height=\\\"80\\\" style=\\\"text-align: left\\\">\\n<tr valign=\\\"middle\\\">\\n<td style=\\\"font-size: 11px; font-family: arial, sans-serif; color: #777777;\\\">\\n                  \\n                    You received this mandatory email service announcement to update you about important changes to your Google product or account.\\n                  \\n                  <br/>\\n<br/>\\n<div style=\\\"direction: ltr;\\\">\\n                  \\n                    \\u00a9 2013 Google Inc., 1600 Amphitheatre Parkway, Mountain View, CA 94043, USA\\n                  \\n                  </div>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n</table>\\n</body></html>\", \"id\": 10, \"subject\": \"Google Account recovery phone number changed\", \"g_msgid\": 1449471921372979402, \"from_addr\": [[\"\", \"no-reply@accounts.google.com\"]], \"g_thrid\": 1449471921372979402, \"inbox_uid\": null, \"snippet\": \"\\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n            \\n              Inbox App\\n            \\n           \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n            \\n              Hi Inbox,\\n               \\n \\n            \\n\\n\\nThe recove\", \"message_id_header\": \"<MC4rhxPMVYU1ydNeoLDDDA@notifications.google.com>\", \"received_date\": {\"$date\": 1382324143000}, \"size\": 19501, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"7836dd4eef7852ea9e9fafae09cc40d18887478d8279d0c2e215c2a7daad3deb\", \"reply_to\": []}',83,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'89cNRb',NULL,NULL,NULL),('folderitem',29,'insert','{\"thread_id\": 10, \"id\": 29, \"folder_name\": \"archive\"}',84,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'!fVAJ8%',NULL,NULL,NULL),('contact',1,'update','{\"score\": 18}',85,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'iR|Nc.~',NULL,NULL,NULL),('contact',7,'insert','{\"public_id\": \"ekf3dtag2jpkv2ig7w2enzj91\", \"uid\": {\"$uuid\": \"94d616ac3963442a9d05b88d43a94758\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"no-reply@accounts.google.com\", \"id\": 7, \"name\": \"\"}',86,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'7v*oNN \'O',NULL,NULL,NULL),('part',34,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5ax75yobfwixrdetp1ng44126\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 34, \"filename\": null, \"message_id\": 11, \"size\": 31}',87,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'A_P^C<6^',NULL,NULL,NULL),('folderitem',30,'insert','{\"thread_id\": 11, \"id\": 30, \"folder_name\": \"archive\"}',88,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"ۙ|bHOu/`^j',NULL,NULL,NULL),('part',35,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"ap322i8toyc00gyrrkrzmxhit\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 35, \"filename\": null, \"message_id\": 11, \"size\": 61}',89,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'^]Ms¸Eh',NULL,NULL,NULL),('part',33,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"6qe3ajoabbndu00y33a97x987\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"21ddd725936b604c5b970431f6f44c3887797938c8ba98525bb2098c128aed81\", \"id\": 33, \"message_id\": 11, \"size\": 891}',90,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'&oH\Z<f:',NULL,NULL,NULL),('message',11,'insert','{\"public_id\": \"djb98ezfhbmjhd62qhqgj7web\", \"sender_addr\": [], \"thread_id\": 11, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 11, \"subject\": \"Wakeup78fcb997159345c9b160573e1887264a\", \"g_msgid\": 1466856002099058157, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466856002099058157, \"inbox_uid\": \"c64be65384804950972d7cb34cd33c69\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<5361906e.c3ef320a.62fb.064c@mx.google.com>\", \"received_date\": {\"$date\": 1398902894000}, \"size\": 1238, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"aa2f127af89b74364ae781becd35704c48f690a3df0abd90e543eafc2ef4d590\", \"reply_to\": []}',91,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'tXFHMf',NULL,NULL,NULL),('contact',1,'update','{\"score\": 19}',92,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ׂkLER',NULL,NULL,NULL),('part',38,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"aytpnjos6jd1bjjhppk3l3ifv\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 38, \"filename\": null, \"message_id\": 12, \"size\": 61}',93,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'@Ǆ-*p}',NULL,NULL,NULL),('part',36,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"1yb2l76yhu9txhtcfkbwd2t3\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"553b8ce2185f5d66380cf0209f81cb2fa6a3a0e1f59845d8530ed08b38e96a0e\", \"id\": 36, \"message_id\": 12, \"size\": 852}',94,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'li!/BЂb	͌',NULL,NULL,NULL),('folderitem',31,'insert','{\"thread_id\": 12, \"id\": 31, \"folder_name\": \"archive\"}',95,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' ::kDuX',NULL,NULL,NULL),('message',12,'insert','{\"public_id\": \"k0e9h2pn2my9dc84m3iku8k\", \"sender_addr\": [], \"thread_id\": 12, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 12, \"subject\": \"Wakeup1dd3dabe7d9444da8aec3be27a82d030\", \"g_msgid\": 1466855488650356657, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466855488650356657, \"inbox_uid\": \"e4f72ba9f22842bab7d41e6c4b877b83\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53618e85.e14f320a.1f54.21a6@mx.google.com>\", \"received_date\": {\"$date\": 1398902405000}, \"size\": 1199, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"4a07bb7d5d933c811c267c0262525de7c468d735e9b6edb0ee2060b6f24ab330\", \"reply_to\": []}',96,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'oT{VHj1ȅ',NULL,NULL,NULL),('part',37,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"71pgb9ywiaux79rycl7zd24x4\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 37, \"filename\": null, \"message_id\": 12, \"size\": 31}',97,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'u2OB',NULL,NULL,NULL),('contact',1,'update','{\"score\": 20}',98,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'∾凬Ha	',NULL,NULL,NULL),('folderitem',32,'insert','{\"thread_id\": 13, \"id\": 32, \"folder_name\": \"archive\"}',99,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'{<HǪ:!:cwN',NULL,NULL,NULL),('part',40,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"eozodoynme9dz7eebc07oekp5\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 40, \"filename\": null, \"message_id\": 13, \"size\": 31}',100,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Ur2D *M',NULL,NULL,NULL),('part',39,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"4t19q2tk6ls09y4bb8cxmc5ti\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"5f015f0eab6e3adcf8320221b6b0686b73f05a2a3cae54e7367f1d42ba44c734\", \"id\": 39, \"message_id\": 13, \"size\": 853}',101,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' IMe\\^',NULL,NULL,NULL),('part',41,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"cw8hwwytjt17p71ehki9gbvrc\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 41, \"filename\": null, \"message_id\": 13, \"size\": 61}',102,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'JA7D]',NULL,NULL,NULL),('message',13,'insert','{\"public_id\": \"97fjigzedwnk3rb8ato4s5b99\", \"sender_addr\": [], \"thread_id\": 13, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 13, \"subject\": \"Wakeupe2ea85dc880d421089b7e1fb8cc12c35\", \"g_msgid\": 1466854894292093968, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466854894292093968, \"inbox_uid\": \"d1dea076298a4bd09178758433f7542c\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53618c4e.a983320a.45a5.21a5@mx.google.com>\", \"received_date\": {\"$date\": 1398901838000}, \"size\": 1200, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"91b33ba2f89ca4006d4b5c26d760d4e253bb3f4ed5c87efe964545c2c4ca0db4\", \"reply_to\": []}',103,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' \0JB=\0ӄw&',NULL,NULL,NULL),('contact',1,'update','{\"score\": 21}',104,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,')(ײZHҶ`.',NULL,NULL,NULL),('contact',2,'update','{\"score\": 10}',105,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/wݣOmZd7',NULL,NULL,NULL),('part',44,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7r5mj5l3w82fggryzl7y9f0a0\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 44, \"filename\": null, \"message_id\": 14, \"size\": 61}',106,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'d25%I((',NULL,NULL,NULL),('part',43,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"b3l94s1lk9xqdciacziws43k\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 43, \"filename\": null, \"message_id\": 14, \"size\": 31}',107,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'M&LR%z',NULL,NULL,NULL),('folderitem',33,'insert','{\"thread_id\": 14, \"id\": 33, \"folder_name\": \"archive\"}',108,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Idaà^',NULL,NULL,NULL),('message',14,'insert','{\"public_id\": \"dcgxhwejsfkijv9nlfi25ad9f\", \"sender_addr\": [], \"thread_id\": 14, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 14, \"subject\": \"Wakeup735d8864f6124797a10e94ec5de6be13\", \"g_msgid\": 1466761634398434761, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466761634398434761, \"inbox_uid\": \"5bf16c2bc9684717a9b77b73cbe9ba45\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<536030e2.640e430a.04ce.ffff8de9@mx.google.com>\", \"received_date\": {\"$date\": 1398812898000}, \"size\": 1205, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"73b93d369f20843a12a81daf72788b1b7fbe703c4abd289f69d1e41f212833a0\", \"reply_to\": []}',109,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'@Q*BfGo1',NULL,NULL,NULL),('part',42,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"b10systeyyaxcelzv23ngeme8\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"0b940bea3d7f6e2523605b3e5e91f3d93aa38d780d6ba49f6fd3664ee3b0eaad\", \"id\": 42, \"message_id\": 14, \"size\": 858}',110,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'e5cEw\Z2XZ',NULL,NULL,NULL),('contact',1,'update','{\"score\": 22}',111,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'i|E݋MǍ',NULL,NULL,NULL),('part',46,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"cwa3z3ei2il150ayylmz8bld6\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 46, \"filename\": null, \"message_id\": 15, \"size\": 31}',112,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'MfMKW\0e',NULL,NULL,NULL),('part',45,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"71jjzbbu3srbwdmltebcbb3xt\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"42cefe658856c48397713f475e04af3059fa8c43ee5cc67b7c25ff822f6fdd1c\", \"id\": 45, \"message_id\": 15, \"size\": 895}',113,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'2gA2`!\\',NULL,NULL,NULL),('folderitem',34,'insert','{\"thread_id\": 15, \"id\": 34, \"folder_name\": \"archive\"}',114,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'8SlC;R!0x	',NULL,NULL,NULL),('message',15,'insert','{\"public_id\": \"7sk0a64w7d6j1yad31jd8hzia\", \"sender_addr\": [], \"thread_id\": 15, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 15, \"subject\": \"Wakeup2eba715ecd044a55ae4e12f604a8dc96\", \"g_msgid\": 1466761259745473801, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466761259745473801, \"inbox_uid\": \"7e7d36a5b6f54af1af551a55b48d1735\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53602f7d.a6a3420a.73de.6c0b@mx.google.com>\", \"received_date\": {\"$date\": 1398812541000}, \"size\": 1242, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"b13ddac39e20275606cf2f651e269f22f850ac18dce43cf18de982ed3ac20e4f\", \"reply_to\": []}',115,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ݻ1ǗDCts',NULL,NULL,NULL),('part',47,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"8rbi9qhj6oqghodwc3gwrwntc\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 47, \"filename\": null, \"message_id\": 15, \"size\": 61}',116,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\'FD}Qv',NULL,NULL,NULL),('contact',1,'update','{\"score\": 23}',117,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>ܽL[?>',NULL,NULL,NULL),('part',48,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"4jwrhu8sh8svr5ixbn5meooup\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"3a50e724e41242746339a2ad4accd821dca20a73844848c54556d5fc13e58a31\", \"id\": 48, \"message_id\": 16, \"size\": 3092}',118,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'G3LBz@f%:H',NULL,NULL,NULL),('folderitem',35,'insert','{\"thread_id\": 16, \"id\": 35, \"folder_name\": \"important\"}',119,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'QBI,c',NULL,NULL,NULL),('part',49,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5lzeffp6m3yh5kmaa1h9cvncu\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"UTF-8\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"d30c644879e3b7b618dd03d593e67a9b6ff80615e4aea01b06b992dbed47008a\", \"id\": 49, \"filename\": null, \"message_id\": 16, \"size\": 2722}',120,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'* /J۳|ܺ',NULL,NULL,NULL),('message',16,'insert','{\"public_id\": \"b07gpwg599b3q2p6ms71z0oeo\", \"sender_addr\": [], \"thread_id\": 16, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"<CA+ADUwxeXG8+=Mya+T1Qb_RYS23w6=_EZgssm3GgW6SkhXPxGQ@mail.gmail.com>\\t<F7C679E5-09F7-4F17-B1CA-A67A6B207650@gmail.com>\\t<CAPGJ9TSw5oHjhDNGNa3zs4GQ1WC=bCJ8UTdF12NFqgSdYib9FA@mail.gmail.com>\\t<CAPGJ9TRPNG7pS0JTEZog1A+usobFsH3S5nE0EbPbqtwBW3dKKw@mail.gmail.com>\\t<CA+ADUwytg_oZ6B2HfW=v=Vy39G1t1vT17UpjUTaYJuqr8FYR6w@mail.gmail.com>\\t<CALEp7UFOAXWGgMUW9_GVmJfd1xQSfmXHoGs3rajEd6wZwra1Qw@mail.gmail.com>\\t<CA+ADUwwh7gmTDfzVObOkcm0d=5j9mMZt-NxswDqXv9VnpYg_Lg@mail.gmail.com>\\t<CAMpoCYqjMdo=dVvQMZZE5BhZMb2sZkznQnc=7K6kZ_M6NCg+EQ@mail.gmail.com>\\t<CAPGJ9TQi7Rqxr+HmjASJJ0o2OMgFBG5z-mguUQuy8su1fakLiQ@mail.gmail.com>\\t<CA+ADUwzEgH6GC=ji5FT0m+i1XSxu0uamwrqAwGMAZhg-qWvL2g@mail.gmail.com>\\t<CAPGJ9TQkb923ZKeVxqfqB=JeLnhE9-MOAigRrHo-PZCtueZ-Tg@mail.gmail.com>\\t<3A2441BA-C669-4533-A67A-5CE841A82B54@gmail.com>\\t<CALEp7UFN3t=rzzZ_in=3LvAypVN=S9hi_RQkpKwc1kc13ymYTw@mail.gmail.com>\\t<CALRhdLLxFd1L5D+7RoUKVqq0G62cLJezYmMZaST2eiB7kQDCPw@mail.gmail.com>\\t<CAPGJ9TQe4TyhwmS3vbu1hkZgDkNzsb4O2F1OYvvhMxO3v61Ehg@mail.gmail.com>\\t<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\"><br/><br/><br/></div></body></html>\", \"id\": 16, \"subject\": \"Golden Gate Park next Sat\", \"g_msgid\": 1466255156975764289, \"from_addr\": [[\"kavya joshi\", \"kavya719@gmail.com\"]], \"g_thrid\": 1466255156975764289, \"inbox_uid\": null, \"snippet\": \"\", \"message_id_header\": \"<CAMpoCYqq6BmoRW+MouXOwDxiA=DO20b=sG4e2agmr04Bt8Wg_g@mail.gmail.com>\", \"received_date\": {\"$date\": 1398329884000}, \"size\": 13142, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": \"<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\", \"is_draft\": false, \"data_sha256\": \"a5993aef718c4ce3ffd93f0a3cf3a4e54f93278bcb5873a533de3882c383e706\", \"reply_to\": []}',121,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'-WajdBR[[BD',NULL,NULL,NULL),('part',50,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7mv2uy2nxtvnl7vsh6eds5zjw\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"UTF-8\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"37a1732d9a602ad020d4bf3c878571d8c19eb968ca61a382a4d2d3fb5e8ef896\", \"id\": 50, \"filename\": null, \"message_id\": 16, \"size\": 6605}',122,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'[M.3ߜ',NULL,NULL,NULL),('folderitem',36,'insert','{\"thread_id\": 16, \"id\": 36, \"folder_name\": \"archive\"}',123,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'שE\"Cϝ}',NULL,NULL,NULL),('contact',1,'update','{\"score\": 24}',124,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'l\\-0LM1,4R',NULL,NULL,NULL),('contact',8,'insert','{\"public_id\": \"5rn57m6b3rp2te4qd5qgh4nk3\", \"uid\": {\"$uuid\": \"47c6565a2c8e49a5a32c9a7aff921248\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"kavya719@gmail.com\", \"id\": 8, \"name\": \"kavya joshi\"}',125,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\r7OMNem =',NULL,NULL,NULL);
+INSERT INTO `transaction` VALUES ('part',3,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"a5dswfe6mzl9ad0g8mrk399eq\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"6103eda40adfd98a9e4b4e16ff958e693893f4c37359c76fd9b4e77531a22828\", \"id\": 3, \"filename\": null, \"message_id\": 1, \"size\": 36}',1,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'}3KhS',NULL,NULL,NULL,NULL),('part',2,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5nrzawkxf1apntb0evw541akg\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"d58d3859935609dd2afe7233c68939cd9cd20ef54e3a61d0442f41fc157fc10d\", \"id\": 2, \"filename\": null, \"message_id\": 1, \"size\": 15}',2,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'.3[J=j{F\Z',NULL,NULL,NULL,NULL),('folderitem',1,'insert','{\"thread_id\": 1, \"id\": 1, \"folder_name\": \"important\"}',3,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'4XiN*',NULL,NULL,NULL,NULL),('message',1,'insert','{\"public_id\": \"1c393pgoea1sqnv4mv1rpux1c\", \"sender_addr\": [], \"thread_id\": 1, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">iuhasdklfhasdf</div></body></html>\", \"id\": 1, \"subject\": \"asiuhdakhsdf\", \"g_msgid\": 1464327557735981576, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464327557735981576, \"inbox_uid\": null, \"snippet\": \"iuhasdklfhasdf\", \"message_id_header\": \"<CABO4WuP6D+RUW5T_ZbER9T-O--qYDj_JbgD72RGGfrSkJteQ4Q@mail.gmail.com>\", \"received_date\": {\"$date\": 1396491582000}, \"size\": 2127, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"f92545e762b44776e0cb3fdad773f47a563fd5cb72a7fc31c26a2c43cc764343\", \"reply_to\": []}',4,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']EN|Bs',NULL,NULL,NULL,NULL),('folderitem',3,'insert','{\"thread_id\": 1, \"id\": 3, \"folder_name\": \"archive\"}',5,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'$twA%1-',NULL,NULL,NULL,NULL),('folderitem',2,'insert','{\"thread_id\": 1, \"id\": 2, \"folder_name\": \"inbox\"}',6,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B%J(t~(',NULL,NULL,NULL,NULL),('part',1,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"ccylhpm5fvy284raoo34lgut2\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"1c61dd2b4dd1193911f3aaa63ac0d7d55058d567664cddaab094e59a46cdc59d\", \"id\": 1, \"message_id\": 1, \"size\": 1950}',7,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'u.J5O{\\Ϸ',NULL,NULL,NULL,NULL),('contact',1,'insert','{\"public_id\": \"9fmqsnooedtybo5c3z0clflnc\", \"uid\": {\"$uuid\": \"ac99aa06560442349cccdfb5f41973d1\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 10, \"provider_name\": \"inbox\", \"email_address\": \"inboxapptest@gmail.com\", \"id\": 1, \"name\": \"\"}',8,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'VLqI*',NULL,NULL,NULL,NULL),('contact',2,'insert','{\"public_id\": \"92jcqqvvaje9akg7kveteaaln\", \"uid\": {\"$uuid\": \"523f7769c26e4728921dffd43e5bb1b4\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"benbitdiddle1861@gmail.com\", \"id\": 2, \"name\": \"Ben Bitdiddle\"}',9,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>L\\p=5l',NULL,NULL,NULL,NULL),('part',6,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"mup7o0q2aqinnisod06d7kto\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"UTF-8\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"2014eb3bb6de2ecb23151b266a3057be6cf3e9c19659d215b531fcee286a87f5\", \"id\": 6, \"filename\": null, \"message_id\": 2, \"size\": 2120}',10,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ZEtr|',NULL,NULL,NULL,NULL),('message',2,'insert','{\"public_id\": \"78pdocq8sa8qw4ky77gzxhdl9\", \"sender_addr\": [[\"\", \"golang-nuts@googlegroups.com\"]], \"thread_id\": 2, \"bcc_addr\": [], \"cc_addr\": [[\"golang-nuts\", \"golang-nuts@googlegroups.com\"]], \"references\": \"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground.<div class=\\\"gmail_extra\\\"></div></div>\\n<p></p>\\n\\n-- <br/>\\nYou received this message because you are subscribed to the Google Groups \\\"golang-nuts\\\" group.<br/>\\nTo unsubscribe from this group and stop receiving emails from it, send an email to <a href=\\\"mailto:golang-nuts+unsubscribe@googlegroups.com\\\">golang-nuts+unsubscribe@googlegroups.com</a>.<br/>\\nFor more options, visit <a href=\\\"https://groups.google.com/d/optout\\\">https://groups.google.com/d/optout</a>.<br/></body></html>\", \"id\": 2, \"subject\": \"[go-nuts] Runtime Panic On Method Call\", \"g_msgid\": 1467038319150540079, \"from_addr\": [[\"\'Rui Ueyama\' via golang-nuts\", \"golang-nuts@googlegroups.com\"]], \"g_thrid\": 1467038319150540079, \"inbox_uid\": null, \"snippet\": \"I\'d think you\'ll get more help if you can reproduce the issue with smaller code and paste it to Go Playground. \\n \\n\\n--  \\nYou received this message because you are subscribed to the Google Grou\", \"message_id_header\": \"<CAJENXgt5t4yYJdDuV7m2DKwcDEbsY8TohVWmgmMqhnqC3pGwMw@mail.gmail.com>\", \"received_date\": {\"$date\": 1399076765000}, \"size\": 10447, \"type\": \"message\", \"to_addr\": [[\"Paul Tiseo\", \"paulxtiseo@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": \"<golang-nuts.googlegroups.com>\", \"List-Post\": \"<http://groups.google.com/group/golang-nuts/post>, <mailto:golang-nuts@googlegroups.com>\", \"List-Owner\": null, \"List-Subscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:golang-nuts+subscribe@googlegroups.com>\", \"List-Unsubscribe\": \"<http://groups.google.com/group/golang-nuts/subscribe>, <mailto:googlegroups-manage+332403668183+unsubscribe@googlegroups.com>\", \"List-Archive\": \"<http://groups.google.com/group/golang-nuts>\", \"List-Help\": \"<http://groups.google.com/support/>, <mailto:golang-nuts+help@googlegroups.com>\"}, \"in_reply_to\": \"<1286bda0-97a1-47c4-be2d-93b2640f2435@googlegroups.com>\", \"is_draft\": false, \"data_sha256\": \"e317a191277854cb8b88481268940441a065bad48d02d5a477f0564d4cbe5297\", \"reply_to\": [[\"Rui Ueyama\", \"ruiu@google.com\"]]}',11,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'q\ngBJC̲ܛ',NULL,NULL,NULL,NULL),('folderitem',6,'insert','{\"thread_id\": 2, \"id\": 6, \"folder_name\": \"archive\"}',12,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Jե@KٛfCX',NULL,NULL,NULL,NULL),('folderitem',4,'insert','{\"thread_id\": 2, \"id\": 4, \"folder_name\": \"important\"}',13,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'HD_Kn\r4',NULL,NULL,NULL,NULL),('part',4,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"6zkps691gu9y2b3dk5zwh7upk\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"179cd7e3034869737ae02cee0b918fb85f9254ea2fd0c0b3f7b84a32420edebc\", \"id\": 4, \"message_id\": 2, \"size\": 6738}',14,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\nKV\'I4! u',NULL,NULL,NULL,NULL),('part',5,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"eeu7pyr0rpvvnue1nj1rde1dv\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"UTF-8\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"7fdc6a5d14d7832747b01287f8b7da14bf612e2e100df9df1b4561bcaec8d268\", \"id\": 5, \"filename\": null, \"message_id\": 2, \"size\": 1361}',15,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/ABobEOUA',NULL,NULL,NULL,NULL),('folderitem',5,'insert','{\"thread_id\": 2, \"id\": 5, \"folder_name\": \"inbox\"}',16,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\'dH<Kt',NULL,NULL,NULL,NULL),('contact',3,'insert','{\"public_id\": \"de3rvdrlp4cuksjn9jt33uhg4\", \"uid\": {\"$uuid\": \"0ff751115a7246a4a0d0d1d189422117\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 10, \"provider_name\": \"inbox\", \"email_address\": \"paulxtiseo@gmail.com\", \"id\": 3, \"name\": \"Paul Tiseo\"}',17,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'LOE^',NULL,NULL,NULL,NULL),('contact',4,'insert','{\"public_id\": \"a46s0bayqfw9kihg3i6sss2dm\", \"uid\": {\"$uuid\": \"6840fd7634e34b1ab0a36b797bbf92d7\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"golang-nuts@googlegroups.com\", \"id\": 4, \"name\": \"golang-nuts\"}',18,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/QDgũ6g',NULL,NULL,NULL,NULL),('folderitem',7,'insert','{\"thread_id\": 3, \"id\": 7, \"folder_name\": \"important\"}',19,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'*6K?T	F/',NULL,NULL,NULL,NULL),('part',8,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"16ecxuyoazxnhz6msuqcac4bm\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"windows-1252\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"b1558fdb97bc5918be82a7d342358fdd8abaa32cace1c96056319c594af6ddfe\", \"id\": 8, \"filename\": null, \"message_id\": 3, \"size\": 1251}',20,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'3fJ&',NULL,NULL,NULL,NULL),('part',9,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7ll34zrterre48tmhvjs18tpr\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"windows-1252\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"5ef8b7411036839cf82f81125fda1227b56378c14e4d2f2e251aaaa5496062ad\", \"id\": 9, \"filename\": null, \"message_id\": 3, \"size\": 12626}',21,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'I˸',NULL,NULL,NULL,NULL),('folderitem',8,'insert','{\"thread_id\": 3, \"id\": 8, \"folder_name\": \"inbox\"}',22,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\n#KRM9',NULL,NULL,NULL,NULL),('message',3,'insert','{\"public_id\": \"aowxtw42xdybrxfpkalf7qvki\", \"sender_addr\": [], \"thread_id\": 3, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html xmlns=\\\"http://www.w3.org/1999/xhtml\\\"><head><meta content=\\\"text/html;charset=utf-8\\\" http-equiv=\\\"content-type\\\"/><title>Tips for using Gmail</title></head><body link=\\\"#1155CC\\\" marginheight=\\\"0\\\" marginwidth=\\\"0\\\" text=\\\"#444444\\\">\\n<table bgcolor=\\\"#f5f5f5\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"100%\\\">\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"51\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"51\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td background=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-middle.png\\\" bgcolor=\\\"#f5f5f5\\\" height=\\\"51\\\" valign=\\\"bottom\\\" width=\\\"673\\\">\\n</td>\\n<td height=\\\"51\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"51\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-top-right.png\\\" style=\\\"display:block\\\" width=\\\"68\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"225\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"225\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td bgcolor=\\\"#ffffff\\\" valign=\\\"top\\\" width=\\\"668\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"100%\\\">\\n<tr>\\n<td colspan=\\\"3\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"center\\\" colspan=\\\"3\\\" height=\\\"50\\\" valign=\\\"bottom\\\"><img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/logo.gif\\\" style=\\\"display:block\\\"/></td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"40\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td width=\\\"450\\\">\\n<b>\\n<font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height: 1.4em\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_small.png\\\" style=\\\"display:block;float:left;margin-top:4px;margin-right:3px;\\\"/>Hi Inbox\\n                    </font>\\n</b>\\n</td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td height=\\\"40\\\" valign=\\\"top\\\">\\n</td></tr>\\n<tr>\\n<td width=\\\"111\\\">\\u00a0</td>\\n<td align=\\\"left\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"540\\\">\\n<tr>\\n<td valign=\\\"top\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"+2\\\"><span style=\\\"font-family:Open Sans, Arial, sans-serif; font-size: 25px\\\">Tips for using Gmail</span></font></td>\\n</tr>\\n</table>\\n</td>\\n<td width=\\\"111\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"10\\\">\\u00a0</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"225\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"225\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-1-right.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"950\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"950\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td align=\\\"center\\\" bgcolor=\\\"#ffffff\\\" valign=\\\"top\\\" width=\\\"668\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse;\\\" width=\\\"540\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_hangouts.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Chat right from your inbox</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">Chat with contacts and start video chats with up to 10 people in <a href=\\\"http://www.google.com/+/learnmore/hangouts/?hl=en\\\" style=\\\"text-decoration:none;\\\">Google+ Hangouts</a>.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_contacts.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Bring your email into Gmail</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">You can import your email from other webmail to make the transition to Gmail a bit easier. <a href=\\\"https://support.google.com/mail/answer/164640?hl=en\\\" style=\\\"text-decoration:none;\\\">Learn how.</a></font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_drive.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Use Google Drive to send large files</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\"><a href=\\\"https://support.google.com/mail/answer/2480713?hl=en\\\" style=\\\"text-decoration:none;\\\">Send huge files in Gmail </a>  (up to 10GB) using <a href=\\\"https://drive.google.com/?hl=en\\\" style=\\\"text-decoration:none;\\\">Google Drive</a>. Plus files stored in Drive stay up-to-date automatically so everyone has the most recent version and can access them from anywhere.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/welcome_storage.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Save everything</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">With 10GB of space, you\\u2019ll never need to delete an email. Just keep everything and easily find it later.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\">\\n<img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/mail/welcome/localized/en/welcome_search.png\\\" style=\\\"display:block\\\"/>\\n</td>\\n<td width=\\\"15\\\"></td>\\n<td align=\\\"left\\\" valign=\\\"middle\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse:collapse;\\\" width=\\\"400\\\">\\n<tr>\\n<td align=\\\"left\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"+1\\\"><span style=\\\"font-family:Arial, sans-serif; font-size: 20px;\\\">Find emails fast</span></font>\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"10\\\"></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\">\\n<font color=\\\"#444444\\\" face=\\\"Arial,sans-serif\\\" size=\\\"-1\\\" style=\\\"line-height:1.4em\\\">With the power of Google Search right in your inbox, you can quickly find the important emails you need with suggestions based on emails, past searches and contacts.</font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n<tr>\\n<td colspan=\\\"3\\\" height=\\\"30\\\">\\u00a0</td>\\n</tr>\\n</table>\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"500\\\">\\n<tr>\\n<td colspan=\\\"2\\\" height=\\\"40\\\">\\u00a0</td>\\n</tr>\\n<tr>\\n<td rowspan=\\\"2\\\" width=\\\"68\\\"><img alt=\\\"\\\" src=\\\"https://ssl.gstatic.com/accounts/services/mail/msa/gmail_icon_large.png\\\" style=\\\"display:block\\\"/></td>\\n<td align=\\\"left\\\" height=\\\"20\\\" valign=\\\"bottom\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-1\\\">Happy emailing,</font></td>\\n</tr>\\n<tr>\\n<td align=\\\"left\\\" valign=\\\"top\\\"><font color=\\\"#444444\\\" face=\\\"Arial, sans-serif\\\" size=\\\"+2\\\"><span style=\\\"font-family:Open Sans, Arial, sans-serif;\\\">The Gmail Team</span></font></td>\\n</tr>\\n<tr>\\n<td colspan=\\\"2\\\" height=\\\"60\\\">\\u00a0</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"950\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"950\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-middle-2-right.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n<tr>\\n<td>\\u00a0</td>\\n<td height=\\\"102\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"102\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-left.png\\\" style=\\\"display:block\\\" width=\\\"64\\\"/></td>\\n<td background=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-middle.png\\\" height=\\\"102\\\" valign=\\\"top\\\" width=\\\"673\\\">\\n<table border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"border-collapse: collapse; \\\" width=\\\"100%\\\">\\n<tr>\\n<td height=\\\"12\\\"></td>\\n</tr>\\n<tr>\\n<td valign=\\\"bottom\\\">\\n<font color=\\\"#AAAAAA\\\" face=\\\"Arial, sans-serif\\\" size=\\\"-2\\\">\\n                  \\u00a9 2013 Google Inc. 1600 Amphitheatre Parkway, Mountain View, CA 94043\\n                </font>\\n</td>\\n</tr>\\n</table>\\n</td>\\n<td height=\\\"102\\\" width=\\\"64\\\"><img alt=\\\"\\\" height=\\\"102\\\" src=\\\"https://ssl.gstatic.com/drive/announcements/images/framework-bottom-right.png\\\" style=\\\"display:block\\\" width=\\\"68\\\"/></td>\\n<td>\\u00a0</td>\\n</tr>\\n</table>\\n</body></html>\", \"id\": 3, \"subject\": \"Tips for using Gmail\", \"g_msgid\": 1443911956831022215, \"from_addr\": [[\"Gmail Team\", \"mail-noreply@google.com\"]], \"g_thrid\": 1443911956831022215, \"inbox_uid\": null, \"snippet\": \"\\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n Hi Inbox\\n                     \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\n Tips for using Gmail \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \\n \\n \\n \\n \\u00a0 \\n \\n \\n \\u00a0 \\n \", \"message_id_header\": \"<CAOPuB_MAEq7GsOVvWgE+qHR_6vWYXifHhF+hQ1sFyzk_eKPYpQ@mail.gmail.com>\", \"received_date\": {\"$date\": 1377021748000}, \"size\": 15711, \"type\": \"message\", \"to_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"8f62d93f04735652b9f4edc89bc764e5b48fff1bcd0acec67718047c81d76051\", \"reply_to\": []}',23,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'6\nEUx(C',NULL,NULL,NULL,NULL),('folderitem',9,'insert','{\"thread_id\": 3, \"id\": 9, \"folder_name\": \"archive\"}',24,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'.JGs\0',NULL,NULL,NULL,NULL),('part',7,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"73dkm7j8xewm7c4m93wnu4w9a\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"98ae516cd24a27e52537143ff996e1c462ae2be9ea96ef0df3e4db41f8cb1060\", \"id\": 7, \"message_id\": 3, \"size\": 453}',25,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\n&BU $H|',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 11}',26,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Q\" J	@+',NULL,NULL,NULL,NULL),('contact',5,'insert','{\"public_id\": \"di10igsxl9uy7c71bcwz05h1j\", \"uid\": {\"$uuid\": \"31d28d8167df479bae796f19589a88dd\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"mail-noreply@google.com\", \"id\": 5, \"name\": \"Gmail Team\"}',27,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'f1BK?vgbE',NULL,NULL,NULL,NULL),('message',4,'insert','{\"public_id\": \"464qbsuwnumipzmfny7kr7rxf\", \"sender_addr\": [[\"\", \"christine.spang@gmail.com\"]], \"thread_id\": 4, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">hi</div></body></html>\", \"id\": 4, \"subject\": \"trigger poll\", \"g_msgid\": 1463159441433026019, \"from_addr\": [[\"Christine Spang\", \"christine@spang.cc\"]], \"g_thrid\": 1463159441433026019, \"inbox_uid\": null, \"snippet\": \"hi\", \"message_id_header\": \"<CAFMxqJyA0xft8f67uEcDiTAs8pgfXO26VaipnGHngFB45Vwiog@mail.gmail.com>\", \"received_date\": {\"$date\": 1395377580000}, \"size\": 2178, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"6b0736bd5f6e9cb4200e1b280ac649229ee78eae1447028a7489b68739506c3a\", \"reply_to\": []}',28,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'gʧm@F',NULL,NULL,NULL,NULL),('folderitem',10,'insert','{\"thread_id\": 4, \"id\": 10, \"folder_name\": \"important\"}',29,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'9֢VIUš',NULL,NULL,NULL,NULL),('folderitem',12,'insert','{\"thread_id\": 4, \"id\": 12, \"folder_name\": \"archive\"}',30,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/\rcD8F599',NULL,NULL,NULL,NULL),('part',12,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"3s8wuv52par00vberkuk85kgj\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"408ba4f10aada5751a08119a3c82a667239b3094bf14fe2e67a258dc03afbacf\", \"id\": 12, \"filename\": null, \"message_id\": 4, \"size\": 24}',31,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ÜN2BxL\"',NULL,NULL,NULL,NULL),('part',10,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"bwzdk7r5we57dpel296wcf6ln\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"af620f6b1b2178f7ae978e21534b334c1b313e09c1c9657db686726368312434\", \"id\": 10, \"message_id\": 4, \"size\": 2037}',32,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'=e@,YC>!f',NULL,NULL,NULL,NULL),('part',11,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5gg7622l7gsovibw5jd5opogl\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"98ea6e4f216f2fb4b69fff9b3a44842c38686ca685f3f55dc48c5d3fb1107be4\", \"id\": 11, \"filename\": null, \"message_id\": 4, \"size\": 3}',33,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'j}Mva',NULL,NULL,NULL,NULL),('folderitem',11,'insert','{\"thread_id\": 4, \"id\": 11, \"folder_name\": \"inbox\"}',34,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'쉋Lcя-',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 12}',35,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Q	J_G^',NULL,NULL,NULL,NULL),('contact',6,'insert','{\"public_id\": \"5gb3egbwvvh087gnytdb4ud04\", \"uid\": {\"$uuid\": \"c0849c30e29d4404b931ddf9c3d06201\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"christine@spang.cc\", \"id\": 6, \"name\": \"Christine Spang\"}',36,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>ԾC{? ',NULL,NULL,NULL,NULL),('part',13,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"d9u8mcwr689m3y24ygjlohw4l\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"889b24bb1bf892e1634717a015b0ccd9f93b39afa46a2986be3fe90879d6d19e\", \"id\": 13, \"message_id\": 5, \"size\": 2846}',37,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'qWZNݏ\ZQ)',NULL,NULL,NULL,NULL),('message',5,'insert','{\"public_id\": \"3tyqksg3qclys5cpr40mssun1\", \"sender_addr\": [], \"thread_id\": 5, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">idle trigger</div></body></html>\", \"id\": 5, \"subject\": \"idle trigger\", \"g_msgid\": 1464328115838585338, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464328115838585338, \"inbox_uid\": null, \"snippet\": \"idle trigger\", \"message_id_header\": \"<CABO4WuM+fcDS9QGXnvOEvm-N8VjF8XxgVLtYLZ0=ENx_0A8u2A@mail.gmail.com>\", \"received_date\": {\"$date\": 1396492114000}, \"size\": 3003, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"4461bfa07c3638fa6082535ecb1affb98e3a5a855d32543ac6e7f1d66c95c08e\", \"reply_to\": []}',38,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\r6L;1;`wb',NULL,NULL,NULL,NULL),('folderitem',15,'insert','{\"thread_id\": 5, \"id\": 15, \"folder_name\": \"archive\"}',39,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"t])Fjʍ϶yd',NULL,NULL,NULL,NULL),('folderitem',13,'insert','{\"thread_id\": 5, \"id\": 13, \"folder_name\": \"important\"}',40,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'|:kE]',NULL,NULL,NULL,NULL),('part',15,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7v9apij58ue792rntg53t2ekj\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"a0d9bb0476a09e0b8cda7c8799e2ff00959e645292dcd64790d9138623393995\", \"id\": 15, \"filename\": null, \"message_id\": 5, \"size\": 34}',41,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'$hNLʥON+=',NULL,NULL,NULL,NULL),('part',14,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"82n7afyko0sdt4xgk0ea8bv5b\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"004815e57fe5989f9536f2d50d29bcc0474462dfd0543868e43c5351285c4f60\", \"id\": 14, \"filename\": null, \"message_id\": 5, \"size\": 13}',42,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'a\r2CRKZj4v',NULL,NULL,NULL,NULL),('folderitem',14,'insert','{\"thread_id\": 5, \"id\": 14, \"folder_name\": \"inbox\"}',43,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'W~dIL\'',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 13}',44,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'׺[xE݌C&',NULL,NULL,NULL,NULL),('part',16,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"7lk6ltkocb1tjfamz1pqttdek\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"f582e89b834cd098b5d023d09014c99554e519649523427da7eb6ed1bbb2dbb9\", \"id\": 16, \"message_id\": 6, \"size\": 1951}',45,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\ZA>@):դ',NULL,NULL,NULL,NULL),('part',18,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"8kxtx92ooontidy3ufzfsun3d\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"3f93e1bec4711d5bca6c71e1ae3bd7a81437a6ade1e1afab07fd8c26e8f60961\", \"id\": 18, \"filename\": null, \"message_id\": 6, \"size\": 35}',46,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ևWyBڌ\'',NULL,NULL,NULL,NULL),('message',6,'insert','{\"public_id\": \"ejx6a26qz7hci1ksc4gwscw39\", \"sender_addr\": [], \"thread_id\": 6, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">idle test 123</div></body></html>\", \"id\": 6, \"subject\": \"idle test 123\", \"g_msgid\": 1464330773292835572, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464330773292835572, \"inbox_uid\": null, \"snippet\": \"idle test 123\", \"message_id_header\": \"<CABO4WuN+beJ_br_j0uifnXUE+EFAf_bDDBJ0tB-Zkd_2USTc+w@mail.gmail.com>\", \"received_date\": {\"$date\": 1396494648000}, \"size\": 2126, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"be9b8517433ab5524b7719653d2a057d1f0e4145b4f111e9e4c83dbab6bd6242\", \"reply_to\": []}',47,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'RFM5i3',NULL,NULL,NULL,NULL),('folderitem',17,'insert','{\"thread_id\": 6, \"id\": 17, \"folder_name\": \"inbox\"}',48,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Yc@Cr\Z?8Ex',NULL,NULL,NULL,NULL),('folderitem',18,'insert','{\"thread_id\": 6, \"id\": 18, \"folder_name\": \"archive\"}',49,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'BQ[:DF%',NULL,NULL,NULL,NULL),('part',17,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"9ita4einrwv0zrzxswzz7ejc0\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"b0bbbdfc73c7ebd75b9d5e66896312cc3c3a59fe5c86e0de44de3a132b34ebad\", \"id\": 17, \"filename\": null, \"message_id\": 6, \"size\": 14}',50,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'=i8%ER.',NULL,NULL,NULL,NULL),('folderitem',16,'insert','{\"thread_id\": 6, \"id\": 16, \"folder_name\": \"important\"}',51,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'l\"wKȑ\'Dyt',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 14}',52,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'XfDkvR',NULL,NULL,NULL,NULL),('message',7,'insert','{\"public_id\": \"3fqr02v6yjz37rfr902w63tgk\", \"sender_addr\": [], \"thread_id\": 7, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">hello</div></body></html>\", \"id\": 7, \"subject\": \"another idle test\", \"g_msgid\": 1464328502421499234, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464328502421499234, \"inbox_uid\": null, \"snippet\": \"hello\", \"message_id_header\": \"<CABO4WuNcTC0_37JuNRQugskTCyYM9-HrszhPKfrf+JqOJE8ntA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396492483000}, \"size\": 2124, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"8adff77788264670035888b1cb2afc6edd4a20b50c43f5b11874f2bc84d1c835\", \"reply_to\": []}',53,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,',f#Cf\r{',NULL,NULL,NULL,NULL),('folderitem',21,'insert','{\"thread_id\": 7, \"id\": 21, \"folder_name\": \"archive\"}',54,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ߍ}NS	',NULL,NULL,NULL,NULL),('folderitem',20,'insert','{\"thread_id\": 7, \"id\": 20, \"folder_name\": \"inbox\"}',55,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'a߁uM@ʿ\ZWƤ?',NULL,NULL,NULL,NULL),('part',19,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"17qyhh8lgpw0ytyodxhpkgnep\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"223681a017f96b40fa854b8810c039a20db392c8df9773575177976aba3e0834\", \"id\": 19, \"message_id\": 7, \"size\": 1965}',56,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'å\nL~>|6o',NULL,NULL,NULL,NULL),('part',20,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"2qktlwsya5ibd1gwt6cdbry75\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"5891b5b522d5df086d0ff0b110fbd9d21bb4fc7163af34d08286a2e846f6be03\", \"id\": 20, \"filename\": null, \"message_id\": 7, \"size\": 6}',57,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'JW',NULL,NULL,NULL,NULL),('part',21,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"ew61n9u0ongow41dmayeyo7i8\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"eccf61f9770be39afd1efe2c8ec5bdbf2ddc3d3cf30a688bf6a18bf4dac45048\", \"id\": 21, \"filename\": null, \"message_id\": 7, \"size\": 27}',58,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B@]3~6',NULL,NULL,NULL,NULL),('folderitem',19,'insert','{\"thread_id\": 7, \"id\": 19, \"folder_name\": \"important\"}',59,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'sp;@ƺI_',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 15}',60,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']BHkmKلsY',NULL,NULL,NULL,NULL),('part',23,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"aljqi080vg3g2e99fhjx8nlo6\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"31b75c53af215582d8b94e90730e58dd711f17b2c6c9128836ba98e8620892c8\", \"id\": 23, \"filename\": null, \"message_id\": 8, \"size\": 13}',61,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'֑\"H(0',NULL,NULL,NULL,NULL),('folderitem',24,'insert','{\"thread_id\": 8, \"id\": 24, \"folder_name\": \"archive\"}',62,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'߃GI)3<іϫ',NULL,NULL,NULL,NULL),('message',8,'insert','{\"public_id\": \"1ois6b5z3fuczqszu0qxji89p\", \"sender_addr\": [], \"thread_id\": 8, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">aoiulhksjndf</div></body></html>\", \"id\": 8, \"subject\": \"ohaiulskjndf\", \"g_msgid\": 1464329835043990839, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464329835043990839, \"inbox_uid\": null, \"snippet\": \"aoiulhksjndf\", \"message_id_header\": \"<CABO4WuOoG=Haky985B_Lx3J0kBo1o8J+2rH87qdpnyHg1+JVJA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396493754000}, \"size\": 2994, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"6e4a76ba1ca34b0b4edd2d164229ad9d4b8a5d53ea53dc214799c93b802f2340\", \"reply_to\": []}',63,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'B7eNDgrA',NULL,NULL,NULL,NULL),('part',22,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"dzddta75o6reb07yhuhxse0hu\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"6a10813ed0f5a12fb60a530aed347f74b32c0de65da5f8b4f14cd459469bfb30\", \"id\": 22, \"message_id\": 8, \"size\": 2837}',64,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'{O',NULL,NULL,NULL,NULL),('folderitem',23,'insert','{\"thread_id\": 8, \"id\": 23, \"folder_name\": \"inbox\"}',65,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,']aDueU',NULL,NULL,NULL,NULL),('folderitem',22,'insert','{\"thread_id\": 8, \"id\": 22, \"folder_name\": \"important\"}',66,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'q\ZBw9S',NULL,NULL,NULL,NULL),('part',24,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"cvksynwp4v7uu0irsqkbagol6\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"889eddcafac71f421c65339c0c38bec66940ffdd76adedce2472a4edf704398d\", \"id\": 24, \"filename\": null, \"message_id\": 8, \"size\": 34}',67,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'|NƓt8',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 16}',68,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'-K<A',NULL,NULL,NULL,NULL),('part',27,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"bkeoyvyzdrq9wz3l4vneejr8a\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"d560107b9f59d09cabcbc2633bbf986545e2bd41f3517655d7b8bf3c7dea7786\", \"id\": 27, \"filename\": null, \"message_id\": 9, \"size\": 63}',69,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'p\"x+BVu',NULL,NULL,NULL,NULL),('message',9,'insert','{\"public_id\": \"m7gc8epgseemesuizweahmfq\", \"sender_addr\": [], \"thread_id\": 9, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\">a8ogysuidfaysogudhkbjfasdf<div><br/></div></div></body></html>\", \"id\": 9, \"subject\": \"guaysdhbjkf\", \"g_msgid\": 1464329212533881603, \"from_addr\": [[\"Ben Bitdiddle\", \"ben.bitdiddle1861@gmail.com\"]], \"g_thrid\": 1464329212533881603, \"inbox_uid\": null, \"snippet\": \"a8ogysuidfaysogudhkbjfasdf\", \"message_id_header\": \"<CABO4WuM6jXXOtc7KGU-M4bQKkP3wXxjnrBWFhbznsJDsiauHmA@mail.gmail.com>\", \"received_date\": {\"$date\": 1396493160000}, \"size\": 2165, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"e5cc414d931127db23a633eb27b12b1fa7621562ee639487b20c18818cb78437\", \"reply_to\": []}',70,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"\0%DEY',NULL,NULL,NULL,NULL),('folderitem',27,'insert','{\"thread_id\": 9, \"id\": 27, \"folder_name\": \"archive\"}',71,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'^ZMJ',NULL,NULL,NULL,NULL),('part',26,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"bzn56f396mgwi69xsitc7q06r\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"ISO-8859-1\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"a87dd39d644c9330f2f60ea9458b35c503352a3d6a9be0339f5b3b44d8239d88\", \"id\": 26, \"filename\": null, \"message_id\": 9, \"size\": 27}',72,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'[3N[>1k',NULL,NULL,NULL,NULL),('folderitem',25,'insert','{\"thread_id\": 9, \"id\": 25, \"folder_name\": \"important\"}',73,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'+pCIMZWD',NULL,NULL,NULL,NULL),('folderitem',26,'insert','{\"thread_id\": 9, \"id\": 26, \"folder_name\": \"inbox\"}',74,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ZVJO$d2z',NULL,NULL,NULL,NULL),('part',25,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"7ohzr8mnpeipdy49220gppi1g\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"46866e65955fdb44934bda5241facc2e5351d85bc58d5fe4363bacd99dfbed9b\", \"id\": 25, \"message_id\": 9, \"size\": 1949}',75,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'E3GW\\',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 17}',76,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'`Eҩrܨd',NULL,NULL,NULL,NULL),('part',30,'insert','{\"walk_index\": 3, \"namespace_id\": 1, \"public_id\": \"au4mckfefae6a41wglfyct7d9\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"ISO-8859-1\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"e956c365e2a7b8481070dde8bdd3d741d799f32f2c208a44a8b6aac9c377419a\", \"id\": 30, \"filename\": null, \"message_id\": 10, \"size\": 5575}',77,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'mh\rAۯ\n=p˚',NULL,NULL,NULL,NULL),('folderitem',28,'insert','{\"thread_id\": 10, \"id\": 28, \"folder_name\": \"inbox\"}',78,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'3_L9dH\0zYx',NULL,NULL,NULL,NULL),('part',28,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"cl2vbhbrfbmchgutyg3kcqbuf\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"f9f27dc47aa42dcd7dc0140be6723e58942ae5f4b5a4947ff43d8c427991917c\", \"id\": 28, \"message_id\": 10, \"size\": 2224}',79,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'uN+iU',NULL,NULL,NULL,NULL),('part',32,'insert','{\"walk_index\": 5, \"namespace_id\": 1, \"public_id\": \"ej0vssrsaddtidsfrelsavift\", \"misc_keyval\": [[\"Content-Type\", [\"image/png\", {\"name\": \"profilephoto.png\"}]], [\"Content-Disposition\", [\"attachment\", {\"filename\": \"profilephoto.png\"}]], [\"Content-Transfer-Encoding\", [\"base64\", {}]], [\"Content-Id\", \"<profilephoto>\"]], \"_content_type_other\": null, \"_content_type_common\": \"image/png\", \"content_id\": \"<profilephoto>\", \"data_sha256\": \"ff3f6b9d30f972e18d28a27d9c19aee77c5f704de8cf490a502c1389c2caf93a\", \"id\": 32, \"filename\": \"profilephoto.png\", \"content_disposition\": \"attachment\", \"message_id\": 10, \"size\": 565}',80,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'N(OM*H?)F̕',NULL,NULL,NULL,NULL),('part',29,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"c6fl5i9mbrbcrwwn9inpwfbwm\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"format\": \"flowed\", \"charset\": \"ISO-8859-1\", \"delsp\": \"yes\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"3d747459c9884417e66ceb56b4f1811b15cfb3fc8efcf1bfb4ac88e3859fa4f0\", \"id\": 29, \"filename\": null, \"message_id\": 10, \"size\": 993}',81,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'TZE[/M\n',NULL,NULL,NULL,NULL),('part',31,'insert','{\"walk_index\": 4, \"namespace_id\": 1, \"public_id\": \"2kumywaetaego8caxg47xe9f3\", \"misc_keyval\": [[\"Content-Type\", [\"image/png\", {\"name\": \"google.png\"}]], [\"Content-Disposition\", [\"attachment\", {\"filename\": \"google.png\"}]], [\"Content-Transfer-Encoding\", [\"base64\", {}]], [\"Content-Id\", \"<google>\"]], \"_content_type_other\": null, \"_content_type_common\": \"image/png\", \"content_id\": \"<google>\", \"data_sha256\": \"2991102bf5c783ea6f018731a8939ee97a4d7562a76e8188775447e3c6e0876f\", \"id\": 31, \"filename\": \"google.png\", \"content_disposition\": \"attachment\", \"message_id\": 10, \"size\": 6321}',82,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'VcR\"EߡIП',NULL,NULL,NULL,NULL),('message',10,'insert','{\"public_id\": \"4pg72e80db49823fwyibgvezq\", \"sender_addr\": [], \"thread_id\": 10, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"\", \"sanitized_body\": \"<html lang=\\\"en\\\"><body style=\\\"margin:0; padding: 0;\\\">\\n<table align=\\\"center\\\" bgcolor=\\\"#f1f1f1\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" height=\\\"100%\\\" style=\\\"border-collapse: collapse\\\" width=\\\"100%\\\">\\n<tr align=\\\"center\\\">\\n<td valign=\\\"top\\\">\\n<table bgcolor=\\\"#f1f1f1\\\" border=\\\"0\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" height=\\\"60\\\" style=\\\"border-collapse: collapse\\\">\\n<tr height=\\\"40\\\" valign=\\\"middle\\\">\\n<td width=\\\"9\\\"></td>\\n<td valign=\\\"middle\\\" width=\\\"217\\\">\\n<img alt=\\\"Google Accounts\\\" border=\\\"0\\\" height=\\\"40\\\" src=\\\"cid:google\\\" style=\\\"display: block;\\\"/>\\n</td>\\n<td style=\\\"font-size: 13px; font-family: arial, sans-serif; color: #777777; text-align: right\\\" width=\\\"327\\\">\\n            \\n              Inbox App\\n            \\n          </td>\\n<td width=\\\"10\\\"></td>\\n<td><img src=\\\"cid:profilephoto\\\"/></td>\\n<td width=\\\"10\\\"></td>\\n</tr>\\n</table>\\n<table bgcolor=\\\"#ffffff\\\" border=\\\"1\\\" bordercolor=\\\"#e5e5e5\\\" cellpadding=\\\"0\\\" cellspacing=\\\"0\\\" style=\\\"text-align: left\\\">\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n<tr>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\">\\n</td>\\n<td style=\\\"font-size: 83%; border-top: none; border-bottom: none; border-left: none; border-right: none; font-size: 13px; font-family: arial, sans-serif; color: #222222; line-height: 18px\\\" valign=\\\"top\\\" width=\\\"568\\\">\\n            \\n              Hi Inbox,\\n              <br/>\\n<br/>\\n            \\n\\n\\nThe recovery phone number for your Google Account - inboxapptest@gmail.com - was recently changed. If you made this change, you don\'t need to do anything more.\\n\\n<br/>\\n<br/>\\n\\nIf you didn\'t change your recovery phone, someone may have broken into your account. Visit this link for more information: <a href=\\\"https://support.google.com/accounts/bin/answer.py?answer=2450236\\\" style=\\\"text-decoration: none; color: #4D90FE\\\">https://support.google.com/accounts/bin/answer.py?answer=2450236</a>.\\n\\n<br/>\\n<br/>\\n\\nIf you are having problems accessing your account, reset your password by clicking the button below:\\n\\n<br/>\\n<br/>\\n<a href=\\\"https://accounts.google.com/RecoverAccount?fpOnly=1&amp;source=ancrppe&amp;Email=inboxapptest@gmail.com\\\" style=\\\"text-align: center; font-size: 11px; font-family: arial, sans-serif; color: white; font-weight: bold; border-color: #3079ed; background-color: #4d90fe; background-image: linear-gradient(top,#4d90fe,#4787ed); text-decoration: none; display:inline-block; height: 27px; padding-left: 8px; padding-right: 8px; line-height: 27px; border-radius: 2px; border-width: 1px;\\\" target=\\\"_blank\\\">\\n<span style=\\\"color: white;\\\">\\n    \\n      Reset password\\n    \\n  </span>\\n</a>\\n<br/>\\n<br/>\\n                \\n                  Sincerely,<br/>\\n                  The Google Accounts team\\n                \\n                </td>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\">\\n</td>\\n</tr>\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n<tr>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\"></td>\\n<td style=\\\"font-size: 11px; font-family: arial, sans-serif; color: #777777; border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"568\\\">\\n                \\n                  This email can\'t receive replies. For more information, visit the <a href=\\\"https://support.google.com/accounts/bin/answer.py?answer=2450236\\\" style=\\\"text-decoration: none; color: #4D90FE\\\"><span style=\\\"color: #4D90FE;\\\">Google Accounts Help Center</span></a>.\\n                \\n                </td>\\n<td style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\" width=\\\"15\\\"></td>\\n</tr>\\n<tr>\\n<td height=\\\"15\\\" style=\\\"border-top: none; border-bottom: none; border-left: none; border-right: none;\\\">\\n</td>\\n</tr>\\n</table>\\n<table bgcolor=\\\"#f1f1f1\\\" height=\\\"80\\\" style=\\\"text-align: left\\\">\\n<tr valign=\\\"middle\\\">\\n<td style=\\\"font-size: 11px; font-family: arial, sans-serif; color: #777777;\\\">\\n                  \\n                    You received this mandatory email service announcement to update you about important changes to your Google product or account.\\n                  \\n                  <br/>\\n<br/>\\n<div style=\\\"direction: ltr;\\\">\\n                  \\n                    \\u00a9 2013 Google Inc., 1600 Amphitheatre Parkway, Mountain View, CA 94043, USA\\n                  \\n                  </div>\\n</td>\\n</tr>\\n</table>\\n</td>\\n</tr>\\n</table>\\n</body></html>\", \"id\": 10, \"subject\": \"Google Account recovery phone number changed\", \"g_msgid\": 1449471921372979402, \"from_addr\": [[\"\", \"no-reply@accounts.google.com\"]], \"g_thrid\": 1449471921372979402, \"inbox_uid\": null, \"snippet\": \"\\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n            \\n              Inbox App\\n            \\n           \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n \\n            \\n              Hi Inbox,\\n               \\n \\n            \\n\\n\\nThe recove\", \"message_id_header\": \"<MC4rhxPMVYU1ydNeoLDDDA@notifications.google.com>\", \"received_date\": {\"$date\": 1382324143000}, \"size\": 19501, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"7836dd4eef7852ea9e9fafae09cc40d18887478d8279d0c2e215c2a7daad3deb\", \"reply_to\": []}',83,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'89cNRb',NULL,NULL,NULL,NULL),('folderitem',29,'insert','{\"thread_id\": 10, \"id\": 29, \"folder_name\": \"archive\"}',84,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'!fVAJ8%',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 18}',85,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'iR|Nc.~',NULL,NULL,NULL,NULL),('contact',7,'insert','{\"public_id\": \"ekf3dtag2jpkv2ig7w2enzj91\", \"uid\": {\"$uuid\": \"94d616ac3963442a9d05b88d43a94758\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"no-reply@accounts.google.com\", \"id\": 7, \"name\": \"\"}',86,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'7v*oNN \'O',NULL,NULL,NULL,NULL),('part',34,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5ax75yobfwixrdetp1ng44126\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 34, \"filename\": null, \"message_id\": 11, \"size\": 31}',87,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'A_P^C<6^',NULL,NULL,NULL,NULL),('folderitem',30,'insert','{\"thread_id\": 11, \"id\": 30, \"folder_name\": \"archive\"}',88,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\"ۙ|bHOu/`^j',NULL,NULL,NULL,NULL),('part',35,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"ap322i8toyc00gyrrkrzmxhit\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 35, \"filename\": null, \"message_id\": 11, \"size\": 61}',89,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'^]Ms¸Eh',NULL,NULL,NULL,NULL),('part',33,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"6qe3ajoabbndu00y33a97x987\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"21ddd725936b604c5b970431f6f44c3887797938c8ba98525bb2098c128aed81\", \"id\": 33, \"message_id\": 11, \"size\": 891}',90,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'&oH\Z<f:',NULL,NULL,NULL,NULL),('message',11,'insert','{\"public_id\": \"djb98ezfhbmjhd62qhqgj7web\", \"sender_addr\": [], \"thread_id\": 11, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 11, \"subject\": \"Wakeup78fcb997159345c9b160573e1887264a\", \"g_msgid\": 1466856002099058157, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466856002099058157, \"inbox_uid\": \"c64be65384804950972d7cb34cd33c69\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<5361906e.c3ef320a.62fb.064c@mx.google.com>\", \"received_date\": {\"$date\": 1398902894000}, \"size\": 1238, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"aa2f127af89b74364ae781becd35704c48f690a3df0abd90e543eafc2ef4d590\", \"reply_to\": []}',91,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'tXFHMf',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 19}',92,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ׂkLER',NULL,NULL,NULL,NULL),('part',38,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"aytpnjos6jd1bjjhppk3l3ifv\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 38, \"filename\": null, \"message_id\": 12, \"size\": 61}',93,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'@Ǆ-*p}',NULL,NULL,NULL,NULL),('part',36,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"1yb2l76yhu9txhtcfkbwd2t3\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"553b8ce2185f5d66380cf0209f81cb2fa6a3a0e1f59845d8530ed08b38e96a0e\", \"id\": 36, \"message_id\": 12, \"size\": 852}',94,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'li!/BЂb	͌',NULL,NULL,NULL,NULL),('folderitem',31,'insert','{\"thread_id\": 12, \"id\": 31, \"folder_name\": \"archive\"}',95,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' ::kDuX',NULL,NULL,NULL,NULL),('message',12,'insert','{\"public_id\": \"k0e9h2pn2my9dc84m3iku8k\", \"sender_addr\": [], \"thread_id\": 12, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 12, \"subject\": \"Wakeup1dd3dabe7d9444da8aec3be27a82d030\", \"g_msgid\": 1466855488650356657, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466855488650356657, \"inbox_uid\": \"e4f72ba9f22842bab7d41e6c4b877b83\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53618e85.e14f320a.1f54.21a6@mx.google.com>\", \"received_date\": {\"$date\": 1398902405000}, \"size\": 1199, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"4a07bb7d5d933c811c267c0262525de7c468d735e9b6edb0ee2060b6f24ab330\", \"reply_to\": []}',96,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'oT{VHj1ȅ',NULL,NULL,NULL,NULL),('part',37,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"71pgb9ywiaux79rycl7zd24x4\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 37, \"filename\": null, \"message_id\": 12, \"size\": 31}',97,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'u2OB',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 20}',98,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'∾凬Ha	',NULL,NULL,NULL,NULL),('folderitem',32,'insert','{\"thread_id\": 13, \"id\": 32, \"folder_name\": \"archive\"}',99,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'{<HǪ:!:cwN',NULL,NULL,NULL,NULL),('part',40,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"eozodoynme9dz7eebc07oekp5\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 40, \"filename\": null, \"message_id\": 13, \"size\": 31}',100,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Ur2D *M',NULL,NULL,NULL,NULL),('part',39,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"4t19q2tk6ls09y4bb8cxmc5ti\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"5f015f0eab6e3adcf8320221b6b0686b73f05a2a3cae54e7367f1d42ba44c734\", \"id\": 39, \"message_id\": 13, \"size\": 853}',101,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' IMe\\^',NULL,NULL,NULL,NULL),('part',41,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"cw8hwwytjt17p71ehki9gbvrc\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 41, \"filename\": null, \"message_id\": 13, \"size\": 61}',102,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'JA7D]',NULL,NULL,NULL,NULL),('message',13,'insert','{\"public_id\": \"97fjigzedwnk3rb8ato4s5b99\", \"sender_addr\": [], \"thread_id\": 13, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 13, \"subject\": \"Wakeupe2ea85dc880d421089b7e1fb8cc12c35\", \"g_msgid\": 1466854894292093968, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466854894292093968, \"inbox_uid\": \"d1dea076298a4bd09178758433f7542c\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53618c4e.a983320a.45a5.21a5@mx.google.com>\", \"received_date\": {\"$date\": 1398901838000}, \"size\": 1200, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"91b33ba2f89ca4006d4b5c26d760d4e253bb3f4ed5c87efe964545c2c4ca0db4\", \"reply_to\": []}',103,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,' \0JB=\0ӄw&',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 21}',104,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,')(ײZHҶ`.',NULL,NULL,NULL,NULL),('contact',2,'update','{\"score\": 10}',105,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'/wݣOmZd7',NULL,NULL,NULL,NULL),('part',44,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7r5mj5l3w82fggryzl7y9f0a0\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 44, \"filename\": null, \"message_id\": 14, \"size\": 61}',106,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'d25%I((',NULL,NULL,NULL,NULL),('part',43,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"b3l94s1lk9xqdciacziws43k\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 43, \"filename\": null, \"message_id\": 14, \"size\": 31}',107,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'M&LR%z',NULL,NULL,NULL,NULL),('folderitem',33,'insert','{\"thread_id\": 14, \"id\": 33, \"folder_name\": \"archive\"}',108,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'Idaà^',NULL,NULL,NULL,NULL),('message',14,'insert','{\"public_id\": \"dcgxhwejsfkijv9nlfi25ad9f\", \"sender_addr\": [], \"thread_id\": 14, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 14, \"subject\": \"Wakeup735d8864f6124797a10e94ec5de6be13\", \"g_msgid\": 1466761634398434761, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466761634398434761, \"inbox_uid\": \"5bf16c2bc9684717a9b77b73cbe9ba45\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<536030e2.640e430a.04ce.ffff8de9@mx.google.com>\", \"received_date\": {\"$date\": 1398812898000}, \"size\": 1205, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"73b93d369f20843a12a81daf72788b1b7fbe703c4abd289f69d1e41f212833a0\", \"reply_to\": []}',109,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'@Q*BfGo1',NULL,NULL,NULL,NULL),('part',42,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"b10systeyyaxcelzv23ngeme8\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"0b940bea3d7f6e2523605b3e5e91f3d93aa38d780d6ba49f6fd3664ee3b0eaad\", \"id\": 42, \"message_id\": 14, \"size\": 858}',110,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'e5cEw\Z2XZ',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 22}',111,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'i|E݋MǍ',NULL,NULL,NULL,NULL),('part',46,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"cwa3z3ei2il150ayylmz8bld6\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/text\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": \"text/text\", \"_content_type_common\": null, \"content_id\": null, \"data_sha256\": \"7747fbe457d3e6d5ead68b4d6f39d17cc2b33e24f9fa78ee40dfe8accbad8ae0\", \"id\": 46, \"filename\": null, \"message_id\": 15, \"size\": 31}',112,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'MfMKW\0e',NULL,NULL,NULL,NULL),('part',45,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"71jjzbbu3srbwdmltebcbb3xt\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"42cefe658856c48397713f475e04af3059fa8c43ee5cc67b7c25ff822f6fdd1c\", \"id\": 45, \"message_id\": 15, \"size\": 895}',113,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'2gA2`!\\',NULL,NULL,NULL,NULL),('folderitem',34,'insert','{\"thread_id\": 15, \"id\": 34, \"folder_name\": \"archive\"}',114,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'8SlC;R!0x	',NULL,NULL,NULL,NULL),('message',15,'insert','{\"public_id\": \"7sk0a64w7d6j1yad31jd8hzia\", \"sender_addr\": [], \"thread_id\": 15, \"bcc_addr\": [], \"cc_addr\": [[\"\", \"ben.bitdiddle1861@gmail.com\"]], \"references\": \"\", \"sanitized_body\": \"<html><body><h2>Sea, birds, yoga and sand.</h2></body></html>\", \"id\": 15, \"subject\": \"Wakeup2eba715ecd044a55ae4e12f604a8dc96\", \"g_msgid\": 1466761259745473801, \"from_addr\": [[\"Inbox App\", \"inboxapptest@gmail.com\"]], \"g_thrid\": 1466761259745473801, \"inbox_uid\": \"7e7d36a5b6f54af1af551a55b48d1735\", \"snippet\": \"Sea, birds, yoga and sand.\", \"message_id_header\": \"<53602f7d.a6a3420a.73de.6c0b@mx.google.com>\", \"received_date\": {\"$date\": 1398812541000}, \"size\": 1242, \"type\": \"message\", \"to_addr\": [[\"\\u2605The red-haired mermaid\\u2605\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": null, \"is_draft\": false, \"data_sha256\": \"b13ddac39e20275606cf2f651e269f22f850ac18dce43cf18de982ed3ac20e4f\", \"reply_to\": []}',115,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'ݻ1ǗDCts',NULL,NULL,NULL,NULL),('part',47,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"8rbi9qhj6oqghodwc3gwrwntc\", \"misc_keyval\": [[\"Mime-Version\", \"1.0\"], [\"Content-Type\", [\"text/html\", {\"charset\": \"ascii\"}]], [\"Content-Transfer-Encoding\", [\"7bit\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"8c9624e032689b58d2dfa87635f7a2ae2d0b4faa06312065eeacde739c1f2252\", \"id\": 47, \"filename\": null, \"message_id\": 15, \"size\": 61}',116,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\'FD}Qv',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 23}',117,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'>ܽL[?>',NULL,NULL,NULL,NULL),('part',48,'insert','{\"walk_index\": 0, \"namespace_id\": 1, \"public_id\": \"4jwrhu8sh8svr5ixbn5meooup\", \"_content_type_other\": null, \"_content_type_common\": null, \"data_sha256\": \"3a50e724e41242746339a2ad4accd821dca20a73844848c54556d5fc13e58a31\", \"id\": 48, \"message_id\": 16, \"size\": 3092}',118,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'G3LBz@f%:H',NULL,NULL,NULL,NULL),('folderitem',35,'insert','{\"thread_id\": 16, \"id\": 35, \"folder_name\": \"important\"}',119,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'QBI,c',NULL,NULL,NULL,NULL),('part',49,'insert','{\"walk_index\": 1, \"namespace_id\": 1, \"public_id\": \"5lzeffp6m3yh5kmaa1h9cvncu\", \"misc_keyval\": [[\"Content-Type\", [\"text/plain\", {\"charset\": \"UTF-8\"}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/plain\", \"content_id\": null, \"data_sha256\": \"d30c644879e3b7b618dd03d593e67a9b6ff80615e4aea01b06b992dbed47008a\", \"id\": 49, \"filename\": null, \"message_id\": 16, \"size\": 2722}',120,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'* /J۳|ܺ',NULL,NULL,NULL,NULL),('message',16,'insert','{\"public_id\": \"b07gpwg599b3q2p6ms71z0oeo\", \"sender_addr\": [], \"thread_id\": 16, \"bcc_addr\": [], \"cc_addr\": [], \"references\": \"<CA+ADUwxeXG8+=Mya+T1Qb_RYS23w6=_EZgssm3GgW6SkhXPxGQ@mail.gmail.com>\\t<F7C679E5-09F7-4F17-B1CA-A67A6B207650@gmail.com>\\t<CAPGJ9TSw5oHjhDNGNa3zs4GQ1WC=bCJ8UTdF12NFqgSdYib9FA@mail.gmail.com>\\t<CAPGJ9TRPNG7pS0JTEZog1A+usobFsH3S5nE0EbPbqtwBW3dKKw@mail.gmail.com>\\t<CA+ADUwytg_oZ6B2HfW=v=Vy39G1t1vT17UpjUTaYJuqr8FYR6w@mail.gmail.com>\\t<CALEp7UFOAXWGgMUW9_GVmJfd1xQSfmXHoGs3rajEd6wZwra1Qw@mail.gmail.com>\\t<CA+ADUwwh7gmTDfzVObOkcm0d=5j9mMZt-NxswDqXv9VnpYg_Lg@mail.gmail.com>\\t<CAMpoCYqjMdo=dVvQMZZE5BhZMb2sZkznQnc=7K6kZ_M6NCg+EQ@mail.gmail.com>\\t<CAPGJ9TQi7Rqxr+HmjASJJ0o2OMgFBG5z-mguUQuy8su1fakLiQ@mail.gmail.com>\\t<CA+ADUwzEgH6GC=ji5FT0m+i1XSxu0uamwrqAwGMAZhg-qWvL2g@mail.gmail.com>\\t<CAPGJ9TQkb923ZKeVxqfqB=JeLnhE9-MOAigRrHo-PZCtueZ-Tg@mail.gmail.com>\\t<3A2441BA-C669-4533-A67A-5CE841A82B54@gmail.com>\\t<CALEp7UFN3t=rzzZ_in=3LvAypVN=S9hi_RQkpKwc1kc13ymYTw@mail.gmail.com>\\t<CALRhdLLxFd1L5D+7RoUKVqq0G62cLJezYmMZaST2eiB7kQDCPw@mail.gmail.com>\\t<CAPGJ9TQe4TyhwmS3vbu1hkZgDkNzsb4O2F1OYvvhMxO3v61Ehg@mail.gmail.com>\\t<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\", \"sanitized_body\": \"<html><body><div dir=\\\"ltr\\\"><br/><br/><br/></div></body></html>\", \"id\": 16, \"subject\": \"Golden Gate Park next Sat\", \"g_msgid\": 1466255156975764289, \"from_addr\": [[\"kavya joshi\", \"kavya719@gmail.com\"]], \"g_thrid\": 1466255156975764289, \"inbox_uid\": null, \"snippet\": \"\", \"message_id_header\": \"<CAMpoCYqq6BmoRW+MouXOwDxiA=DO20b=sG4e2agmr04Bt8Wg_g@mail.gmail.com>\", \"received_date\": {\"$date\": 1398329884000}, \"size\": 13142, \"type\": \"message\", \"to_addr\": [[\"\", \"inboxapptest@gmail.com\"]], \"mailing_list_headers\": {\"List-Id\": null, \"List-Post\": null, \"List-Owner\": null, \"List-Subscribe\": null, \"List-Unsubscribe\": null, \"List-Archive\": null, \"List-Help\": null}, \"in_reply_to\": \"<2D4C6F7D-59F9-4B12-8BEF-3C60556AEC7E@gmail.com>\", \"is_draft\": false, \"data_sha256\": \"a5993aef718c4ce3ffd93f0a3cf3a4e54f93278bcb5873a533de3882c383e706\", \"reply_to\": []}',121,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'-WajdBR[[BD',NULL,NULL,NULL,NULL),('part',50,'insert','{\"walk_index\": 2, \"namespace_id\": 1, \"public_id\": \"7mv2uy2nxtvnl7vsh6eds5zjw\", \"misc_keyval\": [[\"Content-Type\", [\"text/html\", {\"charset\": \"UTF-8\"}]], [\"Content-Transfer-Encoding\", [\"quoted-printable\", {}]]], \"_content_type_other\": null, \"_content_type_common\": \"text/html\", \"content_id\": null, \"data_sha256\": \"37a1732d9a602ad020d4bf3c878571d8c19eb968ca61a382a4d2d3fb5e8ef896\", \"id\": 50, \"filename\": null, \"message_id\": 16, \"size\": 6605}',122,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'[M.3ߜ',NULL,NULL,NULL,NULL),('folderitem',36,'insert','{\"thread_id\": 16, \"id\": 36, \"folder_name\": \"archive\"}',123,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'שE\"Cϝ}',NULL,NULL,NULL,NULL),('contact',1,'update','{\"score\": 24}',124,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'l\\-0LM1,4R',NULL,NULL,NULL,NULL),('contact',8,'insert','{\"public_id\": \"5rn57m6b3rp2te4qd5qgh4nk3\", \"uid\": {\"$uuid\": \"47c6565a2c8e49a5a32c9a7aff921248\"}, \"account_id\": 1, \"source\": \"local\", \"score\": 9, \"provider_name\": \"inbox\", \"email_address\": \"kavya719@gmail.com\", \"id\": 8, \"name\": \"kavya joshi\"}',125,1,'2014-05-13 02:19:13','2014-05-13 02:19:13',NULL,'\r7OMNem =',NULL,NULL,NULL,NULL);
 /*!40000 ALTER TABLE `transaction` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `transactioncursor`
+--
+
+DROP TABLE IF EXISTS `transactioncursor`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `transactioncursor` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `created_at` datetime NOT NULL,
+  `updated_at` datetime NOT NULL,
+  `deleted_at` datetime DEFAULT NULL,
+  `name` varchar(64) NOT NULL,
+  `transaction_id` int(11) NOT NULL DEFAULT '0',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `name` (`name`),
+  KEY `ix_transactioncursor_created_at` (`created_at`),
+  KEY `ix_transactioncursor_deleted_at` (`deleted_at`),
+  KEY `ix_transactioncursor_updated_at` (`updated_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `transactioncursor`
+--
+
+LOCK TABLES `transactioncursor` WRITE;
+/*!40000 ALTER TABLE `transactioncursor` DISABLE KEYS */;
+/*!40000 ALTER TABLE `transactioncursor` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `webhook`
 --
@@ -1140,6 +1222,7 @@ CREATE TABLE `webhook` (
   `created_at` datetime NOT NULL,
   `updated_at` datetime NOT NULL,
   `deleted_at` datetime DEFAULT NULL,
+  `max_batch_size` int(11) NOT NULL DEFAULT '1',
   PRIMARY KEY (`id`),
   KEY `namespace_id` (`namespace_id`),
   KEY `ix_webhook_namespace_id` (`namespace_id`),
@@ -1161,6 +1244,40 @@ LOCK TABLES `webhook` WRITE;
 /*!40000 ALTER TABLE `webhook` DISABLE KEYS */;
 /*!40000 ALTER TABLE `webhook` ENABLE KEYS */;
 UNLOCK TABLES;
+
+--
+-- Table structure for table `webhookretry`
+--
+
+DROP TABLE IF EXISTS `webhookretry`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `webhookretry` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `created_at` datetime NOT NULL,
+  `updated_at` datetime NOT NULL,
+  `deleted_at` datetime DEFAULT NULL,
+  `webhook_id` int(11) NOT NULL,
+  `transaction_id` int(11) NOT NULL,
+  `attempts` int(11) NOT NULL DEFAULT '1',
+  `retry_at` datetime NOT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `webhook_id` (`webhook_id`,`transaction_id`),
+  KEY `ix_webhookretry_created_at` (`created_at`),
+  KEY `ix_webhookretry_deleted_at` (`deleted_at`),
+  KEY `ix_webhookretry_updated_at` (`updated_at`),
+  CONSTRAINT `webhookretry_ibfk_1` FOREIGN KEY (`webhook_id`) REFERENCES `webhook` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `webhookretry`
+--
+
+LOCK TABLES `webhookretry` WRITE;
+/*!40000 ALTER TABLE `webhookretry` DISABLE KEYS */;
+/*!40000 ALTER TABLE `webhookretry` ENABLE KEYS */;
+UNLOCK TABLES;
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
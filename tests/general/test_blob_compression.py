@@ -0,0 +1,34 @@
+from hashlib import sha256
+
+from inbox.models.roles import (_encode_blob, _decode_blob, _storage_format,
+                                BLOB_MAGIC, ZLIB_FORMAT)
+
+
+def test_compressed_blob_round_trip():
+    data = 'Lorem ipsum dolor sit amet. ' * 200
+    data_sha256 = sha256(data).hexdigest()
+
+    stored = _encode_blob(data, ZLIB_FORMAT)
+    assert stored.startswith(BLOB_MAGIC)
+    assert len(stored) < len(data)
+    assert _decode_blob(stored, data_sha256) == data
+
+    # Raw (e.g. pre-compression) blobs are read back unchanged.
+    assert _decode_blob(data, data_sha256) == data
+
+
+def test_incompressible_blobs_stored_raw():
+    assert _storage_format('image/jpeg') is None
+    assert _storage_format('application/pdf') is None
+    assert _storage_format('application/zip') is None
+    assert _storage_format('text/html') is not None
+    # The JSON headers part has no content type.
+    assert _storage_format(None) is not None
+
+    tiny = 'hi'
+    assert _encode_blob(tiny, ZLIB_FORMAT) == tiny
+
+
+def test_raw_blob_with_magic_prefix_is_not_decoded():
+    data = BLOB_MAGIC + ZLIB_FORMAT + 'not actually zlib data'
+    assert _decode_blob(data, sha256(data).hexdigest()) == data
@@ -0,0 +1,42 @@
+from hashlib import sha256
+
+import pytest
+
+from inbox.models import roles
+from inbox.models.roles import Blob, BlobIntegrityError
+
+
+class DiskBlob(Blob):
+    def __init__(self, data, path):
+        self.size = len(data)
+        self.data_sha256 = sha256(data).hexdigest()
+        self.path = path
+
+    @property
+    def _data_file_path(self):
+        return self.path
+
+
+def _corrupt_blob(tmpdir, i):
+    data = 'blob number {0} '.format(i) * 50
+    path = tmpdir.join('blob')
+    path.write('X' + data[1:])
+    return DiskBlob(data, str(path))
+
+
+def test_corrupt_blob_stream_raises(tmpdir, monkeypatch):
+    monkeypatch.setattr(roles, 'BLOB_STORE', 'disk')
+    blob = _corrupt_blob(tmpdir, 1)
+    chunks = blob.open_stream(chunk_size=100)
+    delivered = []
+    with pytest.raises(BlobIntegrityError):
+        for chunk in chunks:
+            delivered.append(chunk)
+    # The last chunk is never delivered.
+    assert len(''.join(delivered)) < blob.size
+
+
+def test_corrupt_blob_range_not_served(tmpdir, monkeypatch):
+    monkeypatch.setattr(roles, 'BLOB_STORE', 'disk')
+    blob = _corrupt_blob(tmpdir, 2)
+    assert blob.open_stream(100, 200) is None
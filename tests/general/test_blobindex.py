@@ -0,0 +1,56 @@
+import os
+import sqlite3
+
+import pytest
+
+from inbox.util.blobindex import BlobIndex
+
+
+def test_shared_blob_removed_on_last_reference(tmpdir):
+    index = BlobIndex(os.path.join(str(tmpdir), 'index.sqlite3'))
+    removed = []
+    remove = lambda: removed.append('x')
+
+    assert index.incref('abc', exists=lambda: False)
+    assert not index.incref('abc', exists=lambda: True)
+    assert index.refcount('abc') == 2
+
+    assert index.decref('abc', remove) == 1
+    assert not removed
+    assert index.decref('abc', remove) == 0
+    assert removed == ['x']
+    assert index.refcount('abc') is None
+
+
+def test_unindexed_blobs_are_pinned(tmpdir):
+    index = BlobIndex(os.path.join(str(tmpdir), 'index.sqlite3'))
+    removed = []
+    remove = lambda: removed.append('x')
+
+    # Untracked blobs are never removed.
+    assert index.decref('legacy', remove) is None
+
+    # A file that predates the index isn't rewritten, and isn't removed
+    # until the index has been rebuilt.
+    assert not index.incref('legacy', exists=lambda: True)
+    assert index.decref('legacy', remove) == 0
+    assert not removed
+
+    index.rebuild([('legacy', 1)])
+    assert index.decref('legacy', remove) == 0
+    assert removed == ['x']
+
+
+def test_incref_checks_for_the_file_under_the_lock(tmpdir):
+    path = os.path.join(str(tmpdir), 'index.sqlite3')
+    index = BlobIndex(path)
+
+    def exists():
+        # A concurrent decref couldn't get in here.
+        other = sqlite3.connect(path, timeout=0, isolation_level=None)
+        with pytest.raises(sqlite3.OperationalError):
+            other.execute('BEGIN IMMEDIATE')
+        other.close()
+        return False
+
+    assert index.incref('abc', exists)
@@ -0,0 +1,63 @@
+import os
+
+import gevent
+import pytest
+
+from inbox.util.blobwriter import BlobWriter, BlobWriteError
+
+
+def test_blob_writes_are_durable_after_wait(tmpdir):
+    writer = BlobWriter(num_threads=2, batch_size=4).start()
+    written = []
+
+    def make_write(name):
+        def write():
+            path = os.path.join(str(tmpdir), name)
+            with open(path, 'wb') as f:
+                f.write(name)
+            written.append(name)
+            return str(tmpdir)
+        return write
+
+    keys = ['blob{}'.format(i) for i in range(10)]
+    for key in keys:
+        writer.submit(key, make_write(key))
+    # Resubmitting a pending key still runs (the store refcounts blobs).
+    writer.submit(keys[0], make_write(keys[0]))
+
+    writer.wait(keys)
+    assert sorted(written) == sorted(keys + keys[:1])
+    assert sorted(os.listdir(str(tmpdir))) == sorted(keys)
+    assert not writer.pending
+    writer.stop()
+
+
+def test_failed_blob_write_raises_on_wait():
+    writer = BlobWriter(num_threads=1).start()
+
+    def fail():
+        raise IOError('disk full')
+
+    writer.submit('good', lambda: None)
+    writer.submit('bad', fail)
+    with pytest.raises(BlobWriteError):
+        writer.wait(['good', 'bad'])
+    writer.stop()
+
+
+def test_failed_blob_write_raises_on_later_wait():
+    writer = BlobWriter(num_threads=1).start()
+
+    def fail():
+        raise IOError('disk full')
+
+    result = writer.submit('bad', fail)
+    # The write fails long before anything waits on it.
+    while not result.ready():
+        gevent.sleep(0.01)
+    assert 'bad' not in writer.pending
+    with pytest.raises(BlobWriteError):
+        writer.wait(['bad'])
+    # Reported once.
+    writer.wait(['bad'])
+    writer.stop()
@@ -2,12 +2,13 @@
 
 from pytest import fixture
 
-from sqlalchemy import create_engine, Column, Enum, String, Integer
+from sqlalchemy import create_engine, inspect, Column, Enum, String, Integer
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 
 from inbox.sqlalchemy_ext.util import BigJSON
-from inbox.sqlalchemy_ext.revision import versioned_session, Revision, gen_rev_role
+from inbox.sqlalchemy_ext.revision import (versioned_session, Revision,
+                                           gen_rev_role, delta)
 
 
 @as_declarative()
@@ -110,4 +111,17 @@ def test_take_snapshot(db_session):
     assert txn.public_snapshot == {'favorite_food': 'banana'}
 
 
+def test_delta_looks_only_at_modified_attributes(db_session):
+    db_session.add(Monkey(type='gorilla', name='Koko', age=40))
+    db_session.commit()
+    monkey = db_session.query(Monkey).one()
+    db_session.expire(monkey, ['name', 'type'])
+
+    monkey.age = 41
+    assert delta(monkey) == dict(age=41)
+    # Nothing had to be loaded to find that out.
+    assert 'name' not in inspect(monkey).dict
+    assert delta(monkey, modified_only=False) == dict(age=41)
+
+
 # TODO: Test updates on objects with relationships.
@@ -0,0 +1,100 @@
+import os
+from hashlib import sha256
+
+from inbox.models import roles
+from inbox.models.roles import Blob
+from inbox.util.packstore import PackStore
+
+
+def _blob(i):
+    data = 'blob number {0} '.format(i) * 50
+    return sha256(data).hexdigest(), data
+
+
+def test_pack_store_round_trip_and_dedup(tmpdir):
+    store = PackStore(str(tmpdir))
+    data_sha256, data = _blob(1)
+
+    assert store.put(data_sha256, data) == store.segment_path(1)
+    # Already packed: nothing is appended.
+    assert store.put(data_sha256, data) is None
+    assert store.get(data_sha256) == data
+
+    # One reference left after the first delete.
+    store.delete(data_sha256)
+    assert store.get(data_sha256) == data
+    store.delete(data_sha256)
+    assert store.get(data_sha256) is None
+
+
+def test_pack_store_compaction(tmpdir):
+    # Small segments, so a handful of blobs spans several of them.
+    store = PackStore(str(tmpdir), segment_size=4096)
+    blobs = [_blob(i) for i in range(12)]
+    for data_sha256, data in blobs:
+        store.put(data_sha256, data)
+    assert os.path.exists(store.segment_path(2))
+
+    deleted, kept = blobs[::2], blobs[1::2]
+    for data_sha256, _ in deleted:
+        store.delete(data_sha256)
+
+    assert store.compact(threshold=0.4) > 0
+    assert not os.path.exists(store.segment_path(1))
+    for data_sha256, data in kept:
+        assert store.get(data_sha256) == data
+    for data_sha256, _ in deleted:
+        assert store.get(data_sha256) is None
+
+
+def test_pack_store_writes_during_compaction(tmpdir):
+    store = PackStore(str(tmpdir), segment_size=4096)
+    blobs = [_blob(i) for i in range(12)]
+    for data_sha256, data in blobs:
+        store.put(data_sha256, data)
+    for data_sha256, _ in blobs[:4]:
+        store.delete(data_sha256)
+
+    copy_live = store._copy_live
+    new_sha256, new_data = _blob(100)
+    removed_sha256, _ = blobs[5]
+
+    def copy_and_write(segment):
+        copied = copy_live(segment)
+        # The index isn't locked while segments are copied.
+        store.put(new_sha256, new_data)
+        store.delete(removed_sha256)
+        return copied
+    store._copy_live = copy_and_write
+
+    assert store.compact(threshold=0.4) > 0
+    assert not os.path.exists(store.segment_path(1))
+    assert store.get(new_sha256) == new_data
+    assert store.get(removed_sha256) is None
+    for data_sha256, data in blobs[4:5] + blobs[6:]:
+        assert store.get(data_sha256) == data
+
+
+class DiskBlob(Blob):
+    def __init__(self, data, path):
+        self.size = len(data)
+        self.data_sha256 = sha256(data).hexdigest()
+        self.path = path
+
+    @property
+    def _data_file_path(self):
+        return self.path
+
+
+def test_pack_store_reads_fall_back_to_disk(tmpdir, monkeypatch):
+    store = PackStore(str(tmpdir.join('packs')))
+    monkeypatch.setattr(roles, 'BLOB_STORE', 'pack')
+    monkeypatch.setattr(roles, 'get_pack_store', lambda: store)
+
+    # Written by the disk store before the switch.
+    data_sha256, data = _blob(1)
+    path = tmpdir.join(data_sha256)
+    path.write(data)
+    blob = DiskBlob(data, str(path))
+    assert blob.data == data
+    assert ''.join(blob.open_stream()) == data
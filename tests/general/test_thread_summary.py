@@ -0,0 +1,71 @@
+""" Tests for maintenance of the denormalized thread summaries. """
+import datetime
+
+THREAD_ID = 1
+
+
+def summary_tag_names(thread):
+    return {tag['name'] for tag in thread.summary.tags}
+
+
+def test_summary_follows_tag_changes(db):
+    from inbox.models import Thread, Tag
+    thread = db.session.query(Thread).get(THREAD_ID)
+    tag = Tag(name='summarized', namespace=thread.namespace,
+              user_created=True)
+    thread.apply_tag(tag)
+    db.session.commit()
+    assert 'summarized' in summary_tag_names(thread)
+
+    thread.remove_tag(tag)
+    db.session.commit()
+    assert 'summarized' not in summary_tag_names(thread)
+    assert thread.summary.unread == ('unread' in
+                                     {t.public_id for t in thread.tags})
+
+
+def test_summary_follows_new_messages(db):
+    from inbox.models import Thread, Message
+    thread = db.session.query(Thread).get(THREAD_ID)
+
+    m = Message()
+    m.thread = thread
+    m.received_date = datetime.datetime.utcnow()
+    m.size = 0
+    m.sanitized_body = ''
+    m.snippet = ''
+    m.from_addr = [['Summary Test', 'summary@example.com']]
+    m.to_addr = m.cc_addr = m.bcc_addr = []
+    db.session.add(m)
+    db.session.commit()
+
+    assert m.public_id in thread.summary.message_public_ids
+    assert ['Summary Test', 'summary@example.com'] in \
+        [list(p) for p in thread.summary.participants]
+
+
+def test_summary_updated_without_recomputing(db, monkeypatch):
+    from inbox.models import Thread, Tag
+    thread = db.session.query(Thread).get(THREAD_ID)
+    thread.update_summary()
+    db.session.commit()
+
+    rebuilt = []
+    monkeypatch.setattr(Thread, 'update_summary',
+                        lambda self: rebuilt.append(self))
+
+    tag = Tag(name='incremental', namespace=thread.namespace,
+              user_created=True)
+    thread.apply_tag(tag)
+    db.session.commit()
+    assert 'incremental' in summary_tag_names(thread)
+
+    # Columns the summary doesn't use leave it alone.
+    message = thread.messages[0]
+    message.is_read = not message.is_read
+    db.session.commit()
+
+    thread.remove_tag(tag)
+    db.session.commit()
+    assert 'incremental' not in summary_tag_names(thread)
+    assert not rebuilt
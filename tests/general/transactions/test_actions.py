@@ -0,0 +1,42 @@
+""" Tests for coalescing syncback actions. """
+import pytest
+
+from tests.util.base import MockQueue
+
+
+def test_action_batcher_coalesces():
+    from inbox.actions import (archive, unarchive, star, unstar, run_batch)
+    from inbox.transactions.actions import ActionBatcher
+    queue = MockQueue()
+    batcher = ActionBatcher(queue, {archive: unarchive, unarchive: archive,
+                                    star: unstar, unstar: star})
+    account_id = 1
+    # Thread 1 is archived and unarchived: nothing to do.
+    batcher.add(archive, account_id, 1)
+    batcher.add(unarchive, account_id, 1)
+    # Thread 2 ends up archived.
+    batcher.add(archive, account_id, 2)
+    batcher.add(unarchive, account_id, 2)
+    batcher.add(archive, account_id, 2)
+    # Thread 3 is archived twice and starred.
+    batcher.add(archive, account_id, 3)
+    batcher.add(star, account_id, 3)
+    batcher.add(archive, account_id, 3)
+    batcher.flush()
+
+    assert sorted(queue) == sorted([(run_batch, archive, account_id, [2, 3]),
+                                    (run_batch, star, account_id, [3])])
+
+
+def test_run_batch_fallback_runs_every_thread():
+    from inbox.actions import run_batch
+    attempted = []
+
+    def flaky_action(account_id, thread_id):
+        attempted.append(thread_id)
+        if thread_id == 2:
+            raise ValueError('Failed on purpose')
+
+    with pytest.raises(Exception):
+        run_batch(flaky_action, 1, [1, 2, 3])
+    assert attempted == [1, 2, 3]
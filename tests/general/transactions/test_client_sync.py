@@ -1,6 +1,6 @@
 import json
 import time
-from tests.util.base import api_client
+from tests.util.base import api_client, db
 
 
 def test_invalid_input(api_client):
@@ -58,3 +58,59 @@ def test_event_generation(api_client):
     stamp = sync_data['events_end']
     sync_data = api_client.get_data('/sync/events?stamp={0}'.format(stamp))
     assert len(sync_data['events']) == 2
+
+
+def test_long_poll(api_client):
+    import gevent
+    stamp = json.loads(api_client.post_data(
+        '/sync/generate_stamp', {'start': int(time.time()) + 1}).data)['stamp']
+
+    # Times out with no events.
+    start = time.time()
+    sync_data = api_client.get_data(
+        '/sync/events?stamp={}&timeout=0.5'.format(stamp))
+    assert sync_data['events'] == []
+    assert time.time() - start >= 0.5
+
+    # Returns as soon as there's something new.
+    gevent.spawn_later(0.2, api_client.post_data, '/tags/', {'name': 'poll'})
+    start = time.time()
+    sync_data = api_client.get_data(
+        '/sync/events?stamp={}&timeout=30'.format(stamp))
+    assert len(sync_data['events']) == 1
+    assert time.time() - start < 10
+
+
+def test_change_hub_wakes_waiters(db):
+    import gevent
+    from sqlalchemy import func
+    from inbox.models import Transaction
+    from inbox.transactions.feed import ChangeFeed
+    from inbox.transactions.hub import ChangeHub
+    hub = ChangeHub(ChangeFeed(poll_interval=0.05))
+    head = db.session.query(func.max(Transaction.id)).scalar()
+    latest = db.session.query(func.max(Transaction.id)). \
+        filter(Transaction.namespace_id == 1).scalar()
+    # Changed before the wait started.
+    assert hub.wait(1, latest - 1, timeout=0)
+
+    gevent.spawn_later(0.1, hub.notify, 1, latest + 1)
+    assert hub.wait(1, latest, timeout=5)
+
+    # A waiter on a namespace with no transactions doesn't send the hub
+    # back to the start of the log.
+    assert not hub.wait(1000, 0, timeout=0.1)
+    assert hub.position >= head
+
+
+def test_publish_decision_recorded(api_client, db):
+    from inbox.models import Transaction
+    api_client.post_data('/tags/', {'name': 'publishable'})
+    thread_id = api_client.get_data('/threads/')[0]['id']
+    api_client.put_data('/threads/{}'.format(thread_id),
+                        {'add_tags': ['publishable']})
+
+    transaction = db.session.query(Transaction). \
+        filter(Transaction.object_public_id == thread_id). \
+        order_by(Transaction.id.desc()).first()
+    assert transaction.publishable is True
@@ -0,0 +1,101 @@
+""" Tests for transaction log compaction and retention. """
+from collections import defaultdict
+from datetime import timedelta
+
+from tests.util.base import api_client
+
+FOREVER = timedelta(days=36500)
+
+
+def transactions(db):
+    from inbox.models import Transaction
+    db.session.expire_all()
+    return db.session.query(Transaction).order_by(Transaction.id).all()
+
+
+def test_compaction_collapses_updates_and_strips_bodies(db):
+    from inbox.transactions.compaction import (CompactionService,
+                                               MESSAGE_TABLES)
+    service = CompactionService(compact_after=timedelta(0),
+                                retain_for=FOREVER)
+    stats = service.compact()
+    assert stats['purged'] == 0
+
+    updates = defaultdict(list)
+    for transaction in transactions(db):
+        if transaction.command == 'update':
+            updates[(transaction.table_name,
+                     transaction.record_id)].append(transaction)
+        if transaction.table_name in MESSAGE_TABLES:
+            assert transaction.public_snapshot.get('body') is None
+    assert all(len(entries) == 1 for entries in updates.values())
+
+    # Nothing left to do.
+    assert service.compact()['bytes'] == 0
+
+
+def test_purge_stops_at_consumers(db):
+    from inbox.models import TransactionCursor
+    from inbox.transactions.compaction import CompactionService
+    first_id = transactions(db)[0].id
+    db.session.add(TransactionCursor(name='test-consumer',
+                                     transaction_id=first_id + 5))
+    db.session.commit()
+
+    service = CompactionService(compact_after=timedelta(0),
+                                retain_for=timedelta(0))
+    stats = service.compact()
+    assert stats['purged'] == 6
+    assert stats['bytes'] > 0
+    assert transactions(db)[0].id == first_id + 6
+
+
+def test_compaction_skips_missing_snapshots(db, monkeypatch):
+    from inbox.config import config
+    from inbox.models import Message, Transaction
+    from inbox.transactions.compaction import (CompactionService,
+                                               MESSAGE_TABLES)
+    monkeypatch.setitem(config, 'DEFER_TRANSACTION_SNAPSHOTS', True)
+
+    message = db.session.query(Message).first()
+    message.subject = 'Deferred'
+    db.session.commit()
+    pending = transactions(db)[-1]
+    assert pending.table_name in MESSAGE_TABLES
+    assert pending.record_id == message.id
+    assert pending.public_snapshot is None
+
+    service = CompactionService(compact_after=timedelta(0),
+                                retain_for=FOREVER)
+    service.compact()
+    db.session.expire_all()
+    assert db.session.query(Transaction).get(pending.id). \
+        public_snapshot is None
+
+
+def test_collapsed_update_still_synced(api_client, db):
+    from inbox.models import Thread, Transaction
+    from inbox.transactions.compaction import CompactionService
+    api_client.post_data('/tags/', {'name': 'compacted'})
+    thread_id = api_client.get_data('/threads/')[0]['id']
+    api_client.put_data('/threads/{}'.format(thread_id),
+                        {'add_tags': ['compacted']})
+    # A change the API doesn't show.
+    thread = db.session.query(Thread). \
+        filter(Thread.public_id == thread_id).one()
+    thread.mailing_list_headers = {'List-Id': '<compaction.example.com>'}
+    db.session.commit()
+    latest = db.session.query(Transaction). \
+        filter(Transaction.object_public_id == thread_id). \
+        order_by(Transaction.id.desc()).limit(2).all()
+    assert [t.publishable for t in latest] == [False, True]
+
+    service = CompactionService(compact_after=timedelta(0),
+                                retain_for=FOREVER)
+    assert service.compact()['collapsed'] > 0
+
+    events = api_client.get_data('/sync/events?stamp=0&limit=100000')[
+        'events']
+    updates = [event for event in events if event['id'] == thread_id]
+    assert 'compacted' in [tag['name'] for tag in
+                           updates[-1]['attributes']['tags']]
@@ -0,0 +1,83 @@
+""" Tests for webhook delivery. """
+from datetime import datetime
+
+import requests
+
+from inbox.transactions import webhook
+from inbox.transactions.delivery import Checkpoint, EventData
+
+
+class FakeHook(object):
+    id = 1
+    public_id = 'hook'
+    lens = None
+    min_processed_id = 0
+    include_body = False
+    callback_url = 'https://example.com'
+    failure_notify_url = None
+    max_retries = 3
+    retry_interval = 60
+    max_batch_size = 1
+    updated_at = datetime(2014, 1, 1)
+
+
+class FakeScheduler(object):
+    def __init__(self):
+        self.scheduled = []
+        self.deferred = []
+
+    def schedule(self, worker, events):
+        self.scheduled.extend(events)
+
+    def defer(self, worker, events):
+        self.deferred.extend(events)
+
+
+class FakeTransaction(object):
+    def __init__(self, id_):
+        self.id = id_
+        self.public_snapshot = {'id': str(id_)}
+
+
+def test_checkpoint_waits_for_earliest_pending_event():
+    checkpoint = Checkpoint(10)
+    for id_ in (12, 15, 20):
+        checkpoint.add(id_)
+    assert checkpoint.position == 11
+
+    checkpoint.done(15)
+    assert checkpoint.position == 11
+
+    checkpoint.done(12)
+    assert checkpoint.position == 19
+
+    checkpoint.done(20)
+    assert checkpoint.position == 20
+
+    # Late additions don't move it back.
+    checkpoint.add(18)
+    assert checkpoint.position == 20
+
+
+def test_failed_request_is_retried(monkeypatch):
+    def post(url, data):
+        raise requests.TooManyRedirects()
+    monkeypatch.setattr(webhook, 'post', post)
+    scheduler = FakeScheduler()
+    worker = webhook.WebhookWorker(FakeHook(), scheduler)
+    event = EventData(FakeTransaction(5))
+    worker.checkpoint.add(event.id)
+    assert not worker.execute([event])
+    assert scheduler.scheduled == [event]
+    assert worker.checkpoint.position == 5
+
+
+def test_full_queue_defers_events():
+    scheduler = FakeScheduler()
+    worker = webhook.WebhookWorker(FakeHook(), scheduler, max_queue_size=1)
+    events = [EventData(FakeTransaction(id_)) for id_ in (1, 2)]
+    for event in events:
+        worker.enqueue(event)
+    assert worker.queue.qsize() == 1
+    assert scheduler.deferred == events[1:]
+    assert worker.checkpoint.position == 0
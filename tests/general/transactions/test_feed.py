@@ -0,0 +1,85 @@
+""" Tests for the change feed. """
+from inbox.transactions.feed import Subscriber
+
+
+class Recorder(Subscriber):
+    def __init__(self, position, table_names=None, full=True,
+                 cursor_name=None):
+        self.position = position
+        self.table_names = table_names
+        self.full = full
+        self.cursor_name = cursor_name
+        self.entries = []
+
+    def process(self, entries, db_session):
+        self.entries.extend(entries)
+
+
+def test_feed_fans_out_one_read(db):
+    from inbox.models import Transaction, TransactionCursor
+    from inbox.transactions.feed import ChangeFeed
+    ids = [id_ for id_, in db.session.query(Transaction.id).
+           order_by(Transaction.id)]
+    feed = ChangeFeed(batch_size=len(ids) + 1)
+    threads = Recorder(0, table_names={'thread', 'imapthread'},
+                       cursor_name='test-threads')
+    everything = Recorder(ids[10], full=False)
+    feed.subscribe(threads)
+    feed.subscribe(everything)
+    assert not feed.process_batch()
+    feed.unsubscribe(threads)
+    feed.unsubscribe(everything)
+
+    assert threads.entries
+    assert all(transaction.table_name in ('thread', 'imapthread')
+               for transaction in threads.entries)
+    assert [row[0] for row in everything.entries] == ids[11:]
+    assert threads.position == everything.position == ids[-1]
+
+    db.session.expire_all()
+    cursor = db.session.query(TransactionCursor). \
+        filter_by(name='test-threads').one()
+    assert cursor.transaction_id == ids[-1]
+
+
+def test_failing_subscriber_is_retried(db):
+    from inbox.models import Transaction
+    from inbox.transactions.feed import ChangeFeed
+
+    class Failing(Recorder):
+        def process(self, entries, db_session):
+            raise ValueError
+
+    first_id = db.session.query(Transaction.id). \
+        order_by(Transaction.id).first()[0]
+    feed = ChangeFeed()
+    failing = Failing(first_id)
+    feed.subscribe(failing)
+    feed.process_batch()
+    feed.unsubscribe(failing)
+    assert failing.position == first_id
+
+
+def test_stuck_subscriber_holds_back_nobody(db):
+    from inbox.models import Transaction
+    from inbox.transactions.feed import ChangeFeed
+
+    class Failing(Recorder):
+        def process(self, entries, db_session):
+            raise ValueError
+
+    ids = [id_ for id_, in db.session.query(Transaction.id).
+           order_by(Transaction.id)]
+    feed = ChangeFeed(batch_size=5)
+    stuck = Failing(ids[0])
+    behind = Recorder(ids[-12], full=False)
+    feed.subscribe(stuck)
+    feed.subscribe(behind)
+    for _ in range(5):
+        feed.process_batch()
+    feed.unsubscribe(stuck)
+    feed.unsubscribe(behind)
+
+    assert stuck.position == ids[0]
+    assert behind.position == ids[-1]
+    assert [row[0] for row in behind.entries] == ids[-11:]
@@ -0,0 +1,53 @@
+""" Tests for the webhook lens index. """
+from tests.util.base import config
+config()
+
+from inbox.models import Lens
+from inbox.transactions.matching import LensIndex, index_key
+
+NAMESPACE_ID = 1
+
+
+class FakeTransaction(object):
+    def __init__(self, public_snapshot, private_snapshot=None,
+                 namespace_id=NAMESPACE_ID):
+        self.namespace_id = namespace_id
+        self.public_snapshot = public_snapshot
+        self.private_snapshot = private_snapshot or {}
+
+
+def test_index_key_prefers_exact_criteria():
+    assert index_key(Lens(subject='Hello', from_addr='a@example.com')) == \
+        ('from', 'a@example.com')
+    assert index_key(Lens(subject='Hello', from_addr='/example/')) == \
+        ('subject', 'Hello')
+    assert index_key(Lens(subject='/Hello/')) is None
+
+
+def test_candidates():
+    index = LensIndex()
+    lenses = {
+        'from': Lens(from_addr='a@example.com'),
+        'any_email': Lens(any_email='Somebody'),
+        'filename': Lens(filename='report.pdf'),
+        'subject': Lens(subject='Hello'),
+        'regex': Lens(subject='/Hell/'),
+        'other': Lens(subject='Goodbye'),
+    }
+    for name, lens in lenses.iteritems():
+        index.add(NAMESPACE_ID, name, lens)
+    index.add(NAMESPACE_ID + 1, 'elsewhere', Lens(subject='Hello'))
+
+    transaction = FakeTransaction(
+        {'subject': 'Hello', 'thread': 'abc',
+         'from': [{'name': 'A', 'email': 'a@example.com'}],
+         'to': [{'name': 'Somebody', 'email': 'b@example.com'}],
+         'cc': None, 'bcc': None},
+        {'filenames': ['report.pdf']})
+    assert index.candidates(transaction) == \
+        {'from', 'any_email', 'filename', 'subject', 'regex'}
+
+    index.remove('subject')
+    index.remove('regex')
+    assert index.candidates(transaction) == \
+        {'from', 'any_email', 'filename'}
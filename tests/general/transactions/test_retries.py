@@ -0,0 +1,90 @@
+""" Tests for webhook retry scheduling. """
+from inbox.transactions.retries import backoff
+
+NAMESPACE_ID = 1
+
+
+class FakeWorker(object):
+    def __init__(self, hook):
+        self.id = hook.id
+        self.max_retries = hook.max_retries
+        self.retry_interval = hook.retry_interval
+        self.retried = []
+
+    def retry(self, event):
+        self.retried.append(event)
+
+
+def test_backoff():
+    assert [backoff(60, attempts) for attempts in (1, 2, 3)] == \
+        [60, 120, 240]
+    assert backoff(60, 20, max_backoff=3600) == 3600
+
+
+def test_retries_are_stored(db):
+    from inbox.models import Lens, Transaction, Webhook, WebhookRetry
+    from inbox.transactions.delivery import EventData
+    from inbox.transactions.retries import RetryScheduler
+
+    lens = Lens(namespace_id=NAMESPACE_ID, subject='Retried')
+    hook = Webhook(namespace_id=NAMESPACE_ID, lens=lens,
+                   callback_url='https://example.com', include_body=False,
+                   max_retries=3, retry_interval=60)
+    db.session.add_all([lens, hook])
+    db.session.commit()
+    worker = FakeWorker(hook)
+
+    transactions = db.session.query(Transaction). \
+        order_by(Transaction.id).limit(2).all()
+    events = [EventData(transaction) for transaction in transactions]
+    scheduler = RetryScheduler(lambda hook_id: worker)
+    scheduler.schedule(worker, events)
+    retries = db.session.query(WebhookRetry). \
+        filter_by(webhook_id=hook.id).all()
+    assert sorted(retry.transaction_id for retry in retries) == \
+        [transaction.id for transaction in transactions]
+    assert all(retry.attempts == 1 for retry in retries)
+
+    # A new scheduler picks them up again.
+    restarted = RetryScheduler(lambda hook_id: worker)
+    restarted.load(hook.id)
+    assert sorted(entry[3].id for entry in restarted._heap) == \
+        [transaction.id for transaction in transactions]
+
+    scheduler.delivered(worker, events[:1])
+    # The last attempt gives up on it.
+    events[1].retry_count = hook.max_retries - 1
+    scheduler.schedule(worker, events[1:])
+    db.session.expire_all()
+    assert not db.session.query(WebhookRetry). \
+        filter_by(webhook_id=hook.id).all()
+
+
+def test_deferred_events_are_stored(db):
+    from inbox.models import Lens, Transaction, Webhook, WebhookRetry
+    from inbox.transactions.delivery import EventData
+    from inbox.transactions.retries import RetryScheduler
+
+    lens = Lens(namespace_id=NAMESPACE_ID, subject='Deferred')
+    hook = Webhook(namespace_id=NAMESPACE_ID, lens=lens,
+                   callback_url='https://example.com', include_body=False,
+                   max_retries=1, retry_interval=60)
+    db.session.add_all([lens, hook])
+    db.session.commit()
+    worker = FakeWorker(hook)
+
+    transaction = db.session.query(Transaction). \
+        order_by(Transaction.id).first()
+    event = EventData(transaction)
+    scheduler = RetryScheduler(lambda hook_id: worker)
+    scheduler.defer(worker, [event])
+    # Not counted as an attempt, so its one attempt is still to come.
+    assert event.retry_count == 0
+    retry = db.session.query(WebhookRetry). \
+        filter_by(webhook_id=hook.id).one()
+    assert retry.attempts == 0
+
+    scheduler.delivered(worker, [event])
+    db.session.expire_all()
+    assert not db.session.query(WebhookRetry). \
+        filter_by(webhook_id=hook.id).all()
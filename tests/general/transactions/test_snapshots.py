@@ -0,0 +1,52 @@
+""" Tests for deferred transaction snapshots. """
+THREAD_ID = 1
+
+
+def latest_transaction(db, thread):
+    from inbox.models import Transaction
+    db.session.expire_all()
+    return db.session.query(Transaction). \
+        filter(Transaction.table_name == thread.__tablename__,
+               Transaction.record_id == thread.id). \
+        order_by(Transaction.id.desc()).first()
+
+
+def test_deferred_snapshots(db, monkeypatch):
+    from inbox.config import config
+    from inbox.models import Thread
+    from inbox.transactions.snapshots import ensure_snapshots
+    monkeypatch.setitem(config, 'DEFER_TRANSACTION_SNAPSHOTS', True)
+
+    thread = db.session.query(Thread).get(THREAD_ID)
+    thread.subject = 'Deferred snapshot'
+    db.session.commit()
+
+    transaction = latest_transaction(db, thread)
+    assert transaction.snapshot_pending
+    assert transaction.public_snapshot is None
+
+    ensure_snapshots([transaction])
+    assert not transaction.snapshot_pending
+    assert transaction.public_snapshot['subject'] == 'Deferred snapshot'
+    assert transaction.publishable
+
+    # Recorded for everyone, not just this session.
+    transaction = latest_transaction(db, thread)
+    assert transaction.public_snapshot['subject'] == 'Deferred snapshot'
+
+
+def test_snapshot_service_catches_up(db, monkeypatch):
+    from inbox.config import config
+    from inbox.models import Thread
+    from inbox.transactions.snapshots import SnapshotService
+    monkeypatch.setitem(config, 'DEFER_TRANSACTION_SNAPSHOTS', True)
+
+    thread = db.session.query(Thread).get(THREAD_ID)
+    thread.subject = 'Caught up'
+    db.session.commit()
+
+    service = SnapshotService(batch_size=1)
+    while service._process_log():
+        pass
+    transaction = latest_transaction(db, thread)
+    assert transaction.public_snapshot['subject'] == 'Caught up'